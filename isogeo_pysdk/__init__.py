@@ -4,21 +4,67 @@
 """This module is an abstraction class about the Isogeo REST API.
 
 https://www.isogeo.com/
+
+Classes are loaded at first access (PEP 562): importing the package doesn't load the HTTP stack.
 """
 
+# standard library
+from importlib import import_module
+
 # submodules
 from .__about__ import __version__  # noqa: F401
-from .api_hooks import IsogeoHooks  # noqa: F401
-from .checker import IsogeoChecker  # noqa: F401
-from .decorators import ApiDecorators  # noqa: F401
-from .exceptions import AlreadyExistError  # noqa: F401
-from .isogeo import Isogeo  # noqa: F401
-from .translator import IsogeoTranslator  # noqa: F401
-from .utils import IsogeoUtils  # noqa: F401
 
 # subpackages
-from .api import *  # noqa: F401 F403
-from .enums import *  # noqa: F401 F403
-from .models import *  # noqa: F401 F403
+from . import api, enums, models  # noqa: F401
+
+# submodules classes by name
+_SUBMODULES = {
+    "AlreadyExistError": ".exceptions",
+    "ApiDecorators": ".decorators",
+    "AsyncIsogeo": ".isogeo_async",
+    "CircuitOpenError": ".exceptions",
+    "DeadlineExceededError": ".exceptions",
+    "Isogeo": ".isogeo",
+    "IsogeoCache": ".cache",
+    "IsogeoChecker": ".checker",
+    "IsogeoCircuitBreaker": ".circuit_breaker",
+    "IsogeoDeadline": ".deadline",
+    "IsogeoHedging": ".hedging",
+    "IsogeoHooks": ".api_hooks",
+    "IsogeoHttpCache": ".http_cache",
+    "IsogeoJsonBackend": ".json_backend",
+    "IsogeoMetrics": ".metrics",
+    "IsogeoPipeline": ".pipeline",
+    "IsogeoRateLimiter": ".rate_limit",
+    "IsogeoPaginator": ".paginator",
+    "IsogeoSingleFlight": ".single_flight",
+    "IsogeoTracer": ".tracing",
+    "IsogeoTranslator": ".translator",
+    "IsogeoUtils": ".utils",
+    "OperationCancelledError": ".exceptions",
+}
 
 VERSION = __version__
+
+__all__ = ["VERSION"] + list(_SUBMODULES) + api.__all__ + enums.__all__ + models.__all__
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        value = getattr(import_module(_SUBMODULES.get(name), __name__), name)
+    else:
+        for subpackage in (api, enums, models):
+            if name in subpackage.__all__:
+                value = getattr(subpackage, name)
+                break
+        else:
+            raise AttributeError(
+                "module {!r} has no attribute {!r}".format(__name__, name)
+            )
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
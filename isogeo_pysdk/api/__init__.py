@@ -1,28 +1,51 @@
 # coding: utf-8
-#! python3  # noqa: E265 F401
-
-from .routes_application import ApiApplication  # noqa: F401
-from .routes_about import ApiAbout  # noqa: F401
-from .routes_account import ApiAccount  # noqa: F401
-from .routes_catalog import ApiCatalog  # noqa: F401
-from .routes_contact import ApiContact  # noqa: F401
-from .routes_condition import ApiCondition  # noqa: F401
-from .routes_coordinate_systems import ApiCoordinateSystem  # noqa: F401
-from .routes_datasource import ApiDatasource  # noqa: F401
-from .routes_directives import ApiDirective  # noqa: F401
-from .routes_feature_attributes import ApiFeatureAttribute  # noqa: F401
-from .routes_format import ApiFormat  # noqa: F401
-from .routes_keyword import ApiKeyword  # noqa: F401
-from .routes_invitation import ApiInvitation  # noqa: F401
-from .routes_license import ApiLicense  # noqa: F401
-from .routes_metadata import ApiMetadata  # noqa: F401
-from .routes_metadata_bulk import ApiBulk  # noqa: F401
-from .routes_search import ApiSearch  # noqa: F401
-from .routes_service import ApiService  # noqa: F401
-from .routes_service_layers import ApiServiceLayer  # noqa: F401
-from .routes_service_operations import ApiServiceOperation  # noqa: F401
-from .routes_share import ApiShare  # noqa: F401
-from .routes_specification import ApiSpecification  # noqa: F401
-from .routes_thesaurus import ApiThesaurus  # noqa: F401
-from .routes_user import ApiUser  # noqa: F401
-from .routes_workgroup import ApiWorkgroup  # noqa: F401
+#! python3  # noqa: E265
+
+"""Routes of the Isogeo API, loaded at first access (PEP 562)."""
+
+# standard library
+from importlib import import_module
+
+# routes classes by module
+_ROUTES = {
+    "ApiApplication": ".routes_application",
+    "ApiAbout": ".routes_about",
+    "ApiAccount": ".routes_account",
+    "ApiCatalog": ".routes_catalog",
+    "ApiContact": ".routes_contact",
+    "ApiCondition": ".routes_condition",
+    "ApiCoordinateSystem": ".routes_coordinate_systems",
+    "ApiDatasource": ".routes_datasource",
+    "ApiDirective": ".routes_directives",
+    "ApiFeatureAttribute": ".routes_feature_attributes",
+    "ApiFormat": ".routes_format",
+    "ApiKeyword": ".routes_keyword",
+    "ApiInvitation": ".routes_invitation",
+    "ApiLicense": ".routes_license",
+    "ApiMetadata": ".routes_metadata",
+    "ApiBulk": ".routes_metadata_bulk",
+    "ApiSearch": ".routes_search",
+    "ApiService": ".routes_service",
+    "ApiServiceLayer": ".routes_service_layers",
+    "ApiServiceOperation": ".routes_service_operations",
+    "ApiShare": ".routes_share",
+    "ApiSpecification": ".routes_specification",
+    "ApiThesaurus": ".routes_thesaurus",
+    "ApiUser": ".routes_user",
+    "ApiWorkgroup": ".routes_workgroup",
+}
+
+__all__ = list(_ROUTES)
+
+
+def __getattr__(name: str):
+    if name in _ROUTES:
+        value = getattr(import_module(_ROUTES.get(name), __name__), name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
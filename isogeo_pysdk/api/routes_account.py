@@ -71,23 +71,10 @@ class ApiAccount:
         else:
             payload = None
 
-        # request URL
-        url_account = utils.get_request_base_url(route="account")
-
         # request
-        req_account = self.api_client.get(
-            url=url_account,
-            headers=self.api_client.header,
-            params=payload,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
-        )
-
-        # checking response
-        req_check = checker.check_api_response(req_account)
-        if isinstance(req_check, tuple):
-            return req_check
+        req_account = self.api_client.execute("GET", route="account", params=payload)
+        if isinstance(req_account, tuple):
+            return req_account
 
         # if caching use or store the response
         if caching:
@@ -109,23 +96,12 @@ class ApiAccount:
         else:
             pass
 
-        # URL
-        url_account_update = utils.get_request_base_url(route="account")
-
         # request
-        req_account_update = self.api_client.put(
-            url=url_account_update,
-            json=account.to_dict(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_account_update = self.api_client.execute(
+            "PUT", route="account", json=account.to_dict()
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_account_update)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_account_update, tuple):
+            return req_account_update
 
         # if caching use or store the response
         if caching and not self.api_client._user:
@@ -155,22 +131,12 @@ class ApiAccount:
         >>> print(len(groups_where_iam_reader))
         1
         """
-        # URL builder
-        url_user_memberships = utils.get_request_base_url(route="account/memberships")
-
         # request
-        req_user_memberships = self.api_client.get(
-            url=url_user_memberships,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_user_memberships = self.api_client.execute(
+            "GET", route="account/memberships"
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_user_memberships)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_user_memberships, tuple):
+            return req_user_memberships
 
         return req_user_memberships.json()
 
@@ -100,19 +100,11 @@ class ApiApplication:
             url_applications = utils.get_request_base_url(route="applications")
 
         # request
-        req_applications = self.api_client.get(
-            url=url_applications,
-            headers=self.api_client.header,
-            params=payload,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_applications = self.api_client.execute(
+            "GET", url=url_applications, params=payload
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_applications)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_applications, tuple):
+            return req_applications
 
         applications = req_applications.json()
 
@@ -154,25 +146,12 @@ class ApiApplication:
         else:
             payload = None
 
-        # URL
-        url_application = utils.get_request_base_url(
-            route="applications/{}".format(application_id)
-        )
-
         # request
-        req_application = self.api_client.get(
-            url=url_application,
-            headers=self.api_client.header,
-            params=payload,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_application = self.api_client.execute(
+            "GET", route="applications/{}".format(application_id), params=payload
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_application)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_application, tuple):
+            return req_application
 
         # end of method
         return Application(**req_application.json())
@@ -204,23 +183,12 @@ class ApiApplication:
         else:
             pass
 
-        # URL
-        url_application_create = utils.get_request_base_url(route="applications")
-
         # request
-        req_new_application = self.api_client.post(
-            url=url_application_create,
-            json=application.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_new_application = self.api_client.execute(
+            "POST", route="applications", json=application.to_dict_creation()
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_new_application)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_new_application, tuple):
+            return req_new_application
 
         # load new application and save it to the cache
         new_application = Application(**req_new_application.json())
@@ -243,25 +211,11 @@ class ApiApplication:
         else:
             pass
 
-        # request URL
-        url_application_delete = utils.get_request_base_url(
-            route="applications/{}".format(application_id)
-        )
-
         # request
-        req_application_deletion = self.api_client.delete(
-            url=url_application_delete,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_application_deletion = self.api_client.execute(
+            "DELETE", route="applications/{}".format(application_id)
         )
 
-        # checking response
-        req_check = checker.check_api_response(req_application_deletion)
-        if isinstance(req_check, tuple):
-            return req_check
-
         return req_application_deletion
 
     @ApiDecorators._check_bearer_validity
@@ -284,19 +238,10 @@ class ApiApplication:
         )
 
         # request
-        req_application_exists = self.api_client.get(
-            url_application_exists,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_application_exists = self.api_client.execute(
+            "GET", url=url_application_exists
         )
 
-        # checking response
-        req_check = checker.check_api_response(req_application_exists)
-        if isinstance(req_check, tuple):
-            return req_check
-
         return req_application_exists
 
     @ApiDecorators._check_bearer_validity
@@ -314,25 +259,14 @@ class ApiApplication:
         else:
             pass
 
-        # URL
-        url_application_update = utils.get_request_base_url(
-            route="applications/{}".format(application._id)
-        )
-
         # request
-        req_application_update = self.api_client.put(
-            url=url_application_update,
+        req_application_update = self.api_client.execute(
+            "PUT",
+            route="applications/{}".format(application._id),
             json=application.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_application_update)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_application_update, tuple):
+            return req_application_update
 
         # update application in cache
         new_application = Application(**req_application_update.json())
@@ -366,24 +300,12 @@ class ApiApplication:
         # else:
         #     payload = None
 
-        # URL
-        url_application_groups = utils.get_request_base_url(
-            route="applications/{}/groups".format(application_id)
-        )
-
         # request
-        req_applications = self.api_client.get(
-            url=url_application_groups,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_applications = self.api_client.execute(
+            "GET", route="applications/{}/groups".format(application_id)
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_applications)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_applications, tuple):
+            return req_applications
 
         # end of method
         return req_applications.json()
@@ -463,25 +385,12 @@ class ApiApplication:
         else:
             pass
 
-        # URL
-        url_application_association = utils.get_request_base_url(
-            route="applications/{}/groups/{}".format(application._id, workgroup._id)
-        )
-
         # request
-        req_application_assocation = self.api_client.put(
-            url=url_application_association,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_application_assocation = self.api_client.execute(
+            "PUT",
+            route="applications/{}/groups/{}".format(application._id, workgroup._id),
         )
 
-        # checking response
-        req_check = checker.check_api_response(req_application_assocation)
-        if isinstance(req_check, tuple):
-            return req_check
-
         # end of method
         return req_application_assocation
 
@@ -518,25 +427,12 @@ class ApiApplication:
         else:
             pass
 
-        # URL
-        url_application_dissociation = utils.get_request_base_url(
-            route="applications/{}/groups/{}".format(application._id, workgroup._id)
-        )
-
         # request
-        req_application_dissociation = self.api_client.delete(
-            url=url_application_dissociation,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_application_dissociation = self.api_client.execute(
+            "DELETE",
+            route="applications/{}/groups/{}".format(application._id, workgroup._id),
         )
 
-        # checking response
-        req_check = checker.check_api_response(req_application_dissociation)
-        if isinstance(req_check, tuple):
-            return req_check
-
         # end of method
         return req_application_dissociation
 
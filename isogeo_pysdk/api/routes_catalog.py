@@ -105,25 +105,12 @@ class ApiCatalog:
         else:
             payload = None
 
-        # request URL
-        url_catalogs = utils.get_request_base_url(
-            route="groups/{}/catalogs".format(workgroup_id)
-        )
-
         # request
-        req_wg_catalogs = self.api_client.get(
-            url_catalogs,
-            headers=self.api_client.header,
-            params=payload,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_wg_catalogs = self.api_client.execute(
+            "GET", route="groups/{}/catalogs".format(workgroup_id), params=payload
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_wg_catalogs)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_wg_catalogs, tuple):
+            return req_wg_catalogs
 
         wg_catalogs = req_wg_catalogs.json()
 
@@ -154,29 +141,18 @@ class ApiCatalog:
         else:
             pass
 
-        # URL
-        url_metadata_catalogs = utils.get_request_base_url(
-            route="resources/{}/catalogs/".format(metadata_id)
-        )
-
         # request
-        req_metadata_catalogs = self.api_client.get(
-            url=url_metadata_catalogs,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_metadata_catalogs = self.api_client.execute(
+            "GET", route="resources/{}/catalogs/".format(metadata_id)
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_metadata_catalogs)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_metadata_catalogs, tuple):
+            return req_metadata_catalogs
 
         # end of method
         return req_metadata_catalogs.json()
 
     @lru_cache()
+    @ApiDecorators._coalesce_calls("groups/{workgroup_id}/catalogs/{catalog_id}")
     @ApiDecorators._check_bearer_validity
     def get(
         self,
@@ -209,25 +185,14 @@ class ApiCatalog:
         else:
             payload = None
 
-        # catalog route
-        url_catalog = utils.get_request_base_url(
-            route="groups/{}/catalogs/{}".format(workgroup_id, catalog_id)
-        )
-
         # request
-        req_catalog = self.api_client.get(
-            url=url_catalog,
-            headers=self.api_client.header,
+        req_catalog = self.api_client.execute(
+            "GET",
+            route="groups/{}/catalogs/{}".format(workgroup_id, catalog_id),
             params=payload,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_catalog)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_catalog, tuple):
+            return req_catalog
 
         # end of method
         return Catalog.clean_attributes(req_catalog.json())
@@ -272,25 +237,14 @@ class ApiCatalog:
         else:
             pass
 
-        # build request url
-        url_catalog_create = utils.get_request_base_url(
-            route="groups/{}/catalogs".format(workgroup_id)
-        )
-
         # request
-        req_new_catalog = self.api_client.post(
-            url_catalog_create,
+        req_new_catalog = self.api_client.execute(
+            "POST",
+            route="groups/{}/catalogs".format(workgroup_id),
             data=catalog.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_new_catalog)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_new_catalog, tuple):
+            return req_new_catalog
 
         # handle bad JSON attribute
         new_catalog = req_new_catalog.json()
@@ -324,25 +278,11 @@ class ApiCatalog:
         else:
             pass
 
-        # request URL
-        url_catalog_delete = utils.get_request_base_url(
-            route="groups/{}/catalogs/{}".format(workgroup_id, catalog_id)
-        )
-
         # request
-        req_catalog_deletion = self.api_client.delete(
-            url_catalog_delete,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_catalog_deletion = self.api_client.execute(
+            "DELETE", route="groups/{}/catalogs/{}".format(workgroup_id, catalog_id)
         )
 
-        # checking response
-        req_check = checker.check_api_response(req_catalog_deletion)
-        if isinstance(req_check, tuple):
-            return req_check
-
         return req_catalog_deletion
 
     @ApiDecorators._check_bearer_validity
@@ -365,25 +305,11 @@ class ApiCatalog:
         else:
             pass
 
-        # URL builder
-        url_catalog_exists = utils.get_request_base_url(
-            route="groups/{}/catalogs/{}".format(workgroup_id, catalog_id)
-        )
-
         # request
-        req_catalog_exists = self.api_client.get(
-            url=url_catalog_exists,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_catalog_exists = self.api_client.execute(
+            "GET", route="groups/{}/catalogs/{}".format(workgroup_id, catalog_id)
         )
 
-        # checking response
-        req_check = checker.check_api_response(req_catalog_exists)
-        if isinstance(req_check, tuple):
-            return req_check
-
         return req_catalog_exists
 
     @ApiDecorators._check_bearer_validity
@@ -399,25 +325,14 @@ class ApiCatalog:
         else:
             pass
 
-        # URL
-        url_catalog_update = utils.get_request_base_url(
-            route="groups/{}/catalogs/{}".format(catalog.owner.get("_id"), catalog._id)
-        )
-
         # request
-        req_catalog_update = self.api_client.put(
-            url=url_catalog_update,
+        req_catalog_update = self.api_client.execute(
+            "PUT",
+            route="groups/{}/catalogs/{}".format(catalog.owner.get("_id"), catalog._id),
             json=catalog.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_catalog_update)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_catalog_update, tuple):
+            return req_catalog_update
 
         # handle bad JSON attribute
         new_catalog = req_catalog_update.json()
@@ -479,25 +394,11 @@ class ApiCatalog:
         else:
             pass
 
-        # URL
-        url_catalog_association = utils.get_request_base_url(
-            route="catalogs/{}/resources/{}".format(catalog._id, metadata._id)
-        )
-
         # request
-        req_catalog_association = self.api_client.put(
-            url=url_catalog_association,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_catalog_association = self.api_client.execute(
+            "PUT", route="catalogs/{}/resources/{}".format(catalog._id, metadata._id)
         )
 
-        # checking response
-        req_check = checker.check_api_response(req_catalog_association)
-        if isinstance(req_check, tuple):
-            return req_check
-
         # end of method
         return req_catalog_association
 
@@ -524,25 +425,11 @@ class ApiCatalog:
         else:
             pass
 
-        # URL
-        url_catalog_dissociation = utils.get_request_base_url(
-            route="catalogs/{}/resources/{}".format(catalog._id, metadata._id)
-        )
-
         # request
-        req_catalog_dissociation = self.api_client.delete(
-            url=url_catalog_dissociation,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_catalog_dissociation = self.api_client.execute(
+            "DELETE", route="catalogs/{}/resources/{}".format(catalog._id, metadata._id)
         )
 
-        # checking response
-        req_check = checker.check_api_response(req_catalog_dissociation)
-        if isinstance(req_check, tuple):
-            return req_check
-
         # end of method
         return req_catalog_dissociation
 
@@ -562,24 +449,12 @@ class ApiCatalog:
         else:
             pass
 
-        # URL builder
-        url_catalog_shares = utils.get_request_base_url(
-            route="catalogs/{}/shares".format(catalog_id)
-        )
-
         # request
-        req_catalog_shares = self.api_client.get(
-            url=url_catalog_shares,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_catalog_shares = self.api_client.execute(
+            "GET", route="catalogs/{}/shares".format(catalog_id)
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_catalog_shares)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_catalog_shares, tuple):
+            return req_catalog_shares
 
         return req_catalog_shares.json()
 
@@ -596,24 +471,12 @@ class ApiCatalog:
         else:
             pass
 
-        # URL builder
-        url_catalog_statistics = utils.get_request_base_url(
-            route="catalogs/{}/statistics".format(catalog_id)
-        )
-
         # request
-        req_catalog_statistics = self.api_client.get(
-            url=url_catalog_statistics,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_catalog_statistics = self.api_client.execute(
+            "GET", route="catalogs/{}/statistics".format(catalog_id)
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_catalog_statistics)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_catalog_statistics, tuple):
+            return req_catalog_statistics
 
         return req_catalog_statistics.json()
 
@@ -641,19 +504,10 @@ class ApiCatalog:
                 )
             )
 
-        # URL builder
-        url_catalog_statistics = utils.get_request_base_url(
-            route="catalogs/{}/statistics/tag/{}".format(catalog_id, tag)
-        )
-
         # request
         try:
-            req_catalog_statistics = self.api_client.get(
-                url=url_catalog_statistics,
-                headers=self.api_client.header,
-                proxies=self.api_client.proxies,
-                verify=self.api_client.ssl,
-                timeout=self.api_client.timeout,
+            req_catalog_statistics = self.api_client.execute(
+                "GET", route="catalogs/{}/statistics/tag/{}".format(catalog_id, tag)
             )
         except Timeout as e:
             logger.error(
@@ -662,10 +516,8 @@ class ApiCatalog:
             )
             return False, 500
 
-        # checking response
-        req_check = checker.check_api_response(req_catalog_statistics)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_catalog_statistics, tuple):
+            return req_catalog_statistics
 
         return req_catalog_statistics.json()
 
@@ -78,24 +78,12 @@ class ApiCondition:
         else:
             pass
 
-        # URL
-        url_metadata_conditions = utils.get_request_base_url(
-            route="resources/{}/conditions/".format(metadata_id)
-        )
-
         # request
-        req_metadata_conditions = self.api_client.get(
-            url=url_metadata_conditions,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_metadata_conditions = self.api_client.execute(
+            "GET", route="resources/{}/conditions/".format(metadata_id)
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_metadata_conditions)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_metadata_conditions, tuple):
+            return req_metadata_conditions
 
         # end of method
         return req_metadata_conditions.json()
@@ -123,24 +111,12 @@ class ApiCondition:
         else:
             pass
 
-        # condition route
-        url_condition = utils.get_request_base_url(
-            route="resources/{}/conditions/{}".format(metadata_id, condition_id)
-        )
-
         # request
-        req_condition = self.api_client.get(
-            url=url_condition,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_condition = self.api_client.execute(
+            "GET", route="resources/{}/conditions/{}".format(metadata_id, condition_id)
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_condition)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_condition, tuple):
+            return req_condition
 
         # extend response with uuid of prent metadata
         condition_returned = req_condition.json()
@@ -176,25 +152,14 @@ class ApiCondition:
         else:
             pass
 
-        # URL
-        url_condition_create = utils.get_request_base_url(
-            route="resources/{}/conditions".format(metadata._id)
-        )
-
         # request
-        req_condition_create = self.api_client.post(
-            url=url_condition_create,
+        req_condition_create = self.api_client.execute(
+            "POST",
+            route="resources/{}/conditions".format(metadata._id),
             json=condition.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_condition_create)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_condition_create, tuple):
+            return req_condition_create
 
         # extend response with uuid of prent metadata
         condition_returned = req_condition_create.json()
@@ -226,25 +191,12 @@ class ApiCondition:
         else:
             pass
 
-        # URL
-        url_condition_delete = utils.get_request_base_url(
-            route="resources/{}/conditions/{}".format(metadata._id, condition._id)
-        )
-
         # request
-        req_condition_delete = self.api_client.delete(
-            url=url_condition_delete,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_condition_delete = self.api_client.execute(
+            "DELETE",
+            route="resources/{}/conditions/{}".format(metadata._id, condition._id),
         )
 
-        # checking response
-        req_check = checker.check_api_response(req_condition_delete)
-        if isinstance(req_check, tuple):
-            return req_check
-
         # end of method
         return req_condition_delete
 
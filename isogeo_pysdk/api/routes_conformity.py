@@ -78,24 +78,12 @@ class ApiConformity:
         else:
             pass
 
-        # URL
-        url_metadata_conformities = utils.get_request_base_url(
-            route="resources/{}/specifications/".format(metadata_id)
-        )
-
         # request
-        req_metadata_conformities = self.api_client.get(
-            url=url_metadata_conformities,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_metadata_conformities = self.api_client.execute(
+            "GET", route="resources/{}/specifications/".format(metadata_id)
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_metadata_conformities)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_metadata_conformities, tuple):
+            return req_metadata_conformities
 
         # end of method
         return req_metadata_conformities.json()
@@ -125,27 +113,16 @@ class ApiConformity:
         else:
             pass
 
-        # URL
-        url_conformity_create = utils.get_request_base_url(
+        # request
+        req_conformity_create = self.api_client.execute(
+            "PUT",
             route="resources/{}/specifications/{}".format(
                 metadata._id, conformity.specification._id
-            )
-        )
-
-        # request
-        req_conformity_create = self.api_client.put(
-            url=url_conformity_create,
+            ),
             json=conformity.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_conformity_create)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_conformity_create, tuple):
+            return req_conformity_create
 
         # extend response with uuid of prent metadata
         conformity_returned = req_conformity_create.json()
@@ -197,27 +174,14 @@ class ApiConformity:
         else:
             pass
 
-        # URL
-        url_conformity_delete = utils.get_request_base_url(
+        # request
+        req_conformity_delete = self.api_client.execute(
+            "DELETE",
             route="resources/{}/specifications/{}".format(
                 metadata._id, specification_id
-            )
+            ),
         )
 
-        # request
-        req_conformity_delete = self.api_client.delete(
-            url=url_conformity_delete,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
-        )
-
-        # checking response
-        req_check = checker.check_api_response(req_conformity_delete)
-        if isinstance(req_check, tuple):
-            return req_check
-
         # end of method
         return req_conformity_delete
 
@@ -84,25 +84,12 @@ class ApiContact:
         else:
             payload = None
 
-        # request URL
-        url_contacts = utils.get_request_base_url(
-            route="groups/{}/contacts".format(workgroup_id)
-        )
-
         # request
-        req_wg_contacts = self.api_client.get(
-            url_contacts,
-            headers=self.api_client.header,
-            params=payload,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_wg_contacts = self.api_client.execute(
+            "GET", route="groups/{}/contacts".format(workgroup_id), params=payload
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_wg_contacts)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_wg_contacts, tuple):
+            return req_wg_contacts
 
         wg_contacts = req_wg_contacts.json()
 
@@ -131,22 +118,12 @@ class ApiContact:
         else:
             pass
 
-        # contact route
-        url_contact = utils.get_request_base_url(route="contacts/{}".format(contact_id))
-
         # request
-        req_contact = self.api_client.get(
-            url_contact,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_contact = self.api_client.execute(
+            "GET", route="contacts/{}".format(contact_id)
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_contact)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_contact, tuple):
+            return req_contact
 
         # end of method
         return Contact(**req_contact.json())
@@ -208,25 +185,14 @@ class ApiContact:
         else:
             pass
 
-        # build request url
-        url_contact_create = utils.get_request_base_url(
-            route="groups/{}/contacts".format(workgroup_id)
-        )
-
         # request
-        req_new_contact = self.api_client.post(
-            url_contact_create,
+        req_new_contact = self.api_client.execute(
+            "POST",
+            route="groups/{}/contacts".format(workgroup_id),
             json=contact.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_new_contact)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_new_contact, tuple):
+            return req_new_contact
 
         # load new contact and save it to the cache
         new_contact = Contact(**req_new_contact.json())
@@ -257,25 +223,11 @@ class ApiContact:
         else:
             pass
 
-        # request URL
-        url_contact_delete = utils.get_request_base_url(
-            route="groups/{}/contacts/{}".format(workgroup_id, contact_id)
-        )
-
         # request
-        req_contact_deletion = self.api_client.delete(
-            url_contact_delete,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_contact_deletion = self.api_client.execute(
+            "DELETE", route="groups/{}/contacts/{}".format(workgroup_id, contact_id)
         )
 
-        # checking response
-        req_check = checker.check_api_response(req_contact_deletion)
-        if isinstance(req_check, tuple):
-            return req_check
-
         return req_contact_deletion
 
     @ApiDecorators._check_bearer_validity
@@ -296,18 +248,7 @@ class ApiContact:
         )
 
         # request
-        req_contact_exists = self.api_client.get(
-            url_contact_exists,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
-        )
-
-        # checking response
-        req_check = checker.check_api_response(req_contact_exists)
-        if isinstance(req_check, tuple):
-            return req_check
+        req_contact_exists = self.api_client.execute("GET", url=url_contact_exists)
 
         return req_contact_exists
 
@@ -324,25 +265,14 @@ class ApiContact:
         else:
             pass
 
-        # URL
-        url_contact_update = utils.get_request_base_url(
-            route="groups/{}/contacts/{}".format(contact.owner.get("_id"), contact._id)
-        )
-
         # request
-        req_contact_update = self.api_client.put(
-            url=url_contact_update,
+        req_contact_update = self.api_client.execute(
+            "PUT",
+            route="groups/{}/contacts/{}".format(contact.owner.get("_id"), contact._id),
             json=contact.to_dict(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_contact_update)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_contact_update, tuple):
+            return req_contact_update
 
         # update contact in cache
         new_contact = Contact(**req_contact_update.json())
@@ -408,26 +338,13 @@ class ApiContact:
         else:
             pass
 
-        # URL
-        url_contact_association = utils.get_request_base_url(
-            route="resources/{}/contacts/{}".format(metadata._id, contact._id)
-        )
-
         # request
-        req_contact_association = self.api_client.put(
-            url=url_contact_association,
+        req_contact_association = self.api_client.execute(
+            "PUT",
+            route="resources/{}/contacts/{}".format(metadata._id, contact._id),
             json={"role": role},
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
 
-        # checking response
-        req_check = checker.check_api_response(req_contact_association)
-        if isinstance(req_check, tuple):
-            return req_check
-
         # end of method
         return req_contact_association
 
@@ -454,25 +371,11 @@ class ApiContact:
         else:
             pass
 
-        # URL
-        url_contact_dissociation = utils.get_request_base_url(
-            route="resources/{}/contacts/{}".format(metadata._id, contact._id)
-        )
-
         # request
-        req_contact_dissociation = self.api_client.delete(
-            url=url_contact_dissociation,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_contact_dissociation = self.api_client.execute(
+            "DELETE", route="resources/{}/contacts/{}".format(metadata._id, contact._id)
         )
 
-        # checking response
-        req_check = checker.check_api_response(req_contact_dissociation)
-        if isinstance(req_check, tuple):
-            return req_check
-
         # end of method
         return req_contact_dissociation
 
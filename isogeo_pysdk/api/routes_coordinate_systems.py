@@ -97,18 +97,11 @@ class ApiCoordinateSystem:
             )
 
         # request
-        req_coordinate_systems = self.api_client.get(
-            url=url_coordinate_systems,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_coordinate_systems = self.api_client.execute(
+            "GET", url=url_coordinate_systems
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_coordinate_systems)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_coordinate_systems, tuple):
+            return req_coordinate_systems
 
         coordinate_systems = req_coordinate_systems.json()
 
@@ -167,18 +160,11 @@ class ApiCoordinateSystem:
             )
 
         # request
-        req_coordinate_system = self.api_client.get(
-            url=url_coordinate_system,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_coordinate_system = self.api_client.execute(
+            "GET", url=url_coordinate_system
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_coordinate_system)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_coordinate_system, tuple):
+            return req_coordinate_system
 
         # end of method
         return CoordinateSystem(**req_coordinate_system.json())
@@ -223,25 +209,14 @@ class ApiCoordinateSystem:
         else:
             pass
 
-        # URL
-        url_srs_association = utils.get_request_base_url(
-            route="resources/{}/coordinate-system".format(metadata._id)
-        )
-
         # request
-        req_srs_association = self.api_client.put(
-            url=url_srs_association,
+        req_srs_association = self.api_client.execute(
+            "PUT",
+            route="resources/{}/coordinate-system".format(metadata._id),
             json=coordinate_system.to_dict(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_srs_association)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_srs_association, tuple):
+            return req_srs_association
 
         # end of method
         return CoordinateSystem(**req_srs_association.json())
@@ -260,25 +235,11 @@ class ApiCoordinateSystem:
         else:
             pass
 
-        # URL
-        url_coordinateSystem_dissociation = utils.get_request_base_url(
-            route="resources/{}/coordinate-system".format(metadata._id)
-        )
-
         # request
-        req_coordinateSystem_dissociation = self.api_client.delete(
-            url=url_coordinateSystem_dissociation,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_coordinateSystem_dissociation = self.api_client.execute(
+            "DELETE", route="resources/{}/coordinate-system".format(metadata._id)
         )
 
-        # checking response
-        req_check = checker.check_api_response(req_coordinateSystem_dissociation)
-        if isinstance(req_check, tuple):
-            return req_check
-
         # end of method
         return req_coordinateSystem_dissociation
 
@@ -315,27 +276,16 @@ class ApiCoordinateSystem:
         else:
             pass
 
-        # request URL
-        url_coordinate_system_association = utils.get_request_base_url(
+        # request
+        req_coordinate_system = self.api_client.execute(
+            "PUT",
             route="groups/{}/coordinate-systems/{}".format(
                 workgroup._id, coordinate_system.code
-            )
-        )
-
-        # request
-        req_coordinate_system = self.api_client.put(
-            url=url_coordinate_system_association,
+            ),
             json={"alias": coordinate_system.alias},
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_coordinate_system)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_coordinate_system, tuple):
+            return req_coordinate_system
 
         # end of method
         return CoordinateSystem(**req_coordinate_system.json())
@@ -366,27 +316,14 @@ class ApiCoordinateSystem:
         else:
             pass
 
-        # request URL
-        url_coordinate_system_dissociation = utils.get_request_base_url(
+        # request
+        req_coordinate_system_dissociation = self.api_client.execute(
+            "DELETE",
             route="groups/{}/coordinate-systems/{}".format(
                 workgroup_id, coordinate_system_code
-            )
+            ),
         )
 
-        # request
-        req_coordinate_system_dissociation = self.api_client.delete(
-            url=url_coordinate_system_dissociation,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
-        )
-
-        # checking response
-        req_check = checker.check_api_response(req_coordinate_system_dissociation)
-        if isinstance(req_check, tuple):
-            return req_check
-
         # end of method
         return req_coordinate_system_dissociation
 
@@ -80,25 +80,12 @@ class ApiDatasource:
         else:
             payload = None
 
-        # request URL
-        url_datasources = utils.get_request_base_url(
-            route="groups/{}/data-sources".format(workgroup_id)
-        )
-
         # request
-        req_wg_datasources = self.api_client.get(
-            url=url_datasources,
-            headers=self.api_client.header,
-            params=payload,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_wg_datasources = self.api_client.execute(
+            "GET", route="groups/{}/data-sources".format(workgroup_id), params=payload
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_wg_datasources)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_wg_datasources, tuple):
+            return req_wg_datasources
 
         wg_datasources = req_wg_datasources.json()
 
@@ -129,24 +116,12 @@ class ApiDatasource:
         else:
             pass
 
-        # datasource route
-        url_datasource = utils.get_request_base_url(
-            route="groups/{}/data-sources/{}".format(workgroup_id, datasource_id)
-        )
-
         # request
-        req_datasource = self.api_client.get(
-            url=url_datasource,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_datasource = self.api_client.execute(
+            "GET", route="groups/{}/data-sources/{}".format(workgroup_id, datasource_id)
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_datasource)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_datasource, tuple):
+            return req_datasource
 
         # end of method
         return Datasource(**req_datasource.json())
@@ -211,25 +186,14 @@ class ApiDatasource:
         else:
             pass
 
-        # build request url
-        url_datasource_create = utils.get_request_base_url(
-            route="groups/{}/data-sources".format(workgroup_id)
-        )
-
         # request
-        req_new_datasource = self.api_client.post(
-            url=url_datasource_create,
+        req_new_datasource = self.api_client.execute(
+            "POST",
+            route="groups/{}/data-sources".format(workgroup_id),
             json=datasource.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_new_datasource)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_new_datasource, tuple):
+            return req_new_datasource
 
         # load new datasource and save it to the cache
         new_datasource = Datasource(**req_new_datasource.json())
@@ -264,25 +228,12 @@ class ApiDatasource:
         else:
             pass
 
-        # request URL
-        url_datasource_delete = utils.get_request_base_url(
-            route="groups/{}/data-sources/{}".format(workgroup_id, datasource_id)
-        )
-
         # request
-        req_datasource_deletion = self.api_client.delete(
-            url=url_datasource_delete,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_datasource_deletion = self.api_client.execute(
+            "DELETE",
+            route="groups/{}/data-sources/{}".format(workgroup_id, datasource_id),
         )
 
-        # checking response
-        req_check = checker.check_api_response(req_datasource_deletion)
-        if isinstance(req_check, tuple):
-            return req_check
-
         return req_datasource_deletion
 
     @ApiDecorators._check_bearer_validity
@@ -308,25 +259,11 @@ class ApiDatasource:
         else:
             pass
 
-        # URL
-        url_datasource_exists = utils.get_request_base_url(
-            route="groups/{}/data-sources/{}".format(workgroup_id, datasource_id)
-        )
-
         # request
-        req_datasource_exists = self.api_client.get(
-            url=url_datasource_exists,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_datasource_exists = self.api_client.execute(
+            "GET", route="groups/{}/data-sources/{}".format(workgroup_id, datasource_id)
         )
 
-        # checking response
-        req_check = checker.check_api_response(req_datasource_exists)
-        if isinstance(req_check, tuple):
-            return req_check
-
         return req_datasource_exists
 
     @ApiDecorators._check_bearer_validity
@@ -355,25 +292,14 @@ class ApiDatasource:
         else:
             pass
 
-        # URL
-        url_datasource_update = utils.get_request_base_url(
-            route="groups/{}/data-sources/{}".format(workgroup_id, datasource._id)
-        )
-
         # request
-        req_datasource_update = self.api_client.put(
-            url=url_datasource_update,
+        req_datasource_update = self.api_client.execute(
+            "PUT",
+            route="groups/{}/data-sources/{}".format(workgroup_id, datasource._id),
             json=datasource.to_dict(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_datasource_update)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_datasource_update, tuple):
+            return req_datasource_update
 
         # update datasource in cache
         new_datasource = Datasource(**req_datasource_update.json())
@@ -62,22 +62,10 @@ class ApiDirective:
 
         :param bool caching: option to cache the response
         """
-        # request URL
-        url_directives = utils.get_request_base_url(route="directives")
-
         # request
-        req_directives = self.api_client.get(
-            url=url_directives,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
-        )
-
-        # checking response
-        req_check = checker.check_api_response(req_directives)
-        if isinstance(req_check, tuple):
-            return req_check
+        req_directives = self.api_client.execute("GET", route="directives")
+        if isinstance(req_directives, tuple):
+            return req_directives
 
         directives = req_directives.json()
 
@@ -63,24 +63,12 @@ class ApiEvent:
 
         :param Metadata metadata: metadata (resource) to edit
         """
-        # URL
-        url_events = utils.get_request_base_url(
-            route="resources/{}/events".format(metadata._id)
-        )
-
         # request
-        req_events = self.api_client.get(
-            url=url_events,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_events = self.api_client.execute(
+            "GET", route="resources/{}/events".format(metadata._id)
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_events)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_events, tuple):
+            return req_events
 
         # end of method
         return req_events.json()
@@ -106,24 +94,12 @@ class ApiEvent:
         else:
             pass
 
-        # URL
-        url_event = utils.get_request_base_url(
-            route="resources/{}/events/{}".format(metadata_id, event_id)
-        )
-
         # request
-        req_event = self.api_client.get(
-            url=url_event,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            timeout=self.api_client.timeout,
-            verify=self.api_client.ssl,
+        req_event = self.api_client.execute(
+            "GET", route="resources/{}/events/{}".format(metadata_id, event_id)
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_event)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_event, tuple):
+            return req_event
 
         # add parent resource id to keep tracking
         event_augmented = req_event.json()
@@ -180,29 +156,18 @@ class ApiEvent:
             event.description = None
             logger.warning("Event comments are not allowed for creation dates")
 
-        # URL
-        url_event_create = utils.get_request_base_url(
-            route="resources/{}/events".format(metadata._id)
-        )
-
         # request
-        req_new_event = self.api_client.post(
-            url=url_event_create,
+        req_new_event = self.api_client.execute(
+            "POST",
+            route="resources/{}/events".format(metadata._id),
             json={
                 "date": event.date,
                 "description": event.description,
                 "kind": event.kind,
             },
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_new_event)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_new_event, tuple):
+            return req_new_event
 
         # add parent resource id to keep tracking
         event_augmented = req_new_event.json()
@@ -232,25 +197,12 @@ class ApiEvent:
         else:
             pass
 
-        # URL
-        url_event_delete = utils.get_request_base_url(
-            route="resources/{}/events/{}".format(event.parent_resource, event._id)
-        )
-
         # request
-        req_event_deletion = self.api_client.delete(
-            url=url_event_delete,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            timeout=self.api_client.timeout,
-            verify=self.api_client.ssl,
+        req_event_deletion = self.api_client.execute(
+            "DELETE",
+            route="resources/{}/events/{}".format(event.parent_resource, event._id),
         )
 
-        # checking response
-        req_check = checker.check_api_response(req_event_deletion)
-        if isinstance(req_check, tuple):
-            return req_check
-
         return req_event_deletion
 
     @ApiDecorators._check_bearer_validity
@@ -274,25 +226,14 @@ class ApiEvent:
         else:
             pass
 
-        # URL
-        url_event_update = utils.get_request_base_url(
-            route="resources/{}/events/{}".format(event.parent_resource, event._id)
-        )
-
         # request
-        req_event_update = self.api_client.put(
-            url=url_event_update,
+        req_event_update = self.api_client.execute(
+            "PUT",
+            route="resources/{}/events/{}".format(event.parent_resource, event._id),
             json=event.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_event_update)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_event_update, tuple):
+            return req_event_update
 
         # add parent resource id to keep tracking
         event_augmented = req_event_update.json()
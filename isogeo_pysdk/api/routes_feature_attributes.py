@@ -70,24 +70,12 @@ class ApiFeatureAttribute:
             )
         else:
             pass
-        # URL
-        url_feature_attributes = utils.get_request_base_url(
-            route="resources/{}/feature-attributes/".format(metadata._id)
-        )
-
         # request
-        req_feature_attributes = self.api_client.get(
-            url=url_feature_attributes,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_feature_attributes = self.api_client.execute(
+            "GET", route="resources/{}/feature-attributes/".format(metadata._id)
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_feature_attributes)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_feature_attributes, tuple):
+            return req_feature_attributes
 
         # end of method
         return req_feature_attributes.json()
@@ -126,24 +114,15 @@ class ApiFeatureAttribute:
         else:
             pass
 
-        # URL
-        url_feature_attribute = utils.get_request_base_url(
-            route="resources/{}/feature-attributes/{}".format(metadata_id, attribute_id)
-        )
-
         # request
-        req_feature_attribute = self.api_client.get(
-            url=url_feature_attribute,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            timeout=self.api_client.timeout,
-            verify=self.api_client.ssl,
+        req_feature_attribute = self.api_client.execute(
+            "GET",
+            route="resources/{}/feature-attributes/{}".format(
+                metadata_id, attribute_id
+            ),
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_feature_attribute)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_feature_attribute, tuple):
+            return req_feature_attribute
 
         # add parent resource id to keep tracking
         feature_attribute_augmented = req_feature_attribute.json()
@@ -207,25 +186,14 @@ class ApiFeatureAttribute:
             )
             attribute.dataType = ""
 
-        # URL
-        url_feature_attribute_create = utils.get_request_base_url(
-            route="resources/{}/feature-attributes/".format(metadata._id)
-        )
-
         # request
-        req_new_feature_attribute = self.api_client.post(
-            url=url_feature_attribute_create,
+        req_new_feature_attribute = self.api_client.execute(
+            "POST",
+            route="resources/{}/feature-attributes/".format(metadata._id),
             json=attribute.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_new_feature_attribute)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_new_feature_attribute, tuple):
+            return req_new_feature_attribute
 
         # add parent resource id to keep tracking
         feature_attribute_augmented = req_new_feature_attribute.json()
@@ -259,27 +227,14 @@ class ApiFeatureAttribute:
         else:
             pass
 
-        # URL
-        url_feature_attribute_delete = utils.get_request_base_url(
+        # request
+        req_feature_attribute_deletion = self.api_client.execute(
+            "DELETE",
             route="resources/{}/feature-attributes/{}".format(
                 attribute.parent_resource, attribute._id
-            )
-        )
-
-        # request
-        req_feature_attribute_deletion = self.api_client.delete(
-            url=url_feature_attribute_delete,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            timeout=self.api_client.timeout,
-            verify=self.api_client.ssl,
+            ),
         )
 
-        # checking response
-        req_check = checker.check_api_response(req_feature_attribute_deletion)
-        if isinstance(req_check, tuple):
-            return req_check
-
         return req_feature_attribute_deletion
 
     @ApiDecorators._check_bearer_validity
@@ -309,27 +264,16 @@ class ApiFeatureAttribute:
         else:
             pass
 
-        # URL
-        url_feature_attribute_update = utils.get_request_base_url(
+        # request
+        req_feature_attribute_update = self.api_client.execute(
+            "PUT",
             route="resources/{}/feature-attributes/{}".format(
                 attribute.parent_resource, attribute._id
-            )
-        )
-
-        # request
-        req_feature_attribute_update = self.api_client.put(
-            url=url_feature_attribute_update,
+            ),
             json=attribute.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_feature_attribute_update)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_feature_attribute_update, tuple):
+            return req_feature_attribute_update
 
         # add parent resource id to keep tracking
         feature_attribute_augmented = req_feature_attribute_update.json()
@@ -23,6 +23,7 @@ from isogeo_pysdk.checker import IsogeoChecker
 from isogeo_pysdk.decorators import ApiDecorators
 from isogeo_pysdk.enums import MetadataTypes
 from isogeo_pysdk.models import Format
+from isogeo_pysdk.paginator import IsogeoPaginator
 from isogeo_pysdk.utils import IsogeoUtils
 
 # #############################################################################
@@ -113,18 +114,9 @@ class ApiFormat:
             logger.debug("Listing all available geographic formats...")
 
         # request
-        req_formats = self.api_client.get(
-            url=url_formats,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
-        )
-
-        # checking response
-        req_check = checker.check_api_response(req_formats)
-        if isinstance(req_check, tuple):
-            return req_check
+        req_formats = self.api_client.execute("GET", url=url_formats)
+        if isinstance(req_formats, tuple):
+            return req_formats
 
         # cache
         if caching:
@@ -166,22 +158,12 @@ class ApiFormat:
         }
         """
 
-        # format route
-        url_format = utils.get_request_base_url(route="formats/{}".format(format_code))
-
         # request
-        req_format = self.api_client.get(
-            url=url_format,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_format = self.api_client.execute(
+            "GET", route="formats/{}".format(format_code)
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_format)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_format, tuple):
+            return req_format
 
         # end of method
         return Format(**req_format.json())
@@ -232,23 +214,12 @@ class ApiFormat:
         else:
             pass
 
-        # URL
-        url_format_create = utils.get_request_base_url(route="formats")
-
         # request
-        req_new_format = self.api_client.post(
-            url=url_format_create,
-            json=frmt.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            timeout=self.api_client.timeout,
-            verify=self.api_client.ssl,
+        req_new_format = self.api_client.execute(
+            "POST", route="formats", json=frmt.to_dict_creation()
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_new_format)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_new_format, tuple):
+            return req_new_format
 
         # update cache
         self.api_client._formats_geo.append(req_new_format.json())
@@ -262,24 +233,12 @@ class ApiFormat:
 
         :param Format frmt: Format model object to delete
         """
-        # URL
-        url_format_delete = utils.get_request_base_url(
-            route="formats/{}".format(frmt.code)
-        )
-
         # request
-        req_format_deletion = self.api_client.delete(
-            url=url_format_delete,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            timeout=self.api_client.timeout,
-            verify=self.api_client.ssl,
+        req_format_deletion = self.api_client.execute(
+            "DELETE", route="formats/{}".format(frmt.code)
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_format_deletion)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_format_deletion, tuple):
+            return req_format_deletion
 
         # update cache
         self.listing()
@@ -313,25 +272,12 @@ class ApiFormat:
         else:
             pass
 
-        # URL
-        url_format_update = utils.get_request_base_url(
-            route="formats/{}".format(frmt.code)
-        )
-
         # request
-        req_format_update = self.api_client.put(
-            url=url_format_update,
-            json=frmt.to_dict(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_format_update = self.api_client.execute(
+            "PUT", route="formats/{}".format(frmt.code), json=frmt.to_dict()
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_format_update)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_format_update, tuple):
+            return req_format_update
 
         # update cache
         self.listing()
@@ -342,13 +288,19 @@ class ApiFormat:
     # -- Routes to manage the formats for non geographic dataset ------------------------------------
     @ApiDecorators._check_bearer_validity
     def nogeo_search(
-        self, query: str = None, page_size: int = 10, offset: int = 0
+        self,
+        query: str = None,
+        page_size: int = 10,
+        offset: int = 0,
+        whole_results: bool = False,
     ) -> list:
         """Search within data formats available in Isogeo API for NON GEOGRAPHICAL DATA ONLY.
 
         :param str query: search terms. Equivalent of **q** parameter in Isogeo API.
         :param int page_size: limits the number of results. Useful to paginate results display. Default value: 10. Max value: 100.
         :param int offset: offset to start page size from a specific results index
+        :param bool whole_results: option to return all results, requested in parallel \
+            pages of 100, instead of only the page size. *False* by DEFAULT.
 
         :returns: list of dicts
         :rtype: list
@@ -377,22 +329,35 @@ class ApiFormat:
             route="formats/resource/search"
         )
 
-        # request
-        req_formats_search_nogeo = self.api_client.get(
-            url=url_formats_search_nogeo,
-            headers=self.api_client.header,
-            params=payload,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
-        )
-
-        # checking response
-        req_check = checker.check_api_response(req_formats_search_nogeo)
-        if isinstance(req_check, tuple):
-            return req_check
+        # request every page through the pagination engine. Total is not returned by the API.
+        if whole_results:
+            pages = IsogeoPaginator(
+                fetch_page=lambda offset, limit: self._nogeo_search_page(
+                    url=url_formats_search_nogeo,
+                    payload=dict(payload, _offset=offset, _limit=limit),
+                )
+            ).collect(offset=offset)
+            if isinstance(pages, tuple):
+                return pages
+            return [frmt for page in pages for frmt in page]
 
         # end of method
+        return self._nogeo_search_page(url=url_formats_search_nogeo, payload=payload)
+
+    def _nogeo_search_page(self, url: str, payload: dict) -> list:
+        """Request a single page of formats for non geographical data.
+
+        :param str url: formats search URL
+        :param dict payload: request parameters
+
+        :rtype: list
+        """
+        req_formats_search_nogeo = self.api_client.execute(
+            "GET", url=url, params=payload
+        )
+        if isinstance(req_formats_search_nogeo, tuple):
+            return req_formats_search_nogeo
+
         return req_formats_search_nogeo.json()
 
 
@@ -72,24 +72,12 @@ class ApiInvitation:
         else:
             pass
 
-        # URL builder
-        url_workgroup_invitations = utils.get_request_base_url(
-            route="groups/{}/invitations".format(workgroup_id)
-        )
-
         # request
-        req_workgroup_invitations = self.api_client.get(
-            url=url_workgroup_invitations,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_workgroup_invitations = self.api_client.execute(
+            "GET", route="groups/{}/invitations".format(workgroup_id)
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_workgroup_invitations)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_workgroup_invitations, tuple):
+            return req_workgroup_invitations
 
         return req_workgroup_invitations.json()
 
@@ -112,25 +100,14 @@ class ApiInvitation:
         >>> # send the invitation
         >>> isogeo.invitation.create(WORKGROUP_UUID, new_invit)
         """
-        # URL
-        url_invitation_create = utils.get_request_base_url(
-            route="groups/{}/invitations".format(workgroup_id)
-        )
-
         # request
-        req_new_invitation = self.api_client.post(
-            url=url_invitation_create,
+        req_new_invitation = self.api_client.execute(
+            "POST",
+            route="groups/{}/invitations".format(workgroup_id),
             data=invitation.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_new_invitation)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_new_invitation, tuple):
+            return req_new_invitation
 
         # end of method
         return Invitation(**req_new_invitation.json())
@@ -148,24 +125,12 @@ class ApiInvitation:
         else:
             pass
 
-        # URL
-        url_invitation = utils.get_request_base_url(
-            route="invitations/{}".format(invitation_id)
-        )
-
         # request
-        req_invitation = self.api_client.get(
-            url=url_invitation,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_invitation = self.api_client.execute(
+            "GET", route="invitations/{}".format(invitation_id)
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_invitation)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_invitation, tuple):
+            return req_invitation
 
         # end of method
         return Invitation(**req_invitation.json())
@@ -176,24 +141,12 @@ class ApiInvitation:
 
         :param class invitation: Invitation model object to accept
         """
-        # URL
-        url_invitation_accept = utils.get_request_base_url(
-            route="invitations/{}/accept".format(invitation._id)
-        )
-
         # request
-        req_new_invitation = self.api_client.post(
-            url=url_invitation_accept,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_new_invitation = self.api_client.execute(
+            "POST", route="invitations/{}/accept".format(invitation._id)
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_new_invitation)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_new_invitation, tuple):
+            return req_new_invitation
 
         print(req_new_invitation.json())
 
@@ -212,24 +165,12 @@ class ApiInvitation:
 
         :param class invitation: Invitation model object to decline
         """
-        # URL
-        url_invitation_refuse = utils.get_request_base_url(
-            route="invitations/{}/refuse".format(invitation._id)
-        )
-
         # request
-        req_new_invitation = self.api_client.post(
-            url=url_invitation_refuse,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_new_invitation = self.api_client.execute(
+            "POST", route="invitations/{}/refuse".format(invitation._id)
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_new_invitation)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_new_invitation, tuple):
+            return req_new_invitation
 
         print(req_new_invitation.json())
 
@@ -256,25 +197,11 @@ class ApiInvitation:
         else:
             pass
 
-        # URL
-        url_invitation_delete = utils.get_request_base_url(
-            route="invitations/{}".format(invitation_id)
-        )
-
         # request
-        req_invitation_deletion = self.api_client.delete(
-            url=url_invitation_delete,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_invitation_deletion = self.api_client.execute(
+            "DELETE", route="invitations/{}".format(invitation_id)
         )
 
-        # checking response
-        req_check = checker.check_api_response(req_invitation_deletion)
-        if isinstance(req_check, tuple):
-            return req_check
-
         return req_invitation_deletion
 
     @ApiDecorators._check_bearer_validity
@@ -291,25 +218,14 @@ class ApiInvitation:
         else:
             pass
 
-        # URL
-        url_invitation_update = utils.get_request_base_url(
-            route="invitations/{}".format(invitation._id)
-        )
-
         # request
-        req_invitation_update = self.api_client.put(
-            url=url_invitation_update,
+        req_invitation_update = self.api_client.execute(
+            "PUT",
+            route="invitations/{}".format(invitation._id),
             json=invitation.to_dict(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_invitation_update)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_invitation_update, tuple):
+            return req_invitation_update
 
         # end of method
         return Invitation(**req_invitation_update.json())
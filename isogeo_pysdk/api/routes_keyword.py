@@ -17,6 +17,7 @@ import logging
 from isogeo_pysdk.checker import IsogeoChecker
 from isogeo_pysdk.decorators import ApiDecorators
 from isogeo_pysdk.models import Keyword, KeywordSearch, Metadata
+from isogeo_pysdk.paginator import IsogeoPaginator
 from isogeo_pysdk.utils import IsogeoUtils
 
 # #############################################################################
@@ -86,25 +87,12 @@ class ApiKeyword:
         else:
             payload = None
 
-        # URL
-        url_metadata_keywords = utils.get_request_base_url(
-            route="resources/{}/keywords/".format(metadata_id)
-        )
-
         # request
-        req_metadata_keywords = self.api_client.get(
-            url=url_metadata_keywords,
-            headers=self.api_client.header,
-            params=payload,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_metadata_keywords = self.api_client.execute(
+            "GET", route="resources/{}/keywords/".format(metadata_id), params=payload
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_metadata_keywords)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_metadata_keywords, tuple):
+            return req_metadata_keywords
 
         # end of method
         return req_metadata_keywords.json()
@@ -121,6 +109,7 @@ class ApiKeyword:
         specific_md: list = [],
         specific_tag: list = [],
         include: tuple = ("_abilities", "count"),
+        whole_results: bool = False,
         caching: bool = 1,
     ) -> KeywordSearch:
         """Search for keywords within a specific thesaurus or a specific group.
@@ -146,6 +135,9 @@ class ApiKeyword:
           * '_abilities'
           * 'count'
           * 'thesaurus'
+
+        :param bool whole_results: option to return all results from the offset, requested \
+            in parallel pages of 100, instead of only the page size. *False* by DEFAULT.
         """
         # specific resources specific parsing
         specific_md = checker._check_filter_specific_md(specific_md)
@@ -171,23 +163,12 @@ class ApiKeyword:
             route="thesauri/{}/keywords/search".format(thesaurus_id)
         )
 
-        # request
-        req_thesaurus_keywords = self.api_client.get(
-            url=url_thesauri_keywords,
-            headers=self.api_client.header,
-            params=payload,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
-        )
-
-        # checking response
-        req_check = checker.check_api_response(req_thesaurus_keywords)
-        if isinstance(req_check, tuple):
-            return req_check
+        # request every page through the pagination engine
+        if whole_results:
+            return self._keywords_whole_results(url=url_thesauri_keywords, payload=payload)
 
         # end of method
-        return KeywordSearch(**req_thesaurus_keywords.json())
+        return self._keywords_page(url=url_thesauri_keywords, payload=payload)
 
     @ApiDecorators._check_bearer_validity
     def workgroup(
@@ -202,6 +183,7 @@ class ApiKeyword:
         specific_md: list = [],
         specific_tag: list = [],
         include: tuple = ("_abilities", "count", "thesaurus"),
+        whole_results: bool = False,
         caching: bool = 1,
     ) -> KeywordSearch:
         """Search for keywords within a specific group's used thesauri.
@@ -228,6 +210,9 @@ class ApiKeyword:
           * '_abilities'
           * 'count'
           * 'thesaurus'
+
+        :param bool whole_results: option to return all results from the offset, requested \
+            in parallel pages of 100, instead of only the page size. *False* by DEFAULT.
         """
         # check workgroup UUID
         if not checker.check_is_uuid(workgroup_id):
@@ -260,23 +245,52 @@ class ApiKeyword:
             route="groups/{}/keywords/search".format(workgroup_id)
         )
 
-        # request
-        req_thesaurus_keywords = self.api_client.get(
-            url=url_workgroup_keywords,
-            headers=self.api_client.header,
-            params=payload,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
-        )
-
-        # checking response
-        req_check = checker.check_api_response(req_thesaurus_keywords)
-        if isinstance(req_check, tuple):
-            return req_check
+        # request every page through the pagination engine
+        if whole_results:
+            return self._keywords_whole_results(url=url_workgroup_keywords, payload=payload)
 
         # end of method
-        return KeywordSearch(**req_thesaurus_keywords.json())
+        return self._keywords_page(url=url_workgroup_keywords, payload=payload)
+
+    def _keywords_page(self, url: str, payload: dict) -> KeywordSearch:
+        """Request a single page of keywords search.
+
+        :param str url: keywords search URL
+        :param dict payload: request parameters
+
+        :rtype: KeywordSearch
+        """
+        req_keywords = self.api_client.execute("GET", url=url, params=payload)
+        if isinstance(req_keywords, tuple):
+            return req_keywords
+
+        return KeywordSearch(**req_keywords.json())
+
+    def _keywords_whole_results(
+        self, url: str, payload: dict, max_workers: int = 5
+    ) -> KeywordSearch:
+        """Request every page of a keywords search, from the payload offset, and merge them.
+
+        :param str url: keywords search URL
+        :param dict payload: request parameters. `_limit` and `_offset` are set for each page.
+        :param int max_workers: maximum number of page requests in flight
+
+        :rtype: KeywordSearch
+        """
+        offset = payload.get("_offset") or 0
+        pages = IsogeoPaginator(
+            fetch_page=lambda offset, limit: self._keywords_page(
+                url=url, payload=dict(payload, _offset=offset, _limit=limit)
+            ),
+            max_workers=max_workers,
+        ).collect(offset=offset)
+        if isinstance(pages, tuple):
+            return pages
+
+        results = [keyword for page in pages for keyword in page.results]
+        return KeywordSearch(
+            limit=len(results), offset=offset, results=results, total=pages[0].total
+        )
 
     @ApiDecorators._check_bearer_validity
     def get(
@@ -308,23 +322,12 @@ class ApiKeyword:
         else:
             payload = None
 
-        # keyword route
-        url_keyword = utils.get_request_base_url(route="keywords/{}".format(keyword_id))
-
         # request
-        req_keyword = self.api_client.get(
-            url=url_keyword,
-            headers=self.api_client.header,
-            params=payload,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_keyword = self.api_client.execute(
+            "GET", route="keywords/{}".format(keyword_id), params=payload
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_keyword)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_keyword, tuple):
+            return req_keyword
 
         # end of method
         return Keyword(**req_keyword.json())
@@ -338,19 +341,12 @@ class ApiKeyword:
 
         :param Keyword keyword: Keyword model object to create
         """
-        # URL
-        url_keyword_create = utils.get_request_base_url(
-            route="thesauri/1616597fbc4348c8b11ef9d59cf594c8/keywords"
-        )
-
         # request
-        req_new_keyword = self.api_client.post(
-            url=url_keyword_create,
+        req_new_keyword = self.api_client.execute(
+            "POST",
+            route="thesauri/1616597fbc4348c8b11ef9d59cf594c8/keywords",
             json=keyword.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            timeout=self.api_client.timeout,
-            verify=self.api_client.ssl,
+            check=False,
         )
 
         # checking response
@@ -404,27 +400,14 @@ class ApiKeyword:
         else:
             pass
 
-        # URL
-        url_keyword_delete = utils.get_request_base_url(
+        # request
+        req_keyword_deletion = self.api_client.execute(
+            "DELETE",
             route="thesauri/1616597fbc4348c8b11ef9d59cf594c8/keywords/{}".format(
                 keyword._id
-            )
-        )
-
-        # request
-        req_keyword_deletion = self.api_client.delete(
-            url=url_keyword_delete,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            timeout=self.api_client.timeout,
-            verify=self.api_client.ssl,
+            ),
         )
 
-        # checking response
-        req_check = checker.check_api_response(req_keyword_deletion)
-        if isinstance(req_check, tuple):
-            return req_check
-
         return req_keyword_deletion
 
     # -- Routes to manage the related objects ------------------------------------------
@@ -502,18 +485,11 @@ class ApiKeyword:
         else:
             pass
 
-        # URL
-        url_keyword_associate = utils.get_request_base_url(
-            route="resources/{}/keywords/{}".format(metadata._id, keyword._id)
-        )
-
         # request
-        req_keyword_associate = self.api_client.post(
-            url=url_keyword_associate,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            timeout=self.api_client.timeout,
-            verify=self.api_client.ssl,
+        req_keyword_associate = self.api_client.execute(
+            "POST",
+            route="resources/{}/keywords/{}".format(metadata._id, keyword._id),
+            check=False,
         )
 
         # checking response
@@ -557,25 +533,11 @@ class ApiKeyword:
         else:
             pass
 
-        # URL
-        url_keyword_dissociate = utils.get_request_base_url(
-            route="resources/{}/keywords/{}".format(metadata._id, keyword._id)
-        )
-
         # request
-        req_keyword_dissociate = self.api_client.delete(
-            url=url_keyword_dissociate,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            timeout=self.api_client.timeout,
-            verify=self.api_client.ssl,
+        req_keyword_dissociate = self.api_client.execute(
+            "DELETE", route="resources/{}/keywords/{}".format(metadata._id, keyword._id)
         )
 
-        # checking response
-        req_check = checker.check_api_response(req_keyword_dissociate)
-        if isinstance(req_check, tuple):
-            return req_check
-
         # end of method
         return req_keyword_dissociate
 
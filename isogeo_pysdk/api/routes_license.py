@@ -84,25 +84,12 @@ class ApiLicense:
         else:
             payload = None
 
-        # request URL
-        url_licenses = utils.get_request_base_url(
-            route="groups/{}/licenses".format(workgroup_id)
-        )
-
         # request
-        req_wg_licenses = self.api_client.get(
-            url_licenses,
-            headers=self.api_client.header,
-            params=payload,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_wg_licenses = self.api_client.execute(
+            "GET", route="groups/{}/licenses".format(workgroup_id), params=payload
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_wg_licenses)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_wg_licenses, tuple):
+            return req_wg_licenses
 
         wg_licenses = req_wg_licenses.json()
 
@@ -127,22 +114,12 @@ class ApiLicense:
         else:
             pass
 
-        # license route
-        url_license = utils.get_request_base_url(route="licenses/{}".format(license_id))
-
         # request
-        req_license = self.api_client.get(
-            url=url_license,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_license = self.api_client.execute(
+            "GET", route="licenses/{}".format(license_id)
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_license)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_license, tuple):
+            return req_license
 
         # end of method
         return License(**req_license.json())
@@ -183,25 +160,14 @@ class ApiLicense:
         else:
             pass
 
-        # build request url
-        url_license_create = utils.get_request_base_url(
-            route="groups/{}/licenses".format(workgroup_id)
-        )
-
         # request
-        req_new_license = self.api_client.post(
-            url_license_create,
+        req_new_license = self.api_client.execute(
+            "POST",
+            route="groups/{}/licenses".format(workgroup_id),
             data=license.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_new_license)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_new_license, tuple):
+            return req_new_license
 
         # load new license and save it to the cache
         new_license = License(**req_new_license.json())
@@ -231,25 +197,11 @@ class ApiLicense:
         else:
             pass
 
-        # request URL
-        url_license_delete = utils.get_request_base_url(
-            route="groups/{}/licenses/{}".format(workgroup_id, license_id)
-        )
-
         # request
-        req_license_deletion = self.api_client.delete(
-            url_license_delete,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_license_deletion = self.api_client.execute(
+            "DELETE", route="groups/{}/licenses/{}".format(workgroup_id, license_id)
         )
 
-        # checking response
-        req_check = checker.check_api_response(req_license_deletion)
-        if isinstance(req_check, tuple):
-            return req_check
-
         return req_license_deletion
 
     @ApiDecorators._check_bearer_validity
@@ -270,18 +222,7 @@ class ApiLicense:
         )
 
         # request
-        req_license_exists = self.api_client.get(
-            url_license_exists,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
-        )
-
-        # checking response
-        req_check = checker.check_api_response(req_license_exists)
-        if isinstance(req_check, tuple):
-            return req_check
+        req_license_exists = self.api_client.execute("GET", url=url_license_exists)
 
         return req_license_exists
 
@@ -298,25 +239,14 @@ class ApiLicense:
         else:
             pass
 
-        # URL
-        url_license_update = utils.get_request_base_url(
-            route="groups/{}/licenses/{}".format(license.owner.get("_id"), license._id)
-        )
-
         # request
-        req_license_update = self.api_client.put(
-            url=url_license_update,
+        req_license_update = self.api_client.execute(
+            "PUT",
+            route="groups/{}/licenses/{}".format(license.owner.get("_id"), license._id),
             data=license.to_dict(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_license_update)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_license_update, tuple):
+            return req_license_update
 
         # update license in cache
         new_license = License(**req_license_update.json())
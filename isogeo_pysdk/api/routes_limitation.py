@@ -62,24 +62,12 @@ class ApiLimitation:
 
         :param Metadata metadata: metadata (resource)
         """
-        # request URL
-        url_limitations = utils.get_request_base_url(
-            route="resources/{}/limitations/".format(metadata._id)
-        )
-
         # request
-        req_limitations = self.api_client.get(
-            url=url_limitations,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_limitations = self.api_client.execute(
+            "GET", route="resources/{}/limitations/".format(metadata._id)
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_limitations)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_limitations, tuple):
+            return req_limitations
 
         # end of method
         return req_limitations.json()
@@ -116,24 +104,13 @@ class ApiLimitation:
         else:
             pass
 
-        # URL
-        url_limitation = utils.get_request_base_url(
-            route="resources/{}/limitations/{}".format(metadata_id, limitation_id)
-        )
-
         # request
-        req_limitation = self.api_client.get(
-            url=url_limitation,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            timeout=self.api_client.timeout,
-            verify=self.api_client.ssl,
+        req_limitation = self.api_client.execute(
+            "GET",
+            route="resources/{}/limitations/{}".format(metadata_id, limitation_id),
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_limitation)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_limitation, tuple):
+            return req_limitation
 
         # add parent resource id to keep tracking
         limitation_augmented = req_limitation.json()
@@ -189,25 +166,14 @@ class ApiLimitation:
                     "Limitation directive are not allowed for security limitations. Only description will be sent."
                 )
 
-        # URL
-        url_limitation_create = utils.get_request_base_url(
-            route="resources/{}/limitations/".format(metadata._id)
-        )
-
         # request
-        req_new_limitation = self.api_client.post(
-            url=url_limitation_create,
+        req_new_limitation = self.api_client.execute(
+            "POST",
+            route="resources/{}/limitations/".format(metadata._id),
             json=limitation.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_new_limitation)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_new_limitation, tuple):
+            return req_new_limitation
 
         # add parent resource id to keep tracking
         limitation_augmented = req_new_limitation.json()
@@ -239,27 +205,14 @@ class ApiLimitation:
         else:
             pass
 
-        # URL
-        url_limitation_delete = utils.get_request_base_url(
+        # request
+        req_limitation_deletion = self.api_client.execute(
+            "DELETE",
             route="resources/{}/limitations/{}".format(
                 limitation.parent_resource, limitation._id
-            )
+            ),
         )
 
-        # request
-        req_limitation_deletion = self.api_client.delete(
-            url=url_limitation_delete,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            timeout=self.api_client.timeout,
-            verify=self.api_client.ssl,
-        )
-
-        # checking response
-        req_check = checker.check_api_response(req_limitation_deletion)
-        if isinstance(req_check, tuple):
-            return req_check
-
         return req_limitation_deletion
 
     @ApiDecorators._check_bearer_validity
@@ -285,27 +238,16 @@ class ApiLimitation:
         else:
             pass
 
-        # URL
-        url_limitation_update = utils.get_request_base_url(
+        # request
+        req_limitation_update = self.api_client.execute(
+            "PUT",
             route="resources/{}/limitations/{}".format(
                 limitation.parent_resource, limitation._id
-            )
-        )
-
-        # request
-        req_limitation_update = self.api_client.put(
-            url=url_limitation_update,
+            ),
             json=limitation.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_limitation_update)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_limitation_update, tuple):
+            return req_limitation_update
 
         # add parent resource id to keep tracking
         limitation_augmented = req_limitation_update.json()
@@ -70,24 +70,12 @@ class ApiLink:
 
         :param Metadata metadata: metadata (resource)
         """
-        # request URL
-        url_links = utils.get_request_base_url(
-            route="resources/{}/links/".format(metadata._id)
-        )
-
         # request
-        req_links = self.api_client.get(
-            url=url_links,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_links = self.api_client.execute(
+            "GET", route="resources/{}/links/".format(metadata._id)
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_links)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_links, tuple):
+            return req_links
 
         # end of method
         return req_links.json()
@@ -130,24 +118,12 @@ class ApiLink:
         else:
             pass
 
-        # URL
-        url_link = utils.get_request_base_url(
-            route="resources/{}/links/{}".format(metadata_id, link_id)
-        )
-
         # request
-        req_link = self.api_client.get(
-            url=url_link,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            timeout=self.api_client.timeout,
-            verify=self.api_client.ssl,
+        req_link = self.api_client.execute(
+            "GET", route="resources/{}/links/{}".format(metadata_id, link_id)
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_link)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_link, tuple):
+            return req_link
 
         # add parent resource id to keep tracking
         link_augmented = req_link.json()
@@ -259,25 +235,14 @@ class ApiLink:
                 "use the 'isogeo.metadata.links.upload_hosted' method instead."
             )
 
-        # URL
-        url_link_create = utils.get_request_base_url(
-            route="resources/{}/links".format(metadata._id)
-        )
-
         # request
-        req_new_link = self.api_client.post(
-            url=url_link_create,
+        req_new_link = self.api_client.execute(
+            "POST",
+            route="resources/{}/links".format(metadata._id),
             json=link.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_new_link)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_new_link, tuple):
+            return req_new_link
 
         # add parent resource id to keep tracking
         link_augmented = req_new_link.json()
@@ -309,25 +274,12 @@ class ApiLink:
         else:
             pass
 
-        # URL
-        url_link_delete = utils.get_request_base_url(
-            route="resources/{}/links/{}".format(link.parent_resource, link._id)
-        )
-
         # request
-        req_link_deletion = self.api_client.delete(
-            url=url_link_delete,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            timeout=self.api_client.timeout,
-            verify=self.api_client.ssl,
+        req_link_deletion = self.api_client.execute(
+            "DELETE",
+            route="resources/{}/links/{}".format(link.parent_resource, link._id),
         )
 
-        # checking response
-        req_check = checker.check_api_response(req_link_deletion)
-        if isinstance(req_check, tuple):
-            return req_check
-
         return req_link_deletion
 
     @ApiDecorators._check_bearer_validity
@@ -351,25 +303,14 @@ class ApiLink:
         else:
             pass
 
-        # URL
-        url_link_update = utils.get_request_base_url(
-            route="resources/{}/links/{}".format(link.parent_resource, link._id)
-        )
-
         # request
-        req_link_update = self.api_client.put(
-            url=url_link_update,
+        req_link_update = self.api_client.execute(
+            "PUT",
+            route="resources/{}/links/{}".format(link.parent_resource, link._id),
             json=link.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_link_update)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_link_update, tuple):
+            return req_link_update
 
         # add parent resource id to keep tracking
         link_augmented = req_link_update.json()
@@ -415,23 +356,12 @@ class ApiLink:
         else:
             pass
 
-        # request URL
-        url_download_hosted = utils.get_request_base_url(route=link.url)
-
         # request
-        req_download_hosted = self.api_client.get(
-            url=url_download_hosted,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            stream=True,
-            timeout=self.api_client.timeout,
-            verify=self.api_client.ssl,
+        req_download_hosted = self.api_client.execute(
+            "GET", route=link.url, stream=True
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_download_hosted)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_download_hosted, tuple):
+            return req_download_hosted
 
         # get filename from header
         content_disposition = req_download_hosted.headers.get("Content-Disposition")
@@ -531,11 +461,6 @@ class ApiLink:
                 "https://stackoverflow.com/a/28652339/2556577"
             )
 
-        # URL
-        url_link_create = utils.get_request_base_url(
-            route="resources/{}/links".format(metadata._id)
-        )
-
         # reading the file and sending it
         logger.debug(
             "Uploading the file {} (type: {}) to the metadata '{}'".format(
@@ -544,8 +469,9 @@ class ApiLink:
         )
         with filepath.open("rb") as opened_file:
             # request
-            req_new_link = self.api_client.post(
-                url=url_link_create,
+            req_new_link = self.api_client.execute(
+                "POST",
+                route="resources/{}/links".format(metadata._id),
                 data=link.to_dict_creation(),
                 files={
                     "file": (
@@ -555,15 +481,9 @@ class ApiLink:
                     )
                 },
                 headers=self.api_client.headers,
-                proxies=self.api_client.proxies,
-                verify=self.api_client.ssl,
-                timeout=self.api_client.timeout,
             )
-
-        # checking response
-        req_check = checker.check_api_response(req_new_link)
-        if isinstance(req_check, tuple):
-            return req_check
+            if isinstance(req_new_link, tuple):
+                return req_new_link
 
         # add parent resource id to keep tracking
         link_augmented = req_new_link.json()[0]
@@ -639,22 +559,10 @@ class ApiLink:
                 ]
 
         """
-        # request URL
-        url_links = utils.get_request_base_url(route="link-kinds/")
-
         # request
-        req_links = self.api_client.get(
-            url=url_links,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
-        )
-
-        # checking response
-        req_check = checker.check_api_response(req_links)
-        if isinstance(req_check, tuple):
-            return req_check
+        req_links = self.api_client.execute("GET", route="link-kinds/")
+        if isinstance(req_links, tuple):
+            return req_links
 
         # caching
         if caching:
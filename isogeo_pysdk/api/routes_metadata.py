@@ -20,6 +20,7 @@ from requests.models import Response
 # submodules
 from isogeo_pysdk.checker import IsogeoChecker
 from isogeo_pysdk.decorators import ApiDecorators
+from isogeo_pysdk.lazy_route import LazyRoute
 from isogeo_pysdk.models import Metadata
 from isogeo_pysdk.utils import IsogeoUtils
 
@@ -49,6 +50,17 @@ utils = IsogeoUtils()
 class ApiMetadata:
     """Routes as methods of Isogeo API used to manipulate metadatas (resources)."""
 
+    # sub routes (instanciated at first access)
+    attributes = LazyRoute(lambda self: ApiFeatureAttribute(self.api_client))
+    bulk = LazyRoute(lambda self: ApiBulk(self.api_client))
+    conditions = LazyRoute(lambda self: ApiCondition(self.api_client))
+    conformity = LazyRoute(lambda self: ApiConformity(self.api_client))
+    events = LazyRoute(lambda self: ApiEvent(self.api_client))
+    layers = LazyRoute(lambda self: ApiServiceLayer(self.api_client))
+    limitations = LazyRoute(lambda self: ApiLimitation(self.api_client))
+    links = LazyRoute(lambda self: ApiLink(self.api_client))
+    operations = LazyRoute(lambda self: ApiServiceOperation(self.api_client))
+
     def __init__(self, api_client=None):
         if api_client is not None:
             self.api_client = api_client
@@ -68,22 +80,12 @@ class ApiMetadata:
             self.ssl,
         ) = utils.set_base_url(self.api_client.platform)
 
-        # sub routes
-        self.attributes = ApiFeatureAttribute(self.api_client)
-        self.bulk = ApiBulk(self.api_client)
-        self.conditions = ApiCondition(self.api_client)
-        self.conformity = ApiConformity(self.api_client)
-        self.events = ApiEvent(self.api_client)
-        self.layers = ApiServiceLayer(self.api_client)
-        self.limitations = ApiLimitation(self.api_client)
-        self.links = ApiLink(self.api_client)
-        self.operations = ApiServiceOperation(self.api_client)
-
         # initialize
         super(ApiMetadata, self).__init__()
 
-    @lru_cache()
     @ApiDecorators._check_bearer_validity
+    @ApiDecorators._cache_response("resources/{id}")
+    @ApiDecorators._coalesce_calls("resources/{id}")
     def get(self, metadata_id: str, include: tuple or str = ()) -> Metadata:
         """Get complete or partial metadata about a specific metadata (= resource).
 
@@ -108,25 +110,12 @@ class ApiMetadata:
             )
         }
 
-        # URL
-        url_resource = utils.get_request_base_url(
-            route="resources/{}".format(metadata_id)
-        )
-
         # request
-        req_metadata = self.api_client.get(
-            url=url_resource,
-            headers=self.api_client.header,
-            params=payload,
-            proxies=self.api_client.proxies,
-            timeout=self.api_client.timeout,
-            verify=self.api_client.ssl,
+        req_metadata = self.api_client.execute(
+            "GET", route="resources/{}".format(metadata_id), params=payload
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_metadata)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_metadata, tuple):
+            return req_metadata
 
         # end of method
         return Metadata.clean_attributes(req_metadata.json())
@@ -184,25 +173,14 @@ class ApiMetadata:
         else:
             pass
 
-        # build request url
-        url_metadata_create = utils.get_request_base_url(
-            route="groups/{}/resources".format(workgroup_id)
-        )
-
         # request
-        req_new_metadata = self.api_client.post(
-            url=url_metadata_create,
+        req_new_metadata = self.api_client.execute(
+            "POST",
+            route="groups/{}/resources".format(workgroup_id),
             json=metadata.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_new_metadata)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_new_metadata, tuple):
+            return req_new_metadata
 
         # load new metadata
         resp_md = req_new_metadata.json()
@@ -231,24 +209,11 @@ class ApiMetadata:
         else:
             pass
 
-        # request URL
-        url_metadata_delete = utils.get_request_base_url(
-            route="resources/{}".format(metadata_id)
-        )
-
         # request
-        req_metadata_deletion = self.api_client.delete(
-            url_metadata_delete,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_metadata_deletion = self.api_client.execute(
+            "DELETE", route="resources/{}".format(metadata_id)
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_metadata_deletion)
-        if isinstance(req_check, tuple):
-            return req_check
+        self._invalidate_cache(metadata_id)
 
         return req_metadata_deletion
 
@@ -266,23 +231,11 @@ class ApiMetadata:
         else:
             pass
 
-        # request URL
-        url_metadata_exists = utils.get_request_base_url(
-            route="resources/{}".format(resource_id)
-        )
-
         # request
-        req_metadata_exists = self.api_client.get(
-            url=url_metadata_exists,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_metadata_exists = self.api_client.execute(
+            "GET", route="resources/{}".format(resource_id)
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_metadata_exists)
-        if isinstance(req_check, tuple):
+        if isinstance(req_metadata_exists, tuple):
             return False
 
         return True
@@ -343,34 +296,33 @@ class ApiMetadata:
         else:
             pass
 
-        # URL builder
-        url_metadata_update = utils.get_request_base_url(
-            route="resources/{}".format(metadata._id)
-        )
-
         # HTTP method according to the metadata.type
         if metadata.type == "service" and _http_method != "PUT":
             return self.update(metadata=metadata, _http_method="PUT")
 
         # request
-        req_metadata_update = self.api_client.request(
-            method=_http_method,
-            url=url_metadata_update,
+        req_metadata_update = self.api_client.execute(
+            _http_method,
+            route="resources/{}".format(metadata._id),
             json=metadata.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_metadata_update)
-        if isinstance(req_check, tuple):
-            return req_check
+        self._invalidate_cache(metadata._id)
+        if isinstance(req_metadata_update, tuple):
+            return req_metadata_update
 
         # return updated object
         return Metadata(**req_metadata_update.json())
 
+    def _invalidate_cache(self, metadata_id: str):
+        """Remove the cached versions of a metadata (see: :meth:`get`), outdated once it's \
+        modified or deleted.
+
+        :param str metadata_id: metadata UUID
+        """
+        cache = getattr(self.api_client, "cache", None)
+        if cache is not None:
+            cache.invalidate("resources/{id}", metadata_id=metadata_id)
+
     # -- Routes to manage the related objects ------------------------------------------
     @ApiDecorators._check_bearer_validity
     def download_xml(self, metadata: Metadata) -> Response:
@@ -399,26 +351,11 @@ class ApiMetadata:
         else:
             pass
 
-        # URL
-        url_metadata_dl_xml = utils.get_request_base_url(
-            route="resources/{}.xml".format(metadata._id)
-        )
-
         # request
-        req_metadata_dl_xml = self.api_client.get(
-            url=url_metadata_dl_xml,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            stream=True,
-            timeout=self.api_client.timeout,
-            verify=self.api_client.ssl,
+        req_metadata_dl_xml = self.api_client.execute(
+            "GET", route="resources/{}.xml".format(metadata._id), stream=True
         )
 
-        # checking response
-        req_check = checker.check_api_response(req_metadata_dl_xml)
-        if isinstance(req_check, tuple):
-            return req_check
-
         # end of method
         return req_metadata_dl_xml
 
@@ -15,6 +15,7 @@ import logging
 from isogeo_pysdk.checker import IsogeoChecker
 from isogeo_pysdk.decorators import ApiDecorators
 from isogeo_pysdk.models import BulkReport, BulkRequest, Metadata
+from isogeo_pysdk.models.serializer import serialize_many
 from isogeo_pysdk.utils import IsogeoUtils
 
 # #############################################################################
@@ -147,7 +148,7 @@ class ApiBulk:
                 )
             )
 
-        prepared_request.model = [obj.to_dict() for obj in models]
+        prepared_request.model = serialize_many(models)
 
         # add it to be sent later
         self.BULK_DATA.append(prepared_request.to_dict())
@@ -161,24 +162,12 @@ class ApiBulk:
         :rtype: List[BulkReport]
         """
 
-        # build request url
-        url_metadata_bulk = utils.get_request_base_url(route="resources")
-
         # request
-        req_metadata_bulk = self.api_client.post(
-            url=url_metadata_bulk,
-            json=self.BULK_DATA,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            stream=True,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_metadata_bulk = self.api_client.execute(
+            "POST", route="resources", json=self.BULK_DATA, stream=True
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_metadata_bulk)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_metadata_bulk, tuple):
+            return req_metadata_bulk
 
         # empty bulk data
         self.BULK_DATA.clear()
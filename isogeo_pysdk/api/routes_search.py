@@ -13,14 +13,16 @@
 
 # Standard library
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 import logging
-from functools import lru_cache, partial
+from functools import partial
 
 # submodules
 from isogeo_pysdk.checker import IsogeoChecker
 from isogeo_pysdk.decorators import ApiDecorators
-from isogeo_pysdk.models import MetadataSearch
+from isogeo_pysdk.exceptions import IsogeoSdkError
+from isogeo_pysdk.models import MetadataColumns, MetadataSearch
+from isogeo_pysdk.paginator import IsogeoPaginator
+from isogeo_pysdk.tracing import IsogeoTracer
 from isogeo_pysdk.utils import IsogeoUtils
 
 # #############################################################################
@@ -42,18 +44,6 @@ class ApiSearch:
         if api_client is not None:
             self.api_client = api_client
 
-        # create an asyncio AbstractEventLoop
-        try:
-            self.loop = asyncio.get_event_loop()
-        except RuntimeError as e:
-            logger.warning(
-                "Async get loop failed. Maybe because it's already executed in a separated thread. Original error: {}".format(
-                    e
-                )
-            )
-            self.loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self.loop)
-
         # store API client (Request [Oauthlib] Session) and pass it to the decorators
         self.api_client = api_client
         ApiDecorators.api_client = api_client
@@ -73,8 +63,9 @@ class ApiSearch:
         super(ApiSearch, self).__init__()
 
     # -- Routes to search --------------------------------------------------------------
-    @lru_cache()
     @ApiDecorators._check_bearer_validity
+    @ApiDecorators._cache_response("resources/search")
+    @ApiDecorators._coalesce_calls("resources/search")
     def search(
         self,
         # application or group
@@ -101,6 +92,8 @@ class ApiSearch:
         expected_total: int = None,
         tags_as_dicts: bool = False,
         whole_results: bool = False,
+        max_workers: int = 10,
+        columnar: bool = False,
     ) -> MetadataSearch:
         """Search within the resources shared to the application. It's the mainly used method to
         retrieve metadata.
@@ -147,11 +140,18 @@ class ApiSearch:
         :param str share: share UUID to filter on
         :param tuple specific_md: list of metadata UUIDs to filter on
         :param tuple include: subresources that should be returned. See: :py:class:`enums.MetadataSubresources`.
-        :param bool whole_results: option to return all results or only the page size. *False* by DEFAULT.
+        :param bool whole_results: option to return all results from the offset or only the \
+            page size. *False* by DEFAULT.
+        :param int max_workers: maximum number of page requests in flight with `whole_results`, \
+            capped to the `pool_maxsize` of the client. Defaults to 10.
         :param bool check: option to check query parameters and avoid erros. *True* by DEFAULT.
         :param bool augment: option to improve API response by adding some tags on the fly (like shares_id)
-        :param int expected_total: if different of None, value will be used to paginate. Can save a request.
+        :param int expected_total: if different of None, value will be used to paginate. \
+            Otherwise, the first page of results is used to get the total.
         :param bool tags_as_dicts: option to store tags as key/values by filter.
+        :param bool columnar: option to also store the results by columns in `columns` \
+            (see :class:`isogeo_pysdk.models.metadata_columns.MetadataColumns`), filled \
+            page by page as they are received. *False* by DEFAULT.
 
         :rtype: MetadataSearch
 
@@ -182,6 +182,264 @@ class ApiSearch:
             )
         """
         # handling request parameters
+        payload = self._search_payload(
+            query=query,
+            share=share,
+            specific_md=specific_md,
+            include=include,
+            bbox=bbox,
+            poly=poly,
+            georel=georel,
+            order_by=order_by,
+            order_dir=order_dir,
+            page_size=page_size,
+            offset=offset,
+            check=check,
+        )
+
+        # URL
+        url_resources_search = self._search_url(group=group)
+
+        # results columns, filled with each page
+        columns = MetadataColumns() if columnar else None
+
+        # SEARCH CASES
+
+        # CASE - MULTIPLE PAGINATED SEARCHES
+        if whole_results:
+            # PAGINATION
+            # the first page (from the offset, maximum size) doubles as the count request
+            if expected_total is None:
+                first_page = self._search_page(
+                    url=url_resources_search,
+                    payload=dict(payload, _offset=offset, _limit=100),
+                )
+                if isinstance(first_page, tuple):
+                    return first_page
+                total_results = first_page.total
+            else:
+                first_page = None
+                total_results = expected_total
+
+            # avoid to paginate if it's possible in one request
+            if total_results - offset <= 100:
+                logger.debug(
+                    "Paginated (size={}) search changed into a unique search because "
+                    "the total of metadata {} from the offset {} is less than the maximum "
+                    "size (100).".format(page_size, total_results, offset)
+                )
+                if first_page is None:
+                    first_page = self._search_page(
+                        url=url_resources_search,
+                        payload=dict(payload, _offset=offset, _limit=100),
+                    )
+                    if isinstance(first_page, tuple):
+                        return first_page
+                req_metadata_search = first_page
+                req_metadata_search.limit = len(first_page.results or ())
+                pages_count = 1
+                if columnar:
+                    columns.extend(first_page.results or ())
+            else:
+                # paginate the remaining pages through the pagination engine
+                pages = self._search_paginator(
+                    url=url_resources_search,
+                    payload=payload,
+                    max_workers=min(
+                        max_workers,
+                        getattr(self.api_client, "pool_maxsize", max_workers),
+                    ),
+                ).collect(
+                    total=total_results,
+                    first_page=first_page,
+                    offset=offset,
+                    on_page=(lambda page: columns.extend(page.results or ()))
+                    if columnar
+                    else None,
+                )
+                if isinstance(pages, tuple):
+                    return pages
+
+                req_metadata_search = self.merge_pages(pages)
+                pages_count = len(pages)
+
+        # cASE - NO PAGINATION NEEDED
+        elif page_size == 0 or not whole_results:
+            logger.debug(
+                "Simple search with page parameters offset={} - page_size={}".format(
+                    offset, page_size
+                )
+            )
+
+            # request
+            req_metadata_search = self._search_page(
+                url=url_resources_search, payload=payload
+            )
+            if isinstance(req_metadata_search, tuple):
+                return req_metadata_search
+            pages_count = 1
+            if columnar:
+                columns.extend(req_metadata_search.results or ())
+
+        req_metadata_search.columns = columns
+
+        # size of the search in the tracing span, if any
+        IsogeoTracer.set_attributes(
+            **{
+                "isogeo.search.pages": pages_count,
+                "isogeo.search.total": req_metadata_search.total,
+                "isogeo.search.results": len(req_metadata_search.results or ()),
+            }
+        )
+
+        # end of method
+        return self.search_post_process(
+            search=req_metadata_search,
+            share=share,
+            augment=augment,
+            tags_as_dicts=tags_as_dicts,
+        )
+
+    @ApiDecorators._check_bearer_validity
+    def search_pages(
+        self,
+        # application or group
+        group: str = None,
+        # semantic and objects filters
+        query: str = "",
+        share: str = None,
+        specific_md: tuple = (),
+        # results model
+        include: tuple = (),
+        # geographic filters
+        bbox: tuple = None,
+        poly: str = None,
+        georel: str = None,
+        # sorting
+        order_by: str = "_created",
+        order_dir: str = "desc",
+        # pagination
+        page_size: int = 100,
+        max_workers: int = 5,
+        ordered: bool = True,
+        # specific options of implemention
+        check: bool = True,
+        expected_total: int = None,
+    ):
+        """Stream the whole results of a search, page by page, as soon as they are received.
+        Unlike `search(whole_results=True)`, nothing is accumulated: memory stays flat whatever
+        the size of the catalog and the first page is usable immediately.
+
+        Pages are requested concurrently within a sliding window, bounded by `max_workers`.
+
+        :param int page_size: number of metadata per page. Max value (and default): 100.
+        :param int max_workers: maximum number of page requests in flight.
+        :param bool ordered: option to yield pages in offset order. If False, pages are \
+            yielded as soon as they arrive. *True* by DEFAULT.
+        :param int expected_total: if different of None, value will be used to paginate \
+            without waiting for the first page.
+
+        See :meth:`search` for the other parameters.
+
+        :returns: generator of MetadataSearch, one per page. If a request fails, \
+            the error tuple is yielded and the iteration stops.
+
+        :Example:
+
+        .. code-block:: python
+
+            # export metadata while they are retrieved
+            for page in isogeo.search_pages(include=("contacts",), max_workers=8):
+                for md in page.results:
+                    exporter.write(Metadata.clean_attributes(md))
+        """
+        # URL and request parameters
+        url_resources_search = self._search_url(group=group)
+        payload = self._search_payload(
+            query=query,
+            share=share,
+            specific_md=specific_md,
+            include=include,
+            bbox=bbox,
+            poly=poly,
+            georel=georel,
+            order_by=order_by,
+            order_dir=order_dir,
+            check=check,
+        )
+
+        # the first page gives the total, if not known
+        yield from self._search_paginator(
+            url=url_resources_search,
+            payload=payload,
+            page_size=page_size,
+            max_workers=max_workers,
+            ordered=ordered,
+        ).pages(total=expected_total)
+
+    def iter_search(self, views: bool = False, **kwargs):
+        """Stream the whole results of a search, metadata by metadata. Shortcut to iterate \
+        over :meth:`search_pages` results. Same parameters.
+
+        :param bool views: option to yield read-only metadata views \
+            (:class:`isogeo_pysdk.models.metadata_view.MetadataView`) instead of dicts. \
+            *False* by DEFAULT.
+
+        :returns: generator of metadata (dict), as returned by the API.
+
+        :Example:
+
+        .. code-block:: python
+
+            for md in isogeo.iter_search(query="type:vector-dataset", include="all"):
+                print(md.get("title"))
+        """
+        for page in self.search_pages(**kwargs):
+            if isinstance(page, tuple):
+                raise IsogeoSdkError(
+                    "Search request failed (HTTP {}). Iteration stopped.".format(page[1])
+                )
+            if views:
+                yield from page.views()
+            else:
+                yield from page.results
+
+    # -- SEARCH SUBMETHODS
+    def _search_url(self, group: str = None) -> str:
+        """Build the search URL depending on the context: application or group.
+
+        :param str group: workgroup UUID or None to search as application
+        """
+        if group is None:
+            logger.debug("Searching as application")
+            return utils.get_request_base_url(route="resources/search")
+        elif checker.check_is_uuid(group):
+            logger.debug("Searching as group")
+            return utils.get_request_base_url(
+                route="groups/{}/resources/search".format(group)
+            )
+        else:
+            raise ValueError
+
+    def _search_payload(
+        self,
+        query: str = "",
+        share: str = None,
+        specific_md: tuple = (),
+        include: tuple = (),
+        bbox: tuple = None,
+        poly: str = None,
+        georel: str = None,
+        order_by: str = "_created",
+        order_dir: str = "desc",
+        page_size: int = 20,
+        offset: int = 0,
+        check: bool = True,
+    ) -> dict:
+        """Build (and check) the search request parameters. See :meth:`search`.
+
+        :rtype: dict
+        """
         payload = {
             "_id": checker._check_filter_specific_md(specific_md),
             "_include": checker._check_filter_includes(
@@ -204,234 +462,168 @@ class ApiSearch:
         else:
             pass
 
-        # URL
-        if group is None:
-            logger.debug("Searching as application")
-            url_resources_search = utils.get_request_base_url(route="resources/search")
-        elif checker.check_is_uuid(group):
-            logger.debug("Searching as group")
-            url_resources_search = utils.get_request_base_url(
-                route="groups/{}/resources/search".format(group)
-            )
-        else:
-            raise ValueError
+        return payload
 
-        # SEARCH CASES
+    def _search_page(self, url: str, payload: dict) -> MetadataSearch:
+        """Request a single page of search.
 
-        # CASE - MULTIPLE PAGINATED SEARCHES
-        if whole_results:
-            # PAGINATION
-            # determine if a request to get the total is required
-            if expected_total is None:
-                # make an empty request with same filters
-                total_results = self.search(
-                    # search context: application or group
-                    group=group,
-                    # filters
-                    query=query,
-                    share=share,
-                    specific_md=specific_md,
-                    bbox=bbox,
-                    georel=georel,
-                    poly=poly,
-                    # options
-                    augment=0,
-                    check=0,
-                    page_size=0,
-                    whole_results=0,
-                ).total
-            else:
-                total_results = expected_total
+        :param str url: search URL
+        :param dict payload: request parameters
 
-            # avoid to launch async searches if it's possible in one request
-            if total_results <= 100:
-                logger.debug(
-                    "Paginated (size={}) search changed into a unique search because "
-                    "the total of metadata {} is less than the maximum size (100).".format(
-                        page_size, total_results
-                    )
-                )
-                return self.search(
-                    # search context: application or group
-                    group=group,
-                    # filters
-                    query=query,
-                    share=share,
-                    specific_md=specific_md,
-                    bbox=bbox,
-                    georel=georel,
-                    poly=poly,
-                    # results
-                    include=include,
-                    # sorting
-                    order_by=order_by,
-                    order_dir=order_dir,
-                    # options
-                    augment=augment,
-                    check=0,
-                    page_size=100,
-                    whole_results=0,
-                )
-            else:
-                # store search args as dict
-                search_params = {
-                    # search context: application or group
-                    "group": group,
-                    # filters
-                    "query": query,
-                    "include": include,
-                    "share": share,
-                    "specific_md": specific_md,
-                    "bbox": bbox,
-                    "georel": georel,
-                    "poly": poly,
-                    # sorting
-                    "order_by": order_by,
-                    "order_dir": order_dir,
-                }
-
-                # check loop state
-                if self.loop.is_closed():
-                    logger.debug(
-                        "Current event loop is already closed. Creating a new one..."
-                    )
-                    self.loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(self.loop)
+        :rtype: MetadataSearch
+        """
+        req_metadata_search = self.api_client.execute(
+            "GET", url=url, params=payload, timeout=(5, 200)
+        )
+        if isinstance(req_metadata_search, tuple):
+            return req_metadata_search
 
-                # launch async searches
-                future_searches_concatenated = asyncio.ensure_future(
-                    self.search_metadata_asynchronous(
-                        total_results=total_results, **search_params
-                    ),
-                    loop=self.loop,
-                )
-                self.loop.run_until_complete(future_searches_concatenated)
+        return MetadataSearch(**req_metadata_search.json())
 
-                # check results structure
-                req_metadata_search = future_searches_concatenated.result()
+    async def search_metadata_asynchronous(
+        self, total_results: int, max_workers: int = 10, **kwargs
+    ) -> MetadataSearch:
+        """Meta async method used to request big searches (> 100 results), using asyncio. The
+        pages are requested through the pagination engine in the loop default executor.
 
-                # properly close the loop
-                self.loop.close()
+        :param int total_results: total of results to retrieve
+        :param int max_workers: maximum number of page requests in flight
 
-        # cASE - NO PAGINATION NEEDED
-        elif page_size == 0 or not whole_results:
-            logger.debug(
-                "Simple search with page parameters offset={} - page_size={}".format(
-                    offset, page_size
-                )
+        :rtype: MetadataSearch
+        """
+        payload = self._search_payload(
+            query=kwargs.get("query"),
+            share=kwargs.get("share"),
+            specific_md=kwargs.get("specific_md"),
+            include=kwargs.get("include"),
+            bbox=kwargs.get("bbox"),
+            poly=kwargs.get("poly"),
+            georel=kwargs.get("georel"),
+            order_by=kwargs.get("order_by"),
+            order_dir=kwargs.get("order_dir"),
+            check=0,
+        )
+        paginator = self._search_paginator(
+            url=self._search_url(group=kwargs.get("group")),
+            payload=payload,
+            max_workers=max_workers,
+        )
+        logger.debug(
+            "Async search launched with {} pages.".format(
+                utils.pages_counter(total_results, page_size=100)
             )
+        )
 
-            # request
-            req_metadata_search = self.api_client.get(
-                url=url_resources_search,
-                headers=self.api_client.header,
-                params=payload,
-                proxies=self.api_client.proxies,
-                verify=self.api_client.ssl,
-                timeout=(5, 200),
+        try:
+            pages = await asyncio.get_running_loop().run_in_executor(
+                None, partial(paginator.collect, total=total_results)
             )
+        except asyncio.CancelledError:
+            # the caller gave up: stop requesting pages
+            paginator.cancel()
+            raise
+        if isinstance(pages, tuple):
+            return pages
+
+        # store responses in a fresh Metadata Search object
+        return self.merge_pages(pages)
+
+    def _search_paginator(
+        self,
+        url: str,
+        payload: dict,
+        page_size: int = 100,
+        max_workers: int = 10,
+        ordered: bool = True,
+    ) -> IsogeoPaginator:
+        """Returns a pagination engine for a search.
+
+        :param str url: search URL
+        :param dict payload: request parameters. `_limit` and `_offset` are set for each page.
+        :param int page_size: number of metadata per page
+        :param int max_workers: maximum number of page requests in flight
+        :param bool ordered: option to yield pages in offset order
+
+        :rtype: IsogeoPaginator
+        """
+        return IsogeoPaginator(
+            fetch_page=lambda offset, limit: self._search_page(
+                url=url, payload=dict(payload, _offset=offset, _limit=limit)
+            ),
+            page_size=page_size,
+            max_workers=max_workers,
+            ordered=ordered,
+        )
 
-            # checking response
-            req_check = checker.check_api_response(req_metadata_search)
-            if isinstance(req_check, tuple):
-                return req_check
+    # -- UTILITIES -----------------------------------------------------------
+    def search_post_process(
+        self,
+        search: MetadataSearch,
+        share: str = None,
+        augment: bool = False,
+        tags_as_dicts: bool = False,
+    ) -> MetadataSearch:
+        """Apply the options of implementation (augment, tags_as_dicts) to a search response.
+        Shared between the synchronous and asynchronous clients.
 
-            req_metadata_search = MetadataSearch(**req_metadata_search.json())
+        :param MetadataSearch search: search to post-process
+        :param str share: share UUID used to filter the search
+        :param bool augment: option to add shares to tags and query
+        :param bool tags_as_dicts: option to store tags as key/values by filter
 
+        :rtype: MetadataSearch
+        """
         # add shares to tags and query
         if augment:
-            self.add_tags_shares(req_metadata_search)
+            self.add_tags_shares(search)
             if share:
-                req_metadata_search.query["_shares"] = [share]
+                search.query["_shares"] = [share]
             else:
-                req_metadata_search.query["_shares"] = []
+                search.query["_shares"] = []
         else:
             pass
 
         # store tags in dicts
         if tags_as_dicts:
-            new_tags = utils.tags_to_dict(
-                tags=req_metadata_search.tags, prev_query=req_metadata_search.query
-            )
+            new_tags = utils.tags_to_dict(tags=search.tags, prev_query=search.query)
             # clear
-            req_metadata_search.tags.clear()
-            req_metadata_search.query.clear()
+            search.tags.clear()
+            search.query.clear()
             # update
-            req_metadata_search.tags.update(new_tags[0])
-            req_metadata_search.query.update(new_tags[1])
+            search.tags.update(new_tags[0])
+            search.query.update(new_tags[1])
         else:
             pass
 
-        # end of method
-        return req_metadata_search
+        return search
 
-    # -- SEARCH SUBMETHODS
-    async def search_metadata_asynchronous(
-        self, total_results: int, max_workers: int = 10, **kwargs
-    ) -> MetadataSearch:
-        """Meta async method used to request big searches (> 100 results), using asyncio. It's a
-        private method launched by the main search method.
+    @staticmethod
+    def merge_pages(pages: list) -> MetadataSearch:
+        """Concatenate paginated search responses into a single Metadata Search. Results \
+        columns are concatenated too if every response has some.
 
-        :param int total_results: total of results to retrieve
-        :param int max_workers: maximum number of thread to use :class:`python.concurrent.futures`
+        :param list pages: MetadataSearch responses, in offset order
 
         :rtype: MetadataSearch
         """
-        # prepare async searches
-        total_pages = utils.pages_counter(total_results, page_size=100)
-        li_offsets = [offset * 100 for offset in range(0, total_pages)]
-        logger.debug("Async search launched with {} pages.".format(total_pages))
-
-        with ThreadPoolExecutor(
-            max_workers=max_workers, thread_name_prefix="IsogeoSearch"
-        ) as executor:
-            self.loop = asyncio.get_event_loop()
-            tasks = [
-                self.loop.run_in_executor(
-                    executor,
-                    partial(
-                        self.search,
-                        # search context: application or group
-                        group=kwargs.get("group"),
-                        # filters
-                        query=kwargs.get("query"),
-                        include=kwargs.get("include"),
-                        share=kwargs.get("share"),
-                        specific_md=kwargs.get("specific_md"),
-                        bbox=kwargs.get("bbox"),
-                        poly=kwargs.get("poly"),
-                        georel=kwargs.get("georel"),
-                        # sorting
-                        order_by=kwargs.get("order_by"),
-                        order_dir=kwargs.get("order_dir"),
-                        # pagination
-                        offset=offset,
-                        page_size=100,
-                        # options
-                        augment=0,
-                        check=0,
-                        expected_total=total_results,
-                        tags_as_dicts=0,
-                        whole_results=0,
-                    ),
-                )
-                for offset in li_offsets
-            ]
-
-            # store responses in a fresh Metadata Search object
-            final_search = MetadataSearch(results=[], query={}, tags={})
-            for response in await asyncio.gather(*tasks):
-                final_search.envelope = response.envelope
-                final_search.limit = response.total
-                final_search.offset = 0
-                final_search.query.update(response.query)
-                final_search.results.extend(response.results)
-                final_search.tags.update(response.tags)
-                final_search.total = response.total
-
-            return final_search
+        final_search = MetadataSearch(
+            offset=pages[0].offset if pages else 0, results=[], query={}, tags={}
+        )
+        for response in pages:
+            final_search.envelope = response.envelope
+            final_search.query.update(response.query)
+            final_search.results.extend(response.results)
+            final_search.tags.update(response.tags)
+            final_search.total = response.total
+        final_search.limit = len(final_search.results)
+
+        if pages and all(response.columns is not None for response in pages):
+            final_search.columns = MetadataColumns()
+            for response in pages:
+                final_search.columns.concat(response.columns)
+
+        return final_search
 
-    # -- UTILITIES -----------------------------------------------------------
     def add_tags_shares(self, search: MetadataSearch):
         """Add shares list to the tags attributes in search.
 
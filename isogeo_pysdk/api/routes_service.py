@@ -22,6 +22,7 @@ import requests
 from isogeo_pysdk.exceptions import AlreadyExistError
 from isogeo_pysdk.checker import IsogeoChecker
 from isogeo_pysdk.decorators import ApiDecorators
+from isogeo_pysdk.lazy_route import LazyRoute
 from isogeo_pysdk.models import Metadata
 from isogeo_pysdk.utils import IsogeoUtils
 
@@ -47,6 +48,10 @@ class ApiService:
     It's a set of helpers and shortcuts to make easier the sevrice management with the isogeo API.
     """
 
+    # sub routes (instanciated at first access)
+    layers = LazyRoute(lambda self: ApiServiceLayer(self.api_client))
+    operations = LazyRoute(lambda self: ApiServiceOperation(self.api_client))
+
     def __init__(self, api_client=None):
         if api_client is not None:
             self.api_client = api_client
@@ -66,10 +71,6 @@ class ApiService:
             self.ssl,
         ) = utils.set_base_url(self.api_client.platform)
 
-        # sub routes
-        self.layers = ApiServiceLayer(self.api_client)
-        self.operations = ApiServiceOperation(self.api_client)
-
         # initialize
         super(ApiService, self).__init__()
 
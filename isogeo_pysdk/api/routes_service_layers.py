@@ -75,24 +75,12 @@ class ApiServiceLayer:
         else:
             pass
 
-        # URL
-        url_service_layers = utils.get_request_base_url(
-            route="resources/{}/layers/".format(metadata._id)
-        )
-
         # request
-        req_service_layers = self.api_client.get(
-            url=url_service_layers,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_service_layers = self.api_client.execute(
+            "GET", route="resources/{}/layers/".format(metadata._id)
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_service_layers)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_service_layers, tuple):
+            return req_service_layers
 
         # end of method
         return req_service_layers.json()
@@ -120,24 +108,12 @@ class ApiServiceLayer:
         else:
             pass
 
-        # URL
-        url_service_layer = utils.get_request_base_url(
-            route="resources/{}/layers/{}".format(metadata_id, layer_id)
-        )
-
         # request
-        req_service_layer = self.api_client.get(
-            url=url_service_layer,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            timeout=self.api_client.timeout,
-            verify=self.api_client.ssl,
+        req_service_layer = self.api_client.execute(
+            "GET", route="resources/{}/layers/{}".format(metadata_id, layer_id)
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_service_layer)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_service_layer, tuple):
+            return req_service_layer
 
         # add parent resource id to keep tracking
         service_layer_augmented = req_service_layer.json()
@@ -163,25 +139,14 @@ class ApiServiceLayer:
         else:
             pass
 
-        # URL
-        url_service_layer_create = utils.get_request_base_url(
-            route="resources/{}/layers/".format(metadata._id)
-        )
-
         # request
-        req_new_service_layer = self.api_client.post(
-            url=url_service_layer_create,
+        req_new_service_layer = self.api_client.execute(
+            "POST",
+            route="resources/{}/layers/".format(metadata._id),
             json=layer.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_new_service_layer)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_new_service_layer, tuple):
+            return req_new_service_layer
 
         # add parent resource id to keep tracking
         service_layer_augmented = req_new_service_layer.json()
@@ -215,25 +180,12 @@ class ApiServiceLayer:
         else:
             pass
 
-        # URL
-        url_service_layer_delete = utils.get_request_base_url(
-            route="resources/{}/layers/{}".format(layer.parent_resource, layer._id)
-        )
-
         # request
-        req_service_layer_deletion = self.api_client.delete(
-            url=url_service_layer_delete,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            timeout=self.api_client.timeout,
-            verify=self.api_client.ssl,
+        req_service_layer_deletion = self.api_client.execute(
+            "DELETE",
+            route="resources/{}/layers/{}".format(layer.parent_resource, layer._id),
         )
 
-        # checking response
-        req_check = checker.check_api_response(req_service_layer_deletion)
-        if isinstance(req_check, tuple):
-            return req_check
-
         return req_service_layer_deletion
 
     @ApiDecorators._check_bearer_validity
@@ -261,25 +213,14 @@ class ApiServiceLayer:
         else:
             pass
 
-        # URL
-        url_service_layer_update = utils.get_request_base_url(
-            route="resources/{}/layers/{}".format(layer.parent_resource, layer._id)
-        )
-
         # request
-        req_service_layer_update = self.api_client.put(
-            url=url_service_layer_update,
+        req_service_layer_update = self.api_client.execute(
+            "PUT",
+            route="resources/{}/layers/{}".format(layer.parent_resource, layer._id),
             json=layer.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_service_layer_update)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_service_layer_update, tuple):
+            return req_service_layer_update
 
         # add parent resource id to keep tracking
         service_layer_augmented = req_service_layer_update.json()
@@ -372,20 +313,13 @@ class ApiServiceLayer:
         else:
             pass
 
-        # URL
-        url_layer_association = utils.get_request_base_url(
+        # request
+        req_layer_association = self.api_client.execute(
+            "POST",
             route="resources/{}/layers/{}/dataset/{}".format(
                 service._id, layer._id, dataset._id
-            )
-        )
-
-        # request
-        req_layer_association = self.api_client.post(
-            url=url_layer_association,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+            ),
+            check=False,
         )
 
         # checking response
@@ -467,27 +401,14 @@ class ApiServiceLayer:
         else:
             pass
 
-        # URL
-        url_layer_dissociation = utils.get_request_base_url(
+        # request
+        req_layer_dissociation = self.api_client.execute(
+            "DELETE",
             route="resources/{}/layers/{}/dataset/{}".format(
                 service._id, layer._id, dataset._id
-            )
+            ),
         )
 
-        # request
-        req_layer_dissociation = self.api_client.delete(
-            url=url_layer_dissociation,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
-        )
-
-        # checking response
-        req_check = checker.check_api_response(req_layer_dissociation)
-        if isinstance(req_check, tuple):
-            return req_check
-
         # end of method
         return req_layer_dissociation
 
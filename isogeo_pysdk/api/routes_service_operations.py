@@ -72,24 +72,12 @@ class ApiServiceOperation:
         else:
             pass
 
-        # URL
-        url_service_operations = utils.get_request_base_url(
-            route="resources/{}/operations/".format(metadata._id)
-        )
-
         # request
-        req_service_operations = self.api_client.get(
-            url=url_service_operations,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_service_operations = self.api_client.execute(
+            "GET", route="resources/{}/operations/".format(metadata._id)
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_service_operations)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_service_operations, tuple):
+            return req_service_operations
 
         # end of method
         return req_service_operations.json()
@@ -118,24 +106,12 @@ class ApiServiceOperation:
         else:
             pass
 
-        # URL
-        url_service_operation = utils.get_request_base_url(
-            route="resources/{}/operations/{}".format(metadata_id, operation_id)
-        )
-
         # request
-        req_service_operation = self.api_client.get(
-            url=url_service_operation,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            timeout=self.api_client.timeout,
-            verify=self.api_client.ssl,
+        req_service_operation = self.api_client.execute(
+            "GET", route="resources/{}/operations/{}".format(metadata_id, operation_id)
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_service_operation)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_service_operation, tuple):
+            return req_service_operation
 
         # add parent resource id to keep tracking
         service_operation_augmented = req_service_operation.json()
@@ -163,25 +139,14 @@ class ApiServiceOperation:
         else:
             pass
 
-        # URL
-        url_service_operation_create = utils.get_request_base_url(
-            route="resources/{}/operations/".format(metadata._id)
-        )
-
         # request
-        req_new_service_operation = self.api_client.post(
-            url=url_service_operation_create,
+        req_new_service_operation = self.api_client.execute(
+            "POST",
+            route="resources/{}/operations/".format(metadata._id),
             json=operation.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_new_service_operation)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_new_service_operation, tuple):
+            return req_new_service_operation
 
         # add parent resource id to keep tracking
         service_operation_augmented = req_new_service_operation.json()
@@ -62,6 +62,7 @@ class ApiShare:
 
     # -- Routes to manage the object ---------------------------------------------------
     @lru_cache()
+    @ApiDecorators._coalesce_calls("shares")
     @ApiDecorators._check_bearer_validity
     def listing(self, workgroup_id: str = None, caching: bool = 1) -> list:
         """Get all shares which are accessible by the authenticated user OR shares for a workgroup.
@@ -83,18 +84,9 @@ class ApiShare:
             url_shares = utils.get_request_base_url(route="shares")
 
         # request
-        req_shares = self.api_client.get(
-            url=url_shares,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=(5, 200),
-        )
-
-        # checking response
-        req_check = checker.check_api_response(req_shares)
-        if isinstance(req_check, tuple):
-            return req_check
+        req_shares = self.api_client.execute("GET", url=url_shares, timeout=(5, 200))
+        if isinstance(req_shares, tuple):
+            return req_shares
 
         shares = req_shares.json()
 
@@ -128,23 +120,12 @@ class ApiShare:
         else:
             payload = None
 
-        # URL
-        url_share = utils.get_request_base_url(route="shares/{}".format(share_id))
-
         # request
-        req_share = self.api_client.get(
-            url=url_share,
-            headers=self.api_client.header,
-            params=payload,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_share = self.api_client.execute(
+            "GET", route="shares/{}".format(share_id), params=payload
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_share)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_share, tuple):
+            return req_share
 
         # end of method
         return Share(**req_share.json())
@@ -178,25 +159,14 @@ class ApiShare:
         else:
             pass
 
-        # URL
-        url_share_create = utils.get_request_base_url(
-            route="groups/{}/shares".format(workgroup_id)
-        )
-
         # request
-        req_new_share = self.api_client.post(
-            url=url_share_create,
+        req_new_share = self.api_client.execute(
+            "POST",
+            route="groups/{}/shares".format(workgroup_id),
             json=share.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_new_share)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_new_share, tuple):
+            return req_new_share
 
         # load new share and save it to the cache
         new_share = Share(**req_new_share.json())
@@ -217,25 +187,11 @@ class ApiShare:
         else:
             pass
 
-        # request URL
-        url_share_delete = utils.get_request_base_url(
-            route="shares/{}".format(share_id)
-        )
-
         # request
-        req_share_deletion = self.api_client.delete(
-            url=url_share_delete,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_share_deletion = self.api_client.execute(
+            "DELETE", route="shares/{}".format(share_id)
         )
 
-        # checking response
-        req_check = checker.check_api_response(req_share_deletion)
-        if isinstance(req_check, tuple):
-            return req_check
-
         return req_share_deletion
 
     @ApiDecorators._check_bearer_validity
@@ -250,25 +206,11 @@ class ApiShare:
         else:
             pass
 
-        # URL
-        url_share_exists = utils.get_request_base_url(
-            route="shares/{}".format(share_id)
-        )
-
         # request
-        req_share_exists = self.api_client.get(
-            url=url_share_exists,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_share_exists = self.api_client.execute(
+            "GET", route="shares/{}".format(share_id)
         )
 
-        # checking response
-        req_check = checker.check_api_response(req_share_exists)
-        if isinstance(req_check, tuple):
-            return req_check
-
         return req_share_exists
 
     @ApiDecorators._check_bearer_validity
@@ -284,25 +226,12 @@ class ApiShare:
         else:
             pass
 
-        # URL
-        url_share_update = utils.get_request_base_url(
-            route="shares/{}".format(share._id)
-        )
-
         # request
-        req_share_update = self.api_client.put(
-            url=url_share_update,
-            json=share.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_share_update = self.api_client.execute(
+            "PUT", route="shares/{}".format(share._id), json=share.to_dict_creation()
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_share_update)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_share_update, tuple):
+            return req_share_update
 
         # update share in cache
         new_share = Share(**req_share_update.json())
@@ -352,25 +281,12 @@ class ApiShare:
         else:
             share.rights = []
 
-        # URL
-        url_share_refresh = utils.get_request_base_url(
-            route="shares/{}".format(share._id)
-        )
-
         # request
-        req_share_refresh = self.api_client.put(
-            url=url_share_refresh,
-            json=share.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_share_refresh = self.api_client.execute(
+            "PUT", route="shares/{}".format(share._id), json=share.to_dict_creation()
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_share_refresh)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_share_refresh, tuple):
+            return req_share_refresh
 
         # end of method
         return Share(**req_share_refresh.json())
@@ -387,24 +303,12 @@ class ApiShare:
         else:
             pass
 
-        # URL
-        url_share_refresh = utils.get_request_base_url(
-            route="shares/{}/refresh-token".format(share._id)
-        )
-
         # request
-        req_share_refresh = self.api_client.post(
-            url=url_share_refresh,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_share_refresh = self.api_client.execute(
+            "POST", route="shares/{}/refresh-token".format(share._id)
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_share_refresh)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_share_refresh, tuple):
+            return req_share_refresh
 
         # end of method
         return Share(**req_share_refresh.json())
@@ -439,25 +343,11 @@ class ApiShare:
         else:
             pass
 
-        # URL
-        url_share_association = utils.get_request_base_url(
-            route="shares/{}/applications/{}".format(share._id, application._id)
-        )
-
         # request
-        req_share_association = self.api_client.put(
-            url=url_share_association,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_share_association = self.api_client.execute(
+            "PUT", route="shares/{}/applications/{}".format(share._id, application._id)
         )
 
-        # checking response
-        req_check = checker.check_api_response(req_share_association)
-        if isinstance(req_check, tuple):
-            return req_check
-
         # end of method
         return req_share_association
 
@@ -490,25 +380,12 @@ class ApiShare:
         else:
             pass
 
-        # URL
-        url_share_dissociation = utils.get_request_base_url(
-            route="shares/{}/applications/{}".format(share._id, application._id)
-        )
-
         # request
-        req_share_dissociation = self.api_client.delete(
-            url=url_share_dissociation,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_share_dissociation = self.api_client.execute(
+            "DELETE",
+            route="shares/{}/applications/{}".format(share._id, application._id),
         )
 
-        # checking response
-        req_check = checker.check_api_response(req_share_dissociation)
-        if isinstance(req_check, tuple):
-            return req_check
-
         # end of method
         return req_share_dissociation
 
@@ -531,25 +408,11 @@ class ApiShare:
         else:
             pass
 
-        # URL
-        url_share_association = utils.get_request_base_url(
-            route="shares/{}/catalogs/{}".format(share._id, catalog._id)
-        )
-
         # request
-        req_share_association = self.api_client.put(
-            url=url_share_association,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_share_association = self.api_client.execute(
+            "PUT", route="shares/{}/catalogs/{}".format(share._id, catalog._id)
         )
 
-        # checking response
-        req_check = checker.check_api_response(req_share_association)
-        if isinstance(req_check, tuple):
-            return req_check
-
         # end of method
         return req_share_association
 
@@ -572,25 +435,11 @@ class ApiShare:
         else:
             pass
 
-        # URL
-        url_share_dissociation = utils.get_request_base_url(
-            route="shares/{}/catalogs/{}".format(share._id, catalog._id)
-        )
-
         # request
-        req_share_dissociation = self.api_client.delete(
-            url=url_share_dissociation,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_share_dissociation = self.api_client.execute(
+            "DELETE", route="shares/{}/catalogs/{}".format(share._id, catalog._id)
         )
 
-        # checking response
-        req_check = checker.check_api_response(req_share_dissociation)
-        if isinstance(req_check, tuple):
-            return req_check
-
         # end of method
         return req_share_dissociation
 
@@ -623,25 +472,11 @@ class ApiShare:
         else:
             pass
 
-        # URL
-        url_share_association = utils.get_request_base_url(
-            route="shares/{}/groups/{}".format(share._id, group._id)
-        )
-
         # request
-        req_share_association = self.api_client.put(
-            url=url_share_association,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_share_association = self.api_client.execute(
+            "PUT", route="shares/{}/groups/{}".format(share._id, group._id)
         )
 
-        # checking response
-        req_check = checker.check_api_response(req_share_association)
-        if isinstance(req_check, tuple):
-            return req_check
-
         # end of method
         return req_share_association
 
@@ -675,25 +510,11 @@ class ApiShare:
         else:
             pass
 
-        # URL
-        url_share_dissociation = utils.get_request_base_url(
-            route="shares/{}/groups/{}".format(share._id, group._id)
-        )
-
         # request
-        req_share_dissociation = self.api_client.delete(
-            url=url_share_dissociation,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_share_dissociation = self.api_client.execute(
+            "DELETE", route="shares/{}/groups/{}".format(share._id, group._id)
         )
 
-        # checking response
-        req_check = checker.check_api_response(req_share_dissociation)
-        if isinstance(req_check, tuple):
-            return req_check
-
         # end of method
         return req_share_dissociation
 
@@ -86,25 +86,12 @@ class ApiSpecification:
         else:
             payload = None
 
-        # request URL
-        url_specifications = utils.get_request_base_url(
-            route="groups/{}/specifications".format(workgroup_id)
-        )
-
         # request
-        req_specifications_wg = self.api_client.get(
-            url_specifications,
-            headers=self.api_client.header,
-            params=payload,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_specifications_wg = self.api_client.execute(
+            "GET", route="groups/{}/specifications".format(workgroup_id), params=payload
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_specifications_wg)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_specifications_wg, tuple):
+            return req_specifications_wg
 
         wg_specifications = req_specifications_wg.json()
 
@@ -129,24 +116,12 @@ class ApiSpecification:
         else:
             pass
 
-        # specification route
-        url_specification = utils.get_request_base_url(
-            route="specifications/{}".format(specification_id)
-        )
-
         # request
-        req_specification = self.api_client.get(
-            url_specification,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_specification = self.api_client.execute(
+            "GET", route="specifications/{}".format(specification_id)
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_specification)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_specification, tuple):
+            return req_specification
 
         # end of method
         return Specification(**req_specification.json())
@@ -190,25 +165,14 @@ class ApiSpecification:
         else:
             pass
 
-        # build request url
-        url_specification_create = utils.get_request_base_url(
-            route="groups/{}/specifications".format(workgroup_id)
-        )
-
         # request
-        req_new_specification = self.api_client.post(
-            url_specification_create,
+        req_new_specification = self.api_client.execute(
+            "POST",
+            route="groups/{}/specifications".format(workgroup_id),
             data=specification.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_new_specification)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_new_specification, tuple):
+            return req_new_specification
 
         # load new specification and save it to the cache
         new_specification = Specification(**req_new_specification.json())
@@ -242,25 +206,12 @@ class ApiSpecification:
         else:
             pass
 
-        # request URL
-        url_specification_delete = utils.get_request_base_url(
-            route="groups/{}/specifications/{}".format(workgroup_id, specification_id)
-        )
-
         # request
-        req_specification_deletion = self.api_client.delete(
-            url_specification_delete,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_specification_deletion = self.api_client.execute(
+            "DELETE",
+            route="groups/{}/specifications/{}".format(workgroup_id, specification_id),
         )
 
-        # checking response
-        req_check = checker.check_api_response(req_specification_deletion)
-        if isinstance(req_check, tuple):
-            return req_check
-
         return req_specification_deletion
 
     @ApiDecorators._check_bearer_validity
@@ -283,19 +234,10 @@ class ApiSpecification:
         )
 
         # request
-        req_specification_exists = self.api_client.get(
-            url_specification_exists,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_specification_exists = self.api_client.execute(
+            "GET", url=url_specification_exists
         )
 
-        # checking response
-        req_check = checker.check_api_response(req_specification_exists)
-        if isinstance(req_check, tuple):
-            return req_check
-
         return req_specification_exists
 
     @ApiDecorators._check_bearer_validity
@@ -313,27 +255,16 @@ class ApiSpecification:
         else:
             pass
 
-        # URL
-        url_specification_update = utils.get_request_base_url(
+        # request
+        req_specification_update = self.api_client.execute(
+            "PUT",
             route="groups/{}/specifications/{}".format(
                 specification.owner.get("_id"), specification._id
-            )
-        )
-
-        # request
-        req_specification_update = self.api_client.put(
-            url=url_specification_update,
+            ),
             data=specification.to_dict(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_specification_update)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_specification_update, tuple):
+            return req_specification_update
 
         # update specification in cache
         new_specification = Specification(**req_specification_update.json())
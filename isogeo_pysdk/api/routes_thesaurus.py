@@ -60,22 +60,10 @@ class ApiThesaurus:
     @ApiDecorators._check_bearer_validity
     def thesauri(self, caching: bool = 1) -> list:
         """Get all thesauri."""
-        # URL builder
-        url_thesauri = utils.get_request_base_url(route="thesauri")
-
         # request
-        req_thesauri = self.api_client.get(
-            url=url_thesauri,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
-        )
-
-        # checking response
-        req_check = checker.check_api_response(req_thesauri)
-        if isinstance(req_check, tuple):
-            return req_check
+        req_thesauri = self.api_client.execute("GET", route="thesauri")
+        if isinstance(req_thesauri, tuple):
+            return req_thesauri
 
         thesauri = req_thesauri.json()
 
@@ -114,25 +102,12 @@ class ApiThesaurus:
         else:
             payload = None
 
-        # URL builder
-        url_thesaurus = utils.get_request_base_url(
-            route="thesauri/{}".format(thesaurus_id)
-        )
-
         # request
-        req_thesaurus = self.api_client.get(
-            url=url_thesaurus,
-            headers=self.api_client.header,
-            params=payload,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_thesaurus = self.api_client.execute(
+            "GET", route="thesauri/{}".format(thesaurus_id), params=payload
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_thesaurus)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_thesaurus, tuple):
+            return req_thesaurus
 
         # end of method
         return Thesaurus(**req_thesaurus.json())
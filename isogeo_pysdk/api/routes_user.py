@@ -81,23 +81,10 @@ class ApiUser:
         # handling request parameters
         payload = {"_include": "memberships"}
 
-        # request URL
-        url_users = utils.get_request_base_url(route="users")
-
         # request
-        req_users = self.api_client.get(
-            url=url_users,
-            headers=self.api_client.header,
-            params=payload,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
-        )
-
-        # checking response
-        req_check = checker.check_api_response(req_users)
-        if isinstance(req_check, tuple):
-            return req_check
+        req_users = self.api_client.execute("GET", route="users", params=payload)
+        if isinstance(req_users, tuple):
+            return req_users
 
         # end of method
         return req_users.json()
@@ -123,23 +110,12 @@ class ApiUser:
         else:
             payload = None
 
-        # URL
-        url_user = utils.get_request_base_url(route="users/{}".format(user_id))
-
         # request
-        req_user = self.api_client.get(
-            url=url_user,
-            headers=self.api_client.header,
-            params=payload,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_user = self.api_client.execute(
+            "GET", route="users/{}".format(user_id), params=payload
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_user)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_user, tuple):
+            return req_user
 
         # end of method
         return User(**req_user.json())
@@ -178,23 +154,12 @@ class ApiUser:
         else:
             pass
 
-        # URL
-        url_user_create = utils.get_request_base_url(route="users")
-
         # request
-        req_new_user = self.api_client.post(
-            url=url_user_create,
-            json=user.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_new_user = self.api_client.execute(
+            "POST", route="users", json=user.to_dict_creation()
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_new_user)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_new_user, tuple):
+            return req_new_user
 
         # load new user and save it to the cache
         new_user = User(**req_new_user.json())
@@ -216,25 +181,15 @@ class ApiUser:
         else:
             pass
 
-        # URL
-        url_user_delete = utils.get_request_base_url(route="users/{}".format(user._id))
-
         # request
-        req_user_delete = self.api_client.delete(
-            url=url_user_delete,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_user_delete = self.api_client.execute(
+            "DELETE", route="users/{}".format(user._id)
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_user_delete)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_user_delete, tuple):
+            return req_user_delete
 
         # end of method
-        return req_check
+        return checker.check_api_response(req_user_delete)
 
     @ApiDecorators._check_bearer_validity
     def update(self, user: User) -> User:
@@ -263,23 +218,12 @@ class ApiUser:
         else:
             pass
 
-        # URL
-        url_user_update = utils.get_request_base_url(route="users/{}".format(user._id))
-
         # request
-        req_user_update = self.api_client.put(
-            url=url_user_update,
-            json=user.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_user_update = self.api_client.execute(
+            "PUT", route="users/{}".format(user._id), json=user.to_dict_creation()
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_user_update)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_user_update, tuple):
+            return req_user_update
 
         # end of method
         return User(**req_user_update.json())
@@ -294,24 +238,12 @@ class ApiUser:
         logger.warning(
             "This route doesn't work in 2019. See: https://github.com/isogeo/isogeo-api/issues/7"
         )
-        # URL builder
-        url_user_memberships = utils.get_request_base_url(
-            route="users/{}/memberships".format(user_id)
-        )
-
         # request
-        req_user_memberships = self.api_client.get(
-            url=url_user_memberships,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_user_memberships = self.api_client.execute(
+            "GET", route="users/{}/memberships".format(user_id)
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_user_memberships)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_user_memberships, tuple):
+            return req_user_memberships
 
         return req_user_memberships.json()
 
@@ -370,23 +302,12 @@ class ApiUser:
         else:
             user_subscription["isInterested"] = bool(subscribe)
 
-        # URL
-        url_user_update = utils.get_request_base_url(route="users/{}".format(user._id))
-
         # request
-        req_user_update = self.api_client.put(
-            url=url_user_update,
-            json=user.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_user_update = self.api_client.execute(
+            "PUT", route="users/{}".format(user._id), json=user.to_dict_creation()
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_user_update)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_user_update, tuple):
+            return req_user_update
 
         # end of method
         return User(**req_user_update.json())
@@ -21,6 +21,7 @@ from requests.exceptions import Timeout
 # submodules
 from isogeo_pysdk.checker import IsogeoChecker
 from isogeo_pysdk.decorators import ApiDecorators
+from isogeo_pysdk.lazy_route import LazyRoute
 from isogeo_pysdk.enums import WorkgroupStatisticsTags
 from isogeo_pysdk.models import Contact, Invitation, Workgroup
 from isogeo_pysdk.utils import IsogeoUtils
@@ -43,6 +44,9 @@ utils = IsogeoUtils()
 class ApiWorkgroup:
     """Routes as methods of Isogeo API used to manipulate workgroups."""
 
+    # sub routes (instanciated at first access)
+    srs = LazyRoute(lambda self: ApiCoordinateSystem(self.api_client))
+
     def __init__(self, api_client=None):
         if api_client is not None:
             self.api_client = api_client
@@ -62,9 +66,6 @@ class ApiWorkgroup:
             self.ssl,
         ) = utils.set_base_url(self.api_client.platform)
 
-        # sub routes
-        self.srs = ApiCoordinateSystem(self.api_client)
-
         # initialize
         super(ApiWorkgroup, self).__init__()
 
@@ -85,23 +86,10 @@ class ApiWorkgroup:
         else:
             payload = None
 
-        # request URL
-        url_workgroups = utils.get_request_base_url(route="groups")
-
         # request
-        req_workgroups = self.api_client.get(
-            url=url_workgroups,
-            headers=self.api_client.header,
-            params=payload,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
-        )
-
-        # checking response
-        req_check = checker.check_api_response(req_workgroups)
-        if isinstance(req_check, tuple):
-            return req_check
+        req_workgroups = self.api_client.execute("GET", route="groups", params=payload)
+        if isinstance(req_workgroups, tuple):
+            return req_workgroups
 
         wg_workgroups = req_workgroups.json()
 
@@ -137,25 +125,12 @@ class ApiWorkgroup:
         else:
             payload = None
 
-        # URL
-        url_workgroup = utils.get_request_base_url(
-            route="groups/{}".format(workgroup_id)
-        )
-
         # request
-        req_workgroup = self.api_client.get(
-            url=url_workgroup,
-            headers=self.api_client.header,
-            params=payload,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_workgroup = self.api_client.execute(
+            "GET", route="groups/{}".format(workgroup_id), params=payload
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_workgroup)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_workgroup, tuple):
+            return req_workgroup
 
         # end of method
         return Workgroup(**req_workgroup.json())
@@ -194,23 +169,12 @@ class ApiWorkgroup:
         else:
             pass
 
-        # URL
-        url_workgroup_create = utils.get_request_base_url(route="groups")
-
         # request
-        req_new_workgroup = self.api_client.post(
-            url=url_workgroup_create,
-            data=workgroup.to_dict_creation(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_new_workgroup = self.api_client.execute(
+            "POST", route="groups", data=workgroup.to_dict_creation()
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_new_workgroup)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_new_workgroup, tuple):
+            return req_new_workgroup
 
         # load new workgroup and save it to the cache
         new_workgroup = Workgroup(**req_new_workgroup.json())
@@ -235,25 +199,11 @@ class ApiWorkgroup:
         else:
             pass
 
-        # URL
-        url_workgroup_delete = utils.get_request_base_url(
-            route="groups/{}".format(workgroup_id)
-        )
-
         # request
-        req_workgroup_deletion = self.api_client.delete(
-            url=url_workgroup_delete,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_workgroup_deletion = self.api_client.execute(
+            "DELETE", route="groups/{}".format(workgroup_id)
         )
 
-        # checking response
-        req_check = checker.check_api_response(req_workgroup_deletion)
-        if isinstance(req_check, tuple):
-            return req_check
-
         return req_workgroup_deletion
 
     @ApiDecorators._check_bearer_validity
@@ -270,25 +220,11 @@ class ApiWorkgroup:
         else:
             pass
 
-        # URL builder
-        url_workgroup_exists = utils.get_request_base_url(
-            route="groups/{}".format(workgroup_id)
-        )
-
         # request
-        req_workgroup_exists = self.api_client.get(
-            url=url_workgroup_exists,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_workgroup_exists = self.api_client.execute(
+            "GET", route="groups/{}".format(workgroup_id)
         )
 
-        # checking response
-        req_check = checker.check_api_response(req_workgroup_exists)
-        if isinstance(req_check, tuple):
-            return req_check
-
         return req_workgroup_exists
 
     @ApiDecorators._check_bearer_validity
@@ -306,25 +242,12 @@ class ApiWorkgroup:
         else:
             pass
 
-        # URL
-        url_workgroup_update = utils.get_request_base_url(
-            route="groups/{}".format(workgroup._id)
-        )
-
         # request
-        req_workgroup_update = self.api_client.put(
-            url=url_workgroup_update,
-            json=workgroup.to_dict(),
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_workgroup_update = self.api_client.execute(
+            "PUT", route="groups/{}".format(workgroup._id), json=workgroup.to_dict()
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_workgroup_update)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_workgroup_update, tuple):
+            return req_workgroup_update
 
         # update workgroup in cache
         workgroup_updated = Workgroup(**req_workgroup_update.json())
@@ -371,24 +294,12 @@ class ApiWorkgroup:
         else:
             pass
 
-        # URL builder
-        url_workgroup_limits = utils.get_request_base_url(
-            route="/groups/{}/limits".format(workgroup_id)
-        )
-
         # request
-        req_workgroup_limits = self.api_client.get(
-            url=url_workgroup_limits,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_workgroup_limits = self.api_client.execute(
+            "GET", route="/groups/{}/limits".format(workgroup_id)
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_workgroup_limits)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_workgroup_limits, tuple):
+            return req_workgroup_limits
 
         return req_workgroup_limits.json()
 
@@ -407,24 +318,12 @@ class ApiWorkgroup:
         else:
             pass
 
-        # URL builder
-        url_workgroup_memberships = utils.get_request_base_url(
-            route="/groups/{}/memberships".format(workgroup_id)
-        )
-
         # request
-        req_workgroup_memberships = self.api_client.get(
-            url=url_workgroup_memberships,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_workgroup_memberships = self.api_client.execute(
+            "GET", route="/groups/{}/memberships".format(workgroup_id)
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_workgroup_memberships)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_workgroup_memberships, tuple):
+            return req_workgroup_memberships
 
         return req_workgroup_memberships.json()
 
@@ -443,24 +342,12 @@ class ApiWorkgroup:
         else:
             pass
 
-        # URL builder
-        url_workgroup_statistics = utils.get_request_base_url(
-            route="groups/{}/statistics".format(workgroup_id)
-        )
-
         # request
-        req_workgroup_statistics = self.api_client.get(
-            url=url_workgroup_statistics,
-            headers=self.api_client.header,
-            proxies=self.api_client.proxies,
-            verify=self.api_client.ssl,
-            timeout=self.api_client.timeout,
+        req_workgroup_statistics = self.api_client.execute(
+            "GET", route="groups/{}/statistics".format(workgroup_id)
         )
-
-        # checking response
-        req_check = checker.check_api_response(req_workgroup_statistics)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_workgroup_statistics, tuple):
+            return req_workgroup_statistics
 
         return req_workgroup_statistics.json()
 
@@ -491,19 +378,10 @@ class ApiWorkgroup:
                 )
             )
 
-        # URL builder
-        url_workgroup_statistics = utils.get_request_base_url(
-            route="groups/{}/statistics/tag/{}".format(workgroup_id, tag)
-        )
-
         # request
         try:
-            req_workgroup_statistics = self.api_client.get(
-                url=url_workgroup_statistics,
-                # headers=self.api_client.header,
-                proxies=self.api_client.proxies,
-                verify=self.api_client.ssl,
-                timeout=self.api_client.timeout,
+            req_workgroup_statistics = self.api_client.execute(
+                "GET", route="groups/{}/statistics/tag/{}".format(workgroup_id, tag)
             )
         except Timeout as e:
             logger.error(
@@ -512,10 +390,8 @@ class ApiWorkgroup:
             )
             return False, 500
 
-        # checking response
-        req_check = checker.check_api_response(req_workgroup_statistics)
-        if isinstance(req_check, tuple):
-            return req_check
+        if isinstance(req_workgroup_statistics, tuple):
+            return req_workgroup_statistics
 
         return req_workgroup_statistics.json()
 
@@ -0,0 +1,334 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""In-memory cache of the API responses, with expiration (TTL) by route and size limit."""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import logging
+import sys
+import threading
+from collections import OrderedDict
+from itertools import islice
+from time import monotonic
+from weakref import WeakSet
+
+# submodules
+from isogeo_pysdk.models.slots import slots_values
+
+# ##############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# all the caches instanciated, to be cleared at once (see: IsogeoUtils.cache_clearer)
+_registry = WeakSet()
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class IsogeoCache(object):
+    """Thread-safe cache of the API responses, used by the routes decorated with \
+    :meth:`isogeo_pysdk.decorators.ApiDecorators._cache_response`.
+
+    - entries expire after a time-to-live (TTL) set by route template
+    - the least recently used entries are evicted above a maximum size (estimated in bytes)
+    - keys are normalized so that logically identical arguments share the same entry \
+        (i.e. `include` as a list or a tuple, `bbox` as a string or a tuple)
+    - errors are never cached
+
+    :param int max_size: maximum size of the cache, in bytes. Defaults to 32 Mo.
+    :param float default_ttl: time-to-live in seconds of the entries. Defaults to 5 minutes.
+    :param dict ttls: time-to-live in seconds by route template, overriding the default. \
+        0 disables the cache for the route. Example: `{"resources/search": 30}`.
+
+    :Example:
+
+    .. code-block:: python
+
+        # cache searches during 30 seconds but not the metadata
+        isogeo = Isogeo(
+            client_id=app_id,
+            client_secret=app_secret,
+            auto_refresh_url=isogeo_token_uri,
+            cache=IsogeoCache(ttls={"resources/search": 30, "resources/{id}": 0}),
+        )
+        isogeo.connect()
+
+        # later
+        print(isogeo.cache.info())
+
+        # without cache
+        isogeo = Isogeo(..., cache=False)
+    """
+
+    # items measured in the big containers to estimate their size
+    SAMPLE_SIZE = 20
+
+    def __init__(
+        self, max_size: int = 32 * 1024 ** 2, default_ttl: float = 300, ttls: dict = None
+    ):
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        self.ttls = ttls or {}
+
+        # stats
+        self.hits = 0
+        self.misses = 0
+        self.size = 0
+
+        # key: (expires_at, size, value)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        _registry.add(self)
+
+    # -- PUBLIC ---------------------------------------------------------------
+    def ttl(self, route: str) -> float:
+        """Returns the time-to-live of a route.
+
+        :param str route: route template (i.e. 'resources/{id}')
+        """
+        return self.ttls.get(route, self.default_ttl)
+
+    def is_enabled(self, route: str) -> bool:
+        """Returns True if responses of the route can be cached.
+
+        :param str route: route template (i.e. 'resources/{id}')
+        """
+        return self.max_size > 0 and self.ttl(route) > 0
+
+    def get(self, key: tuple) -> tuple:
+        """Look for a value in the cache.
+
+        :param tuple key: cache key, as returned by :meth:`make_key`
+
+        :returns: tuple (hit, value)
+        :rtype: tuple
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+
+            expires_at, size, value = entry
+            if expires_at < monotonic():
+                self._remove(key)
+                self.misses += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, value
+
+    def set(self, key: tuple, value, ttl: float):
+        """Store a value in the cache. Errors (tuples) and values bigger than the cache are \
+        ignored.
+
+        :param tuple key: cache key, as returned by :meth:`make_key`
+        :param value: value to store
+        :param float ttl: time-to-live in seconds
+        """
+        if isinstance(value, tuple) or ttl <= 0:
+            return
+
+        size = self.estimate_size(value)
+        if size > self.max_size:
+            logger.debug(
+                "Response too big to be cached ({} > {} bytes).".format(
+                    size, self.max_size
+                )
+            )
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (monotonic() + ttl, size, value)
+            self.size += size
+
+            # evict the least recently used entries
+            while self.size > self.max_size:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, route: str, **arguments) -> int:
+        """Remove the entries of a route matching the arguments, whatever the other \
+        arguments of the calls (i.e. every `include` of a metadata). Used by the routes \
+        modifying a cached object.
+
+        :param str route: route template (i.e. 'resources/{id}')
+        :param arguments: arguments of the entries to remove, by name \
+            (i.e. `metadata_id=...`). If not set, every entry of the route is removed.
+
+        :returns: count of removed entries
+        :rtype: int
+        """
+        criteria = set(self.make_key(route, arguments)[1])
+        with self._lock:
+            keys = [
+                key
+                for key in self._entries
+                if key[0] == route and criteria.issubset(key[1])
+            ]
+            for key in keys:
+                self._remove(key)
+
+        return len(keys)
+
+    def clear(self):
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def info(self) -> dict:
+        """Returns the cache statistics.
+
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "max_size": self.max_size,
+                "misses": self.misses,
+                "size": self.size,
+            }
+
+    @classmethod
+    def clear_all(cls):
+        """Clear every cache instanciated in the process."""
+        for cache in list(_registry):
+            cache.clear()
+
+    # -- KEYS -----------------------------------------------------------------
+    @classmethod
+    def make_key(cls, route: str, arguments: dict) -> tuple:
+        """Build a normalized cache key from a route template and the arguments of the call.
+
+        :param str route: route template (i.e. 'resources/{id}')
+        :param dict arguments: arguments of the call, by name
+
+        :rtype: tuple
+        """
+        return (
+            route,
+            tuple(
+                sorted(
+                    (name, cls._normalize(name, value))
+                    for name, value in arguments.items()
+                )
+            ),
+        )
+
+    @classmethod
+    def _normalize(cls, name: str, value):
+        """Returns a hashable and canonical version of an argument value."""
+        # bounding box: "-4.97,45.9,-1.21,48.5" or (-4.97, 45.9, -1.21, 48.5)
+        if name == "bbox" and value:
+            if isinstance(value, str):
+                value = value.split(",")
+            try:
+                return tuple(float(coord) for coord in value)
+            except (TypeError, ValueError):
+                return str(value)
+
+        # order of subresources and filters doesn't matter
+        if name in ("include", "specific_md", "specific_tag") and isinstance(
+            value, (list, tuple, set, frozenset)
+        ):
+            return tuple(sorted(str(i) for i in value))
+
+        if isinstance(value, dict):
+            return tuple(
+                sorted((str(k), cls._normalize(k, v)) for k, v in value.items())
+            )
+        if isinstance(value, (set, frozenset)):
+            return tuple(sorted(cls._normalize(name, i) for i in value))
+        if isinstance(value, (list, tuple)):
+            return tuple(cls._normalize(name, i) for i in value)
+        if isinstance(value, str):
+            return value.strip()
+        if isinstance(value, bool) or value is None:
+            return value
+        if isinstance(value, (int, float)):
+            # 1 and True are both used as flags
+            return value
+        if hasattr(value, "to_dict"):
+            return cls._normalize(name, value.to_dict())
+
+        return repr(value)
+
+    # -- SIZE -----------------------------------------------------------------
+    @classmethod
+    def estimate_size(cls, value, sample_size: int = SAMPLE_SIZE) -> int:
+        """Estimate the memory size of a response (decoded JSON or model), in bytes. \
+        Containers bigger than the sample size are estimated from a sample of their items, \
+        so the cost doesn't grow with the count of results.
+
+        :param value: object to measure
+        :param int sample_size: count of items measured by container. None to measure \
+            every item.
+
+        :rtype: int
+        """
+        size = 0
+        seen = set()
+        # objects to measure and the count of objects each one stands for
+        stack = [(value, 1)]
+        while stack:
+            obj, weight = stack.pop()
+            if id(obj) in seen:
+                continue
+            seen.add(id(obj))
+            size += sys.getsizeof(obj) * weight
+
+            if isinstance(obj, dict):
+                items = obj.items()
+            elif isinstance(obj, (list, tuple, set, frozenset)):
+                items = obj
+            elif hasattr(obj, "__dict__"):
+                stack.append((vars(obj), weight))
+                continue
+            elif hasattr(obj, "__slots__"):
+                items = slots_values(obj)
+            else:
+                continue
+
+            count = len(items)
+            if sample_size is not None and count > sample_size:
+                if isinstance(items, (list, tuple)):
+                    items = items[:: count // sample_size][:sample_size]
+                else:
+                    items = list(islice(items, sample_size))
+                weight = weight * count / len(items)
+            for item in items:
+                if isinstance(obj, dict):
+                    stack.append((item[0], weight))
+                    stack.append((item[1], weight))
+                else:
+                    stack.append((item, weight))
+
+        return int(size)
+
+    # -- INTERNAL -------------------------------------------------------------
+    def _remove(self, key: tuple):
+        """Remove an entry. Must be called with the lock acquired."""
+        _, size, _ = self._entries.pop(key)
+        self.size -= size
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    cache = IsogeoCache()
+    print(cache.info())
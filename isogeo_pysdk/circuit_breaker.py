@@ -0,0 +1,236 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Circuit breaker: fail fast while the API is degraded instead of waiting out every timeout."""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import logging
+import threading
+from time import monotonic
+from urllib.parse import urlsplit
+
+# 3rd party
+from requests.exceptions import (
+    ChunkedEncodingError,
+    ConnectionError,
+    ContentDecodingError,
+    RetryError,
+    Timeout,
+)
+
+# submodules
+from isogeo_pysdk.exceptions import CircuitOpenError
+
+# ##############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# exceptions meaning the API didn't answer properly
+_FAILURES = (
+    ChunkedEncodingError,
+    ConnectionError,
+    ContentDecodingError,
+    RetryError,
+    Timeout,
+)
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class _Circuit(object):
+    """State of the circuit of a host."""
+
+    __slots__ = ("state", "failures", "opened_at", "trials")
+
+    def __init__(self):
+        self.state = IsogeoCircuitBreaker.CLOSED
+        self.failures = 0  # consecutive failures
+        self.opened_at = 0.0
+        self.trials = 0  # requests in flight while half-open
+
+
+class IsogeoCircuitBreaker(object):
+    """Circuit breaker by host, shared by all the threads of a client:
+
+    - closed: requests are sent. After `failure_threshold` consecutive failures (connection \
+        errors, timeouts, broken responses or `failure_statuses`), the circuit opens.
+    - open: requests fail immediately with :class:`isogeo_pysdk.exceptions.CircuitOpenError`, \
+        without waiting for the API. After `recovery_timeout` seconds, the circuit is half-open.
+    - half-open: up to `half_open_max_calls` trial requests are sent, the others fail \
+        immediately. A success closes the circuit, a failure opens it again.
+
+    :param int failure_threshold: consecutive failures opening the circuit. Defaults to 5.
+    :param float recovery_timeout: delay in seconds before trying again. Defaults to 30.
+    :param int half_open_max_calls: concurrent trial requests while half-open. Defaults to 1.
+    :param tuple failure_statuses: HTTP statuses counted as failures. Defaults to server errors \
+        meaning the API is unavailable: 500, 502, 503, 504.
+
+    :Example:
+
+    .. code-block:: python
+
+        isogeo = Isogeo(
+            ...,
+            circuit_breaker=IsogeoCircuitBreaker(failure_threshold=3, recovery_timeout=60),
+        )
+        try:
+            md = isogeo.metadata.get(metadata_id)
+        except CircuitOpenError as exc:
+            # back off the whole job
+            time.sleep(exc.retry_in)
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30,
+        half_open_max_calls: int = 1,
+        failure_statuses: tuple = (500, 502, 503, 504),
+    ):
+        if failure_threshold < 1:
+            raise ValueError(
+                "Failure threshold must be at least 1: {}".format(failure_threshold)
+            )
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = max(1, half_open_max_calls)
+        self.failure_statuses = frozenset(failure_statuses)
+
+        # stats
+        self.rejected = 0  # count of requests failed fast
+
+        self._circuits = {}
+        self._lock = threading.Lock()
+
+    def state(self, url: str) -> str:
+        """Returns the state of the circuit of an URL host: closed, open or half-open.
+
+        :param str url: URL or host
+
+        :rtype: str
+        """
+        with self._lock:
+            circuit = self._circuits.get(self._host(url))
+            if circuit is None:
+                return self.CLOSED
+            self._update(circuit)
+            return circuit.state
+
+    def reset(self):
+        """Close all the circuits."""
+        with self._lock:
+            self._circuits.clear()
+
+    def call(self, url: str, send):
+        """Send a request through the circuit of the URL host.
+
+        :param str url: URL to request
+        :param callable send: function sending the request and returning the response
+
+        :raises CircuitOpenError: if the circuit is open
+
+        :rtype: requests.Response
+        """
+        host = self._host(url)
+        with self._lock:
+            circuit = self._circuits.setdefault(host, _Circuit())
+            self._update(circuit)
+            if circuit.state == self.OPEN or (
+                circuit.state == self.HALF_OPEN
+                and circuit.trials >= self.half_open_max_calls
+            ):
+                self.rejected += 1
+                raise CircuitOpenError(
+                    host,
+                    retry_in=max(
+                        0.0, circuit.opened_at + self.recovery_timeout - monotonic()
+                    ),
+                )
+            if circuit.state == self.HALF_OPEN:
+                circuit.trials += 1
+            trial = circuit.state == self.HALF_OPEN
+
+        try:
+            response = send()
+        except _FAILURES:
+            self._record(host, success=False, trial=trial)
+            raise
+        except BaseException:
+            # not an outcome of the API (i.e. deadline of the caller): free the trial only
+            if trial:
+                self._release(host)
+            raise
+        self._record(
+            host,
+            success=response.status_code not in self.failure_statuses,
+            trial=trial,
+        )
+        return response
+
+    # -- INTERNAL -------------------------------------------------------------
+    @staticmethod
+    def _host(url: str) -> str:
+        """Returns the host of an URL, or the value itself if it's already a host."""
+        return urlsplit(url).netloc or url
+
+    def _update(self, circuit: _Circuit):
+        """Turn an open circuit half-open once the recovery timeout is over."""
+        if (
+            circuit.state == self.OPEN
+            and monotonic() - circuit.opened_at >= self.recovery_timeout
+        ):
+            circuit.state = self.HALF_OPEN
+            circuit.trials = 0
+
+    def _release(self, host: str):
+        """Free a trial request slot of a half-open circuit, without changing its state."""
+        with self._lock:
+            circuit = self._circuits.setdefault(host, _Circuit())
+            circuit.trials = max(0, circuit.trials - 1)
+
+    def _record(self, host: str, success: bool, trial: bool):
+        """Update the circuit of a host with the outcome of a request."""
+        with self._lock:
+            circuit = self._circuits.setdefault(host, _Circuit())
+            if trial:
+                circuit.trials = max(0, circuit.trials - 1)
+            if success:
+                if circuit.state != self.CLOSED:
+                    logger.info("Circuit closed: {} is back".format(host))
+                circuit.state = self.CLOSED
+                circuit.failures = 0
+                return
+
+            circuit.failures += 1
+            if circuit.state == self.HALF_OPEN or (
+                circuit.state == self.CLOSED
+                and circuit.failures >= self.failure_threshold
+            ):
+                circuit.state = self.OPEN
+                circuit.opened_at = monotonic()
+                logger.warning(
+                    "Circuit opened after {} consecutive failures: requests to {} "
+                    "fail fast during {}s".format(
+                        circuit.failures, host, self.recovery_timeout
+                    )
+                )
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    pass
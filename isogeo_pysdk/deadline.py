@@ -0,0 +1,210 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Deadline and cancellation token propagated to the requests and the pagination tasks of \
+an SDK call."""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import logging
+import threading
+from contextvars import ContextVar
+from time import monotonic
+
+# submodules
+from isogeo_pysdk.exceptions import DeadlineExceededError, OperationCancelledError
+
+# ##############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# deadline of the running SDK call, if any
+_current_deadline = ContextVar("isogeo_deadline", default=None)
+
+_END = object()  # end of iteration marker
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class IsogeoDeadline(object):
+    """Deadline and cancellation token of an SDK call.
+
+    Pass it to any route method (`deadline` keyword argument) or activate it as a context \
+    manager: it's propagated to every HTTP request and pagination task of the call, \
+    threads included. Then:
+
+    - no request is sent once the deadline is exceeded or the token cancelled;
+    - requests timeouts are capped to the remaining time;
+    - paginations stop and the call raises :class:`isogeo_pysdk.exceptions.DeadlineExceededError` \
+        (or :class:`isogeo_pysdk.exceptions.OperationCancelledError` if cancelled) or, with \
+        `partial`, returns the pages already received.
+
+    Requests in flight when the token is cancelled end with their own (capped) timeout.
+
+    :param float timeout: delay in seconds before the deadline. None (default) for a \
+        cancellation token without deadline.
+    :param bool partial: option to return the results received so far by the paginated \
+        calls (i.e. `search(whole_results=True)`) instead of raising. *False* by DEFAULT.
+    :param IsogeoDeadline parent: parent token: the deadline is exceeded or cancelled \
+        with it. Its `partial` option is inherited.
+
+    :Example:
+
+    .. code-block:: python
+
+        # give me what you can in 5 seconds
+        search = isogeo.search(
+            whole_results=1, deadline=IsogeoDeadline(5, partial=True)
+        )
+        if len(search.results) < search.total:
+            print("partial results")
+
+        # cancellable from another thread
+        token = IsogeoDeadline()
+        threading.Timer(2, token.cancel).start()
+        with token:
+            for md in isogeo.iter_search(include="all"):
+                ...
+    """
+
+    def __init__(self, timeout: float = None, partial: bool = False, parent=None):
+        self.timeout = timeout
+        self.partial = partial or (parent is not None and parent.partial)
+        self.parent = parent
+        self.expires_at = None if timeout is None else monotonic() + timeout
+        self._cancelled = threading.Event()
+        self._tokens = []  # context tokens of the `with` blocks
+
+    def __repr__(self):
+        return "IsogeoDeadline(remaining={}, cancelled={})".format(
+            self.remaining(), self.cancelled
+        )
+
+    def __enter__(self):
+        self._tokens.append(_current_deadline.set(self))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _current_deadline.reset(self._tokens.pop())
+
+    # -- STATE ----------------------------------------------------------------
+    @staticmethod
+    def current():
+        """Returns the deadline of the running SDK call, None if there is not.
+
+        :rtype: IsogeoDeadline
+        """
+        return _current_deadline.get()
+
+    def cancel(self):
+        """Cancel the call. Thread-safe."""
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Returns True if the token (or its parent) has been cancelled."""
+        return self._cancelled.is_set() or (
+            self.parent is not None and self.parent.cancelled
+        )
+
+    @property
+    def expired(self) -> bool:
+        """Returns True if the deadline is exceeded or the token cancelled."""
+        return self.remaining() == 0
+
+    def remaining(self) -> float:
+        """Returns the remaining time in seconds, 0 if cancelled, None if there is \
+        no deadline.
+
+        :rtype: float
+        """
+        if self.cancelled:
+            return 0.0
+        remaining = None
+        if self.expires_at is not None:
+            remaining = max(0.0, self.expires_at - monotonic())
+        if self.parent is not None:
+            parent_remaining = self.parent.remaining()
+            if parent_remaining is not None:
+                remaining = (
+                    parent_remaining
+                    if remaining is None
+                    else min(remaining, parent_remaining)
+                )
+
+        return remaining
+
+    def check(self):
+        """Raise if the call must stop.
+
+        :raises OperationCancelledError: if the token has been cancelled
+        :raises DeadlineExceededError: if the deadline is exceeded
+        """
+        if self.cancelled:
+            raise OperationCancelledError("SDK call cancelled.")
+        if self.expired:
+            raise DeadlineExceededError(
+                "SDK call deadline exceeded ({}s).".format(self._timeout())
+            )
+
+    def cap_timeout(self, timeout):
+        """Returns a requests timeout capped to the remaining time.
+
+        :param timeout: requests timeout: None, seconds or (connect, read) tuple
+        """
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        if timeout is None:
+            return remaining
+        if isinstance(timeout, tuple):
+            return tuple(remaining if t is None else min(t, remaining) for t in timeout)
+
+        return min(timeout, remaining)
+
+    # -- PROPAGATION ----------------------------------------------------------
+    def run(self, func, *args, **kwargs):
+        """Call a function with this deadline as current one (i.e. in another thread).
+
+        :param callable func: function to call
+        """
+        token = _current_deadline.set(self)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _current_deadline.reset(token)
+
+    def iterate(self, iterator):
+        """Iterate with this deadline as current one at each step (i.e. over a generator \
+        route method).
+
+        :param iterator: iterator or generator to consume
+        """
+        iterator = iter(iterator)
+        while True:
+            item = self.run(next, iterator, _END)
+            if item is _END:
+                return
+            yield item
+
+    # -- INTERNAL -------------------------------------------------------------
+    def _timeout(self) -> float:
+        """Returns the timeout of the deadline, or of its parent."""
+        if self.timeout is None and self.parent is not None:
+            return self.parent._timeout()
+        return self.timeout
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    pass
@@ -10,10 +10,18 @@
 # ##################################
 
 # standard library
+import inspect
 import logging
 from datetime import datetime
 from functools import wraps
 
+# submodules
+from isogeo_pysdk.cache import IsogeoCache
+from isogeo_pysdk.deadline import IsogeoDeadline
+from isogeo_pysdk.single_flight import IsogeoSingleFlight
+from isogeo_pysdk.token_manager import IsogeoTokenManager
+from isogeo_pysdk.tracing import IsogeoTracer
+
 # ##############################################################################
 # ########## Globals ###############
 # ##################################
@@ -34,29 +42,144 @@ class ApiDecorators(object):
         Isogeo ID delivers authentication bearers which are valid during
         a certain time. So this decorator checks the validity of the token
         comparing with actual datetime (UTC) and renews it if necessary.
+        If the API client has a token manager (see: :class:`isogeo_pysdk.token_manager.IsogeoTokenManager`),
+        the renewal is delegated to it.
         See: https://tools.ietf.org/html/rfc6750#section-2
 
+        As it wraps every public method of the routes, it also opens the span of the method \
+        if the API client has a tracer (see: :class:`isogeo_pysdk.tracing.IsogeoTracer`). \
+        Generators are not traced as a whole: their requests are.
+
+        It also accepts a `deadline` keyword argument (see: \
+        :class:`isogeo_pysdk.deadline.IsogeoDeadline`), propagated to the requests of the method.
+
         :param decorated_func token: original function to execute after check
         """
+        traceable = not inspect.isgeneratorfunction(decorated_func)
 
         @wraps(decorated_func)
         def wrapper(*args, **kwargs):
+            deadline = kwargs.pop("deadline", None)
+            if deadline is not None:
+                if traceable:
+                    return deadline.run(wrapper, *args, **kwargs)
+                return deadline.iterate(wrapper(*args, **kwargs))
+
+            # API client of the routes object, the last instanciated otherwise
+            api_client = getattr(args[0], "api_client", None) if args else None
+            if api_client is None:
+                api_client = self.api_client
+
+            token_manager = getattr(api_client, "token_manager", None)
+            if isinstance(token_manager, IsogeoTokenManager):
+                # renewed in advance and serialized by the manager
+                token_manager.ensure_valid()
             # compare token expiration date and ask for a new one if it's expired
-            if datetime.utcnow() > datetime.utcfromtimestamp(
-                self.api_client.token.get("expires_at")
+            elif datetime.utcnow() > datetime.utcfromtimestamp(
+                api_client.token.get("expires_at")
             ):
-                self.api_client.refresh_token(
-                    token_url=self.api_client.auto_refresh_url
-                )
+                api_client.refresh_token(token_url=api_client.auto_refresh_url)
                 logging.debug("Token was about to expire, so has been renewed.")
             else:
                 logging.debug("Token is still valid.")
 
             # let continue running the original function
-            return decorated_func(*args, **kwargs)
+            tracer = getattr(api_client, "tracer", None)
+            if tracer is None or not traceable:
+                return decorated_func(*args, **kwargs)
+
+            with tracer.span(decorated_func.__qualname__):
+                return decorated_func(*args, **kwargs)
 
         return wrapper
 
+    @classmethod
+    def _cache_response(self, route: str):
+        """Cache the responses of a route method in the :class:`isogeo_pysdk.cache.IsogeoCache` \
+        of the API client (attribute `cache`), during the TTL set for the route.
+
+        Errors (tuples returned by the checker) are not cached. The cached objects are shared: \
+        modifying them modifies the cache.
+
+        :param str route: route template used as key prefix and to get the TTL (i.e. 'resources/{id}')
+        """
+
+        def decorator(decorated_func):
+            signature = inspect.signature(decorated_func)
+
+            @wraps(decorated_func)
+            def wrapper(route_obj, *args, **kwargs):
+                cache = getattr(route_obj.api_client, "cache", None)
+                if not isinstance(cache, IsogeoCache) or not cache.is_enabled(route):
+                    return decorated_func(route_obj, *args, **kwargs)
+
+                key = _call_key(route, signature, route_obj, *args, **kwargs)
+
+                hit, value = cache.get(key)
+                IsogeoTracer.set_attributes(**{"isogeo.cache_hit": hit})
+                if hit:
+                    logging.debug("Response retrieved from cache: {}".format(route))
+                    metrics = getattr(route_obj.api_client, "metrics", None)
+                    if metrics is not None:
+                        metrics.record_cache_hit(route)
+                    return value
+
+                value = decorated_func(route_obj, *args, **kwargs)
+                deadline = IsogeoDeadline.current()
+                # results of a call stopped by its deadline may be partial
+                if deadline is None or not deadline.expired:
+                    cache.set(key, value, ttl=cache.ttl(route))
+                return value
+
+            return wrapper
+
+        return decorator
+
+    @classmethod
+    def _coalesce_calls(self, route: str):
+        """Share the execution of identical concurrent calls to a route method, using the \
+        :class:`isogeo_pysdk.single_flight.IsogeoSingleFlight` of the API client \
+        (attribute `single_flight`): one request and one decoded result for all the callers. \
+        Calls with a deadline are not shared.
+
+        :param str route: route template used as key prefix (i.e. 'shares')
+        """
+
+        def decorator(decorated_func):
+            signature = inspect.signature(decorated_func)
+
+            @wraps(decorated_func)
+            def wrapper(route_obj, *args, **kwargs):
+                single_flight = getattr(route_obj.api_client, "single_flight", None)
+                if (
+                    not isinstance(single_flight, IsogeoSingleFlight)
+                    or IsogeoDeadline.current() is not None
+                ):
+                    return decorated_func(route_obj, *args, **kwargs)
+
+                return single_flight.do(
+                    _call_key(route, signature, route_obj, *args, **kwargs),
+                    decorated_func,
+                    route_obj,
+                    *args,
+                    **kwargs,
+                )
+
+            return wrapper
+
+        return decorator
+
+
+# #############################################################################
+# ########## Functions #############
+# ##################################
+def _call_key(route: str, signature: inspect.Signature, *args, **kwargs) -> tuple:
+    """Build the normalized key of a route method call, defaults included (the routes \
+    object itself is ignored)."""
+    call = signature.bind(*args, **kwargs)
+    call.apply_defaults()
+    return IsogeoCache.make_key(route, dict(list(call.arguments.items())[1:]))
+
 
 # ##############################################################################
 # ##### Stand alone program ########
@@ -1,25 +1,48 @@
 # coding: utf-8
 #! python3  # noqa: E265
 
-from .application_types import ApplicationTypes  # noqa: F401
-from .bulk_actions import BulkActions  # noqa: F401
-from .bulk_ignore_reasons import BulkIgnoreReasons  # noqa: F401
-from .bulk_targets import BulkTargets  # noqa: F401
-from .catalog_statistics_tags import CatalogStatisticsTags  # noqa: F401
-from .contact_roles import ContactRoles  # noqa: F401
-from .contact_types import ContactTypes  # noqa: F401
-from .edition_profiles import EditionProfiles  # noqa: F401
-from .event_kinds import EventKinds  # noqa: F401
-from .keyword_casing import KeywordCasing  # noqa: F401
-from .limitation_restrictions import LimitationRestrictions  # noqa: F401
-from .limitation_types import LimitationTypes  # noqa: F401
-from .link_actions import LinkActions  # noqa: F401
-from .link_kinds import LinkKinds  # noqa: F401
-from .link_types import LinkTypes  # noqa: F401
-from .metadata_subresources import MetadataSubresources  # noqa: F401
-from .metadata_types import MetadataTypes  # noqa: F401
-from .search_filters_georelations import SearchGeoRelations  # noqa: F401
-from .session_status import SessionStatus  # noqa: F401
-from .share_types import ShareTypes  # noqa: F401
-from .user_roles import UserRoles  # noqa: F401
-from .workgroup_statistics_tags import WorkgroupStatisticsTags  # noqa: F401
+"""Enums of the Isogeo API, loaded at first access (PEP 562)."""
+
+# standard library
+from importlib import import_module
+
+# enums by module
+_ENUMS = {
+    "ApplicationTypes": ".application_types",
+    "BulkActions": ".bulk_actions",
+    "BulkIgnoreReasons": ".bulk_ignore_reasons",
+    "BulkTargets": ".bulk_targets",
+    "CatalogStatisticsTags": ".catalog_statistics_tags",
+    "ContactRoles": ".contact_roles",
+    "ContactTypes": ".contact_types",
+    "EditionProfiles": ".edition_profiles",
+    "EventKinds": ".event_kinds",
+    "KeywordCasing": ".keyword_casing",
+    "LimitationRestrictions": ".limitation_restrictions",
+    "LimitationTypes": ".limitation_types",
+    "LinkActions": ".link_actions",
+    "LinkKinds": ".link_kinds",
+    "LinkTypes": ".link_types",
+    "MetadataSubresources": ".metadata_subresources",
+    "MetadataTypes": ".metadata_types",
+    "SearchGeoRelations": ".search_filters_georelations",
+    "SessionStatus": ".session_status",
+    "ShareTypes": ".share_types",
+    "UserRoles": ".user_roles",
+    "WorkgroupStatisticsTags": ".workgroup_statistics_tags",
+}
+
+__all__ = list(_ENUMS)
+
+
+def __getattr__(name: str):
+    if name in _ENUMS:
+        value = getattr(import_module(_ENUMS.get(name), __name__), name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
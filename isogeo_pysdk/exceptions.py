@@ -35,3 +35,35 @@ class AlreadyExistError(IsogeoSdkError):
     """An object with similar properties already exists in Isogeo database."""
 
     pass
+
+
+class CircuitOpenError(IsogeoSdkError):
+    """The API is considered unavailable: requests fail fast until the circuit breaker \
+    tries again (see: :class:`isogeo_pysdk.circuit_breaker.IsogeoCircuitBreaker`).
+
+    :param str host: host of the API
+    :param float retry_in: delay in seconds before the next trial request
+    """
+
+    def __init__(self, host: str, retry_in: float = 0):
+        self.host = host
+        self.retry_in = retry_in
+        super(CircuitOpenError, self).__init__(
+            "Circuit open for {}: the API is unavailable, retry in {:.1f}s".format(
+                host, retry_in
+            )
+        )
+
+
+class OperationCancelledError(IsogeoSdkError):
+    """The SDK call has been cancelled \
+    (see: :class:`isogeo_pysdk.deadline.IsogeoDeadline`)."""
+
+    pass
+
+
+class DeadlineExceededError(OperationCancelledError):
+    """The SDK call didn't complete before its deadline \
+    (see: :class:`isogeo_pysdk.deadline.IsogeoDeadline`)."""
+
+    pass
@@ -0,0 +1,299 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Hedged requests: send a second request when the first one is slower than usual and keep \
+the first response."""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import logging
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from functools import partial
+from time import perf_counter
+
+# 3rd party
+from requests.adapters import DEFAULT_POOLSIZE
+
+# ##############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class IsogeoHedging(object):
+    """Hedging policy of the idempotent GET requests, shared by all the threads of a client.
+
+    If no response arrives within the hedging delay, a second identical request is sent \
+    and the first response to finish wins. The delay is the `percentile` of the latest \
+    latencies of the route, bounded by `min_delay` and `max_delay`.
+
+    - requests are not hedged until the latencies of their route are known \
+        (`min_samples`), nor when they are allowed to last long (`max_timeout`, i.e. \
+        search pages): they are sent from the caller's thread
+    - the other requests are sent from `max_workers` threads (one by pooled connection), \
+        the caller's thread waiting for the first response: a blocking request can't be \
+        interrupted to return the hedge response. The latencies don't include the wait \
+        for a thread. Hedge requests have their own `max_hedges` threads, so that they \
+        are sent on time even when many requests are slow.
+    - the losing request is cancelled if not sent yet, else closed as soon as its \
+        headers arrive, without reading its body (see :meth:`send`)
+
+    The losing request is passed to `on_discard` (see :meth:`send`) so that both \
+    requests are counted in the client metrics.
+
+    :param float percentile: latency percentile (0-1) of the route after which a request \
+        is hedged. Defaults to 0.95.
+    :param float delay: hedging delay in seconds until enough latencies are known \
+        (`min_samples`). Defaults to None: requests of the route are not hedged until then.
+    :param float min_delay: minimum hedging delay in seconds. Defaults to 0.05.
+    :param float max_delay: maximum hedging delay in seconds. Defaults to 5.
+    :param int window: count of latest latencies kept by route. Defaults to 100.
+    :param int min_samples: count of latencies required to use the percentile. Defaults to 20.
+    :param int max_workers: maximum count of threads sending the first requests of the \
+        hedged routes. Defaults to the `pool_maxsize` of the client (10 if used alone).
+    :param int max_hedges: maximum count of hedge requests in flight. Defaults to 5.
+    :param float max_timeout: requests whose read timeout is longer, in seconds, are not \
+        hedged. Defaults to 60.
+
+    :Example:
+
+    .. code-block:: python
+
+        isogeo = Isogeo(..., hedging=IsogeoHedging(percentile=0.9))
+        md = isogeo.metadata.get(metadata_id)
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        delay: float = None,
+        min_delay: float = 0.05,
+        max_delay: float = 5,
+        window: int = 100,
+        min_samples: int = 20,
+        max_workers: int = None,
+        max_hedges: int = 5,
+        max_timeout: float = 60,
+    ):
+        if not 0 < percentile <= 1:
+            raise ValueError(
+                "Percentile must be between 0 and 1: {}".format(percentile)
+            )
+        self.percentile = percentile
+        self.delay = delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.window = window
+        self.min_samples = min_samples
+        self.max_workers = max_workers
+        self.max_hedges = max_hedges
+        self.max_timeout = max_timeout
+
+        # stats
+        self.hedged = 0  # count of hedge requests sent
+        self.wins = 0  # count of hedge requests answered first
+
+        self._latencies = {}
+        self._lock = threading.Lock()
+        self._hedges = threading.BoundedSemaphore(max_hedges)
+        self._executor = None
+        self._hedges_executor = None
+
+    def hedge_delay(self, route: str) -> float:
+        """Returns the delay in seconds before hedging a request of a route, None if it \
+        must not be hedged (not enough latencies known and no default delay).
+
+        :param str route: route template (i.e. 'resources/{id}')
+
+        :rtype: float
+        """
+        with self._lock:
+            latencies = sorted(self._latencies.get(route, ()))
+        if len(latencies) < self.min_samples:
+            delay = self.delay
+        else:
+            delay = latencies[int(self.percentile * (len(latencies) - 1))]
+        if delay is None:
+            return None
+
+        return min(max(delay, self.min_delay), self.max_delay)
+
+    def observe(self, route: str, latency: float):
+        """Record the latency of a response of a route.
+
+        :param str route: route template (i.e. 'resources/{id}')
+        :param float latency: duration in seconds
+        """
+        with self._lock:
+            if route not in self._latencies:
+                self._latencies[route] = deque(maxlen=self.window)
+            self._latencies[route].append(latency)
+
+    def send(self, route: str, send, on_discard=None, timeout=None):
+        """Send a request, hedged if it's slower than the hedging delay of the route.
+
+        The response returned by `send` may be streamed (`stream=True`): the race is won \
+        by the first headers, the winning body is read before returning and the losing \
+        one is not downloaded.
+
+        :param str route: route template (i.e. 'resources/{id}')
+        :param callable send: function sending the request and returning the response
+        :param callable on_discard: function called with the response (None if the \
+            request failed) and the latency of the losing request, once it's sent
+        :param timeout: timeout of the request (as passed to requests), to skip the \
+            requests allowed to last long
+
+        :rtype: requests.Response
+        """
+        delay = self.hedge_delay(route)
+        if delay is None or self._is_long(timeout):
+            # from the caller's thread
+            response, latency, error = self._timed(send)
+            if error is not None:
+                raise error
+            self.observe(route, latency)
+            return self._read(response)
+
+        primary = self._submit(send)
+        done, _ = wait((primary,), timeout=delay)
+        if done or not self._hedges.acquire(blocking=False):
+            # fast enough or too many hedge requests in flight
+            response, latency, error = primary.result()
+            if error is not None:
+                raise error
+            self.observe(route, latency)
+            return self._read(response)
+
+        with self._lock:
+            self.hedged += 1
+        hedge = self._submit(send, hedge=True)
+        hedge.add_done_callback(lambda future: self._hedges.release())
+        pending = {primary, hedge}
+        failures = []
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            winner = None
+            for future in done:
+                if future.result()[2] is not None:
+                    failures.append(future.result())
+                elif winner is None:
+                    winner = future
+            if winner is None:
+                continue
+
+            # the other request is cancelled if not sent yet, else counted and closed
+            if failures:
+                if on_discard is not None:
+                    on_discard(None, failures[0][1])
+            else:
+                loser = hedge if winner is primary else primary
+                if not loser.cancel():
+                    loser.add_done_callback(
+                        partial(self._discard, route=route, on_discard=on_discard)
+                    )
+            response, latency, _ = winner.result()
+            self.observe(route, latency)
+            response.hedged = True
+            response.hedge_won = winner is hedge
+            if winner is hedge:
+                with self._lock:
+                    self.wins += 1
+            logger.debug(
+                "Request hedged: {} request won in {:.3f}s".format(
+                    "hedge" if winner is hedge else "first", latency
+                )
+            )
+            return self._read(response)
+
+        # both failed: the first error is raised, the other request is discarded
+        (_, _, error), (_, latency, _) = failures
+        if on_discard is not None:
+            on_discard(None, latency)
+        raise error
+
+    def shutdown(self):
+        """Stop the threads sending the requests."""
+        with self._lock:
+            executors = (self._executor, self._hedges_executor)
+            self._executor = self._hedges_executor = None
+        for executor in executors:
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    # -- INTERNAL -------------------------------------------------------------
+    def _submit(self, send, hedge: bool = False):
+        """Send a request from a thread, in the context of the caller (tracing). Hedge \
+        requests have their own threads."""
+        with self._lock:
+            if hedge:
+                if self._hedges_executor is None:
+                    self._hedges_executor = ThreadPoolExecutor(
+                        max_workers=self.max_hedges,
+                        thread_name_prefix="IsogeoHedging-hedge",
+                    )
+                executor = self._hedges_executor
+            else:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers or DEFAULT_POOLSIZE,
+                        thread_name_prefix="IsogeoHedging",
+                    )
+                executor = self._executor
+
+        return executor.submit(copy_context().run, self._timed, send)
+
+    def _is_long(self, timeout) -> bool:
+        """Returns True if the read timeout of a request is longer than `max_timeout`."""
+        if isinstance(timeout, tuple):
+            timeout = timeout[-1]
+
+        return timeout is not None and timeout > self.max_timeout
+
+    @staticmethod
+    def _read(response):
+        """Read the body of a (possibly streamed) response, releasing its connection."""
+        response.content  # consumes the stream, if any
+        return response
+
+    @staticmethod
+    def _timed(send) -> tuple:
+        """Returns the response (None if the request failed), its latency measured from \
+        the sending and the error raised, if any."""
+        start = perf_counter()
+        try:
+            response, error = send(), None
+        except Exception as exc:
+            response, error = None, exc
+
+        return response, perf_counter() - start, error
+
+    def _discard(self, future, route: str, on_discard=None):
+        """Count and close the losing request, releasing its connection."""
+        response, latency, _ = future.result()
+        if response is not None:
+            self.observe(route, latency)
+        try:
+            if on_discard is not None:
+                on_discard(response, latency)
+        finally:
+            if response is not None:
+                response.close()
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    pass
@@ -0,0 +1,292 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Persistent HTTP cache (SQLite) of the API responses for the reference routes (coordinate-systems,
+formats, licenses...), revalidated with conditional requests (ETag/Last-Modified)."""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import json
+import logging
+import re
+import sqlite3
+import threading
+from hashlib import sha256
+from pathlib import Path
+from time import time
+from urllib.parse import urlsplit
+
+# 3rd party
+from requests import Request, Response
+from requests.structures import CaseInsensitiveDict
+
+# ##############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class IsogeoHttpCache(object):
+    """Persistent cache of the GET responses of the API routes serving static reference tables.
+    Shareable across threads and processes (SQLite database in WAL mode).
+
+    - a response is served from the cache during its freshness lifetime: `max-age` of the \
+        Cache-Control header if set by the API, else the TTL
+    - then it's revalidated with a conditional request (If-None-Match/If-Modified-Since) when \
+        the API has sent an ETag or a Last-Modified header, or requested again
+    - only successful (200) responses are stored
+    - the stored responses of a route are removed on any other request to it or to one of \
+        its items (i.e. a PUT to '/formats/{id}' removes the responses of '/formats')
+
+    :param str path: path to the SQLite database. Defaults to `~/.cache/isogeo-pysdk/http_cache.sqlite`.
+    :param float ttl: freshness lifetime in seconds when the API doesn't set one. Defaults to 1 day.
+    :param tuple routes: regular expressions matching the paths of the routes to cache \
+        (i.e. '/formats'). Defaults to :attr:`STATIC_ROUTES`.
+
+    :Example:
+
+    .. code-block:: python
+
+        isogeo = Isogeo(
+            client_id=app_id,
+            client_secret=app_secret,
+            auto_refresh_url=isogeo_token_uri,
+            http_cache=IsogeoHttpCache(path="/var/cache/isogeo/http.sqlite"),
+        )
+        isogeo.connect()
+
+        # downloaded once, then shared by every process using the same database
+        srs = isogeo.coordinate_system.listing()
+    """
+
+    # anchored to the API root: workgroups lists (i.e. groups/{id}/licenses) are editable
+    STATIC_ROUTES = (
+        r"^/(coordinate-systems|directives|formats|licenses|link-kinds|thesauri)/?$",
+    )
+
+    def __init__(
+        self, path: str = None, ttl: float = 86400, routes: tuple = STATIC_ROUTES
+    ):
+        if path is None:
+            path = Path.home() / ".cache" / "isogeo-pysdk" / "http_cache.sqlite"
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.routes = tuple(re.compile(route) for route in routes)
+
+        # stats
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+
+        # one connection by thread
+        self._local = threading.local()
+        self._connect().execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, url TEXT, headers TEXT, content BLOB, "
+            "etag TEXT, last_modified TEXT, expires_at REAL)"
+        )
+
+    # -- PUBLIC ---------------------------------------------------------------
+    def is_cacheable(self, url: str) -> bool:
+        """Returns True if the URL path matches one of the cached routes.
+
+        :param str url: request URL
+        """
+        path = urlsplit(url).path
+        return any(route.search(path) for route in self.routes)
+
+    def send(self, request, url: str, vary: str = "", **kwargs) -> Response:
+        """Send a GET request through the cache.
+
+        :param callable request: function sending the HTTP request (`method`, `url`, kwargs)
+        :param str url: request URL
+        :param str vary: value distinguishing responses of a same URL (i.e. the API language)
+        :param kwargs: request arguments (params, headers, timeout...)
+
+        :rtype: requests.Response
+        """
+        full_url = Request("GET", url, params=kwargs.get("params")).prepare().url
+        key = sha256("{} {}".format(full_url, vary).encode("utf-8")).hexdigest()
+        entry = self._load(key)
+
+        # fresh
+        if entry is not None and entry.get("expires_at") > time():
+            self.hits += 1
+            logger.debug("Response served from HTTP cache: {}".format(full_url))
+            response = self._to_response(entry)
+            response.from_cache = True
+            return response
+
+        # stale: revalidate if possible
+        headers = dict(kwargs.pop("headers", None) or {})
+        if entry is not None and entry.get("etag"):
+            headers["If-None-Match"] = entry.get("etag")
+        if entry is not None and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry.get("last_modified")
+
+        response = request("GET", url, headers=headers, **kwargs)
+
+        if response.status_code == 304 and entry is not None:
+            self.revalidations += 1
+            logger.debug("Cached response revalidated: {}".format(full_url))
+            self._touch(key, self._expires_at(response.headers))
+            response = self._to_response(entry)
+            response.from_cache = True
+            return response
+
+        self.misses += 1
+        if response.status_code == 200:
+            self._store(key, full_url, response)
+
+        return response
+
+    def invalidate(self, url: str) -> int:
+        """Remove the stored responses of the cached route of an URL, or of the cached \
+        route it belongs to (i.e. '/formats' for '/formats/{id}'), whatever their \
+        parameters and language. Called on the write requests (POST, PUT, DELETE...).
+
+        :param str url: request URL
+
+        :returns: count of removed responses
+        :rtype: int
+        """
+        parts = urlsplit(url)
+        segments = parts.path.strip("/").split("/")
+        removed = 0
+        for i in range(len(segments), 0, -1):
+            path = "/" + "/".join(segments[:i])
+            if not any(route.search(path) for route in self.routes):
+                continue
+            with self._connect() as conn:
+                for base_url in (
+                    "{}://{}{}".format(parts.scheme, parts.netloc, path),
+                    "{}://{}{}/".format(parts.scheme, parts.netloc, path),
+                ):
+                    removed += conn.execute(
+                        "DELETE FROM responses WHERE url = ? OR substr(url, 1, ?) = ?",
+                        (base_url, len(base_url) + 1, base_url + "?"),
+                    ).rowcount
+
+        if removed:
+            logger.debug(
+                "{} cached responses removed after a write to: {}".format(removed, url)
+            )
+        return removed
+
+    def clear(self):
+        """Remove every stored response."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM responses")
+
+    def info(self) -> dict:
+        """Returns the cache statistics.
+
+        :rtype: dict
+        """
+        entries = self._connect().execute("SELECT COUNT(*) FROM responses").fetchone()
+        return {
+            "entries": entries[0],
+            "hits": self.hits,
+            "misses": self.misses,
+            "path": str(self.path),
+            "revalidations": self.revalidations,
+        }
+
+    # -- INTERNAL -------------------------------------------------------------
+    def _connect(self) -> sqlite3.Connection:
+        """Returns the connection of the current thread, opening it if needed."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.path), timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+
+        return conn
+
+    def _expires_at(self, headers) -> float:
+        """Compute the end of freshness from the Cache-Control header, or the TTL."""
+        cache_control = headers.get("Cache-Control", "")
+        max_age = re.search(r"max-age=(\d+)", cache_control)
+        if max_age and "no-cache" not in cache_control:
+            return time() + int(max_age.group(1))
+
+        return time() + self.ttl
+
+    def _load(self, key: str) -> dict:
+        row = (
+            self._connect()
+            .execute(
+                "SELECT url, headers, content, etag, last_modified, expires_at "
+                "FROM responses WHERE key = ?",
+                (key,),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+
+        return dict(
+            zip(
+                ("url", "headers", "content", "etag", "last_modified", "expires_at"),
+                row,
+            )
+        )
+
+    def _store(self, key: str, url: str, response: Response):
+        if "no-store" in response.headers.get("Cache-Control", ""):
+            return
+        # transport headers are not relevant anymore once decoded
+        headers = {
+            k: v
+            for k, v in response.headers.items()
+            if k.lower() not in ("content-encoding", "content-length", "transfer-encoding")
+        }
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    url,
+                    json.dumps(headers),
+                    response.content,
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                    self._expires_at(response.headers),
+                ),
+            )
+
+    def _touch(self, key: str, expires_at: float):
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE responses SET expires_at = ? WHERE key = ?", (expires_at, key)
+            )
+
+    @staticmethod
+    def _to_response(entry: dict) -> Response:
+        """Rebuild a response from a cache entry."""
+        response = Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = entry.get("url")
+        response.headers = CaseInsensitiveDict(json.loads(entry.get("headers")))
+        response._content = entry.get("content")
+        response.encoding = "utf-8"
+        response.request = Request("GET", entry.get("url")).prepare()
+        return response
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    pass
@@ -13,19 +13,33 @@ Author: Julien Moura (@geojulien) for @Isogeo
 
 # Standard library
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # 3rd party library
 from oauthlib.oauth2 import BackendApplicationClient, LegacyApplicationClient
 from requests.adapters import HTTPAdapter
 from requests_oauthlib import OAuth2Session
-from urllib3.util import Retry
+from urllib3.util import Retry, make_headers
 
 # modules
 from isogeo_pysdk import api
 from isogeo_pysdk.__about__ import __version__ as version
 from isogeo_pysdk.api_hooks import IsogeoHooks
+from isogeo_pysdk.cache import IsogeoCache
 from isogeo_pysdk.checker import IsogeoChecker
+from isogeo_pysdk.circuit_breaker import IsogeoCircuitBreaker
+from isogeo_pysdk.hedging import IsogeoHedging
+from isogeo_pysdk.http_cache import IsogeoHttpCache
+from isogeo_pysdk.json_backend import IsogeoJsonBackend
+from isogeo_pysdk.lazy_route import LazyRoute
+from isogeo_pysdk.metrics import IsogeoMetrics
 from isogeo_pysdk.models import Application, User
+from isogeo_pysdk.pipeline import DEFAULT_MIDDLEWARES, IsogeoPipeline, IsogeoRequest
+from isogeo_pysdk.rate_limit import IsogeoRateLimiter
+from isogeo_pysdk.single_flight import IsogeoSingleFlight
+from isogeo_pysdk.token_manager import IsogeoTokenManager
+from isogeo_pysdk.tracing import IsogeoTracer
 from isogeo_pysdk.utils import IsogeoUtils
 
 # ##############################################################################
@@ -36,6 +50,9 @@ logger = logging.getLogger(__name__)
 checker = IsogeoChecker()
 utils = IsogeoUtils()
 
+# compression algorithms the HTTP stack can decode (brotli only if installed)
+ACCEPT_ENCODING = make_headers(accept_encoding=True).get("accept-encoding")
+
 # #############################################################################
 # ########## Classes ###############
 # ##################################
@@ -67,6 +84,40 @@ class Isogeo(OAuth2Session):
         See: `Requests <http://2.python-requests.org/en/master/api/#requests.adapters.HTTPAdapter>`_
     :param int pool_maxsize: custom the maximum number of connections to save in the pool.\
         See: `Requests <http://2.python-requests.org/en/master/api/#requests.adapters.HTTPAdapter>`_
+    :param IsogeoCache cache: cache of the responses (search and metadata). Defaults to an \
+        :class:`isogeo_pysdk.cache.IsogeoCache` with default settings. Pass False to \
+        disable it.
+    :param IsogeoHttpCache http_cache: persistent HTTP cache of the reference routes \
+        (coordinate-systems, formats, licenses...). Disabled by default. \
+        See: :class:`isogeo_pysdk.http_cache.IsogeoHttpCache`.
+    :param bool coalesce_requests: option to share one network call between identical \
+        concurrent GET requests. *True* by DEFAULT.
+    :param float token_refresh_margin: delay in seconds before the token expiration to renew it \
+        in the background. See: :class:`isogeo_pysdk.token_manager.IsogeoTokenManager`.
+    :param bool check_connection: option to check the internet connection before \
+        authenticating (see: :meth:`connect`). *True* by DEFAULT.
+    :param bool warm_up: option to open the pooled connections to the API while \
+        connecting, so the first parallel requests don't wait for the TLS handshakes \
+        (see: :meth:`warm_up_connections`). *False* by DEFAULT.
+    :param IsogeoMetrics metrics: collector of the requests metrics by route. Defaults to an \
+        :class:`isogeo_pysdk.metrics.IsogeoMetrics`. Pass `False` to disable it.
+    :param IsogeoTracer tracer: tracer opening spans around the SDK methods and the HTTP \
+        requests. An OpenTelemetry compatible tracer is also accepted. Disabled by default. \
+        See: :class:`isogeo_pysdk.tracing.IsogeoTracer`.
+    :param IsogeoRateLimiter rate_limiter: client-side rate limit and retries of the \
+        requests throttled by the API (HTTP 429). Defaults to an \
+        :class:`isogeo_pysdk.rate_limit.IsogeoRateLimiter` without rate limit, retrying \
+        the throttled requests. Pass `False` to disable it.
+    :param IsogeoCircuitBreaker circuit_breaker: fail fast with \
+        :class:`isogeo_pysdk.exceptions.CircuitOpenError` while the API is unavailable, \
+        instead of waiting out the timeout and retries of every request. Disabled by default. \
+        See: :class:`isogeo_pysdk.circuit_breaker.IsogeoCircuitBreaker`.
+    :param IsogeoHedging hedging: hedging policy of the GET requests: a second request is \
+        sent when the first one is slower than usual and the first response wins. \
+        Disabled by default. See: :class:`isogeo_pysdk.hedging.IsogeoHedging`.
+    :param IsogeoJsonBackend json_backend: JSON backend decoding the responses and \
+        encoding the payloads, i.e. orjson if installed. Disabled by default (requests \
+        uses the standard library). See: :class:`isogeo_pysdk.json_backend.IsogeoJsonBackend`.
 
     :returns: authenticated requests Session you can use to send requests to the API.
     :rtype: requests_oauthlib.OAuth2Session
@@ -130,6 +181,34 @@ class Isogeo(OAuth2Session):
         "guess": {},
     }
 
+    # -- ROUTES (instanciated at first access) ---------------------------------
+    about = LazyRoute(
+        lambda self: api.ApiAbout(platform=self.platform, proxies=self.proxies)
+    )
+    account = LazyRoute(lambda self: api.ApiAccount(self))
+    application = LazyRoute(lambda self: api.ApiApplication(self))
+    catalog = LazyRoute(lambda self: api.ApiCatalog(self))
+    contact = LazyRoute(lambda self: api.ApiContact(self))
+    coordinate_system = LazyRoute(lambda self: api.ApiCoordinateSystem(self))
+    srs = LazyRoute(lambda self: self.coordinate_system)
+    datasource = LazyRoute(lambda self: api.ApiDatasource(self))
+    directive = LazyRoute(lambda self: api.ApiDirective(self))
+    formats = LazyRoute(lambda self: api.ApiFormat(self))
+    keyword = LazyRoute(lambda self: api.ApiKeyword(self))
+    invitation = LazyRoute(lambda self: api.ApiInvitation(self))
+    license = LazyRoute(lambda self: api.ApiLicense(self))
+    metadata = LazyRoute(lambda self: api.ApiMetadata(self))
+    _api_search = LazyRoute(lambda self: api.ApiSearch(self))
+    search = LazyRoute(lambda self: self._api_search.search)
+    search_pages = LazyRoute(lambda self: self._api_search.search_pages)
+    iter_search = LazyRoute(lambda self: self._api_search.iter_search)
+    services = LazyRoute(lambda self: api.ApiService(self))
+    share = LazyRoute(lambda self: api.ApiShare(self))
+    specification = LazyRoute(lambda self: api.ApiSpecification(self))
+    thesaurus = LazyRoute(lambda self: api.ApiThesaurus(self))
+    user = LazyRoute(lambda self: api.ApiUser(self))
+    workgroup = LazyRoute(lambda self: api.ApiWorkgroup(self))
+
     def __init__(
         self,
         # custom
@@ -143,6 +222,18 @@ class Isogeo(OAuth2Session):
         max_retries: int = 2,
         pool_connections: int = 20,
         pool_maxsize: int = 50,
+        cache: IsogeoCache = None,
+        http_cache: IsogeoHttpCache = None,
+        coalesce_requests: bool = True,
+        token_refresh_margin: float = 60,
+        check_connection: bool = True,
+        warm_up: bool = False,
+        metrics: IsogeoMetrics = None,
+        tracer: IsogeoTracer = None,
+        rate_limiter: IsogeoRateLimiter = None,
+        circuit_breaker: IsogeoCircuitBreaker = None,
+        hedging: IsogeoHedging = None,
+        json_backend: IsogeoJsonBackend = None,
         # additional
         **kwargs,
     ):
@@ -152,6 +243,26 @@ class Isogeo(OAuth2Session):
         self.client_secret = client_secret
         self.custom_hooks = IsogeoHooks()  # custom hooks
         self.timeout = timeout  # default timeout
+        self.cache = IsogeoCache() if cache is None else cache or None  # responses cache
+        self.http_cache = http_cache  # persistent HTTP cache
+        self.single_flight = IsogeoSingleFlight() if coalesce_requests else None
+        self.token_manager = IsogeoTokenManager(self, margin=token_refresh_margin)
+        self.check_connection = check_connection
+        self.warm_up = warm_up
+        self.metrics = IsogeoMetrics() if metrics is None else metrics or None
+        if tracer is not None and not isinstance(tracer, IsogeoTracer):
+            tracer = IsogeoTracer(tracer)
+        self.tracer = tracer
+        self.rate_limiter = (
+            IsogeoRateLimiter() if rate_limiter is None else rate_limiter or None
+        )
+        self.circuit_breaker = circuit_breaker
+        self.hedging = hedging
+        if hedging is not None and hedging.max_workers is None:
+            # one thread by pooled connection
+            hedging.max_workers = pool_maxsize
+        self.json_backend = json_backend
+        self.pipeline = IsogeoPipeline(self._transport, DEFAULT_MIDDLEWARES)
 
         # auth mode
         if auth_mode and auth_mode not in self.AUTH_MODES:
@@ -186,12 +297,6 @@ class Isogeo(OAuth2Session):
         self._wg_shares = {}  # workgroup shares
         self._wg_specifications_names = {}  # workgroup specifications by names
 
-        # checking internet connection
-        if not checker.check_internet_connection():
-            raise EnvironmentError("Internet connection issue.")
-        else:
-            pass
-
         # testing parameters
         if not checker.check_is_uuid(client_id.split("-")[-1]):
             logger.error("Client ID structure length issue: it should be 64 chars.")
@@ -271,28 +376,6 @@ class Isogeo(OAuth2Session):
                 "Mode {} is not implemented yet.".format(auth_mode)
             )
 
-        # load routes as subclass
-        self.about = api.ApiAbout(platform=self.platform, proxies=self.proxies)
-        self.account = api.ApiAccount(self)
-        self.application = api.ApiApplication(self)
-        self.catalog = api.ApiCatalog(self)
-        self.contact = api.ApiContact(self)
-        self.coordinate_system = self.srs = api.ApiCoordinateSystem(self)
-        self.datasource = api.ApiDatasource(self)
-        self.directive = api.ApiDirective(self)
-        self.formats = api.ApiFormat(self)
-        self.keyword = api.ApiKeyword(self)
-        self.invitation = api.ApiInvitation(self)
-        self.license = api.ApiLicense(self)
-        self.metadata = api.ApiMetadata(self)
-        self.search = api.ApiSearch(self).search
-        self.services = api.ApiService(self)
-        self.share = api.ApiShare(self)
-        self.specification = api.ApiSpecification(self)
-        self.thesaurus = api.ApiThesaurus(self)
-        self.user = api.ApiUser(self)
-        self.workgroup = api.ApiWorkgroup(self)
-
         super().__init__(
             # client_id=client_id,
             client=self.client,
@@ -311,6 +394,14 @@ class Isogeo(OAuth2Session):
         :param str username: user login (email). Not required for group apps (Client Credentials).
         :param str password: user password. Not required for group apps (Client Credentials).
         """
+        # checking internet connection
+        if self.check_connection and not checker.check_internet_connection(
+            proxies=self.proxies or None
+        ):
+            raise EnvironmentError("Internet connection issue.")
+        else:
+            pass
+
         # customize HTTPAdapter
         adapter = HTTPAdapter(
             max_retries=Retry(
@@ -369,17 +460,163 @@ class Isogeo(OAuth2Session):
                     **self.share.listing()[0].get("applications")[0]
                 )
 
+        # open the pooled connections
+        if self.warm_up:
+            self.warm_up_connections()
+
+        # renew the token before its expiration
+        self.token_manager.start()
+
+    def warm_up_connections(self, size: int = None) -> int:
+        """Open connections to the API in parallel and keep them in the session pool, \
+        so the next requests reuse them instead of waiting for TCP and TLS handshakes.
+
+        :param int size: count of connections to open. Defaults to the pool max size.
+
+        :returns: count of opened connections
+        :rtype: int
+        """
+        size = size or self.pool_maxsize
+        url = "https://{}.isogeo.com/".format(self.api_url)
+        # hold every connection until all are opened, so none is reused
+        barrier = threading.Barrier(size, timeout=30)
+
+        def open_connection(i: int) -> bool:
+            try:
+                barrier.wait()
+            except threading.BrokenBarrierError:
+                pass
+            try:
+                response = super(Isogeo, self).request(
+                    "HEAD",
+                    url,
+                    headers={"user-agent": self.app_name},
+                    proxies=self.proxies,
+                    verify=self.ssl,
+                    timeout=self.timeout,
+                    stream=True,
+                )
+            except Exception as exc:
+                logger.debug("Connection warm-up failed: {}".format(exc))
+                barrier.abort()
+                return False
+            try:
+                barrier.wait()
+            except threading.BrokenBarrierError:
+                pass
+            # consume the response: its connection goes back to the pool, not closed
+            response.content
+            return True
+
+        with ThreadPoolExecutor(
+            max_workers=size, thread_name_prefix="IsogeoWarmUp"
+        ) as executor:
+            opened = sum(executor.map(open_connection, range(size)))
+
+        logger.debug("{}/{} connections opened to {}".format(opened, size, url))
+        return opened
+
+    def close(self):
+        """Stop the background token renewal and close the session."""
+        self.token_manager.stop()
+        if self.hedging is not None:
+            self.hedging.shutdown()
+        super(Isogeo, self).close()
+
+    def request(self, method: str, url: str, **kwargs):
+        """Send a request through the requests pipeline. Overrides \
+        :meth:`requests_oauthlib.OAuth2Session.request` so every request, authentication \
+        included, goes through the middlewares of :attr:`pipeline`. By default:
+
+        - open a span if a tracer is set (see: :class:`isogeo_pysdk.tracing.IsogeoTracer`)
+        - stop at the deadline of the SDK call and cap the timeout to the remaining time, \
+            if any (see: :class:`isogeo_pysdk.deadline.IsogeoDeadline`)
+        - encode the JSON payloads and decode the JSON responses with the JSON backend, \
+            if set (see: :class:`isogeo_pysdk.json_backend.IsogeoJsonBackend`)
+        - share one network call between identical concurrent GET requests (single-flight)
+        - record the request in the metrics, once by network call \
+            (see: :class:`isogeo_pysdk.metrics.IsogeoMetrics`)
+        - serve the GET requests of the reference routes through the persistent HTTP cache, \
+            if enabled
+        - limit the requests rate and retry the throttled requests (HTTP 429) \
+            (see: :class:`isogeo_pysdk.rate_limit.IsogeoRateLimiter`)
+        - fail fast while the API is unavailable, if a circuit breaker is set \
+            (see: :class:`isogeo_pysdk.circuit_breaker.IsogeoCircuitBreaker`)
+        - hedge the slow GET requests, if a hedging policy is set \
+            (see: :class:`isogeo_pysdk.hedging.IsogeoHedging`)
+
+        See: :class:`isogeo_pysdk.pipeline.IsogeoPipeline`.
+
+        :param str method: HTTP method
+        :param str url: URL to request
+        """
+        return self.pipeline.send(IsogeoRequest(self, method, url, **kwargs))
+
+    def execute(
+        self,
+        method: str,
+        route: str = None,
+        url: str = None,
+        check: bool = True,
+        **kwargs,
+    ):
+        """Send a request to an API route with the client settings and check the response. \
+        Used by the routes methods.
+
+        :param str method: HTTP method
+        :param str route: API route (i.e. 'groups/{}/contacts'), to build the URL \
+            with the platform and the language
+        :param str url: URL to request, instead of the route
+        :param bool check: option to check the response. *True* by DEFAULT.
+        :param kwargs: requests arguments (params, json, data, files, stream...). \
+            Headers, proxies, SSL verification and timeout default to the client ones.
+
+        :returns: the response or a tuple (False, status code) if the API returned an error. \
+            See: :meth:`isogeo_pysdk.checker.IsogeoChecker.check_api_response`.
+
+        :Example:
+
+        .. code-block:: python
+
+            req_formats = isogeo.execute("GET", route="formats")
+            if not isinstance(req_formats, tuple):
+                print(req_formats.json())
+        """
+        if url is None:
+            url = utils.get_request_base_url(route=route)
+        kwargs.setdefault("headers", self.header)
+        kwargs.setdefault("proxies", self.proxies)
+        kwargs.setdefault("verify", self.ssl)
+        kwargs.setdefault("timeout", self.timeout)
+
+        response = self.request(method, url, **kwargs)
+
+        # checking response
+        if check:
+            req_check = checker.check_api_response(response)
+            if isinstance(req_check, tuple):
+                return req_check
+
+        return response
+
+    def _transport(self, request: IsogeoRequest):
+        """Last stage of the pipeline: send the request with the authenticated session."""
+        return super(Isogeo, self).request(
+            request.method, request.url, **request.kwargs
+        )
+
     # -- PROPERTIES -----------------------------------------------------------
     @property
     def header(self) -> dict:
         if self.auth_mode == "group":
             return {
+                "Accept-Encoding": ACCEPT_ENCODING,
                 "Authorization": "Bearer {}".format(self.token.get("access_token")),
                 "user-agent": self.app_name,
             }
         elif self.auth_mode == "user_legacy":
             return {
-                "Accept-Encoding": "gzip, deflate, br",
+                "Accept-Encoding": ACCEPT_ENCODING,
                 "User-Agent": self.app_name,
                 # "Content-Type": "application/json; charset=utf-8",
                 # "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"
@@ -0,0 +1,449 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+
+"""Asynchronous (asyncio) flavor of the Isogeo API Python wrapper.
+
+Every route exposed by :class:`isogeo_pysdk.isogeo.Isogeo` (search, metadata and its
+subresources, catalogs, keywords, shares...) is mirrored as a coroutine function, sharing
+the same models and checker.
+
+The requests are still sent by the synchronous session (requests), each one in a worker
+thread: the concurrency is bounded by the number of threads, not by the event loop.
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import asyncio
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+
+# modules
+from isogeo_pysdk.deadline import IsogeoDeadline
+from isogeo_pysdk.exceptions import IsogeoSdkError
+from isogeo_pysdk.isogeo import Isogeo
+from isogeo_pysdk.models import MetadataSearch
+
+# ##############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class AsyncRoute(object):
+    """Awaitable mirror of a synchronous routes class (ApiMetadata, ApiCatalog...).
+
+    Methods are returned as coroutine functions and sub-routes (i.e. `metadata.links`)
+    are wrapped recursively.
+
+    :param object route: synchronous routes object to mirror
+    :param AsyncIsogeo async_client: asynchronous client which schedules the requests
+    """
+
+    def __init__(self, route: object, async_client):
+        self._route = route
+        self._async_client = async_client
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._route, name)
+
+        # sub routes
+        if type(attr).__name__.startswith("Api"):
+            return AsyncRoute(route=attr, async_client=self._async_client)
+
+        # routes methods
+        if callable(attr):
+
+            async def coroutine(*args, **kwargs):
+                return await self._async_client.run(attr, *args, **kwargs)
+
+            coroutine.__name__ = name
+            coroutine.__doc__ = attr.__doc__
+            return coroutine
+
+        # simple attributes
+        return attr
+
+    def __repr__(self) -> str:
+        return "<AsyncRoute {}>".format(type(self._route).__name__)
+
+
+class AsyncIsogeo(object):
+    """Asynchronous facade of the Isogeo API client, to call it from an event loop without \
+    blocking it. Calls share one authenticated session and its connection pool.
+
+    It's not a non-blocking transport: requests are sent through the \
+    :class:`isogeo_pysdk.isogeo.Isogeo` session (requests, the only HTTP stack declared by \
+    the package), each one blocking a thread of a single executor. At most \
+    `max_concurrency` requests are in flight (one per thread), whatever the number of \
+    awaiting coroutines: raise it with the `pool_maxsize` of the client to go further.
+
+    :param Isogeo isogeo: an already instanciated (and possibly connected) Isogeo client. \
+        If not set, a new one is created with the keyword arguments.
+    :param int max_concurrency: maximum number of requests in flight, i.e. number of \
+        threads of the executor. Defaults to the `pool_maxsize` of the Isogeo client.
+    :param kwargs: arguments passed to :class:`isogeo_pysdk.isogeo.Isogeo` if `isogeo` is not set.
+
+    :Example:
+
+    .. code-block:: python
+
+        async def harvest():
+            async with AsyncIsogeo(
+                client_id=environ.get("ISOGEO_API_GROUP_CLIENT_ID"),
+                client_secret=environ.get("ISOGEO_API_GROUP_CLIENT_SECRET"),
+                auth_mode="group",
+                auto_refresh_url="{}/oauth/token".format(environ.get("ISOGEO_ID_URL")),
+                platform=environ.get("ISOGEO_PLATFORM", "qa"),
+            ) as isogeo:
+                await isogeo.connect()
+                search = await isogeo.search(whole_results=1)
+                mds = await asyncio.gather(
+                    *[isogeo.metadata.get(md.get("_id"), include="all") for md in search.results]
+                )
+
+        asyncio.run(harvest())
+    """
+
+    def __init__(self, isogeo: Isogeo = None, max_concurrency: int = None, **kwargs):
+        if isogeo is None:
+            isogeo = Isogeo(**kwargs)
+        self.api_client = isogeo
+
+        # concurrency settings
+        if max_concurrency is None:
+            max_concurrency = getattr(isogeo, "pool_maxsize", 10)
+        self.max_concurrency = max(1, max_concurrency)
+        pool_maxsize = getattr(isogeo, "pool_maxsize", None)
+        if pool_maxsize is not None and self.max_concurrency > pool_maxsize:
+            logger.warning(
+                "max_concurrency ({}) is greater than the pool_maxsize of the client ({}): "
+                "connections beyond the pool won't be reused.".format(
+                    self.max_concurrency, pool_maxsize
+                )
+            )
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="IsogeoAsync"
+        )
+        self._semaphore = None  # bound to the running loop at first request
+
+        # routes which are not ApiXxx objects
+        self._search_route = getattr(isogeo.search, "__self__", None)
+
+    # -- CONTEXT MANAGER ----------------------------------------------------------
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    # -- ROUTES -------------------------------------------------------------------
+    def __getattr__(self, name: str):
+        # avoid infinite recursion before __init__ is complete
+        if name in ("api_client", "_search_route"):
+            raise AttributeError(name)
+
+        attr = getattr(self.api_client, name)
+        if type(attr).__name__.startswith("Api"):
+            return AsyncRoute(route=attr, async_client=self)
+
+        return attr
+
+    async def run(self, func, *args, **kwargs):
+        """Schedule a synchronous SDK call without blocking the event loop. Used by every
+        mirrored route. Concurrency is bounded by `max_concurrency` (threads).
+
+        The deadline of the caller (see: :class:`isogeo_pysdk.deadline.IsogeoDeadline`), \
+        if any, is propagated to the call.
+
+        :param callable func: synchronous function to execute
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        # the executor doesn't run the call in the caller context
+        deadline = IsogeoDeadline.current()
+        if deadline is not None:
+            func = partial(deadline.run, func)
+
+        async with self._semaphore:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, partial(func, *args, **kwargs)
+            )
+
+    async def connect(self, username: str = None, password: str = None):
+        """Authenticate the underlying Isogeo client. See: :meth:`Isogeo.connect`.
+
+        :param str username: user login (email). Not required for group apps (Client Credentials).
+        :param str password: user password. Not required for group apps (Client Credentials).
+        """
+        return await self.run(
+            self.api_client.connect, username=username, password=password
+        )
+
+    async def close(self):
+        """Close the underlying session and release the executor."""
+        self._executor.shutdown(wait=False)
+        self.api_client.close()
+
+    async def search(
+        self,
+        group: str = None,
+        query: str = "",
+        share: str = None,
+        specific_md: tuple = (),
+        include: tuple = (),
+        bbox: tuple = None,
+        poly: str = None,
+        georel: str = None,
+        order_by: str = "_created",
+        order_dir: str = "desc",
+        page_size: int = 20,
+        offset: int = 0,
+        augment: bool = False,
+        check: bool = True,
+        expected_total: int = None,
+        tags_as_dicts: bool = False,
+        whole_results: bool = False,
+        columnar: bool = False,
+    ) -> MetadataSearch:
+        """Awaitable version of :meth:`isogeo_pysdk.api.routes_search.ApiSearch.search`.
+        With `whole_results`, pages are requested concurrently on the event loop and, with \
+        `columnar`, stored by columns in the executor threads.
+
+        :rtype: MetadataSearch
+        """
+        # search filters shared by every request
+        search_params = {
+            "group": group,
+            "query": query,
+            "share": share,
+            "specific_md": specific_md,
+            "bbox": bbox,
+            "poly": poly,
+            "georel": georel,
+        }
+
+        # CASE - NO PAGINATION NEEDED
+        if not whole_results:
+            return await self.run(
+                self.api_client.search,
+                include=include,
+                order_by=order_by,
+                order_dir=order_dir,
+                page_size=page_size,
+                offset=offset,
+                augment=augment,
+                check=check,
+                tags_as_dicts=tags_as_dicts,
+                whole_results=0,
+                columnar=columnar,
+                **search_params,
+            )
+
+        # CASE - MULTIPLE PAGINATED SEARCHES
+        page_params = {
+            "include": include,
+            "order_by": order_by,
+            "order_dir": order_dir,
+            "page_size": 100,
+            "augment": 0,
+            "tags_as_dicts": 0,
+            "whole_results": 0,
+            "columnar": columnar,
+        }
+        pages = []
+
+        # the first page (from the offset, maximum size) doubles as the count request
+        if expected_total is None:
+            first_page = await self.run(
+                self.api_client.search,
+                offset=offset,
+                check=check,
+                **page_params,
+                **search_params,
+            )
+            if isinstance(first_page, tuple):
+                return first_page
+            pages.append(first_page)
+            expected_total = first_page.total
+
+        li_offsets = list(range(offset + len(pages) * 100, expected_total, 100))
+        logger.debug(
+            "Async search launched with {} pages.".format(len(li_offsets) + len(pages))
+        )
+        pages.extend(
+            await asyncio.gather(
+                *[
+                    self.run(
+                        self.api_client.search,
+                        offset=page_offset,
+                        check=0,
+                        expected_total=expected_total,
+                        **page_params,
+                        **search_params,
+                    )
+                    for page_offset in li_offsets
+                ]
+            )
+        )
+
+        # return the first error met
+        for page in pages:
+            if isinstance(page, tuple):
+                return page
+
+        # post-process (shares, tags) can request the API too
+        return await self.run(
+            self._search_route.search_post_process,
+            search=self._search_route.merge_pages(pages),
+            share=share,
+            augment=augment,
+            tags_as_dicts=tags_as_dicts,
+        )
+
+    async def search_pages(
+        self,
+        group: str = None,
+        query: str = "",
+        share: str = None,
+        specific_md: tuple = (),
+        include: tuple = (),
+        bbox: tuple = None,
+        poly: str = None,
+        georel: str = None,
+        order_by: str = "_created",
+        order_dir: str = "desc",
+        page_size: int = 100,
+        max_workers: int = 5,
+        ordered: bool = True,
+        check: bool = True,
+        expected_total: int = None,
+    ):
+        """Asynchronous iterator version of \
+        :meth:`isogeo_pysdk.api.routes_search.ApiSearch.search_pages`: pages are requested \
+        within a sliding window of `max_workers` requests and yielded as soon as they are \
+        received, without blocking the event loop.
+
+        :returns: asynchronous generator of MetadataSearch, one per page. If a request \
+            fails, the error tuple is yielded and the iteration stops.
+
+        :Example:
+
+        .. code-block:: python
+
+            async for page in isogeo.search_pages(include=("contacts",), max_workers=8):
+                for md in page.results:
+                    exporter.write(Metadata.clean_attributes(md))
+        """
+        fetch_page = partial(
+            self.run,
+            self.api_client.search,
+            group=group,
+            query=query,
+            share=share,
+            specific_md=specific_md,
+            include=include,
+            bbox=bbox,
+            poly=poly,
+            georel=georel,
+            order_by=order_by,
+            order_dir=order_dir,
+            page_size=page_size,
+            augment=0,
+            tags_as_dicts=0,
+            whole_results=0,
+        )
+
+        # the first page gives the total, if not known
+        first_offset = 0
+        if expected_total is None:
+            first_page = await fetch_page(offset=0, check=check)
+            yield first_page
+            if isinstance(first_page, tuple):
+                return
+            expected_total = first_page.total
+            first_offset = page_size
+            check = False
+
+        # sliding window of page requests, in offset order
+        offsets = iter(range(first_offset, expected_total, page_size))
+        tasks = deque()
+        try:
+            while True:
+                for page_offset in islice(offsets, max(1, max_workers) - len(tasks)):
+                    tasks.append(
+                        asyncio.ensure_future(
+                            fetch_page(
+                                offset=page_offset,
+                                check=check,
+                                expected_total=expected_total,
+                            )
+                        )
+                    )
+                    check = False
+                if not tasks:
+                    return
+
+                if ordered:
+                    page = await tasks.popleft()
+                else:
+                    done, _ = await asyncio.wait(
+                        tasks, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    task = done.pop()
+                    tasks.remove(task)
+                    page = task.result()
+
+                yield page
+                if isinstance(page, tuple):
+                    return
+        finally:
+            # iteration stopped early: drop the pages in flight
+            for task in tasks:
+                task.cancel()
+
+    async def iter_search(self, views: bool = False, **kwargs):
+        """Asynchronous iterator version of \
+        :meth:`isogeo_pysdk.api.routes_search.ApiSearch.iter_search`: metadata by metadata \
+        over :meth:`search_pages` results. Same parameters.
+
+        :param bool views: option to yield read-only metadata views \
+            (:class:`isogeo_pysdk.models.metadata_view.MetadataView`) instead of dicts. \
+            *False* by DEFAULT.
+
+        :returns: asynchronous generator of metadata (dict), as returned by the API.
+
+        :Example:
+
+        .. code-block:: python
+
+            async for md in isogeo.iter_search(query="type:vector-dataset", include="all"):
+                print(md.get("title"))
+        """
+        async for page in self.search_pages(**kwargs):
+            if isinstance(page, tuple):
+                raise IsogeoSdkError(
+                    "Search request failed (HTTP {}). Iteration stopped.".format(page[1])
+                )
+            for md in page.views() if views else page.results:
+                yield md
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    pass
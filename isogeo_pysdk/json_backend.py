@@ -0,0 +1,174 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""JSON backend used to decode the API responses and encode the requests payloads: orjson \
+or ujson when installed, standard library otherwise."""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import logging
+from importlib import import_module
+
+# 3rd party
+from requests.models import Response
+
+try:
+    from requests.exceptions import JSONDecodeError
+except ImportError:  # requests < 2.27
+    from json import JSONDecodeError
+
+# ##############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# backends by order of preference
+BACKENDS = ("orjson", "ujson", "json")
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class IsogeoJsonBackend(object):
+    """JSON decoder and encoder of the client. Once set on the client, every response \
+    `.json()` and every `json=` payload go through it, routes methods included.
+
+    :param str name: backend to use: 'orjson', 'ujson', 'json' (standard library) or \
+        'auto' (DEFAULT) for the fastest one installed.
+
+    :raises ImportError: if the backend is not installed
+    :raises ValueError: if the backend is unknown
+
+    :Example:
+
+    .. code-block:: python
+
+        # pip install orjson
+        isogeo = Isogeo(..., json_backend=IsogeoJsonBackend())
+        print(isogeo.json_backend.name)
+    """
+
+    def __init__(self, name: str = "auto"):
+        if name == "auto":
+            name = next(n for n in BACKENDS if self.is_available(n))
+        elif name not in BACKENDS:
+            raise ValueError(
+                "JSON backend must be one of: auto | {}".format(" | ".join(BACKENDS))
+            )
+        elif not self.is_available(name):
+            raise ImportError(
+                "{0} is required to use it as JSON backend: pip install {0}".format(
+                    name
+                )
+            )
+        self.name = name
+        module = import_module(name)
+
+        self._loads = module.loads
+        if name == "orjson":
+            # non-string dict keys are accepted by the standard library
+            option = module.OPT_NON_STR_KEYS
+            self._dumps = lambda obj: module.dumps(obj, option=option)
+        elif name == "ujson":
+            self._dumps = lambda obj: module.dumps(obj, ensure_ascii=False).encode(
+                "utf-8"
+            )
+        else:
+            self._dumps = lambda obj: module.dumps(obj, allow_nan=False).encode("utf-8")
+
+        logger.debug("JSON backend: {}".format(name))
+
+    def __repr__(self):
+        return "IsogeoJsonBackend({!r})".format(self.name)
+
+    @staticmethod
+    def is_available(name: str) -> bool:
+        """Returns True if a backend is installed.
+
+        :param str name: backend name (i.e. 'orjson')
+
+        :rtype: bool
+        """
+        try:
+            import_module(name)
+        except ImportError:
+            return False
+
+        return True
+
+    def loads(self, document):
+        """Decode a JSON document.
+
+        :param document: JSON document (bytes or str)
+
+        :raises JSONDecodeError: if the document is not valid JSON, as requests does
+        """
+        try:
+            return self._loads(document)
+        except ValueError as err:
+            if isinstance(document, bytes):
+                document = document.decode("utf-8", "replace")
+            raise JSONDecodeError(str(err), document, getattr(err, "pos", 0))
+
+    def dumps(self, obj) -> bytes:
+        """Encode an object as JSON (UTF-8).
+
+        :param obj: object to encode
+
+        :rtype: bytes
+        """
+        return self._dumps(obj)
+
+    def decode(self, response: Response):
+        """Decode the JSON body of a response.
+
+        :param requests.Response response: response to decode
+        """
+        encoding = (response.encoding or "utf-8").lower().replace("-", "")
+        if encoding in ("utf8", "ascii"):
+            return self.loads(response.content)
+
+        return self.loads(response.text)
+
+    def bind(self, response):
+        """Make the `.json()` method of a response use this backend. Only the plain \
+        requests responses are bound.
+
+        :param requests.Response response: response to bind
+
+        :returns: the response
+        """
+        if type(response) is Response:
+            response.__class__ = IsogeoJsonResponse
+            response.json_backend = self
+
+        return response
+
+
+class IsogeoJsonResponse(Response):
+    """Response decoded with the JSON backend of the client \
+    (see: :class:`IsogeoJsonBackend`)."""
+
+    json_backend = None
+
+    def json(self, **kwargs):
+        """Returns the JSON body of the response, decoded with the JSON backend. Decoding \
+        options are only supported by the standard library backend."""
+        if kwargs or self.json_backend is None:
+            return super(IsogeoJsonResponse, self).json(**kwargs)
+
+        return self.json_backend.decode(self)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    backend = IsogeoJsonBackend()
+    print(backend, backend.loads(backend.dumps({"version": 1})))
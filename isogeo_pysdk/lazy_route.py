@@ -0,0 +1,61 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Descriptor deferring the instanciation of the routes objects to their first access."""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import threading
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class LazyRoute(object):
+    """Class attribute building a routes object (ApiMetadata, ApiCatalog...) at its first access
+    on an instance, then stored in the instance. Thread-safe: built only once by instance.
+
+    :param callable factory: function building the routes object from the instance
+
+    :Example:
+
+    .. code-block:: python
+
+        class Isogeo(OAuth2Session):
+            metadata = LazyRoute(lambda isogeo: api.ApiMetadata(isogeo))
+    """
+
+    def __init__(self, factory):
+        self.factory = factory
+        self.name = None
+        self.__doc__ = getattr(factory, "__doc__", None)
+        self._lock = threading.Lock()
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        with self._lock:
+            # built by another thread meanwhile
+            if self.name in instance.__dict__:
+                return instance.__dict__[self.name]
+            route = self.factory(instance)
+            # next accesses won't go through the descriptor (non-data descriptor)
+            instance.__dict__[self.name] = route
+
+        return route
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    pass
@@ -0,0 +1,339 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Metrics of the requests sent to the Isogeo API, by route template, and their exporters."""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import logging
+import re
+import threading
+from bisect import bisect_left
+from urllib.parse import urlsplit
+
+# ##############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# path segments replaced in route templates: UUIDs (with or without hyphens) and codes
+_RGX_ROUTE_ID = re.compile(r"^([0-9a-fA-F]{32}|[0-9a-fA-F-]{36}|\d+)$")
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class IsogeoMetrics(object):
+    """Thread-safe collector of the requests metrics, by HTTP method and route template \
+    (i.e. `GET resources/{id}`, `GET groups/{id}/resources/search`):
+
+    - count of requests and of errors (no response)
+    - latency: sum, max and histogram
+    - bytes sent (request body) and received: body bytes on the wire, compressed if the \
+        response is, read from the Content-Length header or else counted by the transport \
+        (chunked responses). Headers are not counted.
+    - retries done by the transport adapter and the rate limiter
+    - hedge requests sent and hedge requests answered first
+    - responses status codes
+    - cache hits (responses cache and persistent HTTP cache)
+
+    :param tuple buckets: upper bounds of the latency histogram buckets, in seconds.
+
+    :Example:
+
+    .. code-block:: python
+
+        isogeo.search(whole_results=1)
+
+        # as a dict
+        print(isogeo.metrics.snapshot())
+        # in Prometheus text format
+        print(isogeo.metrics.export(PrometheusExporter()))
+        # in logs
+        isogeo.metrics.export(LoggingExporter())
+    """
+
+    BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+    def __init__(self, buckets: tuple = BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._routes = {}
+        self._lock = threading.Lock()
+
+    # -- RECORDING ------------------------------------------------------------
+    @staticmethod
+    def route_template(url: str) -> str:
+        """Returns the route template of an URL, identifiers being replaced by `{id}`.
+
+        :param str url: request URL
+
+        :Example:
+
+        >>> IsogeoMetrics.route_template("https://api.isogeo.com/resources/0269803d50c446b09f5060ef7fe3e22b/?_lang=fr")
+        'resources/{id}'
+        """
+        segments = urlsplit(url).path.strip("/").split("/")
+        return "/".join(
+            "{id}" if _RGX_ROUTE_ID.match(segment) else segment for segment in segments
+        )
+
+    def record(
+        self,
+        method: str,
+        url: str,
+        latency: float,
+        response=None,
+        cache_hit: bool = False,
+    ):
+        """Record a request.
+
+        :param str method: HTTP method
+        :param str url: request URL
+        :param float latency: duration in seconds
+        :param requests.Response response: response, None if the request failed
+        :param bool cache_hit: option to count a cache hit
+        """
+        bytes_in = bytes_out = retries = hedges = hedge_wins = 0
+        status = None
+        if response is not None:
+            status = response.status_code
+            bytes_in = self.bytes_received(response)
+            if response.request is not None and response.request.body:
+                bytes_out = len(response.request.body)
+            raw_retries = getattr(getattr(response, "raw", None), "retries", None)
+            retries = len(getattr(raw_retries, "history", None) or ())
+            # throttled requests retried by the rate limiter
+            retries += getattr(response, "throttle_retries", 0)
+            # second request sent by the hedging policy
+            hedges = int(getattr(response, "hedged", False))
+            hedge_wins = int(getattr(response, "hedge_won", False))
+
+        with self._lock:
+            stats = self._stats(method, self.route_template(url))
+            stats["count"] += 1
+            stats["errors"] += response is None
+            stats["latency_sum"] += latency
+            stats["latency_max"] = max(stats.get("latency_max"), latency)
+            stats["latency_buckets"][bisect_left(self.buckets, latency)] += 1
+            stats["bytes_in"] += bytes_in
+            stats["bytes_out"] += bytes_out
+            stats["retries"] += retries
+            stats["hedges"] += hedges
+            stats["hedge_wins"] += hedge_wins
+            stats["cache_hits"] += cache_hit
+            if status is not None:
+                stats["statuses"][status] = stats["statuses"].get(status, 0) + 1
+
+    @staticmethod
+    def bytes_received(response) -> int:
+        """Returns the size of a response body on the wire (compressed if the response is): \
+        its Content-Length header if set, else the bytes read so far by the transport \
+        (i.e. chunked responses). Streamed bodies are not read here.
+
+        :param requests.Response response: response to measure
+
+        :rtype: int
+        """
+        content_length = response.headers.get("Content-Length")
+        if content_length and content_length.isdigit():
+            return int(content_length)
+
+        tell = getattr(getattr(response, "raw", None), "tell", None)
+        try:
+            return int(tell()) if tell is not None else 0
+        except (OSError, ValueError):
+            return 0
+
+    def record_cache_hit(self, route: str, method: str = "GET"):
+        """Record a response served by a cache without any request.
+
+        :param str route: route template (i.e. 'resources/{id}')
+        :param str method: HTTP method
+        """
+        with self._lock:
+            self._stats(method, route)["cache_hits"] += 1
+
+    def reset(self):
+        """Forget every metric."""
+        with self._lock:
+            self._routes.clear()
+
+    # -- EXPOSITION -----------------------------------------------------------
+    def snapshot(self) -> dict:
+        """Returns a copy of the metrics, by 'METHOD route template'. Latency histogram is \
+        cumulative, by bucket upper bound ('+Inf' for the last one).
+
+        :rtype: dict
+        """
+        bounds = [str(b) for b in self.buckets] + ["+Inf"]
+        snapshot = {}
+        with self._lock:
+            for (method, route), stats in sorted(self._routes.items()):
+                cumulative, histogram = 0, {}
+                for bound, count in zip(bounds, stats.get("latency_buckets")):
+                    cumulative += count
+                    histogram[bound] = cumulative
+                snapshot["{} {}".format(method, route)] = dict(
+                    stats,
+                    method=method,
+                    route=route,
+                    latency_avg=(
+                        stats.get("latency_sum") / stats.get("count")
+                        if stats.get("count")
+                        else 0
+                    ),
+                    latency_buckets=histogram,
+                    statuses=dict(stats.get("statuses")),
+                )
+
+        return snapshot
+
+    def export(self, exporter):
+        """Export a snapshot of the metrics.
+
+        :param exporter: object with an `export(snapshot: dict)` method, \
+            i.e. :class:`PrometheusExporter` or :class:`LoggingExporter`
+
+        :returns: what the exporter returns
+        """
+        return exporter.export(self.snapshot())
+
+    # -- INTERNAL -------------------------------------------------------------
+    def _stats(self, method: str, route: str) -> dict:
+        """Returns the metrics of a route, created if needed. Must be called with the lock."""
+        key = (method.upper(), route)
+        if key not in self._routes:
+            self._routes[key] = {
+                "count": 0,
+                "errors": 0,
+                "latency_sum": 0.0,
+                "latency_max": 0.0,
+                "latency_buckets": [0] * (len(self.buckets) + 1),
+                "bytes_in": 0,
+                "bytes_out": 0,
+                "retries": 0,
+                "hedges": 0,
+                "hedge_wins": 0,
+                "cache_hits": 0,
+                "statuses": {},
+            }
+
+        return self._routes[key]
+
+
+class PrometheusExporter(object):
+    """Render the metrics in the Prometheus text exposition format.
+
+    :param str prefix: prefix of the metrics names
+    """
+
+    def __init__(self, prefix: str = "isogeo_sdk"):
+        self.prefix = prefix
+
+    def export(self, snapshot: dict) -> str:
+        """Returns the metrics as Prometheus text.
+
+        :param dict snapshot: metrics snapshot, see :meth:`IsogeoMetrics.snapshot`
+
+        :rtype: str
+        """
+        counters = (
+            ("requests_total", "count", "Requests sent"),
+            ("request_errors_total", "errors", "Requests without response"),
+            ("response_bytes_total", "bytes_in", "Bytes received"),
+            ("request_bytes_total", "bytes_out", "Bytes sent"),
+            ("retries_total", "retries", "Retries done by the transport"),
+            ("hedges_total", "hedges", "Hedge requests sent"),
+            ("hedge_wins_total", "hedge_wins", "Hedge requests answered first"),
+            ("cache_hits_total", "cache_hits", "Responses served by a cache"),
+        )
+        lines = []
+        for name, field, description in counters:
+            lines.append("# HELP {}_{} {}.".format(self.prefix, name, description))
+            lines.append("# TYPE {}_{} counter".format(self.prefix, name))
+            for stats in snapshot.values():
+                lines.append(
+                    "{}_{}{{{}}} {}".format(
+                        self.prefix, name, self._labels(stats), stats.get(field)
+                    )
+                )
+
+        # status codes
+        name = "{}_responses_total".format(self.prefix)
+        lines.append("# HELP {} Responses by status code.".format(name))
+        lines.append("# TYPE {} counter".format(name))
+        for stats in snapshot.values():
+            for status, count in sorted(stats.get("statuses").items()):
+                lines.append(
+                    '{}{{{},status="{}"}} {}'.format(
+                        name, self._labels(stats), status, count
+                    )
+                )
+
+        # latency histogram
+        name = "{}_request_duration_seconds".format(self.prefix)
+        lines.append("# HELP {} Requests latency.".format(name))
+        lines.append("# TYPE {} histogram".format(name))
+        for stats in snapshot.values():
+            labels = self._labels(stats)
+            for bound, count in stats.get("latency_buckets").items():
+                lines.append(
+                    '{}_bucket{{{},le="{}"}} {}'.format(name, labels, bound, count)
+                )
+            lines.append(
+                "{}_sum{{{}}} {}".format(name, labels, stats.get("latency_sum"))
+            )
+            lines.append("{}_count{{{}}} {}".format(name, labels, stats.get("count")))
+
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _labels(stats: dict) -> str:
+        return 'method="{}",route="{}"'.format(stats.get("method"), stats.get("route"))
+
+
+class LoggingExporter(object):
+    """Write the metrics in a logger, one line by route.
+
+    :param logging.Logger logger: logger to use. Defaults to the module logger.
+    :param int level: logging level. Defaults to INFO.
+    """
+
+    def __init__(self, logger: logging.Logger = logger, level: int = logging.INFO):
+        self.logger = logger
+        self.level = level
+
+    def export(self, snapshot: dict):
+        """Log the metrics.
+
+        :param dict snapshot: metrics snapshot, see :meth:`IsogeoMetrics.snapshot`
+        """
+        for key, stats in snapshot.items():
+            self.logger.log(
+                self.level,
+                "{}: {} requests - avg {:.3f}s - max {:.3f}s - {} bytes in - {} bytes out"
+                " - {} retries - {} cache hits - statuses {}".format(
+                    key,
+                    stats.get("count"),
+                    stats.get("latency_avg"),
+                    stats.get("latency_max"),
+                    stats.get("bytes_in"),
+                    stats.get("bytes_out"),
+                    stats.get("retries"),
+                    stats.get("cache_hits"),
+                    stats.get("statuses"),
+                ),
+            )
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    pass
@@ -1,46 +1,65 @@
 # coding: utf-8
 #! python3  # noqa: E265
 
-# models which are imported in a specific order handling their inter-dependencies
-from .contact import Contact  # noqa: F401
-from .workgroup import Workgroup  # noqa: F401
-
-from .application import Application  # noqa: F401
-from .catalog import Catalog  # noqa: F401
-
-from .coordinates_system import CoordinateSystem  # noqa: F401
-from .event import Event  # noqa: F401
-from .format import Format  # noqa: F401
-from .datasource import Datasource  # noqa: F401
-from .directive import Directive  # noqa: F401
-from .feature_attributes import FeatureAttribute  # noqa: F401
-from .keyword import Keyword  # noqa: F401
-from .keyword_search import KeywordSearch  # noqa: F401
-from .invitation import Invitation  # noqa: F401
-from .license import License  # noqa: F401
-from .limitation import Limitation  # noqa: F401
-from .link import Link  # noqa: F401
-from .metadata import Metadata  # noqa: F401
-from .metadata_search import MetadataSearch  # noqa: F401
-from .share import Share  # noqa: F401
-from .service_layer import ServiceLayer  # noqa: F401
-from .service_operation import ServiceOperation  # noqa: F401
-from .specification import Specification  # noqa: F401
-from .thesaurus import Thesaurus  # noqa: F401
-from .user import User  # noqa: F401
-
-# depending on License model
-from .condition import Condition  # noqa: F401
-
-# depending on Specification model
-from .conformity import Conformity  # noqa: F401
-
-# depending on previous models
-from .bulk_request import BulkRequest  # noqa: F401
-from .bulk_report import BulkReport  # noqa: F401
-
-# shortcuts or confusion reducers
-Account = User
-Group = Workgroup
-Resource = Metadata
-ResourceSearch = MetadataSearch
+"""Models of the Isogeo API, loaded at first access (PEP 562).
+
+Models import their own dependencies, so they can be loaded in any order.
+"""
+
+# standard library
+from importlib import import_module
+
+# models by name: (module, class)
+_MODELS = {
+    "Contact": (".contact", "Contact"),
+    "Workgroup": (".workgroup", "Workgroup"),
+    "Application": (".application", "Application"),
+    "Catalog": (".catalog", "Catalog"),
+    "CoordinateSystem": (".coordinates_system", "CoordinateSystem"),
+    "Event": (".event", "Event"),
+    "Format": (".format", "Format"),
+    "Datasource": (".datasource", "Datasource"),
+    "Directive": (".directive", "Directive"),
+    "FeatureAttribute": (".feature_attributes", "FeatureAttribute"),
+    "Keyword": (".keyword", "Keyword"),
+    "KeywordSearch": (".keyword_search", "KeywordSearch"),
+    "Invitation": (".invitation", "Invitation"),
+    "License": (".license", "License"),
+    "Limitation": (".limitation", "Limitation"),
+    "Link": (".link", "Link"),
+    "Metadata": (".metadata", "Metadata"),
+    "MetadataColumns": (".metadata_columns", "MetadataColumns"),
+    "MetadataSearch": (".metadata_search", "MetadataSearch"),
+    "MetadataView": (".metadata_view", "MetadataView"),
+    "Share": (".share", "Share"),
+    "ServiceLayer": (".service_layer", "ServiceLayer"),
+    "ServiceOperation": (".service_operation", "ServiceOperation"),
+    "Specification": (".specification", "Specification"),
+    "Thesaurus": (".thesaurus", "Thesaurus"),
+    "User": (".user", "User"),
+    "Condition": (".condition", "Condition"),
+    "Conformity": (".conformity", "Conformity"),
+    "BulkRequest": (".bulk_request", "BulkRequest"),
+    "BulkReport": (".bulk_report", "BulkReport"),
+    # shortcuts or confusion reducers
+    "Account": (".user", "User"),
+    "Group": (".workgroup", "Workgroup"),
+    "Resource": (".metadata", "Metadata"),
+    "ResourceSearch": (".metadata_search", "MetadataSearch"),
+}
+
+__all__ = list(_MODELS)
+
+
+def __getattr__(name: str):
+    if name in _MODELS:
+        module, attribute = _MODELS.get(name)
+        value = getattr(import_module(module, __name__), attribute)
+        globals()[name] = value
+        return value
+
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
@@ -16,6 +16,8 @@ import pprint
 
 # package
 from isogeo_pysdk.enums import ApplicationTypes
+from isogeo_pysdk.models.serializer import serialize, serialize_creation
+from isogeo_pysdk.models.slots import slots_values
 
 
 # #############################################################################
@@ -109,6 +111,24 @@ class Application(object):
 
     ATTR_MAP = {}
 
+    __slots__ = (
+        "__abilities",
+        "__created",
+        "__id",
+        "__modified",
+        "_canHaveManyGroups",
+        "_client_id",
+        "_client_secret",
+        "_groups",
+        "_kind",
+        "_name",
+        "_redirect_uris",
+        "_scopes",
+        "_staff",
+        "_type",
+        "_url",
+    )
+
     def __init__(
         self,
         _abilities: list = None,
@@ -444,67 +464,11 @@ class Application(object):
 
     def to_dict(self) -> dict:
         """Returns the model properties as a dict."""
-        result = {}
-
-        for attr, _ in self.ATTR_TYPES.items():
-            value = getattr(self, attr)
-            if isinstance(value, list):
-                result[attr] = list(
-                    map(lambda x: x.to_dict() if hasattr(x, "to_dict") else x, value)
-                )
-            elif hasattr(value, "to_dict"):
-                result[attr] = value.to_dict()
-            elif isinstance(value, dict):
-                result[attr] = dict(
-                    map(
-                        lambda item: (item[0], item[1].to_dict())
-                        if hasattr(item[1], "to_dict")
-                        else item,
-                        value.items(),
-                    )
-                )
-            else:
-                result[attr] = value
-        if issubclass(Application, dict):
-            for key, value in self.items():
-                result[key] = value
-
-        return result
+        return serialize(self)
 
     def to_dict_creation(self) -> dict:
         """Returns the model properties as a dict structured for creation purpose (POST)"""
-        result = {}
-
-        for attr, _ in self.ATTR_CREA.items():
-            # get attribute value
-            value = getattr(self, attr)
-            # switch attribute name for creation purpose
-            if attr in self.ATTR_MAP:
-                attr = self.ATTR_MAP.get(attr)
-            # process value depending on attr type
-            if isinstance(value, list):
-
-                result[attr] = list(
-                    map(lambda x: x.to_dict() if hasattr(x, "to_dict") else x, value)
-                )
-            elif hasattr(value, "to_dict"):
-                result[attr] = value.to_dict()
-            elif isinstance(value, dict):
-                result[attr] = dict(
-                    map(
-                        lambda item: (item[0], item[1].to_dict())
-                        if hasattr(item[1], "to_dict")
-                        else item,
-                        value.items(),
-                    )
-                )
-            else:
-                result[attr] = value
-        if issubclass(Application, dict):
-            for key, value in self.items():
-                result[key] = value
-
-        return result
+        return serialize_creation(self)
 
     def to_str(self) -> str:
         """Returns the string representation of the model."""
@@ -519,7 +483,7 @@ class Application(object):
         if not isinstance(other, Application):
             return False
 
-        return self.__dict__ == other.__dict__
+        return slots_values(self) == slots_values(other)
 
     def __ne__(self, other) -> bool:
         """Returns true if both objects are not equal."""
@@ -14,6 +14,10 @@
 # standard library
 import pprint
 
+# package
+from isogeo_pysdk.models.serializer import serialize
+from isogeo_pysdk.models.slots import slots_values
+
 # other model
 from isogeo_pysdk.models.bulk_request import BulkRequest
 
@@ -26,6 +30,11 @@ class BulkReport(object):
 
     ATTR_TYPES = {"ignored": dict, "request": BulkRequest}
 
+    __slots__ = (
+        "_ignored",
+        "_request",
+    )
+
     def __init__(self, ignored: dict = None, request: BulkRequest = None):
 
         # default values for the object attributes/properties
@@ -79,32 +88,7 @@ class BulkReport(object):
     # -- METHODS -----------------------------------------------------------------------
     def to_dict(self) -> dict:
         """Returns the request properties as a dict."""
-        result = {}
-
-        for attr, _ in self.ATTR_TYPES.items():
-            value = getattr(self, attr)
-            if isinstance(value, list):
-                result[attr] = list(
-                    map(lambda x: x.to_dict() if hasattr(x, "to_dict") else x, value)
-                )
-            elif hasattr(value, "to_dict"):
-                result[attr] = value.to_dict()
-            elif isinstance(value, dict):
-                result[attr] = dict(
-                    map(
-                        lambda item: (item[0], item[1].to_dict())
-                        if hasattr(item[1], "to_dict")
-                        else item,
-                        value.items(),
-                    )
-                )
-            else:
-                result[attr] = value
-        if issubclass(BulkReport, dict):
-            for key, value in self.items():
-                result[key] = value
-
-        return result
+        return serialize(self)
 
     def to_str(self) -> str:
         """Returns the string representation of the request."""
@@ -119,7 +103,7 @@ class BulkReport(object):
         if not isinstance(other, BulkReport):
             return False
 
-        return self.__dict__ == other.__dict__
+        return slots_values(self) == slots_values(other)
 
     def __ne__(self, other) -> bool:
         """Returns true if both objects are not equal."""
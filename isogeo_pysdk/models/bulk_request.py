@@ -13,6 +13,10 @@
 # standard library
 import pprint
 
+# package
+from isogeo_pysdk.models.serializer import serialize
+from isogeo_pysdk.models.slots import slots_values
+
 # other model
 from isogeo_pysdk.enums import BulkActions, BulkTargets
 
@@ -25,6 +29,13 @@ class BulkRequest(object):
 
     ATTR_TYPES = {"action": object, "model": int, "query": dict, "target": list}
 
+    __slots__ = (
+        "_action",
+        "_model",
+        "_query",
+        "_target",
+    )
+
     def __init__(
         self,
         action: str = None,
@@ -149,32 +160,7 @@ class BulkRequest(object):
     # -- METHODS -----------------------------------------------------------------------
     def to_dict(self) -> dict:
         """Returns the model properties as a dict."""
-        result = {}
-
-        for attr, _ in self.ATTR_TYPES.items():
-            value = getattr(self, attr)
-            if isinstance(value, list):
-                result[attr] = list(
-                    map(lambda x: x.to_dict() if hasattr(x, "to_dict") else x, value)
-                )
-            elif hasattr(value, "to_dict"):
-                result[attr] = value.to_dict()
-            elif isinstance(value, dict):
-                result[attr] = dict(
-                    map(
-                        lambda item: (item[0], item[1].to_dict())
-                        if hasattr(item[1], "to_dict")
-                        else item,
-                        value.items(),
-                    )
-                )
-            else:
-                result[attr] = value
-        if issubclass(BulkRequest, dict):
-            for key, value in self.items():
-                result[key] = value
-
-        return result
+        return serialize(self)
 
     def to_str(self) -> str:
         """Returns the string representation of the model."""
@@ -189,7 +175,7 @@ class BulkRequest(object):
         if not isinstance(other, BulkRequest):
             return False
 
-        return self.__dict__ == other.__dict__
+        return slots_values(self) == slots_values(other)
 
     def __ne__(self, other) -> bool:
         """Returns true if both objects are not equal."""
@@ -14,6 +14,10 @@
 # standard library
 import pprint
 
+# package
+from isogeo_pysdk.models.serializer import serialize, serialize_creation
+from isogeo_pysdk.models.slots import slots_values
+
 # others related models
 from isogeo_pysdk.models import License
 
@@ -52,6 +56,13 @@ class Condition(object):
 
     ATTR_MAP = {}
 
+    __slots__ = (
+        "__id",
+        "_description",
+        "_license",
+        "_parent_resource",
+    )
+
     def __init__(
         self,
         _id: str = None,
@@ -159,65 +170,11 @@ class Condition(object):
     # -- METHODS -----------------------------------------------------------------------
     def to_dict(self) -> dict:
         """Returns the model properties as a dict."""
-        result = {}
-
-        for attr, _ in self.ATTR_TYPES.items():
-            value = getattr(self, attr)
-            if isinstance(value, list):
-                result[attr] = list(
-                    map(lambda x: x.to_dict() if hasattr(x, "to_dict") else x, value)
-                )
-            elif hasattr(value, "to_dict"):
-                result[attr] = value.to_dict()
-            elif isinstance(value, dict):
-                result[attr] = dict(
-                    map(
-                        lambda item: (item[0], item[1].to_dict())
-                        if hasattr(item[1], "to_dict")
-                        else item,
-                        value.items(),
-                    )
-                )
-            else:
-                result[attr] = value
-        if issubclass(Condition, dict):
-            for key, value in self.items():
-                result[key] = value
-
-        return result
+        return serialize(self)
 
     def to_dict_creation(self) -> dict:
         """Returns the model properties as a dict structured for creation purpose (POST)"""
-        result = {}
-
-        for attr, _ in self.ATTR_CREA.items():
-            # get attribute value
-            value = getattr(self, attr)
-            # switch attribute name for creation purpose
-            if attr in self.ATTR_MAP:
-                attr = self.ATTR_MAP.get(attr)
-            if isinstance(value, list):
-                result[attr] = list(
-                    map(lambda x: x.to_dict() if hasattr(x, "to_dict") else x, value)
-                )
-            elif hasattr(value, "to_dict"):
-                result[attr] = value.to_dict()
-            elif isinstance(value, dict):
-                result[attr] = dict(
-                    map(
-                        lambda item: (item[0], item[1].to_dict())
-                        if hasattr(item[1], "to_dict")
-                        else item,
-                        value.items(),
-                    )
-                )
-            else:
-                result[attr] = value
-        if issubclass(Condition, dict):
-            for key, value in self.items():
-                result[key] = value
-
-        return result
+        return serialize_creation(self)
 
     def to_str(self) -> str:
         """Returns the string representation of the model."""
@@ -232,7 +189,7 @@ class Condition(object):
         if not isinstance(other, Condition):
             return False
 
-        return self.__dict__ == other.__dict__
+        return slots_values(self) == slots_values(other)
 
     def __ne__(self, other) -> bool:
         """Returns true if both objects are not equal."""
@@ -14,6 +14,10 @@
 # standard library
 import pprint
 
+# package
+from isogeo_pysdk.models.serializer import serialize, serialize_creation
+from isogeo_pysdk.models.slots import slots_values
+
 
 # #############################################################################
 # ########## Classes ###############
@@ -62,6 +66,31 @@ class Contact(object):
         "phone": "phoneNumber",
     }
 
+    __slots__ = (
+        "__abilities",
+        "__id",
+        "__tag",
+        "_addressLine1",
+        "_addressLine2",
+        "_addressLine3",
+        "_available",
+        "_city",
+        "_count",
+        "_countryCode",
+        "_email",
+        "_fax",
+        "_hash",
+        "_name",
+        "_organization",
+        "_owner",
+        "_phone",
+        "_type",
+        "_zipCode",
+        "_created",
+        "_modified",
+        "_deleted",
+    )
+
     def __init__(
         self,
         _abilities: list = None,
@@ -491,65 +520,11 @@ class Contact(object):
     # -- METHODS -----------------------------------------------------------------------
     def to_dict(self) -> dict:
         """Returns the model properties as a dict."""
-        result = {}
-
-        for attr, _ in self.ATTR_TYPES.items():
-            value = getattr(self, attr)
-            if isinstance(value, list):
-                result[attr] = list(
-                    map(lambda x: x.to_dict() if hasattr(x, "to_dict") else x, value)
-                )
-            elif hasattr(value, "to_dict"):
-                result[attr] = value.to_dict()
-            elif isinstance(value, dict):
-                result[attr] = dict(
-                    map(
-                        lambda item: (item[0], item[1].to_dict())
-                        if hasattr(item[1], "to_dict")
-                        else item,
-                        value.items(),
-                    )
-                )
-            else:
-                result[attr] = value
-        if issubclass(Contact, dict):
-            for key, value in self.items():
-                result[key] = value
-
-        return result
+        return serialize(self)
 
     def to_dict_creation(self) -> dict:
         """Returns the model properties as a dict structured for creation purpose (POST)"""
-        result = {}
-
-        for attr, _ in self.ATTR_CREA.items():
-            # get attribute value
-            value = getattr(self, attr)
-            # switch attribute name for creation purpose
-            if attr in self.ATTR_MAP:
-                attr = self.ATTR_MAP.get(attr)
-            if isinstance(value, list):
-                result[attr] = list(
-                    map(lambda x: x.to_dict() if hasattr(x, "to_dict") else x, value)
-                )
-            elif hasattr(value, "to_dict"):
-                result[attr] = value.to_dict()
-            elif isinstance(value, dict):
-                result[attr] = dict(
-                    map(
-                        lambda item: (item[0], item[1].to_dict())
-                        if hasattr(item[1], "to_dict")
-                        else item,
-                        value.items(),
-                    )
-                )
-            else:
-                result[attr] = value
-        if issubclass(Contact, dict):
-            for key, value in self.items():
-                result[key] = value
-
-        return result
+        return serialize_creation(self)
 
     def to_str(self) -> str:
         """Returns the string representation of the model."""
@@ -564,7 +539,7 @@ class Contact(object):
         if not isinstance(other, Contact):
             return False
 
-        return self.__dict__ == other.__dict__
+        return slots_values(self) == slots_values(other)
 
     def __ne__(self, other) -> bool:
         """Returns true if both objects are not equal."""
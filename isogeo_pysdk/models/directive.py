@@ -14,6 +14,10 @@
 # standard library
 import pprint
 
+# package
+from isogeo_pysdk.models.serializer import serialize
+from isogeo_pysdk.models.slots import slots_values
+
 
 # #############################################################################
 # ########## Classes ###############
@@ -36,6 +40,12 @@ class Directive(object):
 
     ATTR_MAP = {}
 
+    __slots__ = (
+        "__id",
+        "_description",
+        "_name",
+    )
+
     def __init__(self, _id: str = None, description: str = None, name: str = None):
         """Directive model."""
 
@@ -87,32 +97,7 @@ class Directive(object):
     # -- METHODS -----------------------------------------------------------------------
     def to_dict(self) -> dict:
         """Returns the model properties as a dict."""
-        result = {}
-
-        for attr, _ in self.ATTR_TYPES.items():
-            value = getattr(self, attr)
-            if isinstance(value, list):
-                result[attr] = list(
-                    map(lambda x: x.to_dict() if hasattr(x, "to_dict") else x, value)
-                )
-            elif hasattr(value, "to_dict"):
-                result[attr] = value.to_dict()
-            elif isinstance(value, dict):
-                result[attr] = dict(
-                    map(
-                        lambda item: (item[0], item[1].to_dict())
-                        if hasattr(item[1], "to_dict")
-                        else item,
-                        value.items(),
-                    )
-                )
-            else:
-                result[attr] = value
-        if issubclass(Directive, dict):
-            for key, value in self.items():
-                result[key] = value
-
-        return result
+        return serialize(self)
 
     def to_str(self) -> str:
         """Returns the string representation of the model."""
@@ -127,7 +112,7 @@ class Directive(object):
         if not isinstance(other, Directive):
             return False
 
-        return self.__dict__ == other.__dict__
+        return slots_values(self) == slots_values(other)
 
     def __ne__(self, other) -> bool:
         """Returns true if both objects are not equal."""
@@ -20,6 +20,8 @@ from typing import Union
 
 # package
 from isogeo_pysdk.enums import MetadataTypes
+from isogeo_pysdk.models.serializer import serialize, serialize_creation
+from isogeo_pysdk.models.slots import slots_values
 
 # others models
 from isogeo_pysdk.models import CoordinateSystem, Workgroup
@@ -252,6 +254,55 @@ class Metadata(object):
 
     # -- CLASS INSTANCIATION -----------------------------------------------------------
 
+    __slots__ = (
+        "__abilities",
+        "__created",
+        "__creator",
+        "__id",
+        "__modified",
+        "_abstract",
+        "_collectionContext",
+        "_collectionMethod",
+        "_conditions",
+        "_contacts",
+        "_coordinateSystem",
+        "_creation",
+        "_distance",
+        "_editionProfile",
+        "_encoding",
+        "_envelope",
+        "_events",
+        "_featureAttributes",
+        "_features",
+        "_format",
+        "_formatVersion",
+        "_geometry",
+        "_keywords",
+        "_language",
+        "_layers",
+        "_limitations",
+        "_links",
+        "_modification",
+        "_name",
+        "_operations",
+        "_path",
+        "_precision",
+        "_published",
+        "_scale",
+        "_series",
+        "_serviceLayers",
+        "_specifications",
+        "_tags",
+        "_thumbnailUrl",
+        "_title",
+        "_topologicalConsistency",
+        "_type",
+        "_updateFrequency",
+        "_validFrom",
+        "_validTo",
+        "_validityComment",
+    )
+
     def __init__(
         self,
         _abilities: list = None,
@@ -422,6 +473,8 @@ class Metadata(object):
             self._published = published
         if scale is not None:
             self._scale = scale
+        if series is not None:
+            self._series = series
         if serviceLayers is not None:
             self._serviceLayers = serviceLayers
         if specifications is not None:
@@ -1366,65 +1419,11 @@ class Metadata(object):
 
     def to_dict(self) -> dict:
         """Returns the model properties as a dict."""
-        result = {}
-
-        for attr, _ in self.ATTR_TYPES.items():
-            value = getattr(self, attr)
-            if isinstance(value, list):
-                result[attr] = list(
-                    map(lambda x: x.to_dict() if hasattr(x, "to_dict") else x, value)
-                )
-            elif hasattr(value, "to_dict"):
-                result[attr] = value.to_dict()
-            elif isinstance(value, dict):
-                result[attr] = dict(
-                    map(
-                        lambda item: (item[0], item[1].to_dict())
-                        if hasattr(item[1], "to_dict")
-                        else item,
-                        value.items(),
-                    )
-                )
-            else:
-                result[attr] = value
-        if issubclass(Metadata, dict):
-            for key, value in self.items():
-                result[key] = value
-
-        return result
+        return serialize(self)
 
     def to_dict_creation(self) -> dict:
         """Returns the model properties as a dict structured for creation purpose (POST)"""
-        result = {}
-
-        for attr, _ in self.ATTR_CREA.items():
-            # get attribute value
-            value = getattr(self, attr)
-            # switch attribute name for creation purpose
-            if attr in self.ATTR_MAP:
-                attr = self.ATTR_MAP.get(attr)
-            if isinstance(value, list):
-                result[attr] = list(
-                    map(lambda x: x.to_dict() if hasattr(x, "to_dict") else x, value)
-                )
-            elif hasattr(value, "to_dict"):
-                result[attr] = value.to_dict()
-            elif isinstance(value, dict):
-                result[attr] = dict(
-                    map(
-                        lambda item: (item[0], item[1].to_dict())
-                        if hasattr(item[1], "to_dict")
-                        else item,
-                        value.items(),
-                    )
-                )
-            else:
-                result[attr] = value
-        if issubclass(Metadata, dict):
-            for key, value in self.items():
-                result[key] = value
-
-        return result
+        return serialize_creation(self)
 
     def to_str(self) -> str:
         """Returns the string representation of the model."""
@@ -1439,7 +1438,7 @@ class Metadata(object):
         if not isinstance(other, Metadata):
             return False
 
-        return self.__dict__ == other.__dict__
+        return slots_values(self) == slots_values(other)
 
     def __ne__(self, other) -> bool:
         """Returns true if both objects are not equal."""
@@ -0,0 +1,366 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""
+    Isogeo API v1 - Columnar view of Metadata search results
+
+    Results are stored column by column in typed arrays (standard library `array`), ready
+    for vectorized aggregations with numpy, pandas or Arrow without building a model by
+    metadata.
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# standard library
+import pprint
+import re
+from array import array
+from datetime import date, datetime, timezone
+
+# #############################################################################
+# ########## Globals ###############
+# ##################################
+
+# missing dates: minimal int64, read as NaT by numpy and pandas
+NAT = -(2 ** 63)
+
+# subresource not included in the search results
+NOT_INCLUDED = -1
+
+# ISO 8601 dates returned by the API: '2018-06-14T13:22:17.2880035+00:00'
+_regex_iso_datetime = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})"
+    r"(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:\.(\d+))?)?)?"
+    r"(Z|[+-]\d{2}:?\d{2})?$"
+)
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_EPOCH_ORDINAL = _EPOCH.toordinal()
+
+# columns by kind
+STR_COLUMNS = ("_id", "title", "type", "format")
+DATE_COLUMNS = ("_created", "_modified")
+BBOX_COLUMNS = ("bbox_xmin", "bbox_ymin", "bbox_xmax", "bbox_ymax")
+COUNT_COLUMNS = ("links_count", "keywords_count", "events_count")
+
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+class MetadataColumns(object):
+    """Metadata search results stored by columns: one list or typed array by attribute \
+    instead of one dictionary by metadata.
+
+    Columns:
+
+        * `_id`, `title`, `type`, `format`: lists of str (None if missing)
+        * `_created`, `_modified`: int64 arrays of UTC timestamps in milliseconds \
+            (:data:`NAT` if missing)
+        * `bbox_xmin`, `bbox_ymin`, `bbox_xmax`, `bbox_ymax`: float64 arrays of the \
+            envelope bounding box (NaN if missing)
+        * `links_count`, `keywords_count`, `events_count`: int64 arrays of the \
+            subresources counts (:data:`NOT_INCLUDED` if not included in the search)
+
+    Numeric columns are exposed to numpy, pandas and Arrow without copy: don't extend the \
+    columns while such views are alive (the arrays raise a BufferError).
+
+    :param results: metadata dictionaries to add (see :meth:`extend`)
+
+    :Example:
+
+    .. code-block:: python
+
+        search = isogeo.search(whole_results=1, include=("links",), columnar=1)
+        columns = search.columns
+
+        # standard library
+        print(Counter(columns["type"]), max(columns["_modified"]))
+
+        # pip install pandas
+        df = columns.to_pandas()
+        print(df.groupby("type")["links_count"].sum(), df["_modified"].max())
+    """
+
+    __slots__ = STR_COLUMNS + DATE_COLUMNS + BBOX_COLUMNS + COUNT_COLUMNS
+
+    def __init__(self, results: list = None):
+        """Metadata columns model."""
+        for name in STR_COLUMNS:
+            setattr(self, name, [])
+        for name in DATE_COLUMNS:
+            setattr(self, name, array("q"))
+        for name in BBOX_COLUMNS:
+            setattr(self, name, array("d"))
+        for name in COUNT_COLUMNS:
+            setattr(self, name, array("q"))
+
+        if results is not None:
+            self.extend(results)
+
+    # -- PROPERTIES --------------------------------------------------------------------
+    @property
+    def names(self) -> tuple:
+        """Gets the columns names.
+
+        :rtype: tuple
+        """
+        return self.__slots__
+
+    # -- METHODS -----------------------------------------------------------------------
+    def extend(self, results: list):
+        """Add metadata to the columns. Meant to be called on each page of a search, as \
+        soon as it's received.
+
+        :param list results: metadata dictionaries, as returned by the API (i.e. \
+            `MetadataSearch.results`)
+        """
+        append_id = self._id.append
+        append_title = self.title.append
+        append_type = self.type.append
+        append_format = self.format.append
+        append_created = self._created.append
+        append_modified = self._modified.append
+        append_xmin = self.bbox_xmin.append
+        append_ymin = self.bbox_ymin.append
+        append_xmax = self.bbox_xmax.append
+        append_ymax = self.bbox_ymax.append
+        append_links = self.links_count.append
+        append_keywords = self.keywords_count.append
+        append_events = self.events_count.append
+        nan = float("nan")
+
+        for md in results:
+            append_id(md.get("_id"))
+            append_title(md.get("title"))
+            append_type(md.get("type"))
+            append_format(md.get("format"))
+            append_created(parse_timestamp(md.get("_created")))
+            append_modified(parse_timestamp(md.get("_modified")))
+            xmin, ymin, xmax, ymax = envelope_bbox(md.get("envelope")) or (nan,) * 4
+            append_xmin(xmin)
+            append_ymin(ymin)
+            append_xmax(xmax)
+            append_ymax(ymax)
+            append_links(len(md.get("links") or ()) if "links" in md else NOT_INCLUDED)
+            append_keywords(
+                len(md.get("keywords") or ()) if "keywords" in md else NOT_INCLUDED
+            )
+            append_events(
+                len(md.get("events") or ()) if "events" in md else NOT_INCLUDED
+            )
+
+    def concat(self, other: "MetadataColumns"):
+        """Append the metadata of other columns (i.e. of another search page).
+
+        :param MetadataColumns other: columns to append
+        """
+        for name in self.__slots__:
+            getattr(self, name).extend(getattr(other, name))
+
+    def to_dict(self) -> dict:
+        """Returns the columns as a dict of lists and arrays, by name. Nothing is copied."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def to_arrow(self):
+        """Returns the columns as an Arrow table. Numeric columns share the memory of \
+        the arrays; dates columns are copied only if a date is missing.
+
+        :raises ImportError: if pyarrow is not installed
+
+        :rtype: pyarrow.Table
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError(
+                "pyarrow is required to convert the columns to Arrow: pip install pyarrow"
+            )
+
+        timestamp = pa.timestamp("ms", tz="UTC")
+        types = {"d": pa.float64(), "q": pa.int64()}
+        arrays = {}
+        for name in self.__slots__:
+            column = getattr(self, name)
+            if name in STR_COLUMNS:
+                arrays[name] = pa.array(column, type=pa.string())
+            elif name in DATE_COLUMNS and NAT in column:
+                arrays[name] = pa.array(
+                    [None if value == NAT else value for value in column],
+                    type=timestamp,
+                )
+            else:
+                arrays[name] = pa.Array.from_buffers(
+                    timestamp if name in DATE_COLUMNS else types.get(column.typecode),
+                    len(column),
+                    [None, pa.py_buffer(column)],
+                )
+
+        return pa.table(arrays)
+
+    def to_pandas(self):
+        """Returns the columns as a pandas DataFrame. Numeric and dates columns are \
+        numpy views of the arrays: missing dates are NaT.
+
+        :raises ImportError: if pandas is not installed
+
+        :rtype: pandas.DataFrame
+        """
+        try:
+            import numpy as np
+            import pandas as pd
+        except ImportError:
+            raise ImportError(
+                "pandas is required to convert the columns to a DataFrame: pip install pandas"
+            )
+
+        data = {}
+        for name in self.__slots__:
+            column = getattr(self, name)
+            if name in STR_COLUMNS:
+                data[name] = column
+            elif name in DATE_COLUMNS:
+                data[name] = np.frombuffer(column, dtype=np.int64).view(
+                    "datetime64[ms]"
+                )
+            else:
+                data[name] = np.frombuffer(
+                    column, dtype=np.float64 if column.typecode == "d" else np.int64
+                )
+
+        return pd.DataFrame(data, copy=False)
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model."""
+        return pprint.pformat(self.to_dict())
+
+    def __len__(self) -> int:
+        """Number of metadata."""
+        return len(self._id)
+
+    def __getitem__(self, name: str):
+        """Returns a column by name."""
+        if name not in self.__slots__:
+            raise KeyError(name)
+
+        return getattr(self, name)
+
+    def __repr__(self) -> str:
+        """For `print` and `pprint`"""
+        return self.to_str()
+
+    def __eq__(self, other) -> bool:
+        """Returns true if both objects are equal."""
+        if not isinstance(other, MetadataColumns):
+            return False
+
+        # compared by representation: missing bounding boxes (NaN) are not equal to themselves
+        return repr(self.to_dict()) == repr(other.to_dict())
+
+    def __ne__(self, other) -> bool:
+        """Returns true if both objects are not equal."""
+        return not self == other
+
+    @classmethod
+    def from_results(cls, results: list) -> "MetadataColumns":
+        """Returns the columns of metadata dictionaries.
+
+        :param list results: metadata dictionaries, as returned by the API
+
+        :rtype: MetadataColumns
+        """
+        return cls(results=results)
+
+
+# #############################################################################
+# ########## Functions #############
+# ##################################
+def parse_timestamp(in_date: str) -> int:
+    """Returns an ISO 8601 date as UTC timestamp in milliseconds, :data:`NAT` if missing \
+    or unreadable. Dates without timezone are considered as UTC.
+
+    :param str in_date: date as returned by the API (i.e. '2019-06-13T16:21:38.1917618+00:00')
+
+    :rtype: int
+    """
+    if not in_date:
+        return NAT
+
+    # fast path (Python 3.7+). 7 digits fractions and the 'Z' suffix are only accepted
+    # from Python 3.11: earlier versions raise a ValueError and fall back to the regex
+    try:
+        out_date = datetime.fromisoformat(in_date)
+    except ValueError:
+        pass
+    else:
+        if out_date.tzinfo is None:
+            out_date = out_date.replace(tzinfo=timezone.utc)
+        delta = out_date - _EPOCH
+        return delta.days * 86400000 + delta.seconds * 1000 + delta.microseconds // 1000
+
+    match = _regex_iso_datetime.match(in_date)
+    if match is None:
+        return NAT
+    year, month, day, hour, minute, second, fraction, tz = match.groups()
+
+    try:
+        days = date(int(year), int(month), int(day)).toordinal() - _EPOCH_ORDINAL
+    except ValueError:
+        return NAT
+    timestamp = (
+        days * 86400000
+        + int(hour or 0) * 3600000
+        + int(minute or 0) * 60000
+        + int(second or 0) * 1000
+    )
+    if fraction:
+        timestamp += int(fraction[:3].ljust(3, "0"))
+    if tz and tz != "Z":
+        offset = int(tz[1:3]) * 60 + int(tz[-2:])
+        timestamp -= (offset if tz[0] == "+" else -offset) * 60000
+
+    return timestamp
+
+
+def envelope_bbox(envelope: dict) -> tuple:
+    """Returns the bounding box (xmin, ymin, xmax, ymax) of a metadata envelope: its \
+    `bbox` if any, else computed from its coordinates. None if there is no envelope.
+
+    :param dict envelope: GeoJSON geometry of the metadata
+
+    :rtype: tuple
+    """
+    if not envelope:
+        return None
+    bbox = envelope.get("bbox")
+    if bbox and len(bbox) == 4:
+        return tuple(bbox)
+
+    # flatten the coordinates (Point, Polygon, MultiPolygon...) into positions
+    positions = []
+    stack = [envelope.get("coordinates")]
+    while stack:
+        coordinates = stack.pop()
+        if not coordinates:
+            continue
+        if isinstance(coordinates[0], (int, float)):
+            positions.append(coordinates)
+        else:
+            stack.extend(coordinates)
+    if not positions:
+        return None
+
+    xs = [position[0] for position in positions]
+    ys = [position[1] for position in positions]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    columns = MetadataColumns(
+        [{"_id": "abcd123", "_created": "2018-06-14T13:22:17.2880035+00:00"}]
+    )
+    print(len(columns), columns["_created"])
@@ -14,7 +14,14 @@
 # standard library
 import pprint
 
+# package
+from isogeo_pysdk.models.serializer import serialize
+from isogeo_pysdk.models.slots import slots_values
+
 # other model
+from isogeo_pysdk.models.metadata_columns import MetadataColumns
+from isogeo_pysdk.models.metadata_view import MetadataView
+
 # from isogeo_pysdk.models.resource import Metadata
 # from isogeo_pysdk.models.tag import Tag
 
@@ -35,6 +42,17 @@ class MetadataSearch(object):
         "total": int,
     }
 
+    __slots__ = (
+        "_columns",
+        "_envelope",
+        "_limit",
+        "_offset",
+        "_query",
+        "_results",
+        "_tags",
+        "_total",
+    )
+
     def __init__(
         self,
         envelope: dict = None,
@@ -48,6 +66,7 @@ class MetadataSearch(object):
         """Model for object returned by resource/search?."""
 
         # default values for the object attributes/properties
+        self._columns = None
         self._envelope = None
         self._limit = None
         self._offset = None
@@ -74,6 +93,25 @@ class MetadataSearch(object):
             self._total = total
 
     # -- PROPERTIES --------------------------------------------------------------------
+    # results columns
+    @property
+    def columns(self) -> MetadataColumns:
+        """Gets the results of this Metadata search stored by columns, if the search was \
+        columnar. See :class:`isogeo_pysdk.models.metadata_columns.MetadataColumns`.
+
+        :rtype: MetadataColumns
+        """
+        return self._columns
+
+    @columns.setter
+    def columns(self, columns: MetadataColumns):
+        """Sets the results columns of this Metadata search.
+
+        :param MetadataColumns columns: The results columns of this Metadata search.
+        """
+
+        self._columns = columns
+
     # search results envelope
     @property
     def envelope(self) -> dict:
@@ -216,34 +254,17 @@ class MetadataSearch(object):
         self._total = total
 
     # -- METHODS -----------------------------------------------------------------------
+    def views(self):
+        """Returns an iterator over the results as read-only metadata views, wrapped on the \
+        fly. See :class:`isogeo_pysdk.models.metadata_view.MetadataView`.
+
+        :rtype: Iterator[MetadataView]
+        """
+        return map(MetadataView, self._results or ())
+
     def to_dict(self) -> dict:
         """Returns the model properties as a dict."""
-        result = {}
-
-        for attr, _ in self.ATTR_TYPES.items():
-            value = getattr(self, attr)
-            if isinstance(value, list):
-                result[attr] = list(
-                    map(lambda x: x.to_dict() if hasattr(x, "to_dict") else x, value)
-                )
-            elif hasattr(value, "to_dict"):
-                result[attr] = value.to_dict()
-            elif isinstance(value, dict):
-                result[attr] = dict(
-                    map(
-                        lambda item: (item[0], item[1].to_dict())
-                        if hasattr(item[1], "to_dict")
-                        else item,
-                        value.items(),
-                    )
-                )
-            else:
-                result[attr] = value
-        if issubclass(MetadataSearch, dict):
-            for key, value in self.items():
-                result[key] = value
-
-        return result
+        return serialize(self)
 
     def to_str(self) -> str:
         """Returns the string representation of the model."""
@@ -258,7 +279,7 @@ class MetadataSearch(object):
         if not isinstance(other, MetadataSearch):
             return False
 
-        return self.__dict__ == other.__dict__
+        return slots_values(self) == slots_values(other)
 
     def __ne__(self, other) -> bool:
         """Returns true if both objects are not equal."""
@@ -0,0 +1,147 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""
+    Isogeo API v1 - Read-only view of a Metadata (= Resource) as returned by the API
+
+    See: http://help.isogeo.com/api/complete/index.html#definition-resource
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# standard library
+import pprint
+
+# others models
+from isogeo_pysdk.models import Metadata
+from isogeo_pysdk.models.serializer import serialize
+
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+class MetadataView(object):
+    """Read-only view of a metadata dictionary, as returned by the API (i.e. search \
+    results). Nothing is copied nor converted: attributes are read from the dictionary \
+    on access, with the same names as :class:`Metadata` (i.e. `coordinate-system` is \
+    available as `coordinateSystem`).
+
+    Wrapping costs a single small object by metadata, far less than building a \
+    :class:`Metadata`. Use :meth:`to_metadata` to get a full model.
+
+    :param dict raw_object: metadata dictionary returned by a request.json(). Not modified.
+
+    :Example:
+
+    .. code-block:: python
+
+        search = isogeo.search(whole_results=1, include=("links",))
+        for md in search.views():
+            print(md.title_or_name(), md.groupName, len(md.links or ()))
+
+        # to edit a metadata
+        metadata = md.to_metadata()
+    """
+
+    # -- ATTRIBUTES --------------------------------------------------------------------
+    ATTR_TYPES = Metadata.ATTR_TYPES
+
+    ATTR_MAP = Metadata.ATTR_MAP
+
+    __slots__ = ("_raw",)
+
+    def __init__(self, raw_object: dict):
+        """Metadata view model."""
+        self._raw = raw_object
+
+    # -- PROPERTIES --------------------------------------------------------------------
+    # attributes properties are added after the class definition, from ATTR_TYPES
+    @property
+    def raw(self) -> dict:
+        """Gets the metadata dictionary wrapped by this view.
+
+        :rtype: dict
+        """
+        return self._raw
+
+    # -- SPECIFIC TO IMPLEMENTATION ----------------------------------------------------
+    groupName = Metadata.groupName
+    groupId = Metadata.groupId
+    typeFilter = Metadata.typeFilter
+
+    # -- METHODS -----------------------------------------------------------------------
+    admin_url = Metadata.admin_url
+    title_or_name = Metadata.title_or_name
+    signature = Metadata.signature
+
+    def to_metadata(self) -> Metadata:
+        """Returns the full Metadata model of this view. The wrapped dictionary is not \
+        modified.
+
+        :rtype: Metadata
+        """
+        return Metadata.clean_attributes(dict(self._raw))
+
+    def to_dict(self) -> dict:
+        """Returns the model properties as a dict."""
+        return serialize(self)
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model."""
+        return pprint.pformat(self.to_dict())
+
+    def __repr__(self) -> str:
+        """For `print` and `pprint`"""
+        return self.to_str()
+
+    def __eq__(self, other) -> bool:
+        """Returns true if both objects are equal."""
+        if not isinstance(other, MetadataView):
+            return False
+
+        return self._raw == other._raw
+
+    def __ne__(self, other) -> bool:
+        """Returns true if both objects are not equal."""
+        return not self == other
+
+
+# #############################################################################
+# ########## Functions #############
+# ##################################
+def _view_property(key: str) -> property:
+    """Returns a read-only property getting a key of the wrapped dictionary.
+
+    :param str key: key in the metadata dictionary (i.e. 'coordinate-system')
+    """
+
+    def getter(self):
+        return self._raw.get(key)
+
+    getter.__doc__ = "Gets the {} of this Metadata.".format(key)
+    return property(getter)
+
+
+for _attr in MetadataView.ATTR_TYPES:
+    setattr(
+        MetadataView, _attr, _view_property(MetadataView.ATTR_MAP.get(_attr, _attr))
+    )
+    # Metadata methods (i.e. title_or_name) read the attributes where the model stores
+    # them: '_title' for 'title'
+    if not _attr.startswith("_") and "_" + _attr not in MetadataView.ATTR_TYPES:
+        setattr(
+            MetadataView,
+            "_" + _attr,
+            _view_property(MetadataView.ATTR_MAP.get(_attr, _attr)),
+        )
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    test_view = MetadataView({"title": "abcd123", "coordinate-system": {"code": 2154}})
+    print(test_view.title_or_name(slugged=True), test_view.coordinateSystem)
@@ -0,0 +1,159 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""
+    Isogeo API v1 - Serializer shared by the models `to_dict` and `to_dict_creation` methods
+
+    The attributes to read and the keys to write are compiled once by model class into a \
+    plan of (key, getter) pairs, so serializing a model is a single pass over its plan.
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# standard library
+from operator import attrgetter
+
+# #############################################################################
+# ########## Globals ###############
+# ##################################
+
+# plans by (model class, creation): tuple of (key, getter) or None if not compilable
+_PLANS = {}
+
+# values returned as is
+_SCALARS = frozenset((str, int, float, bool, type(None)))
+
+
+# #############################################################################
+# ########## Functions #############
+# ##################################
+def compile_plan(cls: type, creation: bool = False) -> tuple:
+    """Returns the serialization plan of a model class: (key, getter) pairs of the \
+    attributes listed in ATTR_TYPES, or ATTR_CREA renamed with ATTR_MAP for creation. \
+    Properties are read through their getter function, without attribute lookup.
+
+    Returns None if a creation key isn't a string (i.e. Workgroup contact flattening): \
+    the model method must then be used.
+
+    :param type cls: model class
+    :param bool creation: option to compile the creation plan (POST)
+
+    :rtype: tuple
+    """
+    plan = _PLANS.get((cls, creation), False)
+    if plan is not False:
+        return plan
+
+    attr_map = getattr(cls, "ATTR_MAP", {}) if creation else {}
+    plan = []
+    for attr in cls.ATTR_CREA if creation else cls.ATTR_TYPES:
+        key = attr_map.get(attr, attr)
+        if not isinstance(key, str):
+            plan = None
+            break
+        plan.append((key, _getter(cls, attr)))
+    if plan is not None:
+        plan = tuple(plan)
+
+    _PLANS[(cls, creation)] = plan
+    return plan
+
+
+def serialize(model) -> dict:
+    """Returns the model properties as a dict.
+
+    :param model: model instance (i.e. Metadata)
+
+    :rtype: dict
+    """
+    return {
+        key: serialize_value(getter(model)) for key, getter in compile_plan(type(model))
+    }
+
+
+def serialize_creation(model) -> dict:
+    """Returns the model properties as a dict structured for creation purpose (POST).
+
+    :param model: model instance (i.e. Metadata)
+
+    :rtype: dict
+    """
+    return {
+        key: serialize_value(getter(model))
+        for key, getter in compile_plan(type(model), creation=True)
+    }
+
+
+def serialize_many(models, creation: bool = False) -> list:
+    """Returns a list of models as a list of dicts, in a single pass: plans are looked \
+    up once by class.
+
+    :param models: iterable of models instances, of any classes
+    :param bool creation: option to serialize for creation purpose (POST)
+
+    :rtype: list
+
+    :Example:
+
+    .. code-block:: python
+
+        md_dicts = serialize_many(metadatas)
+        # bulk creation payloads
+        payloads = serialize_many(keywords, creation=True)
+    """
+    plans = {}
+    result = []
+    for model in models:
+        cls = type(model)
+        if cls not in plans:
+            plans[cls] = compile_plan(cls, creation)
+        plan = plans[cls]
+        if plan is None:
+            result.append(model.to_dict_creation())
+        else:
+            result.append({key: serialize_value(getter(model)) for key, getter in plan})
+
+    return result
+
+
+def serialize_value(value):
+    """Returns a value as serialized in a model dict: nested models (with a `to_dict` \
+    method) are converted, in lists and dicts too.
+
+    :param value: attribute value
+    """
+    if type(value) in _SCALARS:
+        return value
+    if isinstance(value, list):
+        return [x.to_dict() if hasattr(x, "to_dict") else x for x in value]
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    if isinstance(value, dict):
+        return {
+            k: v.to_dict() if hasattr(v, "to_dict") else v for k, v in value.items()
+        }
+
+    return value
+
+
+def _getter(cls: type, attr: str):
+    """Returns the function getting an attribute of the model instances: the property \
+    getter if it's a property, else an attribute getter."""
+    for klass in cls.__mro__:
+        if attr in klass.__dict__:
+            descriptor = klass.__dict__.get(attr)
+            if isinstance(descriptor, property) and descriptor.fget is not None:
+                return descriptor.fget
+            break
+
+    return attrgetter(attr)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    pass
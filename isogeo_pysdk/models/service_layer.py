@@ -14,6 +14,10 @@
 # standard library
 import pprint
 
+# package
+from isogeo_pysdk.models.serializer import serialize, serialize_creation
+from isogeo_pysdk.models.slots import slots_values
+
 # submodels
 # from isogeo_pysdk.models.resource import Resource as Metadata
 
@@ -55,6 +59,16 @@ class ServiceLayer(object):
 
     ATTR_MAP = {"name": "id"}
 
+    __slots__ = (
+        "__id",
+        "_dataset",
+        "_name",
+        "_mimeTypes",
+        "_titles",
+        "parent_resource",
+        "_parent_resource",
+    )
+
     def __init__(
         self,
         _id: str = None,
@@ -185,65 +199,11 @@ class ServiceLayer(object):
     # -- METHODS -----------------------------------------------------------------------
     def to_dict(self) -> dict:
         """Returns the model properties as a dict."""
-        result = {}
-
-        for attr, _ in self.ATTR_TYPES.items():
-            value = getattr(self, attr)
-            if isinstance(value, list):
-                result[attr] = list(
-                    map(lambda x: x.to_dict() if hasattr(x, "to_dict") else x, value)
-                )
-            elif hasattr(value, "to_dict"):
-                result[attr] = value.to_dict()
-            elif isinstance(value, dict):
-                result[attr] = dict(
-                    map(
-                        lambda item: (item[0], item[1].to_dict())
-                        if hasattr(item[1], "to_dict")
-                        else item,
-                        value.items(),
-                    )
-                )
-            else:
-                result[attr] = value
-        if issubclass(ServiceLayer, dict):
-            for key, value in self.items():
-                result[key] = value
-
-        return result
+        return serialize(self)
 
     def to_dict_creation(self) -> dict:
         """Returns the model properties as a dict structured for creation purpose (POST)"""
-        result = {}
-
-        for attr, _ in self.ATTR_CREA.items():
-            # get attribute value
-            value = getattr(self, attr)
-            # switch attribute name for creation purpose
-            if attr in self.ATTR_MAP:
-                attr = self.ATTR_MAP.get(attr)
-            if isinstance(value, list):
-                result[attr] = list(
-                    map(lambda x: x.to_dict() if hasattr(x, "to_dict") else x, value)
-                )
-            elif hasattr(value, "to_dict"):
-                result[attr] = value.to_dict()
-            elif isinstance(value, dict):
-                result[attr] = dict(
-                    map(
-                        lambda item: (item[0], item[1].to_dict())
-                        if hasattr(item[1], "to_dict")
-                        else item,
-                        value.items(),
-                    )
-                )
-            else:
-                result[attr] = value
-        if issubclass(ServiceLayer, dict):
-            for key, value in self.items():
-                result[key] = value
-
-        return result
+        return serialize_creation(self)
 
     def to_str(self) -> str:
         """Returns the string representation of the model."""
@@ -258,7 +218,7 @@ class ServiceLayer(object):
         if not isinstance(other, ServiceLayer):
             return False
 
-        return self.__dict__ == other.__dict__
+        return slots_values(self) == slots_values(other)
 
     def __ne__(self, other) -> bool:
         """Returns true if both objects are not equal."""
@@ -271,9 +231,9 @@ class ServiceLayer(object):
 if __name__ == "__main__":
     """standalone execution."""
     test_model = ServiceLayer()
-    print(test_model.__dict__)
+    print(slots_values(test_model))
     print(test_model._id)
-    print(test_model.__dict__.get("_id"))
+    print(getattr(test_model, "_id", None))
     print(hasattr(test_model, "_id"))
     print(test_model.to_dict_creation())
     # print(test_model.to_str()
@@ -0,0 +1,60 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""
+    Isogeo API v1 - Helpers of the models storing their attributes in `__slots__`
+
+    Models have no per-instance `__dict__`: hydrating thousands of search results stays close
+    to the size of the raw JSON.
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# standard library
+from functools import lru_cache
+
+# #############################################################################
+# ########## Functions #############
+# ##################################
+
+
+@lru_cache(maxsize=None)
+def slots_names(cls: type) -> tuple:
+    """Returns the attributes names stored in the slots of a class and its parents, \
+    private names being mangled (i.e. '__id' of Format is '_Format__id').
+
+    :param type cls: class with `__slots__`
+
+    :rtype: tuple
+    """
+    names = []
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for name in slots:
+            if name.startswith("__") and not name.endswith("__"):
+                name = "_{}{}".format(klass.__name__.lstrip("_"), name)
+            names.append(name)
+
+    return tuple(names)
+
+
+def slots_values(obj) -> tuple:
+    """Returns the values stored in the slots of an object, None if unset.
+
+    :param obj: instance of a class with `__slots__`
+
+    :rtype: tuple
+    """
+    return tuple(getattr(obj, name, None) for name in slots_names(type(obj)))
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    pass
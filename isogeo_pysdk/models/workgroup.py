@@ -15,6 +15,10 @@
 import logging
 import pprint
 
+# package
+from isogeo_pysdk.models.serializer import serialize
+from isogeo_pysdk.models.slots import slots_values
+
 # submodels
 from isogeo_pysdk.models.contact import Contact
 
@@ -132,6 +136,25 @@ class Workgroup(object):
         ]
     }
 
+    __slots__ = (
+        "__abilities",
+        "__created",
+        "__id",
+        "__modified",
+        "__tag",
+        "_areKeywordsRestricted",
+        "_canCreateLegacyServiceLinks",
+        "_canCreateMetadata",
+        "_code",
+        "_contact",
+        "_hasCswClient",
+        "_hasScanFme",
+        "_keywordsCasing",
+        "_limits",
+        "_metadataLanguage",
+        "_themeColor",
+    )
+
     def __init__(
         self,
         _abilities: list = None,
@@ -489,32 +512,7 @@ class Workgroup(object):
     # -- METHODS -----------------------------------------------------------------------
     def to_dict(self) -> dict:
         """Returns the model properties as a dict."""
-        result = {}
-
-        for attr, _ in self.ATTR_TYPES.items():
-            value = getattr(self, attr)
-            if isinstance(value, list):
-                result[attr] = list(
-                    map(lambda x: x.to_dict() if hasattr(x, "to_dict") else x, value)
-                )
-            elif hasattr(value, "to_dict"):
-                result[attr] = value.to_dict()
-            elif isinstance(value, dict):
-                result[attr] = dict(
-                    map(
-                        lambda item: (item[0], item[1].to_dict())
-                        if hasattr(item[1], "to_dict")
-                        else item,
-                        value.items(),
-                    )
-                )
-            else:
-                result[attr] = value
-        if issubclass(Workgroup, dict):
-            for key, value in self.items():
-                result[key] = value
-
-        return result
+        return serialize(self)
 
     def to_dict_creation(self) -> dict:
         """Returns the model properties as a dict structured for creation purpose (POST)"""
@@ -550,9 +548,6 @@ class Workgroup(object):
                 )
             else:
                 result[attr] = value
-        if issubclass(Workgroup, dict):
-            for key, value in self.items():
-                result[key] = value
 
         return result
 
@@ -569,7 +564,7 @@ class Workgroup(object):
         if not isinstance(other, Workgroup):
             return False
 
-        return self.__dict__ == other.__dict__
+        return slots_values(self) == slots_values(other)
 
     def __ne__(self, other) -> bool:
         """Returns true if both objects are not equal."""
@@ -0,0 +1,301 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Pagination engine for the Isogeo API routes using `_limit` and `_offset` parameters."""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import logging
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextvars import copy_context
+
+# submodules
+from isogeo_pysdk.deadline import IsogeoDeadline
+from isogeo_pysdk.exceptions import OperationCancelledError
+
+# ##############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# maximum delay before checking if a cancellable pagination has been cancelled, in seconds
+CANCEL_POLL_INTERVAL = 0.1
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class IsogeoPaginator(object):
+    """Bounded and ordered parallel pagination engine.
+
+    Pages are requested concurrently within a sliding window, reassembled in offset order (or
+    yielded as they arrive) and the remaining requests are cancelled as soon as the caller
+    stops iterating, a request fails or :meth:`cancel` is called.
+
+    With a deadline (see: :class:`isogeo_pysdk.deadline.IsogeoDeadline`), the pagination stops \
+    as soon as the deadline is exceeded or the token cancelled: the pages already received \
+    are kept if the deadline is `partial`, otherwise the deadline error is raised. The pending \
+    requests are not waited for.
+
+    :param callable fetch_page: function requesting a page. Called with `offset` and `limit` \
+        keyword arguments, it must return the page or an error tuple (see \
+        :meth:`isogeo_pysdk.checker.IsogeoChecker.check_api_response`).
+    :param int page_size: number of items per page. Max value (and default): 100.
+    :param int max_workers: maximum number of page requests in flight.
+    :param int window: maximum number of pages in flight or waiting for their turn to be \
+        yielded (ordered mode). Defaults to twice `max_workers`.
+    :param bool ordered: option to yield pages in offset order. *True* by DEFAULT.
+    :param callable get_total: function returning the total of items from a page. \
+        Defaults to the `total` attribute. If it returns None, pages are requested until \
+        a page shorter than `page_size` is received.
+    :param callable get_length: function returning the count of items in a page. \
+        Defaults to the length of the `results` attribute or of the page itself.
+    :param IsogeoDeadline deadline: deadline or cancellation token of the pagination. \
+        Defaults to the deadline of the running SDK call, if any.
+
+    :Example:
+
+    .. code-block:: python
+
+        paginator = IsogeoPaginator(
+            fetch_page=lambda offset, limit: isogeo.keyword.thesaurus(
+                offset=offset, page_size=limit
+            ),
+            max_workers=8,
+        )
+        for page in paginator.pages():
+            print(page.offset, len(page.results))
+    """
+
+    def __init__(
+        self,
+        fetch_page,
+        page_size: int = 100,
+        max_workers: int = 5,
+        window: int = None,
+        ordered: bool = True,
+        get_total=None,
+        get_length=None,
+        deadline: IsogeoDeadline = None,
+    ):
+        self.fetch_page = fetch_page
+        self.page_size = min(max(page_size, 1), 100)
+        self.max_workers = max(max_workers, 1)
+        self.window = max(window or self.max_workers * 2, self.max_workers)
+        self.ordered = ordered
+        self.get_total = get_total or (lambda page: getattr(page, "total", None))
+        self.get_length = get_length or self._default_length
+        self.deadline = deadline or IsogeoDeadline.current()
+        self._cancelled = threading.Event()
+
+    # -- PUBLIC ---------------------------------------------------------------
+    def cancel(self):
+        """Stop the pagination: no more page is requested. Thread-safe."""
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Returns True if the pagination has been cancelled or its deadline exceeded."""
+        return self._cancelled.is_set() or (
+            self.deadline is not None and self.deadline.expired
+        )
+
+    def pages(self, total: int = None, first_page=None, offset: int = 0):
+        """Iterate over the pages.
+
+        :param int total: total of items to retrieve. If None, it's read from the first page.
+        :param first_page: page already retrieved at `offset` (i.e. a count request) which is \
+            yielded first and not requested again.
+        :param int offset: offset of the first page.
+
+        :returns: generator of pages. If a request fails, the error tuple is yielded \
+            and the iteration stops.
+        """
+        # the first page gives the total (if not known)
+        if first_page is None and total is None:
+            first_page = self._fetch(offset=offset, limit=self.page_size)
+        if first_page is not None:
+            yield first_page
+            if isinstance(first_page, tuple) or self.cancelled:
+                self._stop()
+                return
+            if total is None:
+                total = self.get_total(first_page)
+            if total is None and self.get_length(first_page) < self.page_size:
+                return
+            offset += self.page_size
+
+        # offsets to request: bounded or open-ended
+        if total is not None:
+            next_offsets = iter(range(offset, total, self.page_size))
+        else:
+            next_offsets = self._open_ended_offsets(offset)
+
+        yield from self._fan_out(
+            next_offsets, first_offset=offset, open_ended=total is None
+        )
+
+    def collect(
+        self, total: int = None, first_page=None, offset: int = 0, on_page=None
+    ) -> list:
+        """Retrieve every page as a list. Returns the first error tuple met, if any.
+
+        :param callable on_page: function called with each page as soon as it's yielded \
+            (i.e. to process the pages while the next ones are requested)
+
+        :rtype: list
+        """
+        pages = []
+        for page in self.pages(total=total, first_page=first_page, offset=offset):
+            if isinstance(page, tuple):
+                return page
+            if on_page is not None:
+                on_page(page)
+            pages.append(page)
+
+        return pages
+
+    # -- INTERNAL -------------------------------------------------------------
+    def _fetch(self, offset: int, limit: int):
+        """Request a page under the deadline of the pagination, if any."""
+        if self.deadline is None:
+            return self.fetch_page(offset=offset, limit=limit)
+
+        return self.deadline.run(self.fetch_page, offset=offset, limit=limit)
+
+    def _stop(self):
+        """Raise the deadline error if the pagination stopped on a deadline which doesn't \
+        accept partial results."""
+        if (
+            self.deadline is not None
+            and self.deadline.expired
+            and not self.deadline.partial
+        ):
+            self.deadline.check()
+
+    def _wait_timeout(self) -> float:
+        """Returns the maximum delay to wait for a page, None if not cancellable."""
+        if self.deadline is None:
+            return None
+        remaining = self.deadline.remaining()
+        if remaining is None:
+            return CANCEL_POLL_INTERVAL
+
+        return min(remaining, CANCEL_POLL_INTERVAL)
+
+    @staticmethod
+    def _default_length(page) -> int:
+        results = getattr(page, "results", page)
+        return len(results) if results is not None else 0
+
+    def _open_ended_offsets(self, offset: int):
+        """Infinite offsets generator, stopped when the last page is met."""
+        while True:
+            yield offset
+            offset += self.page_size
+
+    def _fan_out(self, next_offsets, first_offset: int, open_ended: bool = False):
+        """Request pages within the sliding window and yield them.
+
+        :param iterator next_offsets: offsets to request
+        :param int first_offset: first offset expected (ordered mode)
+        :param bool open_ended: total is unknown, stop at the first short page
+        """
+        pending = {}  # future: offset
+        received = {}  # offset: page, waiting for its turn (ordered mode)
+        expected_offset = first_offset
+        last_offset = None  # offset of the last page, for open-ended pagination
+
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="IsogeoPaginator"
+        )
+
+        def fill_window():
+            while (
+                not self.cancelled
+                and len(pending) < self.max_workers
+                and len(pending) + len(received) < self.window
+            ):
+                page_offset = next(next_offsets, None)
+                if page_offset is None or (
+                    last_offset is not None and page_offset > last_offset
+                ):
+                    return
+                # pages are requested in the caller context (i.e. tracing span)
+                future = executor.submit(
+                    copy_context().run,
+                    self._fetch,
+                    offset=page_offset,
+                    limit=self.page_size,
+                )
+                pending[future] = page_offset
+
+        try:
+            fill_window()
+            while pending:
+                done, _ = wait(
+                    pending, timeout=self._wait_timeout(), return_when=FIRST_COMPLETED
+                )
+                for future in sorted(done, key=pending.get):
+                    page_offset = pending.pop(future)
+                    try:
+                        page = future.result()
+                    except OperationCancelledError:
+                        # deadline exceeded while requesting the page
+                        if not (
+                            self.cancelled
+                            and self.deadline is not None
+                            and self.deadline.partial
+                        ):
+                            raise
+                        break
+                    if isinstance(page, tuple):
+                        yield page
+                        return
+
+                    # open-ended: a short page is the last one
+                    if open_ended and self.get_length(page) < self.page_size:
+                        if last_offset is None or page_offset < last_offset:
+                            last_offset = page_offset
+                            for i in [o for o in received if o > last_offset]:
+                                del received[i]
+                        if not self.get_length(page):
+                            continue
+                    if last_offset is not None and page_offset > last_offset:
+                        continue
+
+                    if self.ordered:
+                        received[page_offset] = page
+                    else:
+                        yield page
+
+                # release pages which are in order
+                while expected_offset in received:
+                    yield received.pop(expected_offset)
+                    expected_offset += self.page_size
+
+                if self.cancelled:
+                    logger.debug("Pagination cancelled.")
+                    self._stop()
+                    return
+                fill_window()
+        finally:
+            # caller stopped iterating, an error occurred or pagination was cancelled
+            for future in pending:
+                future.cancel()
+            # requests in flight are not waited for once cancelled
+            executor.shutdown(wait=not self.cancelled)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    pass
@@ -0,0 +1,368 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Requests pipeline: chain of middlewares every request to the API goes through, ending with the transport."""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import logging
+import threading
+from functools import partial
+from time import perf_counter
+
+# 3rd party
+from requests.exceptions import Timeout
+
+# submodules
+from isogeo_pysdk.deadline import IsogeoDeadline
+from isogeo_pysdk.exceptions import DeadlineExceededError
+from isogeo_pysdk.metrics import IsogeoMetrics
+from isogeo_pysdk.single_flight import IsogeoSingleFlight
+from isogeo_pysdk.tracing import IsogeoTracer
+
+# ##############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class IsogeoRequest(object):
+    """Request going through the pipeline.
+
+    :param Isogeo session: API client sending the request
+    :param str method: HTTP method
+    :param str url: URL to request
+    :param kwargs: requests arguments (params, json, headers, timeout...)
+    """
+
+    def __init__(self, session, method: str, url: str, **kwargs):
+        self.session = session
+        self.method = method.upper()
+        self.url = url
+        self.kwargs = kwargs
+        self._route = None
+
+    def __repr__(self):
+        return "IsogeoRequest({} {})".format(self.method, self.url)
+
+    @property
+    def route(self) -> str:
+        """Route template of the request (i.e. 'resources/{id}')."""
+        if self._route is None:
+            self._route = IsogeoMetrics.route_template(self.url)
+        return self._route
+
+    def replace(self, method: str = None, url: str = None, **kwargs):
+        """Returns a copy of the request, with other method, URL or arguments.
+
+        :rtype: IsogeoRequest
+        """
+        return IsogeoRequest(
+            self.session,
+            method or self.method,
+            url or self.url,
+            **dict(self.kwargs, **kwargs)
+        )
+
+
+class IsogeoPipeline(object):
+    """Chain of middlewares applied to every request, ending with the transport.
+
+    A middleware is a function receiving the request (:class:`IsogeoRequest`) and the next \
+    stage to call, returning the response. It can change the request, return a response \
+    without calling the next stage, retry it, measure it...
+
+    :param callable transport: last stage, sending the request and returning the response
+    :param list middlewares: middlewares, from the outermost to the innermost
+
+    :Example:
+
+    .. code-block:: python
+
+        def add_header(request, call_next):
+            request.kwargs.setdefault("headers", {})["X-Harvest"] = "nightly"
+            return call_next(request)
+
+        isogeo.pipeline.add(add_header)
+    """
+
+    def __init__(self, transport, middlewares: list = None):
+        self.transport = transport
+        self.middlewares = list(middlewares or [])
+        self._lock = threading.Lock()
+        self._build()
+
+    def send(self, request: IsogeoRequest):
+        """Send a request through the middlewares.
+
+        :param IsogeoRequest request: request to send
+
+        :rtype: requests.Response
+        """
+        return self._chain(request)
+
+    def add(self, middleware, index: int = None):
+        """Add a middleware.
+
+        :param callable middleware: middleware to add
+        :param int index: position in the chain. Defaults to the innermost, just before the transport.
+        """
+        with self._lock:
+            if index is None:
+                self.middlewares.append(middleware)
+            else:
+                self.middlewares.insert(index, middleware)
+            self._build()
+
+    def remove(self, middleware):
+        """Remove a middleware.
+
+        :param callable middleware: middleware to remove
+        """
+        with self._lock:
+            self.middlewares.remove(middleware)
+            self._build()
+
+    def _build(self):
+        """Compose the stages once, not on every request."""
+        chain = self.transport
+        for middleware in reversed(self.middlewares):
+            chain = partial(middleware, call_next=chain)
+        self._chain = chain
+
+
+# #############################################################################
+# ########## Middlewares ###########
+# ##################################
+
+
+def trace_request(request: IsogeoRequest, call_next):
+    """Open a span around the request, if the client has a tracer \
+    (see: :class:`isogeo_pysdk.tracing.IsogeoTracer`)."""
+    tracer = request.session.tracer
+    if tracer is None:
+        return call_next(request)
+
+    attributes = {
+        "http.method": request.method,
+        "http.url": request.url,
+        "http.route": request.route,
+    }
+    with tracer.span("HTTP {}".format(request.method), attributes):
+        response = call_next(request)
+        IsogeoTracer.set_attributes(
+            **{
+                "http.status_code": response.status_code,
+                "isogeo.from_cache": getattr(response, "from_cache", False),
+            }
+        )
+
+    return response
+
+
+def enforce_deadline(request: IsogeoRequest, call_next):
+    """Don't send the request once the deadline of the SDK call is exceeded or cancelled and \
+    cap its timeout to the remaining time, if the call has a deadline \
+    (see: :class:`isogeo_pysdk.deadline.IsogeoDeadline`)."""
+    deadline = IsogeoDeadline.current()
+    if deadline is None:
+        return call_next(request)
+
+    deadline.check()
+    request.kwargs["timeout"] = deadline.cap_timeout(request.kwargs.get("timeout"))
+    try:
+        return call_next(request)
+    except Timeout as exc:
+        if deadline.expired:
+            raise DeadlineExceededError(
+                "SDK call deadline exceeded during the request: {} {}".format(
+                    request.method, request.url
+                )
+            ) from exc
+        raise
+
+
+def codec_json(request: IsogeoRequest, call_next):
+    """Encode the JSON payload of the request and decode the JSON body of the response \
+    with the JSON backend of the client, if set \
+    (see: :class:`isogeo_pysdk.json_backend.IsogeoJsonBackend`)."""
+    json_backend = request.session.json_backend
+    if json_backend is None:
+        return call_next(request)
+
+    payload = request.kwargs.get("json")
+    if payload is not None and request.kwargs.get("data") is None:
+        headers = dict(request.kwargs.get("headers") or {})
+        if not any(key.lower() == "content-type" for key in headers):
+            headers["Content-Type"] = "application/json"
+        request = request.replace(
+            json=None, data=json_backend.dumps(payload), headers=headers
+        )
+
+    return json_backend.bind(call_next(request))
+
+
+def record_metrics(request: IsogeoRequest, call_next):
+    """Record the request in the client metrics, if enabled \
+    (see: :class:`isogeo_pysdk.metrics.IsogeoMetrics`). Placed after the coalescing, a \
+    network call shared by identical requests is recorded once."""
+    metrics = request.session.metrics
+    if metrics is None:
+        return call_next(request)
+
+    start = perf_counter()
+    response = None
+    try:
+        response = call_next(request)
+    finally:
+        metrics.record(
+            request.method,
+            request.url,
+            perf_counter() - start,
+            response=response,
+            cache_hit=getattr(response, "from_cache", False),
+        )
+
+    return response
+
+
+def coalesce_request(request: IsogeoRequest, call_next):
+    """Share one network call between identical concurrent GET requests, if enabled \
+    (see: :class:`isogeo_pysdk.single_flight.IsogeoSingleFlight`). Streamed responses \
+    can't be shared, nor the requests of a call with a deadline."""
+    single_flight = request.session.single_flight
+    if (
+        single_flight is None
+        or request.method != "GET"
+        or request.kwargs.get("stream")
+        or IsogeoDeadline.current() is not None
+    ):
+        return call_next(request)
+
+    return single_flight.do(
+        IsogeoSingleFlight.request_key(
+            request.url, request.kwargs.get("params"), vary=request.session.lang
+        ),
+        call_next,
+        request,
+    )
+
+
+def cache_http(request: IsogeoRequest, call_next):
+    """Serve the GET requests of the reference routes through the persistent HTTP cache, \
+    if enabled (see: :class:`isogeo_pysdk.http_cache.IsogeoHttpCache`). Other requests \
+    remove the stored responses of the route they write to."""
+    http_cache = request.session.http_cache
+    if http_cache is None:
+        return call_next(request)
+
+    if request.method != "GET":
+        try:
+            return call_next(request)
+        finally:
+            http_cache.invalidate(request.url)
+
+    if request.kwargs.get("stream") or not http_cache.is_cacheable(request.url):
+        return call_next(request)
+
+    return http_cache.send(
+        lambda method, url, **kwargs: call_next(request.replace(method, url, **kwargs)),
+        request.url,
+        vary=request.session.lang,
+        **request.kwargs
+    )
+
+
+def break_circuit(request: IsogeoRequest, call_next):
+    """Fail fast while the API is unavailable, if the client has a circuit breaker \
+    (see: :class:`isogeo_pysdk.circuit_breaker.IsogeoCircuitBreaker`)."""
+    circuit_breaker = request.session.circuit_breaker
+    if circuit_breaker is None:
+        return call_next(request)
+
+    return circuit_breaker.call(request.url, partial(call_next, request))
+
+
+def hedge_request(request: IsogeoRequest, call_next):
+    """Send a second request when a GET request is slower than usual and keep the first \
+    response, if the client has a hedging policy \
+    (see: :class:`isogeo_pysdk.hedging.IsogeoHedging`). Streamed responses are not hedged. \
+    Hedged requests are streamed, so that the losing body is not downloaded."""
+    hedging = request.session.hedging
+    if hedging is None or request.method != "GET" or request.kwargs.get("stream"):
+        return call_next(request)
+
+    # the losing request is counted in the metrics too
+    metrics = request.session.metrics
+
+    def on_discard(response, latency: float):
+        if metrics is not None:
+            metrics.record(request.method, request.url, latency, response=response)
+
+    return hedging.send(
+        request.route,
+        partial(call_next, request.replace(stream=True)),
+        on_discard=on_discard,
+        timeout=request.kwargs.get("timeout"),
+    )
+
+
+def limit_rate(request: IsogeoRequest, call_next):
+    """Wait for the client rate limiter before sending the request and retry it if it's \
+    throttled by the API (HTTP 429), if enabled \
+    (see: :class:`isogeo_pysdk.rate_limit.IsogeoRateLimiter`). Uploads are not retried, \
+    nor the requests of a call which deadline is before the retry."""
+    rate_limiter = request.session.rate_limiter
+    if rate_limiter is None:
+        return call_next(request)
+
+    deadline = IsogeoDeadline.current()
+    retry = 0
+    while True:
+        rate_limiter.acquire()
+        response = call_next(request)
+        if (
+            response.status_code != 429
+            or retry >= rate_limiter.max_retries
+            or request.kwargs.get("files")
+        ):
+            break
+        # next acquire waits for the delay, unless the call can't wait that long
+        delay = rate_limiter.throttle(response, retry)
+        remaining = None if deadline is None else deadline.remaining()
+        if remaining is not None and delay >= remaining:
+            break
+        response.close()
+        retry += 1
+
+    response.throttle_retries = retry
+    return response
+
+
+# default middlewares, from the outermost to the innermost
+DEFAULT_MIDDLEWARES = (
+    trace_request,
+    enforce_deadline,
+    codec_json,
+    coalesce_request,
+    record_metrics,
+    cache_http,
+    break_circuit,
+    hedge_request,
+    limit_rate,
+)
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    pass
@@ -0,0 +1,184 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Client-side rate limiting (token bucket) and retries of the throttled requests (HTTP 429)."""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import logging
+import random
+import threading
+from email.utils import parsedate_to_datetime
+from time import monotonic, sleep, time
+
+# ##############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class IsogeoRateLimiter(object):
+    """Rate limiter shared by all the threads of a client:
+
+    - token bucket: requests are sent at `rate` per second on average, with bursts up to \
+        `burst` requests. Threads wait for their turn instead of tripping the API throttling.
+    - throttled requests (HTTP 429) are retried after the delay given by the `Retry-After` \
+        header or an exponential backoff, with jitter. Meanwhile, every thread of the \
+        client waits: the API asked to slow down.
+
+    :param float rate: maximum average number of requests per second. None (default) to \
+        not limit the rate, only retry the throttled requests.
+    :param int burst: maximum number of requests sent at once. Defaults to the rate \
+        (at least 1).
+    :param int max_retries: maximum number of retries of a throttled request. Defaults to 3.
+    :param float backoff_factor: base delay in seconds of the exponential backoff, used \
+        when the API doesn't give a `Retry-After`: `backoff_factor * 2 ** retry`.
+    :param float max_backoff: maximum delay in seconds before retrying. Defaults to 60.
+    :param float jitter: maximum ratio of random delay added to the `Retry-After` delay, \
+        so threads don't retry all at once. Defaults to 0.1 (10%).
+
+    :Example:
+
+    .. code-block:: python
+
+        # 10 requests per second, bursts of 20 requests
+        isogeo = Isogeo(..., rate_limiter=IsogeoRateLimiter(rate=10, burst=20))
+    """
+
+    def __init__(
+        self,
+        rate: float = None,
+        burst: int = None,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 60,
+        jitter: float = 0.1,
+    ):
+        if rate is not None and rate <= 0:
+            raise ValueError("Rate must be positive: {}".format(rate))
+        self.rate = rate
+        self.burst = burst or max(1, int(rate or 1))
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+
+        # stats
+        self.throttled = 0  # count of throttled responses (HTTP 429)
+        self.waited = 0.0  # total delay waited by the threads, in seconds
+
+        self._tokens = float(self.burst)
+        self._updated = monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Wait until a request can be sent."""
+        while True:
+            with self._lock:
+                now = monotonic()
+                delay = self._paused_until - now
+                if delay <= 0:
+                    if self.rate is None:
+                        return
+                    # refill the bucket
+                    self._tokens = min(
+                        self.burst, self._tokens + (now - self._updated) * self.rate
+                    )
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    delay = (1 - self._tokens) / self.rate
+                self.waited += delay
+
+            sleep(delay)
+
+    def pause(self, delay: float):
+        """Hold every request of the client during a delay.
+
+        :param float delay: delay in seconds
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, monotonic() + delay)
+
+    def retry_delay(self, response, retry: int) -> float:
+        """Returns the delay before retrying a throttled request.
+
+        :param requests.Response response: throttled response
+        :param int retry: number of retries already done
+
+        :rtype: float
+        """
+        retry_after = self.parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is not None:
+            delay = retry_after * (1 + random.uniform(0, self.jitter))
+        else:
+            # exponential backoff with full jitter
+            delay = random.uniform(0, self.backoff_factor * 2 ** retry)
+
+        return min(delay, self.max_backoff)
+
+    def throttle(self, response, retry: int) -> float:
+        """Hold the requests of the client after a throttled response and returns the delay \
+        before retrying it.
+
+        :param requests.Response response: throttled response
+        :param int retry: number of retries already done
+
+        :rtype: float
+        """
+        delay = self.retry_delay(response, retry)
+        with self._lock:
+            self.throttled += 1
+        self.pause(delay)
+        logger.warning(
+            "Request throttled by the API (HTTP 429): retry {}/{} in {:.2f}s - URL: {}".format(
+                retry + 1, self.max_retries, delay, response.url
+            )
+        )
+        return delay
+
+    @staticmethod
+    def parse_retry_after(value: str) -> float:
+        """Returns the delay in seconds of a `Retry-After` header value: \
+        a number of seconds or an HTTP date. None if missing or invalid.
+
+        :param str value: header value
+
+        :rtype: float
+
+        :Example:
+
+        >>> IsogeoRateLimiter.parse_retry_after("120")
+        120.0
+        """
+        if not value:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time())
+        except (TypeError, ValueError):
+            logger.debug("Invalid Retry-After header: {}".format(value))
+            return None
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    pass
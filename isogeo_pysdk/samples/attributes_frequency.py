@@ -6,7 +6,7 @@
 # Purpose:      Get feature attributes from Isogeo to perform some metrics.
 # Author:       Julien Moura (@geojulien)
 #
-# Python:       2.7.x
+# Python:       3.7+
 # Created:      14/04/2016
 # Updated:      10/05/2017
 # ------------------------------------------------------------------------------
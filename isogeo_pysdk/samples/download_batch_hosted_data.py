@@ -6,7 +6,7 @@
 # Purpose:      Exports hosted data of 10 last updated metadata into an XML ISO19139
 # Author:       Julien Moura (@geojulien)
 #
-# Python:       3.6.x
+# Python:       3.7+
 # ------------------------------------------------------------------------------
 
 # ##############################################################################
@@ -6,7 +6,7 @@
 # Purpose:      Exports each of 10 last updated metadata into an XML ISO19139
 # Author:       Isogeo
 #
-# Python:       3.5+
+# Python:       3.7+
 # Created:      14/11/2016
 # Updated:      15/04/2019
 # ------------------------------------------------------------------------------
@@ -7,7 +7,7 @@
 #               the Isogeo API Python minimalist SDK.
 # Author:       Julien Moura (@geojulien)
 #
-# Python:       3.6.+
+# Python:       3.7+
 # Created:      14/02/2016
 # Updated:      18/02/2016
 # ------------------------------------------------------------------------------
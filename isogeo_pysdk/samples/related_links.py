@@ -8,7 +8,7 @@
 #
 # Author:       Julien Moura (@geojulien)
 #
-# Python:       3.6+
+# Python:       3.7+
 # Created:      01/09/2016
 # Updated:      01/09/2016
 # -----------------------------------------------------------------------------
@@ -6,7 +6,7 @@
 # Purpose:      Exports each of 10 last updated metadata into an XML ISO19139
 # Author:       Julien Moura (@geojulien)
 #
-# Python:       3.6+
+# Python:       3.7+
 # Created:      02/11/2017
 # ------------------------------------------------------------------------------
 
@@ -7,7 +7,7 @@
 #
 # Author:       Julien Moura (@geojulien)
 #
-# Python:       3.6+
+# Python:       3.7+
 # Created:      22/12/2015
 # Updated:      10/01/2016
 # -----------------------------------------------------------------------------
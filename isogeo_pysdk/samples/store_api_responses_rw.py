@@ -6,7 +6,7 @@
 # Purpose:      useful to generate tests fixtures or documentation
 # Author:       Julien Moura (@geojulien)
 #
-# Python:       3.6+
+# Python:       3.7+
 # ------------------------------------------------------------------------------
 
 # ##############################################################################
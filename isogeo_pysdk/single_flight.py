@@ -0,0 +1,101 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Coalescing (single-flight) of identical concurrent calls: the first caller does the work,
+the others wait for its result."""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import logging
+import threading
+from concurrent.futures import Future
+
+# 3rd party
+from requests import Request
+
+# ##############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class IsogeoSingleFlight(object):
+    """Share one execution between the concurrent calls using the same key. Thread-safe.
+
+    Used by :meth:`isogeo_pysdk.isogeo.Isogeo.request` for identical GET requests (one network \
+    call) and by the routes decorated with \
+    :meth:`isogeo_pysdk.decorators.ApiDecorators._coalesce_calls` (one decoded result).
+
+    The result (or exception) is shared: it's the same object for every caller.
+
+    :Example:
+
+    .. code-block:: python
+
+        single_flight = IsogeoSingleFlight()
+        # from 16 threads at once: only one listing is requested
+        shares = single_flight.do(("shares",), isogeo.share.listing)
+    """
+
+    def __init__(self):
+        self.coalesced = 0  # count of calls which waited for another one
+        self._calls = {}  # key: future of the call in flight
+        self._lock = threading.Lock()
+
+    def do(self, key: tuple, func, *args, **kwargs):
+        """Execute the function, or wait for the result of the identical call in flight.
+
+        :param tuple key: hashable identifier of the call
+        :param callable func: function to execute
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            logger.debug("Waiting for the identical call in flight: {}".format(key))
+            return future.result()
+
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    @staticmethod
+    def request_key(url: str, params=None, vary: str = "") -> tuple:
+        """Build the key of a GET request.
+
+        :param str url: request URL
+        :param params: query parameters
+        :param str vary: value distinguishing responses of a same URL (i.e. the API language)
+
+        :rtype: tuple
+        """
+        return ("GET", Request("GET", url, params=params).prepare().url, vary)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    pass
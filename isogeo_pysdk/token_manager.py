@@ -0,0 +1,174 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Proactive and thread-safe renewal of the API authentication token."""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import logging
+import threading
+from time import time
+
+# ##############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class IsogeoTokenManager(object):
+    """Keep the token of an authenticated Isogeo client valid.
+
+    - the token is renewed in the background a margin before its expiration, so callers keep \
+        using the still valid token meanwhile
+    - renewals are serialized: threads hitting the expiration together send one request
+    - callers only wait if the token is really expired
+
+    Used by :meth:`isogeo_pysdk.decorators.ApiDecorators._check_bearer_validity`.
+
+    :param Isogeo api_client: authenticated client whose token to manage
+    :param float margin: delay in seconds before expiration to renew the token. Defaults to 60.
+    :param bool background: option to schedule the renewal in a background thread, even if no \
+        request is sent. *True* by DEFAULT.
+    """
+
+    def __init__(self, api_client, margin: float = 60, background: bool = True):
+        self.api_client = api_client
+        self.margin = margin
+        self.background = background
+        self.refreshes = 0  # count of renewals
+
+        self._lock = threading.Lock()  # serialize the renewals
+        self._state_lock = threading.Lock()  # protect the background state
+        self._refreshing = False  # background renewal in flight
+        self._stopped = False  # background renewal cancelled until the next start
+        self._timer = None
+
+    # -- PUBLIC ---------------------------------------------------------------
+    @property
+    def expires_at(self) -> float:
+        """Expiration timestamp of the current token. 0 if there is no token."""
+        return float((self.api_client.token or {}).get("expires_at") or 0)
+
+    @property
+    def renewal_margin(self) -> float:
+        """Margin before expiration, limited to the half of the token lifetime."""
+        lifetime = (self.api_client.token or {}).get("expires_in")
+        if lifetime:
+            return min(self.margin, float(lifetime) / 2)
+
+        return self.margin
+
+    def ensure_valid(self):
+        """Make sure the token can be used. Blocks only if it's expired."""
+        remaining = self.expires_at - time()
+        if remaining > self.renewal_margin:
+            return
+        elif remaining > 0:
+            logger.debug("Token is about to expire, renewing it in the background.")
+            self._refresh_in_background()
+        else:
+            logger.debug("Token is expired, renewing it.")
+            self.refresh()
+
+    def refresh(self, force: bool = False):
+        """Renew the token, unless another thread has just done it.
+
+        :param bool force: option to renew even if the token is not about to expire
+        """
+        with self._lock:
+            if not force and self.expires_at - time() > self.renewal_margin:
+                return
+            self._renew()
+            self.refreshes += 1
+            logger.debug("Token renewed.")
+
+        self._schedule()
+
+    def start(self):
+        """Schedule the background renewal of the current token."""
+        with self._state_lock:
+            self._stopped = False
+        self._schedule()
+
+    def stop(self):
+        """Cancel the scheduled background renewal. Renewals in flight don't schedule \
+        the next one until :meth:`start` is called again."""
+        with self._state_lock:
+            self._stopped = True
+            self._cancel_timer()
+
+    # -- INTERNAL -------------------------------------------------------------
+    def _schedule(self):
+        """(Re)schedule the background renewal of the current token, unless stopped."""
+        if not self.background or not self.expires_at:
+            return
+
+        with self._state_lock:
+            if self._stopped:
+                return
+            self._cancel_timer()
+            self._timer = threading.Timer(
+                max(self.expires_at - self.renewal_margin - time(), 0),
+                self._refresh_in_background,
+            )
+            self._timer.name = "IsogeoTokenTimer"
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _cancel_timer(self):
+        """Cancel the timer, if any. Must be called with the state lock."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _renew(self):
+        """Request a new token, using the refresh token if any (user authentication) \
+        or the application credentials (group authentication)."""
+        client = self.api_client
+        if client.token.get("refresh_token"):
+            client.refresh_token(token_url=client.auto_refresh_url)
+        else:
+            client.fetch_token(
+                token_url=client.auto_refresh_url,
+                client_id=client.client_id,
+                client_secret=client.client_secret,
+                proxies=client.proxies,
+                verify=client.ssl,
+            )
+
+    def _refresh_in_background(self):
+        """Start a background renewal, unless one is already in flight."""
+        with self._state_lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        threading.Thread(
+            target=self._background_refresh, name="IsogeoTokenRefresh", daemon=True
+        ).start()
+
+    def _background_refresh(self):
+        try:
+            self.refresh()
+        except Exception as exc:
+            # the token is still valid: next calls will retry
+            logger.error("Background token renewal failed: {}".format(exc))
+        finally:
+            with self._state_lock:
+                self._refreshing = False
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    pass
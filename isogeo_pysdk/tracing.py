@@ -0,0 +1,182 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Optional tracing of the SDK operations, compatible with OpenTelemetry without depending on it."""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import logging
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+
+# submodules
+from isogeo_pysdk.__about__ import __version__
+
+# ##############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# span opened by the SDK in the current context (thread, task or pagination worker)
+_current_span = ContextVar("isogeo_current_span", default=None)
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class IsogeoTracer(object):
+    """Open spans around the SDK operations: one by public method of the API routes \
+    (i.e. `ApiSearch.search`), with a child span by HTTP request (i.e. `HTTP GET`).
+
+    Spans are delegated to a tracer implementing the OpenTelemetry API \
+    (`start_as_current_span(name, attributes=None)` context manager returning spans \
+    with `set_attribute`), so OpenTelemetry is not required: use :class:`SpanRecorder` \
+    to collect the spans in memory.
+
+    :param tracer: OpenTelemetry compatible tracer
+
+    :Example:
+
+    .. code-block:: python
+
+        # with OpenTelemetry (pip install opentelemetry-api)
+        isogeo = Isogeo(..., tracer=IsogeoTracer.from_opentelemetry())
+
+        # without
+        recorder = SpanRecorder()
+        isogeo = Isogeo(..., tracer=IsogeoTracer(recorder))
+        isogeo.search(whole_results=1)
+        for span in recorder.spans:
+            print(span.name, span.parent and span.parent.name, span.duration, span.attributes)
+    """
+
+    def __init__(self, tracer):
+        self.tracer = tracer
+
+    @classmethod
+    def from_opentelemetry(cls, name: str = "isogeo_pysdk"):
+        """Use the OpenTelemetry tracer provider configured in the application.
+
+        :param str name: instrumentation name
+
+        :raises ImportError: if OpenTelemetry API is not installed
+        """
+        try:
+            from opentelemetry import trace
+        except ImportError:
+            raise ImportError(
+                "OpenTelemetry is required to use it as tracer: "
+                "pip install opentelemetry-api"
+            )
+
+        return cls(trace.get_tracer(name, __version__))
+
+    @contextmanager
+    def span(self, name: str, attributes: dict = None):
+        """Open a span, child of the current one.
+
+        :param str name: span name
+        :param dict attributes: span attributes
+        """
+        with self.tracer.start_as_current_span(name, attributes=attributes) as span:
+            token = _current_span.set(span)
+            try:
+                yield span
+            finally:
+                _current_span.reset(token)
+
+    @staticmethod
+    def set_attributes(**attributes):
+        """Set attributes on the current SDK span, if any (i.e. results sizes).
+
+        :param attributes: attributes to set. Dots are not allowed in keyword arguments, \
+            use a dict unpacking: `**{"isogeo.search.total": 120}`.
+        """
+        span = _current_span.get()
+        if span is None:
+            return
+
+        for key, value in attributes.items():
+            span.set_attribute(key, value)
+
+
+class RecordedSpan(object):
+    """Span stored by :class:`SpanRecorder`.
+
+    :param str name: span name
+    :param dict attributes: span attributes
+    :param RecordedSpan parent: parent span
+    """
+
+    def __init__(self, name: str, attributes: dict = None, parent=None):
+        self.name = name
+        self.attributes = dict(attributes or {})
+        self.parent = parent
+        self.exception = None
+        self.start = perf_counter()
+        self.end = None
+
+    def __repr__(self):
+        return "RecordedSpan({!r}, parent={!r})".format(
+            self.name, self.parent and self.parent.name
+        )
+
+    @property
+    def duration(self) -> float:
+        """Duration in seconds. None while the span is open."""
+        return self.end - self.start if self.end is not None else None
+
+    def set_attribute(self, key: str, value):
+        self.attributes[key] = value
+
+    def record_exception(self, exception: Exception):
+        self.exception = exception
+
+
+class SpanRecorder(object):
+    """Minimal OpenTelemetry compatible tracer storing the finished spans in memory, \
+    to trace without OpenTelemetry (scripts, tests, profiling)."""
+
+    def __init__(self):
+        self.spans = []  # finished spans, in closing order
+        self._current = ContextVar("isogeo_recorded_span", default=None)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def start_as_current_span(self, name: str, attributes: dict = None):
+        span = RecordedSpan(name, attributes=attributes, parent=self._current.get())
+        token = self._current.set(span)
+        try:
+            yield span
+        except Exception as exc:
+            span.record_exception(exc)
+            raise
+        finally:
+            self._current.reset(token)
+            span.end = perf_counter()
+            with self._lock:
+                self.spans.append(span)
+
+    def children(self, span: RecordedSpan) -> list:
+        """Returns the finished spans whose parent is the given one."""
+        return [child for child in self.spans if child.parent is span]
+
+    def clear(self):
+        """Forget the recorded spans."""
+        with self._lock:
+            self.spans.clear()
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    pass
@@ -24,10 +24,8 @@ from pathlib import Path
 from sys import platform as opersys
 from urllib.parse import urlparse
 
-# 3rd party
-import requests
-
 # modules
+from isogeo_pysdk.cache import IsogeoCache
 from isogeo_pysdk.checker import IsogeoChecker
 from isogeo_pysdk.models import Metadata
 
@@ -220,11 +218,15 @@ class IsogeoUtils(object):
 
     @classmethod
     def cache_clearer(cls, only_already_hit: bool = 1):
-        """Clear all LRU cached functions.
+        """Clear all LRU cached functions and the responses caches of the API clients \
+        (see: :class:`isogeo_pysdk.cache.IsogeoCache`).
 
         :param bool only_already_hit: option to clear cache only for functions which \
             have been already hit. Defaults to True.
         """
+        # responses caches
+        IsogeoCache.clear_all()
+
         # collect wrappers in the garbage collector
         gc.collect()
         # filter on the LRU cache wrappers generated by the package
@@ -383,7 +385,9 @@ class IsogeoUtils(object):
                 )
             )
 
-        # send request
+        # send request (HTTP stack is only loaded when needed)
+        import requests
+
         version_req = requests.get(version_url, proxies=self.proxies, verify=self.ssl)
 
         # checking response
@@ -0,0 +1,532 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Benchmarks of the SDK hot paths, run offline against the local stand-in of the API.
+
+Results are written as JSON to be tracked over time and compared with a baseline.
+
+Usage from the repo root folder:
+
+.. code-block:: python
+
+    # run every benchmark and store the results
+    python -m tests.benchmark --output benchmark.json
+
+    # run a subset, then compare with the previous results (exits with 1 if slower by 20%)
+    python -m tests.benchmark --only hlpr_datetimes check_is_uuid --compare benchmark.json
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import argparse
+import json
+import logging
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from copy import deepcopy
+from datetime import datetime
+from pathlib import Path
+
+# module target
+from isogeo_pysdk import (
+    Isogeo,
+    IsogeoChecker,
+    IsogeoJsonBackend,
+    IsogeoUtils,
+    Metadata,
+    MetadataColumns,
+    MetadataSearch,
+    __version__,
+)
+from isogeo_pysdk.models.serializer import serialize_many
+from isogeo_pysdk.models.slots import slots_names, slots_values
+
+# test helpers
+from tests.mock_server import FIXTURE_METADATA, IsogeoMockServer
+
+# #############################################################################
+# ########## Globals ###############
+# ##################################
+
+# benchmarks registry: name: function(size) -> (callable, operations count)
+BENCHMARKS = {}
+
+# sizes by benchmark, for full and quick runs
+SIZES = {
+    "search_whole_results": ((1000, 10000, 100000), (500,)),
+    "metadata_clean_attributes": ((2000,), (50,)),
+    "metadata_init": ((2000,), (50,)),
+    "metadata_to_dict": ((2000,), (50,)),
+    "metadata_to_dict_creation": ((2000,), (50,)),
+    "serialize_many": ((2000,), (50,)),
+    "search_iter_dicts": ((100000,), (100,)),
+    "search_iter_views": ((100000,), (100,)),
+    "search_columns_ingest": ((100000,), (100,)),
+    "search_aggregate_dicts": ((100000,), (100,)),
+    "search_aggregate_columns": ((100000,), (100,)),
+    "json_decode_stdlib": ((20,), (2,)),
+    "json_decode_backend": ((20,), (2,)),
+    "json_encode_stdlib": ((20,), (2,)),
+    "json_encode_backend": ((20,), (2,)),
+    "tags_to_dict": ((1000, 10000, 50000), (100,)),
+    "hlpr_datetimes": ((50000,), (100,)),
+    "check_is_uuid": ((100000,), (100,)),
+}
+
+# metadata count of the memory measures, for full and quick runs
+MEMORY_SIZES = ((10000,), (100,))
+
+checker = IsogeoChecker()
+utils = IsogeoUtils()
+
+# #############################################################################
+# ########## Functions #############
+# ##################################
+
+
+def benchmark(name: str):
+    """Register a benchmark. The decorated function gets the size and returns the callable
+    to time and the count of operations it performs."""
+
+    def decorator(func):
+        BENCHMARKS[name] = func
+        return func
+
+    return decorator
+
+
+def load_fixture() -> dict:
+    with FIXTURE_METADATA.open("r", encoding="utf-8") as in_json:
+        return json.load(in_json)
+
+
+@benchmark("search_whole_results")
+def bench_search_whole_results(size: int):
+    server = IsogeoMockServer(total=size).start()
+    isogeo = Isogeo(
+        client_id="python-minimalist-sdk-test-{}".format("a" * 32),
+        client_secret="s" * 64,
+        auto_refresh_url="https://id.api.isogeo.com/oauth/token",
+        platform="qa",
+        check_connection=False,
+    )
+    server.mount(isogeo)
+    isogeo.connect()
+
+    def run():
+        isogeo.cache.clear()
+        search = isogeo.search(whole_results=1)
+        assert len(search.results) == size
+
+    run.teardown = lambda: (isogeo.close(), server.stop())
+    return run, size
+
+
+@benchmark("metadata_clean_attributes")
+def bench_metadata_clean_attributes(size: int):
+    fixture = load_fixture()
+    raw_objects = []
+
+    def setup():
+        raw_objects[:] = [deepcopy(fixture) for _ in range(size)]
+
+    def run():
+        for raw_object in raw_objects:
+            Metadata.clean_attributes(raw_object)
+
+    run.setup = setup
+    return run, size
+
+
+@benchmark("metadata_init")
+def bench_metadata_init(size: int):
+    fields = Metadata.clean_attributes(load_fixture()).to_dict()
+
+    def run():
+        for _ in range(size):
+            Metadata(**fields)
+
+    return run, size
+
+
+@benchmark("metadata_to_dict")
+def bench_metadata_to_dict(size: int):
+    metadatas = [Metadata.clean_attributes(load_fixture()) for _ in range(size)]
+
+    def run():
+        for md in metadatas:
+            md.to_dict()
+
+    return run, size
+
+
+@benchmark("metadata_to_dict_creation")
+def bench_metadata_to_dict_creation(size: int):
+    metadatas = [Metadata.clean_attributes(load_fixture()) for _ in range(size)]
+
+    def run():
+        for md in metadatas:
+            md.to_dict_creation()
+
+    return run, size
+
+
+@benchmark("serialize_many")
+def bench_serialize_many(size: int):
+    metadatas = [Metadata.clean_attributes(load_fixture()) for _ in range(size)]
+
+    def run():
+        serialize_many(metadatas)
+
+    return run, size
+
+
+def search_results(size: int) -> MetadataSearch:
+    server = IsogeoMockServer(total=size)
+    return MetadataSearch(results=[server.metadata_record(i) for i in range(size)])
+
+
+@benchmark("search_iter_dicts")
+def bench_search_iter_dicts(size: int):
+    search = search_results(size)
+
+    def run():
+        for md in search.results:
+            md.get("title"), md.get("_creator").get("_id"), md.get("coordinate-system")
+
+    return run, size
+
+
+@benchmark("search_iter_views")
+def bench_search_iter_views(size: int):
+    search = search_results(size)
+
+    def run():
+        for md in search.views():
+            md.title, md.groupId, md.coordinateSystem
+
+    return run, size
+
+
+@benchmark("search_columns_ingest")
+def bench_search_columns_ingest(size: int):
+    search = search_results(size)
+
+    def run():
+        columns = MetadataColumns()
+        for offset in range(0, size, 100):
+            columns.extend(search.results[offset : offset + 100])
+
+    return run, size
+
+
+@benchmark("search_aggregate_dicts")
+def bench_search_aggregate_dicts(size: int):
+    search = search_results(size)
+
+    def run():
+        Counter(md.get("type") for md in search.results)
+        max(md.get("_modified") for md in search.results)
+
+    return run, size
+
+
+@benchmark("search_aggregate_columns")
+def bench_search_aggregate_columns(size: int):
+    columns = MetadataColumns(search_results(size).results)
+
+    def run():
+        Counter(columns.type)
+        max(columns["_modified"])
+
+    return run, size
+
+
+def search_page(size: int = 100) -> dict:
+    """Search page of complete metadata (include='all')."""
+    fixture = load_fixture()
+    return {"limit": size, "offset": 0, "results": [fixture] * size, "total": size}
+
+
+def json_decode(size: int, backend: IsogeoJsonBackend):
+    document = json.dumps(search_page()).encode("utf-8")
+
+    def run():
+        for _ in range(size):
+            backend.loads(document)
+
+    return run, size
+
+
+def json_encode(size: int, backend: IsogeoJsonBackend):
+    page = search_page()
+
+    def run():
+        for _ in range(size):
+            backend.dumps(page)
+
+    return run, size
+
+
+@benchmark("json_decode_stdlib")
+def bench_json_decode_stdlib(size: int):
+    return json_decode(size, IsogeoJsonBackend("json"))
+
+
+@benchmark("json_decode_backend")
+def bench_json_decode_backend(size: int):
+    return json_decode(size, IsogeoJsonBackend())
+
+
+@benchmark("json_encode_stdlib")
+def bench_json_encode_stdlib(size: int):
+    return json_encode(size, IsogeoJsonBackend("json"))
+
+
+@benchmark("json_encode_backend")
+def bench_json_encode_backend(size: int):
+    return json_encode(size, IsogeoJsonBackend())
+
+
+@benchmark("tags_to_dict")
+def bench_tags_to_dict(size: int):
+    workgroups = ["{:032x}".format(i) for i in range(10)]
+    tags = {}
+    for i in range(size):
+        kind = ("keyword:isogeo", "format", "coordinate-system", "contact", "owner")[
+            i % 5
+        ]
+        tags["{}:{:032x}".format(kind, i)] = "label {}".format(i % (size // 2 or 1))
+    tags.update({"owner:{}".format(wg): "Workgroup {}".format(wg) for wg in workgroups})
+    query = {"_tags": list(tags)[:10]}
+
+    def run():
+        utils.tags_to_dict(tags=tags, prev_query=query)
+
+    return run, len(tags)
+
+
+@benchmark("hlpr_datetimes")
+def bench_hlpr_datetimes(size: int):
+    dates = (
+        "2018-06-04",
+        "2018-06-04T00:00:00",
+        "2018-06-04T00:00:00+00:00",
+        "2019-05-17T13:01:08.559123+00:00",
+        "2019-06-13T16:21:38.1917618+00:00",
+    )
+
+    def run():
+        for i in range(size):
+            IsogeoUtils.hlpr_datetimes(dates[i % len(dates)])
+
+    return run, size
+
+
+@benchmark("check_is_uuid")
+def bench_check_is_uuid(size: int):
+    uuids = (
+        "0269803d50c446b09f5060ef7fe3e22b",
+        "0269803d-50c4-46b0-9f50-60ef7fe3e22b",
+        "urn:isogeo:metadata:uuid:0269803d-50c4-46b0-9f50-60ef7fe3e22b",
+        "not-a-uuid",
+    )
+
+    def run():
+        for i in range(size):
+            checker.check_is_uuid(uuids[i % len(uuids)])
+
+    return run, size
+
+
+def traced_memory(build) -> int:
+    """Returns the memory in bytes still allocated by a function once it returned."""
+    tracemalloc.start()
+    try:
+        result = build()
+        current, _ = tracemalloc.get_traced_memory()
+        del result
+    finally:
+        tracemalloc.stop()
+
+    return current
+
+
+def measure_memory(size: int, records: str = "search") -> dict:
+    """Returns the memory taken by metadata: raw JSON, models and the same models with a \
+    per-instance `__dict__`, as before the `__slots__`.
+
+    :param int size: count of metadata
+    :param str records: 'search' for search results without subresources, 'full' for \
+        metadata with all their subresources
+    """
+    server = IsogeoMockServer(total=size)
+    if records == "full":
+        documents = [json.dumps(load_fixture())] * size
+    else:
+        documents = [json.dumps(server.metadata_record(i)) for i in range(size)]
+    DictMetadata = type("DictMetadata", (object,), {})
+    names = slots_names(Metadata)
+
+    def dict_layout(metadata: Metadata):
+        obj = DictMetadata()
+        obj.__dict__.update(zip(names, slots_values(metadata)))
+        return obj
+
+    Metadata.clean_attributes(json.loads(documents[0]))  # warm up caches
+    raw = traced_memory(lambda: [json.loads(doc) for doc in documents])
+    models = traced_memory(
+        lambda: [Metadata.clean_attributes(json.loads(doc)) for doc in documents]
+    )
+    dict_models = traced_memory(
+        lambda: [
+            dict_layout(Metadata.clean_attributes(json.loads(doc))) for doc in documents
+        ]
+    )
+
+    return {
+        "records": records,
+        "size": size,
+        "raw_json_bytes": raw,
+        "models_bytes": models,
+        "dict_models_bytes": dict_models,
+        "saved_ratio": 1 - models / dict_models,
+    }
+
+
+def run_benchmarks(
+    names: list = None, quick: bool = False, repeat: int = 5, memory: bool = True
+) -> dict:
+    """Run the benchmarks and returns the results report.
+
+    :param list names: benchmarks to run. Defaults to all.
+    :param bool quick: option to use the small sizes (smoke test)
+    :param int repeat: number of timed runs by benchmark and size
+    :param bool memory: option to measure the memory taken by the metadata models
+
+    :rtype: dict
+    """
+    results = []
+    for name in names or BENCHMARKS:
+        full_sizes, quick_sizes = SIZES.get(name)
+        for size in quick_sizes if quick else full_sizes:
+            run, operations = BENCHMARKS[name](size)
+            timings = []
+            try:
+                for _ in range(repeat):
+                    if hasattr(run, "setup"):
+                        run.setup()
+                    start = time.perf_counter()
+                    run()
+                    timings.append(time.perf_counter() - start)
+            finally:
+                if hasattr(run, "teardown"):
+                    run.teardown()
+
+            best = min(timings)
+            results.append(
+                {
+                    "name": name,
+                    "size": size,
+                    "operations": operations,
+                    "repeat": repeat,
+                    "best_s": best,
+                    "median_s": statistics.median(timings),
+                    "ops_per_s": operations / best if best else None,
+                }
+            )
+
+    return {
+        "sdk_version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "date": datetime.utcnow().isoformat(),
+        "quick": quick,
+        "results": results,
+        "memory": [
+            measure_memory(size, records)
+            for size in MEMORY_SIZES[quick]
+            for records in ("search", "full")
+            if memory
+        ],
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float = 0.2) -> list:
+    """Returns the regressions of a report against a baseline: benchmarks whose rate \
+    dropped by more than the threshold.
+
+    :param dict current: results report
+    :param dict baseline: previous results report
+    :param float threshold: tolerated slowdown ratio. Defaults to 20%.
+
+    :rtype: list
+    """
+    previous = {
+        (r.get("name"), r.get("size")): r.get("ops_per_s")
+        for r in baseline.get("results", [])
+    }
+    regressions = []
+    for result in current.get("results"):
+        before = previous.get((result.get("name"), result.get("size")))
+        after = result.get("ops_per_s")
+        if before and after and after < before * (1 - threshold):
+            regressions.append(dict(result, baseline_ops_per_s=before))
+
+    return regressions
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """Standalone execution."""
+    logging.disable(logging.CRITICAL)
+    parser = argparse.ArgumentParser(description="Benchmarks of the Isogeo SDK.")
+    parser.add_argument("--only", nargs="*", choices=sorted(BENCHMARKS))
+    parser.add_argument("--quick", action="store_true", help="small sizes only")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="JSON file to write the results")
+    parser.add_argument("--compare", type=Path, help="JSON baseline to compare with")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args()
+
+    # load baseline before it's overwritten
+    baseline = None
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+
+    report = run_benchmarks(
+        names=args.only, quick=args.quick, repeat=args.repeat, memory=not args.only
+    )
+    for result in report.get("results"):
+        print(
+            "{name:<28} size={size:<7} {ops_per_s:>14,.0f} ops/s "
+            "(best {best_s:.4f}s)".format(**result)
+        )
+    for measure in report.get("memory"):
+        print(
+            "{:<28} size={size:<7} raw JSON {raw_json_bytes:>12,} B | models "
+            "{models_bytes:>12,} B | with __dict__ {dict_models_bytes:>12,} B "
+            "({saved_ratio:.0%} saved)".format(
+                "metadata_memory_" + measure.get("records"), **measure
+            )
+        )
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    if baseline is not None:
+        regressions = compare(report, baseline, threshold=args.threshold)
+        for regression in regressions:
+            print(
+                "REGRESSION {name} size={size}: {ops_per_s:,.0f} ops/s "
+                "(was {baseline_ops_per_s:,.0f})".format(**regression)
+            )
+        sys.exit(1 if regressions else 0)
@@ -0,0 +1,559 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Local stand-in of the Isogeo API, to test and benchmark the SDK offline.
+
+Serves the routes mostly used by the SDK (authentication, search, metadata, shares, reference
+lists, keywords) from the fixtures and a synthetic catalog, with configurable latency,
+page size, error rate and catalog size.
+
+Usage from the repo root folder:
+
+.. code-block:: python
+
+    # as a script, then use the printed URL
+    python -m tests.mock_server --total 100000 --latency 0.05
+
+    # in a test or a benchmark
+    with IsogeoMockServer(total=100000, latency=0.01) as server:
+        isogeo = Isogeo(
+            client_id="python-minimalist-sdk-test-uuid-1a2b3c4d5e6f7g8h9i0j11k12l",
+            client_secret="s" * 64,
+            auto_refresh_url="https://id.api.isogeo.com/oauth/token",
+            platform="qa",
+            check_connection=False,
+        )
+        server.mount(isogeo)
+        isogeo.connect()
+        search = isogeo.search(whole_results=1)
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import argparse
+import gzip
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter, deque
+from copy import deepcopy
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+# 3rd party
+from requests.adapters import HTTPAdapter
+
+# #############################################################################
+# ########## Globals ###############
+# ##################################
+
+FIXTURE_METADATA = Path(__file__).parent / "fixtures" / "resource_complete_1.json"
+
+# count of the last requests kept in the history
+REQUESTS_HISTORY = 1000
+
+# hosts of the Isogeo platforms redirected to the local server
+ISOGEO_HOSTS = (
+    "api.isogeo.com",
+    "api.qa.isogeo.com",
+    "id.api.isogeo.com",
+    "id.api.qa.isogeo.com",
+    "v1.api.isogeo.com",
+    "v1.api.qa.isogeo.com",
+)
+
+# synthetic identifiers: fixed prefix + index in the catalog
+ID_PREFIX = "a1500000"
+WORKGROUP_ID = "{}{:024x}".format("b2600000", 1)
+THESAURUS_ID = "1616597fbc4348c8b11ef9d59cf594c8"
+
+METADATA_TYPES = (
+    ("vectorDataset", "type:vector-dataset", "Vector dataset"),
+    ("rasterDataset", "type:raster-dataset", "Raster dataset"),
+    ("service", "type:service", "Service"),
+    ("resource", "type:resource", "Resource"),
+)
+FORMATS = (("shp", "ESRI Shapefile"), ("gpkg", "GeoPackage"), ("tiff", "GeoTIFF"))
+KEYWORDS_COUNT = 50
+
+# responses larger than this size are gzipped if the client accepts it, like the API
+GZIP_MIN_SIZE = 1024
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class IsogeoMockServer(object):
+    """Local HTTP server standing in for the Isogeo API and Isogeo ID.
+
+    :param int total: size of the synthetic catalog. Defaults to 1000.
+    :param float latency: minimal duration of each response, in seconds.
+    :param float latency_jitter: random duration added to the latency, in seconds.
+    :param float error_rate: ratio (0-1) of requests answered with `error_status`.
+    :param int error_status: HTTP status of the simulated errors. Defaults to 503.
+    :param float retry_after: value of the `Retry-After` header of the simulated errors, \
+        in seconds. Not sent by default.
+    :param int max_page_size: maximum `_limit` accepted by the search routes. Defaults to 100.
+    :param int token_lifetime: lifetime of the delivered tokens, in seconds.
+    :param int seed: seed of the random generator (errors and jitter), for reproducibility.
+    :param str host: listening address. Defaults to localhost.
+    :param int port: listening port. Defaults to 0 (random free port).
+    """
+
+    def __init__(
+        self,
+        total: int = 1000,
+        latency: float = 0,
+        latency_jitter: float = 0,
+        error_rate: float = 0,
+        error_status: int = 503,
+        retry_after: float = None,
+        max_page_size: int = 100,
+        token_lifetime: int = 3600,
+        seed: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.total = total
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.retry_after = retry_after
+        self.max_page_size = max_page_size
+        self.token_lifetime = token_lifetime
+
+        # stats: counters and a bounded history, to serve long paginations in flat memory
+        self.received = 0  # count of requests received
+        self.paths = Counter()  # (method, path): count of requests received
+        self.requests = deque(maxlen=REQUESTS_HISTORY)  # (method, path) of the last ones
+        self.connections = set()  # client addresses of the connections received
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+
+        # fixtures
+        with FIXTURE_METADATA.open("r", encoding="utf-8") as in_json:
+            self.fixture_metadata = json.load(in_json)
+
+        self.routes = (
+            ("POST", r"/oauth/token", self.token),
+            ("GET", r"/(groups/(?P<wg>\w+)/)?resources/search", self.search),
+            ("GET", r"/resources/(?P<md>\w+)", self.metadata),
+            ("GET", r"/resources/(?P<md>\w+)/catalogs", lambda **kw: []),
+            ("GET", r"/(groups/(?P<wg>\w+)/)?shares", self.shares),
+            ("GET", r"/account", self.account),
+            ("GET", r"/(groups/(?P<wg>\w+)/)?keywords/search", self.keywords),
+            ("GET", r"/thesauri/(?P<th>\w+)/keywords/search", self.keywords),
+            ("GET", r"/coordinate-systems", self.coordinate_systems),
+            ("GET", r"/directives", self.directives),
+            ("GET", r"/formats", self.formats),
+            ("GET", r"/link-kinds", self.link_kinds),
+            ("GET", r"/(groups/(?P<wg>\w+)/)?licenses", self.licenses),
+            ("GET", r"/thesauri", self.thesauri),
+        )
+
+        # server
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    # -- LIFECYCLE ------------------------------------------------------------
+    @property
+    def url(self) -> str:
+        """Base URL of the server."""
+        host, port = self.httpd.server_address[:2]
+        return "http://{}:{}".format(host, port)
+
+    def start(self):
+        """Serve in a background thread."""
+        self._thread = threading.Thread(
+            target=self.httpd.serve_forever, name="IsogeoMockServer", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and release the port."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def mount(self, session, pool_maxsize: int = 50):
+        """Redirect the requests of a session (i.e. an Isogeo client) to the Isogeo hosts to
+        this server. Must be called before `connect`.
+
+        :param requests.Session session: session to redirect
+        :param int pool_maxsize: size of the connection pool to the server
+        """
+        adapter = MockServerAdapter(
+            self.url, pool_connections=1, pool_maxsize=pool_maxsize
+        )
+        for host in ISOGEO_HOSTS:
+            session.mount("https://{}/".format(host), adapter)
+
+    def count(self, path_pattern: str = r".*", method: str = None) -> int:
+        """Returns the count of received requests matching a path pattern.
+
+        :param str path_pattern: regular expression matched against the request path
+        :param str method: HTTP method to filter on
+        """
+        with self._lock:
+            return sum(
+                count
+                for (r_method, path), count in self.paths.items()
+                if re.search(path_pattern, path) and method in (None, r_method)
+            )
+
+    # -- SYNTHETIC CATALOG ----------------------------------------------------
+    @staticmethod
+    def metadata_id(index: int) -> str:
+        """Returns the UUID of the synthetic metadata at an index."""
+        return "{}{:024x}".format(ID_PREFIX, index)
+
+    def metadata_record(self, index: int) -> dict:
+        """Build the synthetic metadata at an index (without subresources)."""
+        md_type, type_tag, type_label = METADATA_TYPES[index % len(METADATA_TYPES)]
+        fmt_code, fmt_label = FORMATS[index % len(FORMATS)]
+        keyword = index % KEYWORDS_COUNT
+        date = "20{:02d}-{:02d}-{:02d}T10:00:00+00:00".format(
+            10 + index % 10, 1 + index % 12, 1 + index % 28
+        )
+        return {
+            "_id": self.metadata_id(index),
+            "_created": date,
+            "_modified": date,
+            "_creator": {"_id": WORKGROUP_ID, "_tag": "owner:{}".format(WORKGROUP_ID)},
+            "title": "Synthetic metadata {}".format(index),
+            "name": "synthetic_{}.{}".format(index, fmt_code),
+            "type": md_type,
+            "format": fmt_code,
+            "features": index,
+            "tags": {
+                type_tag: type_label,
+                "format:{}".format(fmt_code): fmt_label,
+                "owner:{}".format(WORKGROUP_ID): "Synthetic workgroup",
+                "keyword:isogeo:synthetic-{}".format(keyword): "synthetic {}".format(
+                    keyword
+                ),
+            },
+        }
+
+    def tags_universe(self) -> dict:
+        """Returns every tag used in the synthetic catalog."""
+        tags = {"owner:{}".format(WORKGROUP_ID): "Synthetic workgroup"}
+        tags.update({tag: label for _, tag, label in METADATA_TYPES})
+        tags.update({"format:{}".format(code): label for code, label in FORMATS})
+        tags.update(
+            {
+                "keyword:isogeo:synthetic-{}".format(i): "synthetic {}".format(i)
+                for i in range(KEYWORDS_COUNT)
+            }
+        )
+        return tags
+
+    @lru_cache(maxsize=64)
+    def _matching_indexes(self, query: str) -> tuple:
+        """Indexes of the synthetic metadata matching the tags and words of a query."""
+        filters = query.split()
+        return tuple(
+            i
+            for i in range(self.total)
+            if all(self._match(self.metadata_record(i), f) for f in filters)
+        )
+
+    @staticmethod
+    def _match(record: dict, query_filter: str) -> bool:
+        if ":" in query_filter:
+            return query_filter in record.get("tags")
+        return query_filter.lower() in record.get("title").lower()
+
+    def _with_includes(self, record: dict, include: list) -> dict:
+        """Add the subresources from the fixture."""
+        if "all" in include:
+            include = [k for k in self.fixture_metadata if not k.startswith("_")]
+        for subresource in include:
+            if subresource in self.fixture_metadata and subresource not in record:
+                record[subresource] = deepcopy(self.fixture_metadata.get(subresource))
+        if "tags" not in include:
+            record.pop("tags", None)
+        return record
+
+    # -- ROUTES ---------------------------------------------------------------
+    def token(self, **kwargs) -> dict:
+        return {
+            "access_token": "mock-{}".format(time.time()),
+            "expires_in": self.token_lifetime,
+            "refresh_token": "mock-refresh",
+            "token_type": "Bearer",
+        }
+
+    def search(self, params: dict, **kwargs) -> dict:
+        query = params.get("q", "").strip()
+        offset = int(params.get("_offset", 0))
+        limit = min(int(params.get("_limit", 20)), self.max_page_size)
+        include = [i for i in params.get("_include", "").split(",") if i]
+
+        if query:
+            indexes = self._matching_indexes(query)
+            total = len(indexes)
+            page_indexes = indexes[offset : offset + limit]
+        else:
+            total = self.total
+            page_indexes = range(offset, min(offset + limit, total))
+
+        return {
+            "envelope": None,
+            "limit": limit,
+            "offset": offset,
+            "query": {"_tags": [f for f in query.split() if ":" in f]},
+            "results": [
+                self._with_includes(self.metadata_record(i), include)
+                for i in page_indexes
+            ],
+            "tags": self.tags_universe(),
+            "total": total,
+        }
+
+    def metadata(self, md: str, params: dict, **kwargs) -> dict:
+        include = [i for i in params.get("_include", "").split(",") if i]
+        if md == self.fixture_metadata.get("_id"):
+            return deepcopy(self.fixture_metadata)
+        if md.startswith(ID_PREFIX) and int(md[len(ID_PREFIX) :], 16) < self.total:
+            return self._with_includes(
+                self.metadata_record(int(md[len(ID_PREFIX) :], 16)), include
+            )
+
+        return 404, {"error": "Resource not found: {}".format(md)}
+
+    def shares(self, **kwargs) -> list:
+        return [
+            {
+                "_id": "{}{:024x}".format("c3700000", 1),
+                "_creator": {"_id": WORKGROUP_ID},
+                "applications": [
+                    {
+                        "_id": "{}{:024x}".format("d4800000", 1),
+                        "name": "Mock application",
+                        "type": "group",
+                        "url": "http://localhost",
+                    }
+                ],
+                "catalogs": [],
+                "name": "Mock share",
+                "type": "application",
+            }
+        ]
+
+    def account(self, **kwargs) -> dict:
+        return {
+            "_id": "{}{:024x}".format("e5900000", 1),
+            "contact": {"email": "mock@isogeo.fr", "name": "Mock User"},
+            "language": "fr",
+        }
+
+    def keywords(self, params: dict, **kwargs) -> dict:
+        offset = int(params.get("_offset", 0))
+        limit = min(int(params.get("_limit", 20)), self.max_page_size)
+        return {
+            "limit": limit,
+            "offset": offset,
+            "results": [
+                {
+                    "_id": "{}{:024x}".format("f6a00000", i),
+                    "_tag": "keyword:isogeo:synthetic-{}".format(i),
+                    "code": "synthetic-{}".format(i),
+                    "text": "synthetic {}".format(i),
+                }
+                for i in range(offset, min(offset + limit, KEYWORDS_COUNT))
+            ],
+            "total": KEYWORDS_COUNT,
+        }
+
+    def coordinate_systems(self, **kwargs) -> list:
+        return [
+            {"_tag": "coordinate-system:{}".format(code), "code": code, "name": name}
+            for code, name in ((2154, "RGF93 / Lambert-93"), (4326, "WGS 84"))
+        ]
+
+    def directives(self, **kwargs) -> list:
+        return [
+            {
+                "_id": "{}{:024x}".format("0d100000", 1),
+                "name": "Directive 2007/2/EC (INSPIRE)",
+                "description": "Mock directive",
+            }
+        ]
+
+    def formats(self, **kwargs) -> list:
+        return [
+            {"_id": "{}{:024x}".format("0f200000", i), "code": code, "name": label}
+            for i, (code, label) in enumerate(FORMATS)
+        ]
+
+    def link_kinds(self, **kwargs) -> list:
+        return [
+            {"kind": "data", "actions": ["download", "view"]},
+            {"kind": "url", "actions": ["download", "view", "other"]},
+        ]
+
+    def licenses(self, **kwargs) -> list:
+        return [
+            {
+                "_id": "{}{:024x}".format("01300000", 1),
+                "name": "Licence Ouverte",
+                "link": "https://www.etalab.gouv.fr/licence-ouverte-open-licence",
+            }
+        ]
+
+    def thesauri(self, **kwargs) -> list:
+        return [{"_id": THESAURUS_ID, "code": "isogeo", "name": "Isogeo"}]
+
+    # -- INTERNAL -------------------------------------------------------------
+    def _dispatch(self, method: str, url: str, headers) -> tuple:
+        """Returns the status, the payload of a request and if it's a simulated error."""
+        parts = urlsplit(url)
+        path = "/" + parts.path.strip("/")
+        params = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+
+        with self._lock:
+            self.received += 1
+            self.paths[(method, path)] += 1
+            self.requests.append((method, path))
+            simulate_error = self._random.random() < self.error_rate
+            delay = self.latency + self._random.random() * self.latency_jitter
+
+        if delay:
+            time.sleep(delay)
+        if simulate_error:
+            return self.error_status, {"error": "Simulated error"}, True
+
+        for route_method, pattern, handler in self.routes:
+            match = re.fullmatch(pattern, path)
+            if route_method == method and match:
+                if path != "/oauth/token" and not headers.get("Authorization"):
+                    return 401, {"error": "Missing bearer token"}, False
+                result = handler(
+                    params=params,
+                    **{k: v for k, v in match.groupdict().items() if v is not None}
+                )
+                if isinstance(result, tuple):
+                    return result + (False,)
+                return 200, result, False
+
+        return 404, {"error": "Route not found: {} {}".format(method, path)}, False
+
+    def _handler_class(self):
+        server = self
+
+        class IsogeoMockHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, like the API
+            # headers and body are written separately: don't wait for the delayed ACK
+            disable_nagle_algorithm = True
+
+            def _respond(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+
+                with server._lock:
+                    server.connections.add(self.client_address)
+                status, payload, error = server._dispatch(
+                    self.command, self.path, self.headers
+                )
+                body = json.dumps(payload).encode("utf-8")
+
+                # conditional requests on reference lists
+                etag = '"{}"'.format(hashlib.md5(body).hexdigest())
+                if status == 200 and self.headers.get("If-None-Match") == etag:
+                    status, body = 304, b""
+
+                gzipped = len(body) > GZIP_MIN_SIZE and "gzip" in self.headers.get(
+                    "Accept-Encoding", ""
+                )
+                if gzipped:
+                    body = gzip.compress(body, compresslevel=6)
+
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                if gzipped:
+                    self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("ETag", etag)
+                if error and server.retry_after is not None:
+                    self.send_header("Retry-After", str(server.retry_after))
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(body)
+
+            do_GET = do_HEAD = do_POST = do_PUT = do_DELETE = _respond
+
+            def log_message(self, format, *args):
+                pass
+
+        return IsogeoMockHandler
+
+
+class MockServerAdapter(HTTPAdapter):
+    """Transport adapter sending the requests to the mock server instead of the Isogeo hosts.
+
+    :param str server_url: base URL of the mock server
+    """
+
+    def __init__(self, server_url: str, **kwargs):
+        self.server_url = server_url
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        parts = urlsplit(request.url)
+        request.url = "{}{}{}".format(
+            self.server_url, parts.path, "?" + parts.query if parts.query else ""
+        )
+        kwargs["verify"] = False
+        return super().send(request, **kwargs)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """Standalone execution."""
+    parser = argparse.ArgumentParser(description="Local stand-in of the Isogeo API.")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--total", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0)
+    parser.add_argument("--latency-jitter", type=float, default=0)
+    parser.add_argument("--error-rate", type=float, default=0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--retry-after", type=float)
+    parser.add_argument("--max-page-size", type=int, default=100)
+    args = parser.parse_args()
+
+    mock_server = IsogeoMockServer(
+        total=args.total,
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        retry_after=args.retry_after,
+        max_page_size=args.max_page_size,
+        port=args.port,
+    )
+    print("Mock Isogeo API listening on {}".format(mock_server.url))
+    try:
+        mock_server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        mock_server.stop()
@@ -0,0 +1,77 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+.. code-block:: python
+
+    # for whole test
+    python -m unittest tests.test_benchmark
+    # for specific
+    python -m unittest tests.test_benchmark.TestBenchmark.test_benchmark_report
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import json
+import logging
+import unittest
+
+# module target
+from tests.benchmark import BENCHMARKS, compare, measure_memory, run_benchmarks
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestBenchmark(unittest.TestCase):
+    """Smoke test of the benchmark suite."""
+
+    @classmethod
+    def setUpClass(cls):
+        logging.getLogger("isogeo_pysdk").setLevel(logging.CRITICAL)
+
+    def test_benchmark_report(self):
+        """Every benchmark runs and the report is JSON serializable."""
+        report = run_benchmarks(quick=True, repeat=1)
+        self.assertEqual(
+            sorted({r.get("name") for r in report.get("results")}), sorted(BENCHMARKS)
+        )
+        for result in report.get("results"):
+            self.assertGreater(result.get("ops_per_s"), 0)
+        self.assertEqual(json.loads(json.dumps(report)), report)
+
+    def test_memory(self):
+        """Slotted metadata models are lighter than with a per-instance `__dict__`."""
+        measure = measure_memory(200)
+        self.assertLess(measure.get("models_bytes"), measure.get("dict_models_bytes"))
+        self.assertGreater(measure.get("raw_json_bytes"), 0)
+
+    def test_benchmark_compare(self):
+        """Regressions beyond the threshold are reported."""
+        baseline = {
+            "results": [
+                {"name": "check_is_uuid", "size": 100, "ops_per_s": 1000},
+                {"name": "hlpr_datetimes", "size": 100, "ops_per_s": 1000},
+            ]
+        }
+        current = {
+            "results": [
+                {"name": "check_is_uuid", "size": 100, "ops_per_s": 700},
+                {"name": "hlpr_datetimes", "size": 100, "ops_per_s": 900},
+            ]
+        }
+        regressions = compare(current, baseline, threshold=0.2)
+        self.assertEqual([r.get("name") for r in regressions], ["check_is_uuid"])
+        self.assertEqual(regressions[0].get("baseline_ops_per_s"), 1000)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,174 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+.. code-block:: python
+
+    # for whole test
+    python -m unittest tests.test_cache
+    # for specific
+    python -m unittest tests.test_cache.TestCache.test_cache_ttl
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import time
+import unittest
+
+# module target
+from isogeo_pysdk import IsogeoCache, IsogeoUtils, Metadata
+from isogeo_pysdk.api import ApiSearch
+
+# test helpers
+from tests.mock_server import IsogeoMockServer
+from tests.test_mock_server import new_client
+from tests.test_search_pages import FakeSession
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestCache(unittest.TestCase):
+    """Test responses cache."""
+
+    def test_cache_keys_normalized(self):
+        """Logically identical arguments give the same key."""
+        key_a = IsogeoCache.make_key(
+            "resources/search",
+            {"include": ["tags", "contacts"], "bbox": "-4.97,45.9,-1.21,48.5"},
+        )
+        key_b = IsogeoCache.make_key(
+            "resources/search",
+            {"bbox": (-4.97, 45.9, -1.21, 48.5), "include": ("contacts", "tags")},
+        )
+        self.assertEqual(key_a, key_b)
+        self.assertEqual(hash(key_a), hash(key_b))
+        self.assertNotEqual(
+            key_a, IsogeoCache.make_key("resources/{id}", {"include": ["tags"]})
+        )
+
+    def test_cache_ttl(self):
+        """Entries expire after their TTL."""
+        cache = IsogeoCache()
+        cache.set(("k",), {"a": 1}, ttl=0.05)
+        self.assertEqual(cache.get(("k",)), (True, {"a": 1}))
+        time.sleep(0.1)
+        self.assertEqual(cache.get(("k",)), (False, None))
+        self.assertEqual(cache.info().get("entries"), 0)
+
+    def test_cache_max_size(self):
+        """Least recently used entries are evicted above the maximum size."""
+        value_size = IsogeoCache.estimate_size(["x" * 100])
+        cache = IsogeoCache(max_size=value_size * 2)
+        cache.set(("a",), ["x" * 100], ttl=60)
+        cache.set(("b",), ["x" * 100], ttl=60)
+        cache.get(("a",))
+        cache.set(("c",), ["x" * 100], ttl=60)
+        self.assertTrue(cache.get(("a",))[0])
+        self.assertFalse(cache.get(("b",))[0])
+        self.assertTrue(cache.get(("c",))[0])
+        self.assertLessEqual(cache.size, cache.max_size)
+
+    def test_cache_estimate_sampled(self):
+        """Big responses are estimated from a sample, close to their full size."""
+        server = IsogeoMockServer(total=5000)
+        results = [server.metadata_record(i) for i in range(5000)]
+        full_size = IsogeoCache.estimate_size(results, sample_size=None)
+        sampled_size = IsogeoCache.estimate_size(results)
+        self.assertAlmostEqual(sampled_size / full_size, 1, delta=0.2)
+        # small values are fully measured
+        value = {"a": ["x" * 100]}
+        self.assertEqual(
+            IsogeoCache.estimate_size(value),
+            IsogeoCache.estimate_size(value, sample_size=None),
+        )
+
+    def test_cache_errors_not_cached(self):
+        """Error tuples are not stored."""
+        cache = IsogeoCache()
+        cache.set(("k",), (False, 500), ttl=60)
+        self.assertFalse(cache.get(("k",))[0])
+
+    def test_cache_search_route(self):
+        """Search responses are cached by normalized arguments, failures are not."""
+        session = FakeSession(total=50, fail_at_offset=20)
+        session.cache = IsogeoCache(ttls={"resources/search": 60})
+        api_search = ApiSearch(session)
+
+        search = api_search.search(include=["tags", "contacts"], page_size=10)
+        self.assertIs(
+            api_search.search(include=("contacts", "tags"), page_size=10), search
+        )
+        self.assertEqual(session.requested_offsets, [0])
+
+        # failures are requested again
+        self.assertIsInstance(api_search.search(offset=20, page_size=10), tuple)
+        self.assertIsInstance(api_search.search(offset=20, page_size=10), tuple)
+        self.assertEqual(session.requested_offsets, [0, 20, 20])
+
+        # cleared by the utils
+        IsogeoUtils.cache_clearer()
+        api_search.search(include=["tags", "contacts"], page_size=10)
+        self.assertEqual(session.requested_offsets, [0, 20, 20, 0])
+
+    def test_cache_invalidate(self):
+        """Entries of a route are removed by arguments, whatever the others."""
+        cache = IsogeoCache()
+        for md_id, include in (("a", ()), ("a", ["links"]), ("b", ())):
+            key = IsogeoCache.make_key(
+                "resources/{id}", {"metadata_id": md_id, "include": include}
+            )
+            cache.set(key, {"_id": md_id}, ttl=60)
+        cache.set(IsogeoCache.make_key("shares", {}), [], ttl=60)
+
+        self.assertEqual(cache.invalidate("resources/{id}", metadata_id="a"), 2)
+        self.assertEqual(cache.info().get("entries"), 2)
+        self.assertEqual(cache.invalidate("resources/{id}"), 1)
+        self.assertEqual(cache.info().get("entries"), 1)
+
+    def test_cache_metadata_modified(self):
+        """Updated and deleted metadata are not served from the cache anymore."""
+        md_id = IsogeoMockServer.metadata_id(3)
+        with IsogeoMockServer(total=50) as server:
+            isogeo = new_client(server)
+            isogeo.metadata.get(md_id)
+            isogeo.metadata.get(md_id, include=("links",))
+            isogeo.metadata.update(
+                Metadata(_id=md_id, type="vectorDataset", editionProfile="manual")
+            )
+            isogeo.metadata.get(md_id)
+            isogeo.metadata.delete(md_id)
+            isogeo.metadata.get(md_id)
+            isogeo.close()
+            self.assertEqual(server.count(r"^/resources/\w+$", method="GET"), 4)
+
+    def test_cache_disabled(self):
+        """A null TTL disables the cache for the route."""
+        session = FakeSession(total=50)
+        session.cache = IsogeoCache(ttls={"resources/search": 0})
+        api_search = ApiSearch(session)
+        api_search.search(page_size=10)
+        api_search.search(page_size=10)
+        self.assertEqual(session.requested_offsets, [0, 0])
+
+    def test_cache_disabled_client(self):
+        """Client without cache requests every search."""
+        with IsogeoMockServer(total=50) as server:
+            isogeo = new_client(server, cache=False)
+            isogeo.search(page_size=10)
+            isogeo.search(page_size=10)
+            isogeo.close()
+        self.assertIsNone(isogeo.cache)
+        self.assertEqual(server.count(r"search"), 2)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
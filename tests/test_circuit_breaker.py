@@ -0,0 +1,188 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+.. code-block:: python
+
+    # for whole test
+    python -m unittest tests.test_circuit_breaker
+    # for specific
+    python -m unittest tests.test_circuit_breaker.TestCircuitBreaker.test_open_fail_fast
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import logging
+import unittest
+from time import sleep
+
+# 3rd party
+from requests.exceptions import ChunkedEncodingError, ConnectionError
+from requests.models import Response
+
+# module target
+from isogeo_pysdk import (
+    CircuitOpenError,
+    DeadlineExceededError,
+    IsogeoCircuitBreaker,
+)
+
+# test helpers
+from tests.mock_server import IsogeoMockServer
+from tests.test_mock_server import new_client
+
+# #############################################################################
+# ########## Globals ###############
+# ##################################
+
+URL = "https://v1.api.qa.isogeo.com/resources/search"
+
+# #############################################################################
+# ########## Helpers ###############
+# ##################################
+
+
+def respond(status: int):
+    """Returns a function sending a request answered with a status."""
+
+    def send():
+        response = Response()
+        response.status_code = status
+        return response
+
+    return send
+
+
+def fail():
+    raise ConnectionError("API unreachable")
+
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Test the circuit breaker."""
+
+    @classmethod
+    def setUpClass(cls):
+        logging.getLogger("isogeo_pysdk").setLevel(logging.CRITICAL)
+
+    def test_open_fail_fast(self):
+        """Circuit opens after consecutive failures and requests fail fast."""
+        breaker = IsogeoCircuitBreaker(failure_threshold=3, recovery_timeout=60)
+        for i in range(2):
+            breaker.call(URL, respond(503))
+        self.assertEqual(breaker.state(URL), "closed")
+        with self.assertRaises(ConnectionError):
+            breaker.call(URL, fail)
+        self.assertEqual(breaker.state(URL), "open")
+
+        with self.assertRaises(CircuitOpenError) as context:
+            breaker.call(URL, respond(200))
+        self.assertEqual(context.exception.host, "v1.api.qa.isogeo.com")
+        self.assertGreater(context.exception.retry_in, 50)
+        self.assertEqual(breaker.rejected, 1)
+
+        # other hosts are not affected
+        self.assertEqual(
+            breaker.call("https://v1.api.isogeo.com/", respond(200)).status_code, 200
+        )
+
+    def test_success_resets(self):
+        """Failures must be consecutive, client errors are not failures."""
+        breaker = IsogeoCircuitBreaker(failure_threshold=2)
+        for status in (503, 200, 500, 404, 403):
+            breaker.call(URL, respond(status))
+        self.assertEqual(breaker.state(URL), "closed")
+
+    def test_half_open(self):
+        """After the recovery timeout, one trial request closes or opens the circuit."""
+        breaker = IsogeoCircuitBreaker(failure_threshold=1, recovery_timeout=0.05)
+        breaker.call(URL, respond(502))
+        self.assertEqual(breaker.state(URL), "open")
+        sleep(0.06)
+        self.assertEqual(breaker.state(URL), "half-open")
+
+        # failed trial: open again
+        breaker.call(URL, respond(502))
+        self.assertEqual(breaker.state(URL), "open")
+        sleep(0.06)
+
+        # only one trial at once
+        def trial():
+            with self.assertRaises(CircuitOpenError):
+                breaker.call(URL, respond(200))
+            return respond(200)()
+
+        breaker.call(URL, trial)
+        self.assertEqual(breaker.state(URL), "closed")
+
+    def test_half_open_other_errors(self):
+        """Trial slot is freed whatever the error raised by the trial request."""
+        breaker = IsogeoCircuitBreaker(failure_threshold=1, recovery_timeout=0.05)
+        breaker.call(URL, respond(502))
+        sleep(0.06)
+
+        # broken response: a failure
+        def broken():
+            raise ChunkedEncodingError("Connection broken")
+
+        with self.assertRaises(ChunkedEncodingError):
+            breaker.call(URL, broken)
+        self.assertEqual(breaker.state(URL), "open")
+        sleep(0.06)
+
+        # caller side error: neither a failure nor a success
+        def expired():
+            raise DeadlineExceededError("Deadline exceeded")
+
+        with self.assertRaises(DeadlineExceededError):
+            breaker.call(URL, expired)
+        self.assertEqual(breaker.state(URL), "half-open")
+
+        # next trial is sent
+        breaker.call(URL, respond(200))
+        self.assertEqual(breaker.state(URL), "closed")
+
+    def test_bad_threshold(self):
+        """Failure threshold must be at least 1."""
+        with self.assertRaises(ValueError):
+            IsogeoCircuitBreaker(failure_threshold=0)
+
+    def test_client(self):
+        """Client requests fail fast once the API is unavailable."""
+        with IsogeoMockServer(total=10, error_status=503) as server:
+            isogeo = new_client(
+                server,
+                circuit_breaker=IsogeoCircuitBreaker(
+                    failure_threshold=2, recovery_timeout=60
+                ),
+            )
+            server.error_rate = 1
+            for i in range(2):
+                self.assertEqual(isogeo.execute("GET", route="formats"), (False, 503))
+            sent = server.received
+            with self.assertRaises(CircuitOpenError):
+                isogeo.search(page_size=1)
+            self.assertEqual(server.received, sent)
+            isogeo.close()
+
+    def test_disabled(self):
+        """Circuit breaker is disabled by default."""
+        with IsogeoMockServer(total=10) as server:
+            isogeo = new_client(server)
+            self.assertIsNone(isogeo.circuit_breaker)
+            isogeo.close()
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+.. code-block:: python
+
+    # for whole test
+    python -m unittest tests.test_deadline
+    # for specific
+    python -m unittest tests.test_deadline.TestDeadline.test_search_partial
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import logging
+import threading
+import unittest
+from time import perf_counter, sleep
+
+# module target
+from isogeo_pysdk import (
+    DeadlineExceededError,
+    IsogeoDeadline,
+    IsogeoPaginator,
+    OperationCancelledError,
+)
+
+# test helpers
+from tests.mock_server import IsogeoMockServer
+from tests.test_mock_server import new_client
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestDeadline(unittest.TestCase):
+    """Test the deadline and cancellation token."""
+
+    @classmethod
+    def setUpClass(cls):
+        logging.getLogger("isogeo_pysdk").setLevel(logging.CRITICAL)
+        cls.server = IsogeoMockServer(total=2000).start()
+        cls.isogeo = new_client(cls.server)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.isogeo.close()
+        cls.server.stop()
+
+    def setUp(self):
+        self.isogeo.cache.clear()
+        self.server.latency = 0
+
+    def test_token(self):
+        """Remaining time, timeouts capping and errors."""
+        deadline = IsogeoDeadline(10)
+        self.assertTrue(9 < deadline.remaining() <= 10)
+        connect_timeout, read_timeout = deadline.cap_timeout((15, 45))
+        self.assertLessEqual(connect_timeout, 10)
+        self.assertLessEqual(read_timeout, 10)
+        self.assertEqual(deadline.cap_timeout(5), 5)
+        deadline.check()
+
+        # without deadline
+        token = IsogeoDeadline()
+        self.assertIsNone(token.remaining())
+        self.assertEqual(token.cap_timeout((15, 45)), (15, 45))
+        token.cancel()
+        self.assertTrue(token.expired)
+        with self.assertRaises(OperationCancelledError):
+            token.check()
+
+        # exceeded
+        with self.assertRaises(DeadlineExceededError):
+            IsogeoDeadline(0).check()
+
+    def test_parent(self):
+        """A child token stops with its parent."""
+        parent = IsogeoDeadline(10, partial=True)
+        child = IsogeoDeadline(60, parent=parent)
+        self.assertLessEqual(child.remaining(), 10)
+        self.assertTrue(child.partial)
+        parent.cancel()
+        self.assertTrue(child.cancelled)
+
+    def test_current(self):
+        """Deadline is current within its block and in the copied contexts."""
+        self.assertIsNone(IsogeoDeadline.current())
+        with IsogeoDeadline(5) as deadline:
+            self.assertIs(IsogeoDeadline.current(), deadline)
+        self.assertIsNone(IsogeoDeadline.current())
+        self.assertIs(deadline.run(IsogeoDeadline.current), deadline)
+
+    def test_expired_call(self):
+        """No request is sent once the deadline is exceeded."""
+        count = self.server.received
+        with self.assertRaises(DeadlineExceededError):
+            self.isogeo.metadata.get(
+                IsogeoMockServer.metadata_id(1), deadline=IsogeoDeadline(0)
+            )
+        self.assertEqual(self.server.received, count)
+
+    def test_search_deadline(self):
+        """Whole results search raises promptly once the deadline is exceeded."""
+        self.server.latency = 0.1
+        start = perf_counter()
+        with self.assertRaises(DeadlineExceededError):
+            self.isogeo.search(whole_results=1, deadline=IsogeoDeadline(0.25))
+        self.assertLess(perf_counter() - start, 0.5)
+
+    def test_search_partial(self):
+        """Whole results search returns the pages received before the deadline."""
+        self.server.latency = 0.1
+        search = self.isogeo.search(
+            whole_results=1, deadline=IsogeoDeadline(0.35, partial=True)
+        )
+        self.assertEqual(search.total, 2000)
+        self.assertGreaterEqual(len(search.results), 100)
+        self.assertLess(len(search.results), 2000)
+
+        # partial results are not cached
+        self.server.latency = 0
+        search = self.isogeo.search(whole_results=1)
+        self.assertEqual(len(search.results), 2000)
+
+    def test_pagination_cancelled(self):
+        """Pagination stops when the token is cancelled from another thread."""
+        fetched = []
+
+        def fetch_page(offset, limit):
+            sleep(0.05)
+            fetched.append(offset)
+            return list(range(limit))
+
+        token = IsogeoDeadline(partial=True)
+        paginator = IsogeoPaginator(
+            fetch_page=fetch_page, page_size=10, max_workers=2, deadline=token
+        )
+        threading.Timer(0.2, token.cancel).start()
+        pages = paginator.collect(total=10000)
+        self.assertLess(len(pages), 20)
+        sleep(0.1)
+        self.assertLess(len(fetched), 20)
+
+        # without partial results
+        with self.assertRaises(OperationCancelledError):
+            IsogeoPaginator(
+                fetch_page=fetch_page, page_size=10, deadline=IsogeoDeadline(0.1)
+            ).collect(total=10000)
+
+    def test_generator_route(self):
+        """Deadline passed to a generator route method stops the iteration."""
+        self.server.latency = 0.05
+        with self.assertRaises(DeadlineExceededError):
+            for md in self.isogeo.iter_search(deadline=IsogeoDeadline(0.2)):
+                pass
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,247 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+.. code-block:: python
+
+    # for whole test
+    python -m unittest tests.test_hedging
+    # for specific
+    python -m unittest tests.test_hedging.TestHedging.test_slow_request_hedged
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import io
+import itertools
+import logging
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter, sleep
+
+# 3rd party
+from requests.models import Response
+
+# module target
+from isogeo_pysdk import IsogeoHedging
+
+# test helpers
+from tests.mock_server import IsogeoMockServer
+from tests.test_mock_server import new_client
+
+# #############################################################################
+# ########## Helpers ###############
+# ##################################
+
+
+class SlowThenFast(object):
+    """Sends requests answered after the given delays, in turn."""
+
+    def __init__(self, *delays):
+        self.delays = itertools.cycle(delays)
+        self.responses = []
+        self.threads = []
+
+    def __call__(self):
+        self.threads.append(threading.current_thread())
+        delay = next(self.delays)
+        sleep(delay)
+        # streamed response: the body is read from `raw` on access
+        response = Response()
+        response.status_code = 200
+        response._content = False
+        response.raw = io.BytesIO(str(delay).encode())
+        self.responses.append(response)
+        return response
+
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestHedging(unittest.TestCase):
+    """Test the hedged requests."""
+
+    @classmethod
+    def setUpClass(cls):
+        logging.getLogger("isogeo_pysdk").setLevel(logging.CRITICAL)
+
+    def setUp(self):
+        self.hedging = IsogeoHedging(delay=0.05, min_delay=0.01)
+
+    def tearDown(self):
+        self.hedging.shutdown()
+
+    def test_fast_request_not_hedged(self):
+        """Requests faster than the delay are sent once."""
+        send = SlowThenFast(0)
+        response = self.hedging.send("formats", send)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(send.responses), 1)
+        self.assertEqual(self.hedging.hedged, 0)
+
+    def test_slow_request_hedged(self):
+        """Slow requests are hedged and the first response wins."""
+        send = SlowThenFast(0.5, 0)
+        start = perf_counter()
+        response = self.hedging.send("resources/{id}", send)
+        self.assertLess(perf_counter() - start, 0.4)
+        self.assertEqual(response.content, b"0")
+        self.assertTrue(response.hedged)
+        self.assertTrue(response.hedge_won)
+        self.assertEqual((self.hedging.hedged, self.hedging.wins), (1, 1))
+
+        # losing response is closed once arrived
+        sleep(0.6)
+        self.assertEqual(len(send.responses), 2)
+        winner, loser = send.responses
+        self.assertIs(winner, response)
+        self.assertTrue(loser.raw.closed)
+        # losing body is not downloaded
+        self.assertFalse(loser._content_consumed)
+
+    def test_hedge_delay(self):
+        """Hedging delay is the percentile of the latest latencies of the route."""
+        hedging = IsogeoHedging(percentile=0.9, min_samples=10, min_delay=0.01)
+        # not hedged until enough latencies are known
+        self.assertIsNone(hedging.hedge_delay("formats"))
+        for i in range(1, 101):
+            hedging.observe("formats", i / 100)
+        self.assertAlmostEqual(hedging.hedge_delay("formats"), 0.9, places=2)
+        # bounded by the maximum delay
+        for i in range(100):
+            hedging.observe("formats", 50)
+        self.assertEqual(hedging.hedge_delay("formats"), hedging.max_delay)
+        self.assertIsNone(hedging.hedge_delay("licenses"))
+        self.assertEqual(IsogeoHedging(delay=0.5).hedge_delay("licenses"), 0.5)
+
+    def test_not_hedged(self):
+        """Requests of unknown latency or long timeout are sent from the caller's thread."""
+        hedging = IsogeoHedging(min_samples=2, min_delay=0.01)
+        send = SlowThenFast(0.05)
+        for _ in range(2):
+            hedging.send("formats", send)
+        self.assertAlmostEqual(hedging.hedge_delay("formats"), 0.05, delta=0.03)
+
+        # known latency: hedged
+        hedging.send("formats", SlowThenFast(0.1, 0))
+        self.assertEqual(hedging.hedged, 1)
+
+        # long timeout (i.e. search pages)
+        hedging.send("formats", send, timeout=(5, 200))
+        self.assertEqual(hedging.hedged, 1)
+        self.assertEqual(set(send.threads), {threading.current_thread()})
+        hedging.shutdown()
+
+    def test_loser_cancelled(self):
+        """Losing request is not sent if it's still waiting for a thread."""
+        hedging = IsogeoHedging(delay=0.05, min_delay=0.01, max_workers=1)
+        blocker = threading.Event()
+        hedging._submit(blocker.wait)
+        send = SlowThenFast(0)
+        discarded = []
+        response = hedging.send(
+            "formats", send, on_discard=lambda *args: discarded.append(args)
+        )
+        blocker.set()
+        sleep(0.1)
+        self.assertTrue(response.hedge_won)
+        self.assertEqual(len(send.responses), 1)
+        self.assertEqual(discarded, [])
+        hedging.shutdown()
+
+    def test_max_hedges(self):
+        """No hedge request is sent once too many are in flight."""
+        hedging = IsogeoHedging(delay=0.01, min_delay=0.01, max_hedges=1)
+        hedging._hedges.acquire()
+        send = SlowThenFast(0.05)
+        hedging.send("formats", send)
+        self.assertEqual(len(send.responses), 1)
+        self.assertEqual(hedging.hedged, 0)
+        hedging.shutdown()
+
+    def test_errors(self):
+        """Error of a request is raised only if the other one fails too."""
+        calls = itertools.count()
+
+        def flaky():
+            if next(calls) == 0:
+                sleep(0.1)
+                raise ConnectionError("reset")
+            return SlowThenFast(0.2)()
+
+        response = self.hedging.send("formats", flaky)
+        self.assertEqual(response.status_code, 200)
+
+        def broken():
+            sleep(0.1)
+            raise ConnectionError("reset")
+
+        with self.assertRaises(ConnectionError):
+            self.hedging.send("formats", broken)
+
+    def test_discarded(self):
+        """Losing request is passed to the discard function once finished."""
+        discarded = []
+        send = SlowThenFast(0.2, 0)
+        self.hedging.send(
+            "formats", send, on_discard=lambda *args: discarded.append(args)
+        )
+        sleep(0.3)
+        self.assertEqual(len(discarded), 1)
+        response, latency = discarded[0]
+        self.assertIs(response, send.responses[1])
+        self.assertGreaterEqual(latency, 0.2)
+
+    def test_concurrency(self):
+        """Requests are sent from a thread by pooled connection."""
+        hedging = IsogeoHedging(delay=1, max_hedges=1, max_workers=40)
+        send = SlowThenFast(0.2)
+        start = perf_counter()
+        with ThreadPoolExecutor(max_workers=40) as executor:
+            for _ in range(40):
+                executor.submit(hedging.send, "formats", send)
+        self.assertLess(perf_counter() - start, 0.6)
+        self.assertEqual(len(send.responses), 40)
+        self.assertEqual(len(set(send.threads)), 40)
+        hedging.shutdown()
+
+        # beyond the pool, requests wait for a thread: not counted in the latencies
+        hedging = IsogeoHedging(delay=1, max_hedges=1, max_workers=10)
+        with ThreadPoolExecutor(max_workers=40) as executor:
+            for _ in range(40):
+                executor.submit(hedging.send, "formats", send)
+        self.assertEqual(len(set(send.threads[40:])), 10)
+        self.assertLess(hedging.hedge_delay("formats"), 0.3)
+        hedging.shutdown()
+
+    def test_client(self):
+        """Client GET requests are hedged and both requests counted in metrics."""
+        with IsogeoMockServer(total=50, latency=0.05) as server:
+            isogeo = new_client(
+                server, hedging=IsogeoHedging(delay=0.01, min_delay=0.01)
+            )
+            md = isogeo.metadata.get(IsogeoMockServer.metadata_id(7))
+            sleep(0.1)
+            isogeo.close()
+
+        self.assertEqual(md._id, IsogeoMockServer.metadata_id(7))
+        self.assertEqual(isogeo.hedging.max_workers, isogeo.pool_maxsize)
+        self.assertGreaterEqual(isogeo.hedging.hedged, 1)
+        stats = isogeo.metrics.snapshot().get("GET resources/{id}")
+        self.assertEqual(stats.get("count"), 2)
+        self.assertEqual(stats.get("statuses"), {200: 2})
+        self.assertEqual(stats.get("hedges"), 1)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,181 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+.. code-block:: python
+
+    # for whole test
+    python -m unittest tests.test_http_cache
+    # for specific
+    python -m unittest tests.test_http_cache.TestHttpCache.test_http_cache_revalidation
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+# 3rd party
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+# module target
+from isogeo_pysdk import IsogeoHttpCache
+
+# test helpers
+from tests.mock_server import IsogeoMockServer
+from tests.test_mock_server import new_client
+
+# #############################################################################
+# ########## Helpers ###############
+# ##################################
+
+URL_SRS = "https://api.qa.isogeo.com/coordinate-systems"
+
+
+class FakeApi(object):
+    """Stand-in for the session request method, supporting conditional requests."""
+
+    def __init__(self, etag: str = '"v1"', cache_control: str = None):
+        self.etag = etag
+        self.cache_control = cache_control
+        self.calls = []
+
+    def request(self, method: str, url: str, headers: dict = None, **kwargs):
+        self.calls.append(dict(headers or {}))
+        response = Response()
+        response.url = url
+        response.headers = CaseInsensitiveDict()
+        if self.etag:
+            response.headers["ETag"] = self.etag
+        if self.cache_control:
+            response.headers["Cache-Control"] = self.cache_control
+        if self.etag and (headers or {}).get("If-None-Match") == self.etag:
+            response.status_code = 304
+            response._content = b""
+        else:
+            response.status_code = 200
+            response._content = json.dumps([{"code": 4326}]).encode("utf-8")
+        return response
+
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestHttpCache(unittest.TestCase):
+    """Test persistent HTTP cache."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.tmp_dir.name) / "http_cache.sqlite"
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_http_cache_routes(self):
+        """Only the reference routes are cached."""
+        cache = IsogeoHttpCache(path=self.db_path)
+        self.assertTrue(cache.is_cacheable(URL_SRS))
+        self.assertTrue(cache.is_cacheable("https://api.qa.isogeo.com/formats/"))
+        self.assertFalse(
+            cache.is_cacheable("https://api.qa.isogeo.com/resources/search?q=")
+        )
+        self.assertFalse(
+            cache.is_cacheable("https://api.qa.isogeo.com/coordinate-systems/4326")
+        )
+        # workgroups lists can be edited
+        group_url = "https://api.qa.isogeo.com/groups/{}/".format("a" * 32)
+        for route in ("licenses", "coordinate-systems", "thesauri"):
+            self.assertFalse(cache.is_cacheable(group_url + route), route)
+        self.assertFalse(cache.is_cacheable(group_url + "licenses?_limit=10"))
+
+    def test_http_cache_fresh(self):
+        """Fresh responses are served without request, across instances."""
+        api = FakeApi()
+        cache = IsogeoHttpCache(path=self.db_path, ttl=60)
+        first = cache.send(api.request, URL_SRS, params={"_limit": 10})
+
+        # another process using the same database
+        other = IsogeoHttpCache(path=self.db_path, ttl=60)
+        cached = other.send(api.request, URL_SRS, params={"_limit": 10})
+        self.assertEqual(len(api.calls), 1)
+        self.assertEqual(cached.status_code, 200)
+        self.assertEqual(cached.json(), first.json())
+        self.assertEqual(cached.headers.get("ETag"), '"v1"')
+
+        # other parameters or language: other response
+        other.send(api.request, URL_SRS, params={"_limit": 20})
+        other.send(api.request, URL_SRS, vary="en", params={"_limit": 10})
+        self.assertEqual(len(api.calls), 3)
+
+    def test_http_cache_revalidation(self):
+        """Stale responses are revalidated with a conditional request."""
+        api = FakeApi()
+        cache = IsogeoHttpCache(path=self.db_path, ttl=0)
+        cache.send(api.request, URL_SRS)
+        revalidated = cache.send(api.request, URL_SRS)
+        self.assertEqual(api.calls[1].get("If-None-Match"), '"v1"')
+        self.assertEqual(revalidated.status_code, 200)
+        self.assertEqual(revalidated.json(), [{"code": 4326}])
+        self.assertTrue(revalidated.from_cache)
+        self.assertEqual(cache.info().get("revalidations"), 1)
+
+    def test_http_cache_invalidate(self):
+        """Writes to a cached route or to its items remove its stored responses."""
+        api = FakeApi()
+        cache = IsogeoHttpCache(path=self.db_path, ttl=60)
+        url_formats = "https://api.qa.isogeo.com/formats"
+        cache.send(api.request, URL_SRS)
+        cache.send(api.request, url_formats, params={"_limit": 10})
+        cache.send(api.request, url_formats, vary="en")
+
+        # not a cached route
+        self.assertEqual(cache.invalidate("https://api.qa.isogeo.com/account"), 0)
+        self.assertEqual(cache.invalidate(url_formats + "/" + "a" * 32), 2)
+        self.assertEqual(cache.info().get("entries"), 1)
+        self.assertEqual(cache.invalidate(URL_SRS + "/"), 1)
+        self.assertEqual(cache.info().get("entries"), 0)
+
+    def test_http_cache_client(self):
+        """Write requests sent by the client remove the stored responses."""
+        with IsogeoMockServer() as server:
+            isogeo = new_client(
+                server, http_cache=IsogeoHttpCache(path=self.db_path, ttl=60)
+            )
+            url_formats = "https://v1.api.qa.isogeo.com/formats"
+            isogeo.get(url_formats)
+            self.assertTrue(isogeo.get(url_formats).from_cache)
+            isogeo.put("{}/{}".format(url_formats, "a" * 32), json={})
+            self.assertFalse(getattr(isogeo.get(url_formats), "from_cache", False))
+            isogeo.close()
+            self.assertEqual(server.count(r"^/formats$", method="GET"), 2)
+
+    def test_http_cache_max_age(self):
+        """Cache-Control max-age prevails over the TTL, no-store is respected."""
+        api = FakeApi(etag=None, cache_control="max-age=3600")
+        cache = IsogeoHttpCache(path=self.db_path, ttl=0)
+        cache.send(api.request, URL_SRS)
+        cache.send(api.request, URL_SRS)
+        self.assertEqual(len(api.calls), 1)
+
+        api.cache_control = "no-store"
+        cache.clear()
+        cache.send(api.request, URL_SRS)
+        cache.send(api.request, URL_SRS)
+        self.assertEqual(len(api.calls), 3)
+        self.assertEqual(cache.info().get("entries"), 0)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
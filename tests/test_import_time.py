@@ -0,0 +1,97 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+.. code-block:: python
+
+    # for whole test
+    python -m unittest tests.test_import_time
+    # for specific
+    python -m unittest tests.test_import_time.TestImportTime.test_import_light
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import json
+import subprocess
+import sys
+import unittest
+
+# #############################################################################
+# ########## Globals ###############
+# ##################################
+
+# modules which must not be loaded by a plain import
+HEAVY_MODULES = (
+    "oauthlib",
+    "requests",
+    "requests_oauthlib",
+    "urllib3",
+    "isogeo_pysdk.api.routes_metadata",
+    "isogeo_pysdk.isogeo",
+)
+
+# generous budget in seconds, to detect regressions and not machine slowness
+IMPORT_TIME_BUDGET = 0.5
+
+# #############################################################################
+# ########## Helpers ###############
+# ##################################
+
+
+def measure_import(statement: str) -> dict:
+    """Execute an import statement in a fresh interpreter and return its duration \
+    and the heavy modules loaded."""
+    code = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        "{}\n"
+        "duration = time.perf_counter() - start\n"
+        "print(json.dumps({{'duration': duration, 'loaded': "
+        "[m for m in {!r} if m in sys.modules]}}))".format(statement, HEAVY_MODULES)
+    )
+    output = subprocess.check_output([sys.executable, "-c", code])
+    return json.loads(output.decode("utf-8").splitlines()[-1])
+
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestImportTime(unittest.TestCase):
+    """Benchmark the package import."""
+
+    def test_import_light(self):
+        """Importing the package doesn't load the routes nor the HTTP stack."""
+        result = measure_import("import isogeo_pysdk")
+        self.assertEqual(result.get("loaded"), [])
+        self.assertLess(result.get("duration"), IMPORT_TIME_BUDGET)
+
+    def test_import_helpers(self):
+        """Helpers can be used without loading the HTTP stack."""
+        result = measure_import(
+            "from isogeo_pysdk import IsogeoTranslator, IsogeoUtils\n"
+            "IsogeoUtils.hlpr_datetimes('2019-08-09T14:36:48.123+00:00')"
+        )
+        self.assertEqual(result.get("loaded"), [])
+        self.assertLess(result.get("duration"), IMPORT_TIME_BUDGET)
+
+    def test_import_public_names(self):
+        """Public names are still available, loaded on demand."""
+        result = measure_import(
+            "from isogeo_pysdk import *\n"
+            "assert Isogeo and ApiMetadata and Metadata and LinkKinds and Resource"
+        )
+        self.assertIn("isogeo_pysdk.isogeo", result.get("loaded"))
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
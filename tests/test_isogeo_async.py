@@ -0,0 +1,216 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+.. code-block:: python
+
+    # for whole test
+    python -m unittest tests.test_isogeo_async
+    # for specific
+    python -m unittest tests.test_isogeo_async.TestAsyncIsogeo.test_search_whole_results
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import asyncio
+import threading
+import time
+import unittest
+
+# module target
+from isogeo_pysdk import AsyncIsogeo, MetadataSearch
+from isogeo_pysdk.api import ApiSearch
+
+# #############################################################################
+# ########## Helpers ###############
+# ##################################
+
+
+class ApiFakeMetadata(object):
+    """Stand-in for ApiMetadata, recording the concurrency reached."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def get(self, metadata_id: str, include: tuple = ()) -> dict:
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.02)
+        with self.lock:
+            self.in_flight -= 1
+        return {"_id": metadata_id, "include": include}
+
+
+class FakeSearch(ApiSearch):
+    """Stand-in for ApiSearch serving a catalog of `total` metadata."""
+
+    def __init__(self, total: int):
+        self.total = total
+        self.calls = []
+
+    def search(self, page_size: int = 20, offset: int = 0, **kwargs):
+        self.calls.append((offset, page_size))
+        results = [
+            {"_id": "{:032x}".format(i)}
+            for i in range(offset, min(offset + page_size, self.total))
+        ]
+        return MetadataSearch(
+            envelope=None,
+            limit=page_size,
+            offset=offset,
+            query={"_tags": []},
+            results=results,
+            tags={"type:dataset": "Dataset"},
+            total=self.total,
+        )
+
+
+class FakeIsogeo(object):
+    """Stand-in for an authenticated Isogeo session."""
+
+    pool_maxsize = 4
+
+    def __init__(self, total: int = 250):
+        self.metadata = ApiFakeMetadata()
+        self.search = FakeSearch(total=total).search
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestAsyncIsogeo(unittest.TestCase):
+    """Test asynchronous client."""
+
+    def test_routes_are_awaitable(self):
+        """Route methods are mirrored as coroutines and concurrency is bounded."""
+        fake = FakeIsogeo()
+
+        async def run():
+            async with AsyncIsogeo(isogeo=fake, max_concurrency=3) as isogeo:
+                return await asyncio.gather(
+                    *[isogeo.metadata.get(str(i), include="all") for i in range(12)]
+                )
+
+        mds = asyncio.run(run())
+        self.assertEqual([md.get("_id") for md in mds], [str(i) for i in range(12)])
+        self.assertLessEqual(fake.metadata.max_in_flight, 3)
+        self.assertTrue(fake.closed)
+
+    def test_concurrency_beyond_pool(self):
+        """Concurrency defaults to the connection pool size, warns beyond."""
+        fake = FakeIsogeo()
+        self.assertEqual(AsyncIsogeo(isogeo=fake).max_concurrency, fake.pool_maxsize)
+        with self.assertLogs("isogeo_pysdk.isogeo_async", level="WARNING"):
+            AsyncIsogeo(isogeo=fake, max_concurrency=fake.pool_maxsize + 1)
+
+    def test_search_whole_results(self):
+        """Whole results are retrieved page by page and merged in offset order."""
+        fake = FakeIsogeo(total=250)
+
+        async def run():
+            async with AsyncIsogeo(isogeo=fake) as isogeo:
+                return await isogeo.search(whole_results=1)
+
+        search = asyncio.run(run())
+        self.assertIsInstance(search, MetadataSearch)
+        self.assertEqual(search.total, 250)
+        self.assertEqual(len(search.results), 250)
+        self.assertEqual(
+            [md.get("_id") for md in search.results],
+            ["{:032x}".format(i) for i in range(250)],
+        )
+        # the first page doubles as the count request
+        self.assertEqual(
+            sorted(fake.search.__self__.calls), [(0, 100), (100, 100), (200, 100)]
+        )
+
+    def test_search_whole_results_offset(self):
+        """Whole results start at the offset."""
+        fake = FakeIsogeo(total=250)
+
+        async def run():
+            async with AsyncIsogeo(isogeo=fake) as isogeo:
+                return await isogeo.search(offset=20, whole_results=1)
+
+        search = asyncio.run(run())
+        self.assertEqual(search.offset, 20)
+        self.assertEqual(len(search.results), 230)
+        self.assertEqual(search.results[0].get("_id"), "{:032x}".format(20))
+        self.assertEqual(
+            sorted(fake.search.__self__.calls), [(20, 100), (120, 100), (220, 100)]
+        )
+
+    def test_search_simple(self):
+        """Simple search is just a page."""
+        fake = FakeIsogeo(total=250)
+
+        async def run():
+            async with AsyncIsogeo(isogeo=fake) as isogeo:
+                return await isogeo.search(page_size=10, offset=20)
+
+        search = asyncio.run(run())
+        self.assertEqual(len(search.results), 10)
+        self.assertEqual(search.offset, 20)
+
+    def test_search_pages(self):
+        """Pages are iterated asynchronously, within a sliding window, in offset order."""
+        fake = FakeIsogeo(total=250)
+
+        async def run(**kwargs):
+            async with AsyncIsogeo(isogeo=fake) as isogeo:
+                return [page async for page in isogeo.search_pages(**kwargs)]
+
+        pages = asyncio.run(run(page_size=50, max_workers=2))
+        self.assertEqual([page.offset for page in pages], [0, 50, 100, 150, 200])
+        self.assertEqual(len(fake.search.__self__.calls), 5)
+
+        # known total: no count request
+        pages = asyncio.run(run(expected_total=120, ordered=False))
+        self.assertEqual(sorted(page.offset for page in pages), [0, 100])
+        self.assertEqual(sorted(len(page.results) for page in pages), [100, 100])
+
+    def test_iter_search(self):
+        """Metadata are iterated without blocking the event loop."""
+        fake = FakeIsogeo(total=250)
+        ticks = []
+
+        async def tick():
+            while True:
+                ticks.append(None)
+                await asyncio.sleep(0)
+
+        async def run():
+            ticker = asyncio.ensure_future(tick())
+            async with AsyncIsogeo(isogeo=fake) as isogeo:
+                mds = [md async for md in isogeo.iter_search(page_size=100)]
+                # stopped early
+                async for md in isogeo.iter_search(page_size=10):
+                    break
+            ticker.cancel()
+            return mds
+
+        mds = asyncio.run(run())
+        self.assertEqual(
+            [md.get("_id") for md in mds], ["{:032x}".format(i) for i in range(250)]
+        )
+        self.assertGreater(len(ticks), 3)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+.. code-block:: python
+
+    # for whole test
+    python -m unittest tests.test_isogeo_lazy
+    # for specific
+    python -m unittest tests.test_isogeo_lazy.TestIsogeoLazy.test_routes_lazy
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+# module target
+from isogeo_pysdk import Isogeo
+from isogeo_pysdk.api import ApiCoordinateSystem, ApiMetadata, ApiSearch
+
+# #############################################################################
+# ########## Helpers ###############
+# ##################################
+
+
+def new_client(**kwargs) -> Isogeo:
+    """Instanciate a client with fake credentials."""
+    return Isogeo(
+        client_id="python-minimalist-sdk-test-{}".format("a" * 32),
+        client_secret="s" * 64,
+        auto_refresh_url="https://id.api.isogeo.com/oauth/token",
+        platform="qa",
+        **kwargs,
+    )
+
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestIsogeoLazy(unittest.TestCase):
+    """Test lazy construction of the client."""
+
+    def test_init_offline(self):
+        """Construction doesn't check the internet connection."""
+        with patch(
+            "isogeo_pysdk.isogeo.checker.check_internet_connection",
+            side_effect=AssertionError("no network at construction"),
+        ):
+            isogeo = new_client()
+        self.assertEqual(isogeo.platform, "qa")
+
+    def test_connect_checks_connection(self):
+        """The connectivity probe is deferred to the authentication."""
+        isogeo = new_client()
+        with patch(
+            "isogeo_pysdk.isogeo.checker.check_internet_connection", return_value=False
+        ):
+            self.assertRaises(EnvironmentError, isogeo.connect)
+
+    def test_routes_lazy(self):
+        """Routes are built at their first access, only once."""
+        isogeo = new_client()
+        self.assertNotIn("metadata", vars(isogeo))
+        self.assertIsInstance(isogeo.metadata, ApiMetadata)
+        self.assertIs(isogeo.metadata, isogeo.metadata)
+        self.assertIs(isogeo.metadata.api_client, isogeo)
+        self.assertNotIn("links", vars(isogeo.metadata))
+        self.assertIs(isogeo.metadata.links.api_client, isogeo)
+
+        # aliases and shortcuts
+        self.assertIsInstance(isogeo.srs, ApiCoordinateSystem)
+        self.assertIs(isogeo.srs, isogeo.coordinate_system)
+        self.assertIsInstance(isogeo.search.__self__, ApiSearch)
+        self.assertIs(isogeo.search.__self__, isogeo.iter_search.__self__)
+
+        # routes are not shared between clients
+        self.assertIsNot(new_client().metadata, isogeo.metadata)
+
+    def test_routes_lazy_threads(self):
+        """Concurrent first accesses get the same routes object."""
+        isogeo = new_client()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            routes = list(executor.map(lambda _: isogeo.catalog, range(16)))
+        self.assertEqual(len({id(r) for r in routes}), 1)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
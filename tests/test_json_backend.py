@@ -0,0 +1,134 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+.. code-block:: python
+
+    # for whole test
+    python -m unittest tests.test_json_backend
+    # for specific
+    python -m unittest tests.test_json_backend.TestJsonBackend.test_client
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import json
+import logging
+import unittest
+
+# 3rd party
+from requests.models import Response
+
+# module target
+from isogeo_pysdk import IsogeoChecker, IsogeoJsonBackend
+from isogeo_pysdk.json_backend import BACKENDS, IsogeoJsonResponse
+
+# test helpers
+from tests.mock_server import FIXTURE_METADATA, IsogeoMockServer
+from tests.test_mock_server import new_client
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestJsonBackend(unittest.TestCase):
+    """Test the JSON backend."""
+
+    @classmethod
+    def setUpClass(cls):
+        logging.getLogger("isogeo_pysdk").setLevel(logging.CRITICAL)
+        cls.document = FIXTURE_METADATA.read_bytes()
+
+    def test_backends(self):
+        """Every installed backend decodes and encodes as the standard library."""
+        expected = json.loads(self.document)
+        for name in BACKENDS:
+            if not IsogeoJsonBackend.is_available(name):
+                continue
+            backend = IsogeoJsonBackend(name)
+            self.assertEqual(backend.loads(self.document), expected)
+            self.assertEqual(backend.loads(self.document.decode("utf-8")), expected)
+            self.assertEqual(json.loads(backend.dumps(expected)), expected)
+            self.assertEqual(json.loads(backend.dumps({1: "é"})), {"1": "é"})
+
+    def test_auto(self):
+        """Fastest installed backend is used by default."""
+        installed = [n for n in BACKENDS if IsogeoJsonBackend.is_available(n)]
+        self.assertEqual(IsogeoJsonBackend().name, installed[0])
+        with self.assertRaises(ValueError):
+            IsogeoJsonBackend("simplejson")
+        missing = [n for n in BACKENDS if n not in installed]
+        if missing:
+            with self.assertRaises(ImportError):
+                IsogeoJsonBackend(missing[0])
+
+    def test_decode_error(self):
+        """Invalid documents raise the same error as requests."""
+        backend = IsogeoJsonBackend()
+        with self.assertRaises(json.JSONDecodeError):
+            backend.loads(b"<html>Bad gateway</html>")
+
+        response = backend.bind(Response())
+        response.status_code = 502
+        response._content = b"<html>Bad gateway</html>"
+        response.reason = "Bad Gateway"
+        response.request = response
+        response.url = "https://api.isogeo.com/formats"
+        self.assertEqual(IsogeoChecker().check_api_response(response), (False, 502))
+
+    def test_codec_middleware(self):
+        """Payloads are encoded and responses decoded with the client backend."""
+        backend = IsogeoJsonBackend()
+        sent = []
+
+        def transport(request, call_next):
+            sent.append(request)
+            response = Response()
+            response.status_code = 200
+            response._content = request.kwargs.get("data")
+            return response
+
+        with IsogeoMockServer(total=10) as server:
+            isogeo = new_client(server, json_backend=backend)
+            isogeo.pipeline.add(transport)
+            try:
+                response = isogeo.execute(
+                    "POST", route="resources/", json={"title": "Données"}
+                )
+            finally:
+                isogeo.close()
+
+        kwargs = sent[0].kwargs
+        self.assertIsNone(kwargs.get("json"))
+        self.assertEqual(kwargs.get("data"), backend.dumps({"title": "Données"}))
+        self.assertEqual(kwargs.get("headers").get("Content-Type"), "application/json")
+        self.assertIn("Authorization", kwargs.get("headers"))
+        self.assertIsInstance(response, IsogeoJsonResponse)
+        self.assertEqual(response.json(), {"title": "Données"})
+
+    def test_client(self):
+        """Routes results are the same with any backend."""
+        results = {}
+        with IsogeoMockServer(total=30) as server:
+            for backend in (None, IsogeoJsonBackend(), IsogeoJsonBackend("json")):
+                isogeo = new_client(server, json_backend=backend)
+                search = isogeo.search(whole_results=1, include="all")
+                results[repr(backend)] = search.results
+                isogeo.close()
+
+        first, *others = results.values()
+        self.assertEqual(len(first), 30)
+        for other in others:
+            self.assertEqual(other, first)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,178 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+.. code-block:: python
+
+    # for whole test
+    python -m unittest tests.test_metadata_columns
+    # for specific
+    python -m unittest tests.test_metadata_columns.TestMetadataColumns.test_extend
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import asyncio
+import json
+import logging
+import math
+import unittest
+from copy import deepcopy
+from importlib.util import find_spec
+
+# module target
+from isogeo_pysdk import AsyncIsogeo, MetadataColumns, MetadataSearch
+from isogeo_pysdk.api.routes_search import ApiSearch
+from isogeo_pysdk.models.metadata_columns import (
+    NAT,
+    NOT_INCLUDED,
+    envelope_bbox,
+    parse_timestamp,
+)
+
+# test helpers
+from tests.mock_server import FIXTURE_METADATA, IsogeoMockServer
+from tests.test_mock_server import new_client
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestMetadataColumns(unittest.TestCase):
+    """Test the columnar search results."""
+
+    @classmethod
+    def setUpClass(cls):
+        logging.getLogger("isogeo_pysdk").setLevel(logging.CRITICAL)
+        with FIXTURE_METADATA.open("r", encoding="utf-8") as in_json:
+            cls.fixture = json.load(in_json)
+
+    def columns(self) -> MetadataColumns:
+        """Columns of the complete fixture and of a metadata without subresources."""
+        return MetadataColumns.from_results(
+            [deepcopy(self.fixture), {"_id": "b" * 32, "title": "Title"}]
+        )
+
+    def test_extend(self):
+        """Columns are filled from the metadata dictionaries."""
+        columns = self.columns()
+        self.assertEqual(len(columns), 2)
+        self.assertEqual(columns["_id"], [self.fixture.get("_id"), "b" * 32])
+        self.assertEqual(columns.type, [self.fixture.get("type"), None])
+        self.assertEqual(columns.format, [self.fixture.get("format"), None])
+        self.assertEqual(
+            columns._created.tolist(),
+            [parse_timestamp(self.fixture.get("_created")), NAT],
+        )
+        self.assertEqual(columns.bbox_xmin[0], self.fixture["envelope"]["bbox"][0])
+        self.assertTrue(math.isnan(columns.bbox_ymax[1]))
+        self.assertEqual(
+            columns.links_count.tolist(), [len(self.fixture.get("links")), NOT_INCLUDED]
+        )
+        self.assertEqual(columns.events_count[0], len(self.fixture.get("events")))
+
+        # page by page
+        paged = MetadataColumns()
+        paged.extend([deepcopy(self.fixture)])
+        paged.concat(MetadataColumns([{"_id": "b" * 32, "title": "Title"}]))
+        self.assertEqual(paged, columns)
+        self.assertEqual(set(paged.to_dict()), set(paged.names))
+        with self.assertRaises(KeyError):
+            columns["abstract"]
+
+    def test_parse_timestamp(self):
+        """API dates are read as UTC timestamps in milliseconds."""
+        self.assertEqual(
+            parse_timestamp("2018-06-14T13:22:17.2880035+00:00"), 1528982537288
+        )
+        self.assertEqual(parse_timestamp("2018-06-14T15:22:17+02:00"), 1528982537000)
+        self.assertEqual(parse_timestamp("2018-06-14"), 1528934400000)
+        self.assertEqual(parse_timestamp("2018-06-14T13:22:17Z"), 1528982537000)
+        self.assertEqual(
+            parse_timestamp("2018-06-14T13:22:17.2880035"), 1528982537288
+        )
+        self.assertEqual(parse_timestamp(None), NAT)
+        self.assertEqual(parse_timestamp("not a date"), NAT)
+
+    def test_envelope_bbox(self):
+        """Bounding box is read from the envelope or computed from its coordinates."""
+        envelope = deepcopy(self.fixture.get("envelope"))
+        bbox = envelope_bbox(envelope)
+        self.assertEqual(bbox, tuple(envelope.pop("bbox")))
+        self.assertEqual(envelope_bbox(envelope), bbox)
+        self.assertEqual(
+            envelope_bbox({"type": "Point", "coordinates": [2.5, 48.1]}),
+            (2.5, 48.1, 2.5, 48.1),
+        )
+        self.assertIsNone(envelope_bbox(None))
+
+    def test_merge_pages(self):
+        """Columns of the pages are concatenated with the results."""
+        pages = [
+            MetadataSearch(results=[deepcopy(self.fixture)], query={}, tags={}),
+            MetadataSearch(results=[{"_id": "b" * 32}], query={}, tags={}),
+        ]
+        self.assertIsNone(ApiSearch.merge_pages(pages).columns)
+        for page in pages:
+            page.columns = MetadataColumns(page.results)
+        search = ApiSearch.merge_pages(pages)
+        self.assertEqual(search.columns, MetadataColumns(search.results))
+
+    def test_search_columnar(self):
+        """Columnar search fills the columns page by page."""
+        with IsogeoMockServer(total=250) as server:
+            isogeo = new_client(server)
+            search = isogeo.search(whole_results=1, include=("links",), columnar=1)
+            small_search = isogeo.search(page_size=10, columnar=1)
+            plain_search = isogeo.search(page_size=10)
+            isogeo.close()
+
+        self.assertEqual(len(search.columns), 250)
+        self.assertEqual(search.columns, MetadataColumns(search.results))
+        self.assertEqual(search.columns["_id"][7], IsogeoMockServer.metadata_id(7))
+        self.assertEqual(set(search.columns.links_count), {len(self.fixture["links"])})
+        self.assertEqual(set(search.columns.events_count), {NOT_INCLUDED})
+        self.assertEqual(len(small_search.columns), 10)
+        self.assertIsNone(plain_search.columns)
+
+    def test_search_columnar_async(self):
+        """Pages of the asynchronous client are stored by columns, then concatenated."""
+
+        async def run(isogeo):
+            async with AsyncIsogeo(isogeo=isogeo) as async_isogeo:
+                return await async_isogeo.search(whole_results=1, columnar=1)
+
+        with IsogeoMockServer(total=250) as server:
+            search = asyncio.run(run(new_client(server)))
+
+        self.assertEqual(len(search.columns), 250)
+        self.assertEqual(search.columns, MetadataColumns(search.results))
+
+    @unittest.skipUnless(find_spec("pyarrow"), "pyarrow is not installed")
+    def test_to_arrow(self):
+        """Arrow table has typed columns and missing dates as nulls."""
+        table = self.columns().to_arrow()
+        self.assertEqual(table.num_rows, 2)
+        self.assertEqual(table.column_names, list(MetadataColumns.__slots__))
+        self.assertEqual(table.column("_created").null_count, 1)
+        self.assertEqual(table.column("links_count").to_pylist()[1], NOT_INCLUDED)
+
+    @unittest.skipUnless(find_spec("pandas"), "pandas is not installed")
+    def test_to_pandas(self):
+        """DataFrame has typed columns and missing dates as NaT."""
+        df = self.columns().to_pandas()
+        self.assertEqual(len(df), 2)
+        self.assertEqual(df["_created"].isna().tolist(), [False, True])
+        self.assertEqual(df["links_count"].dtype.kind, "i")
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
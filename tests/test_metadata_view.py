@@ -0,0 +1,103 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+.. code-block:: python
+
+    # for whole test
+    python -m unittest tests.test_metadata_view
+    # for specific
+    python -m unittest tests.test_metadata_view.TestMetadataView.test_same_as_model
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import json
+import logging
+import unittest
+from copy import deepcopy
+
+# module target
+from isogeo_pysdk import Metadata, MetadataSearch, MetadataView
+
+# test helpers
+from tests.mock_server import FIXTURE_METADATA, IsogeoMockServer
+from tests.test_mock_server import new_client
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestMetadataView(unittest.TestCase):
+    """Test the read-only metadata view."""
+
+    @classmethod
+    def setUpClass(cls):
+        logging.getLogger("isogeo_pysdk").setLevel(logging.CRITICAL)
+        with FIXTURE_METADATA.open("r", encoding="utf-8") as in_json:
+            cls.fixture = json.load(in_json)
+
+    def test_same_as_model(self):
+        """Attributes and shortcuts are the same as the Metadata model ones."""
+        raw = deepcopy(self.fixture)
+        view = MetadataView(raw)
+        metadata = Metadata.clean_attributes(deepcopy(self.fixture))
+        for attr in Metadata.ATTR_TYPES:
+            self.assertEqual(getattr(view, attr), getattr(metadata, attr), attr)
+        self.assertEqual(view.to_dict(), metadata.to_dict())
+        self.assertEqual(view.coordinateSystem, self.fixture.get("coordinate-system"))
+        self.assertEqual(view.groupName, metadata.groupName)
+        self.assertEqual(view.groupId, metadata.groupId)
+        self.assertEqual(view.typeFilter, metadata.typeFilter)
+        self.assertEqual(view.admin_url(), metadata.admin_url())
+        self.assertEqual(view.title_or_name(1), metadata.title_or_name(1))
+        self.assertEqual(view.signature(), metadata.signature())
+
+        # wrapped dict is untouched
+        self.assertEqual(raw, self.fixture)
+        self.assertIs(view.raw, raw)
+
+    def test_read_only(self):
+        """View attributes can't be set and missing keys are None."""
+        view = MetadataView({"title": "Title"})
+        with self.assertRaises(AttributeError):
+            view.title = "New title"
+        with self.assertRaises(AttributeError):
+            view.unknown = "value"
+        self.assertIsNone(view.abstract)
+        self.assertEqual(view.title_or_name(), "Title")
+
+    def test_to_metadata(self):
+        """Full model is materialized on demand without modifying the view."""
+        view = MetadataView(deepcopy(self.fixture))
+        metadata = view.to_metadata()
+        self.assertIsInstance(metadata, Metadata)
+        self.assertEqual(metadata, Metadata.clean_attributes(deepcopy(self.fixture)))
+        self.assertIn("coordinate-system", view.raw)
+        self.assertEqual(view, MetadataView(deepcopy(self.fixture)))
+
+    def test_search_views(self):
+        """Search results are iterated as views."""
+        search = MetadataSearch(results=[{"_id": "a" * 32}, {"_id": "b" * 32}])
+        self.assertEqual([md._id for md in search.views()], ["a" * 32, "b" * 32])
+        self.assertEqual(list(MetadataSearch().views()), [])
+
+        with IsogeoMockServer(total=120) as server:
+            isogeo = new_client(server)
+            views = list(isogeo.iter_search(views=True))
+            isogeo.close()
+        self.assertEqual(len(views), 120)
+        self.assertIsInstance(views[0], MetadataView)
+        self.assertEqual(views[7]._id, IsogeoMockServer.metadata_id(7))
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,181 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+.. code-block:: python
+
+    # for whole test
+    python -m unittest tests.test_metrics
+    # for specific
+    python -m unittest tests.test_metrics.TestMetrics.test_route_template
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import logging
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+# module target
+from isogeo_pysdk import IsogeoMetrics
+from isogeo_pysdk.metrics import LoggingExporter, PrometheusExporter
+
+# test helpers
+from tests.mock_server import IsogeoMockServer
+from tests.test_mock_server import new_client
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestMetrics(unittest.TestCase):
+    """Test the requests metrics."""
+
+    @classmethod
+    def setUpClass(cls):
+        logging.getLogger("isogeo_pysdk").setLevel(logging.CRITICAL)
+        cls.server = IsogeoMockServer(total=250).start()
+        cls.isogeo = new_client(cls.server)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.isogeo.close()
+        cls.server.stop()
+
+    def setUp(self):
+        self.isogeo.cache.clear()
+        self.isogeo.metrics.reset()
+
+    def test_route_template(self):
+        """Identifiers are replaced in routes."""
+        self.assertEqual(
+            IsogeoMetrics.route_template(
+                "https://v1.api.qa.isogeo.com/groups/32f7e95ec4e94ca3bc1afda960003882"
+                "/resources/search?q=roads"
+            ),
+            "groups/{id}/resources/search",
+        )
+        self.assertEqual(
+            IsogeoMetrics.route_template(
+                "https://v1.api.qa.isogeo.com/resources/"
+                "0269803d-50c4-46b0-9f50-60ef7fe3e22b/events/"
+            ),
+            "resources/{id}/events",
+        )
+        self.assertEqual(
+            IsogeoMetrics.route_template("https://v1.api.qa.isogeo.com/formats"),
+            "formats",
+        )
+
+    def test_search_recorded(self):
+        """Requests are counted with their latency, sizes and status."""
+        self.isogeo.search(whole_results=1, page_size=100)
+        stats = self.isogeo.metrics.snapshot().get("GET resources/search")
+        self.assertEqual(stats.get("count"), 3)
+        self.assertEqual(stats.get("statuses"), {200: 3})
+        self.assertEqual(stats.get("errors"), 0)
+        self.assertGreater(stats.get("bytes_in"), 0)
+        self.assertGreater(stats.get("latency_sum"), 0)
+        self.assertEqual(stats.get("latency_buckets").get("+Inf"), 3)
+
+    def test_bytes_in(self):
+        """Received bytes are the compressed body size on the wire."""
+        responses = []
+
+        def spy(request, call_next):
+            response = call_next(request)
+            responses.append(response)
+            return response
+
+        self.isogeo.pipeline.add(spy)
+        try:
+            self.isogeo.search(page_size=50, include="all")
+        finally:
+            self.isogeo.pipeline.remove(spy)
+
+        response = responses[0]
+        self.assertEqual(response.headers.get("Content-Encoding"), "gzip")
+        stats = self.isogeo.metrics.snapshot().get("GET resources/search")
+        self.assertEqual(
+            stats.get("bytes_in"), int(response.headers.get("Content-Length"))
+        )
+        self.assertLess(stats.get("bytes_in"), len(response.content))
+
+    def test_coalesced_recorded_once(self):
+        """A network call shared by identical requests is recorded once."""
+        with IsogeoMockServer(total=50, latency=0.3) as server:
+            isogeo = new_client(server)
+            isogeo.metrics.reset()
+            url = "https://v1.api.qa.isogeo.com/resources/search"
+            with ThreadPoolExecutor(5) as executor:
+                for future in [executor.submit(isogeo.get, url) for i in range(5)]:
+                    future.result()
+            isogeo.close()
+            calls = server.count(r"^/resources/search$")
+
+        self.assertLess(calls, 5)
+        stats = isogeo.metrics.snapshot().get("GET resources/search")
+        self.assertEqual(stats.get("count"), calls)
+
+    def test_cache_hits(self):
+        """Responses served by the cache are counted as hits."""
+        md_id = IsogeoMockServer.metadata_id(3)
+        self.isogeo.metadata.get(md_id)
+        self.isogeo.metadata.get(md_id)
+        snapshot = self.isogeo.metrics.snapshot()
+        self.assertEqual(snapshot.get("GET resources/{id}").get("count"), 1)
+        self.assertEqual(snapshot.get("GET resources/{id}").get("cache_hits"), 1)
+
+    def test_record_error(self):
+        """Requests without response are counted as errors."""
+        metrics = IsogeoMetrics(buckets=(0.1, 1))
+        metrics.record("GET", "https://v1.api.qa.isogeo.com/formats", 0.5)
+        stats = metrics.snapshot().get("GET formats")
+        self.assertEqual(stats.get("errors"), 1)
+        self.assertEqual(stats.get("statuses"), {})
+        self.assertEqual(stats.get("latency_buckets"), {"0.1": 0, "1": 1, "+Inf": 1})
+
+    def test_prometheus_exporter(self):
+        """Metrics are rendered in Prometheus text format."""
+        self.isogeo.search(page_size=10)
+        text = self.isogeo.metrics.export(PrometheusExporter(prefix="isogeo"))
+        self.assertIn(
+            'isogeo_requests_total{method="GET",route="resources/search"} 1', text
+        )
+        self.assertIn(
+            'isogeo_responses_total{method="GET",route="resources/search",status="200"} 1',
+            text,
+        )
+        self.assertIn("# TYPE isogeo_request_duration_seconds histogram", text)
+        self.assertIn(
+            'isogeo_request_duration_seconds_bucket{method="GET",route="resources/search",le="+Inf"} 1',
+            text,
+        )
+
+    def test_logging_exporter(self):
+        """Metrics are written in logs, one line by route."""
+        self.isogeo.search(page_size=10)
+        logger = logging.getLogger("isogeo_pysdk.test_metrics")
+        with self.assertLogs(logger, level="INFO") as logs:
+            self.isogeo.metrics.export(LoggingExporter(logger=logger))
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn("GET resources/search: 1 requests", logs.output[0])
+
+    def test_disabled(self):
+        """Metrics can be disabled."""
+        isogeo = new_client(self.server, metrics=False)
+        self.assertIsNone(isogeo.metrics)
+        self.assertIsNotNone(isogeo.search(page_size=1))
+        isogeo.close()
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,194 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+.. code-block:: python
+
+    # for whole test
+    python -m unittest tests.test_mock_server
+    # for specific
+    python -m unittest tests.test_mock_server.TestMockServer.test_search_whole_results
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import logging
+import unittest
+
+# module target
+from isogeo_pysdk import Isogeo, Metadata, MetadataSearch
+
+# test helpers
+from tests.mock_server import REQUESTS_HISTORY, IsogeoMockServer
+
+# #############################################################################
+# ########## Helpers ###############
+# ##################################
+
+
+def new_client(server: IsogeoMockServer, **kwargs) -> Isogeo:
+    """Instanciate and authenticate a client against the mock server."""
+    isogeo = Isogeo(
+        client_id="python-minimalist-sdk-test-{}".format("a" * 32),
+        client_secret="s" * 64,
+        auth_mode="group",
+        auto_refresh_url="https://id.api.isogeo.com/oauth/token",
+        platform="qa",
+        check_connection=False,
+        **kwargs,
+    )
+    server.mount(isogeo)
+    isogeo.connect()
+    return isogeo
+
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestMockServer(unittest.TestCase):
+    """Test the SDK against the local stand-in of the API."""
+
+    @classmethod
+    def setUpClass(cls):
+        logging.getLogger("isogeo_pysdk").setLevel(logging.CRITICAL)
+        cls.server = IsogeoMockServer(total=1234).start()
+        cls.isogeo = new_client(cls.server)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.isogeo.close()
+        cls.server.stop()
+
+    def test_connect(self):
+        """Authentication and application properties."""
+        self.assertTrue(self.isogeo.token.get("access_token").startswith("mock-"))
+        self.assertEqual(self.isogeo.app_properties.name, "Mock application")
+
+    def test_search_page(self):
+        """Simple search returns a page of the synthetic catalog."""
+        search = self.isogeo.search(page_size=10, offset=20, include=("tags",))
+        self.assertIsInstance(search, MetadataSearch)
+        self.assertEqual(search.total, 1234)
+        self.assertEqual(len(search.results), 10)
+        self.assertEqual(
+            search.results[0].get("_id"), IsogeoMockServer.metadata_id(20)
+        )
+        self.assertIn("tags", search.results[0])
+
+    def test_search_whole_results(self):
+        """Whole results are retrieved and ordered."""
+        search = self.isogeo.search(query="type:service", whole_results=1)
+        self.assertEqual(len(search.results), search.total)
+        self.assertEqual(search.total, 308)
+        self.assertEqual(
+            [md.get("_id") for md in search.results[:2]],
+            [IsogeoMockServer.metadata_id(i) for i in (2, 6)],
+        )
+
+    def test_requests_stats(self):
+        """Received requests are counted, only the last ones are kept."""
+        with IsogeoMockServer(total=10) as server:
+            isogeo = new_client(server, rate_limiter=False)
+            for i in range(REQUESTS_HISTORY + 10):
+                isogeo.execute("GET", route="formats")
+            isogeo.close()
+
+        self.assertEqual(server.count(r"^/formats$", method="GET"), REQUESTS_HISTORY + 10)
+        self.assertEqual(server.received, server.count())
+        self.assertEqual(len(server.requests), REQUESTS_HISTORY)
+        self.assertEqual(server.requests[-1], ("GET", "/formats"))
+
+    def test_whole_results_options(self):
+        """Whole results honour the offset and the pagination width."""
+        search = self.isogeo.search(
+            query="type:service", whole_results=1, max_workers=1
+        )
+        self.assertEqual(len(search.results), 308)
+        self.assertEqual(search.limit, 308)
+
+        # from the offset: paginated or in one request
+        for offset in (150, search.total - 30):
+            search_from = self.isogeo.search(
+                query="type:service", offset=offset, whole_results=1
+            )
+            self.assertEqual(search_from.offset, offset)
+            self.assertEqual(search_from.results, search.results[offset:])
+            self.assertEqual(search_from.limit, len(search.results) - offset)
+
+        keywords = self.isogeo.keyword.thesaurus(offset=20, whole_results=1)
+        self.assertEqual(keywords.offset, 20)
+        self.assertEqual(len(keywords.results), keywords.total - 20)
+        self.assertEqual(keywords.limit, len(keywords.results))
+        self.assertEqual(keywords.results[0].get("code"), "synthetic-20")
+
+    def test_metadata(self):
+        """Metadata are served from the fixture with subresources."""
+        md = self.isogeo.metadata.get(
+            IsogeoMockServer.metadata_id(42), include=("contacts", "links")
+        )
+        self.assertIsInstance(md, Metadata)
+        self.assertEqual(md.title, "Synthetic metadata 42")
+        self.assertTrue(md.contacts)
+
+        # unknown metadata
+        self.assertEqual(
+            self.isogeo.metadata.get(IsogeoMockServer.metadata_id(99999)), (False, 404)
+        )
+
+    def test_compression(self):
+        """Large responses are compressed in every authentication mode."""
+        self.assertIn("gzip", self.isogeo.header.get("Accept-Encoding"))
+        responses = []
+
+        def spy(request, call_next):
+            response = call_next(request)
+            responses.append(response)
+            return response
+
+        self.isogeo.pipeline.add(spy)
+        try:
+            search = self.isogeo.search(page_size=50, include="all")
+        finally:
+            self.isogeo.pipeline.remove(spy)
+
+        self.assertEqual(len(search.results), 50)
+        self.assertEqual(responses[0].headers.get("Content-Encoding"), "gzip")
+
+    def test_warm_up(self):
+        """Pooled connections are opened while connecting."""
+        connections = len(self.server.connections)
+        isogeo = new_client(self.server, warm_up=True, pool_maxsize=8)
+        self.assertGreaterEqual(len(self.server.connections) - connections, 8)
+
+        connections = len(self.server.connections)
+        self.assertEqual(isogeo.warm_up_connections(size=4), 4)
+        # connections of the pool are reused
+        self.assertEqual(len(self.server.connections), connections)
+        isogeo.close()
+
+    def test_errors(self):
+        """Simulated errors are returned by the checker."""
+        with IsogeoMockServer(error_rate=1, error_status=500) as server:
+            isogeo = Isogeo(
+                client_id="python-minimalist-sdk-test-{}".format("a" * 32),
+                client_secret="s" * 64,
+                auto_refresh_url="https://id.api.isogeo.com/oauth/token",
+                platform="qa",
+            )
+            isogeo.token = self.isogeo.token
+            server.mount(isogeo)
+            self.assertEqual(isogeo.search(page_size=1), (False, 500))
+            self.assertEqual(server.count(r"/resources/search"), 1)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+.. code-block:: python
+
+    # for whole test
+    python -m unittest tests.test_paginator
+    # for specific
+    python -m unittest tests.test_paginator.TestIsogeoPaginator.test_pages_ordered
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import random
+import threading
+import time
+import unittest
+
+# module target
+from isogeo_pysdk import IsogeoPaginator, KeywordSearch
+
+# #############################################################################
+# ########## Helpers ###############
+# ##################################
+
+
+class FakeRoute(object):
+    """Paginated route serving `total` items, optionally without total in responses."""
+
+    def __init__(self, total: int, with_total: bool = True, fail_at_offset: int = None):
+        self.total = total
+        self.with_total = with_total
+        self.fail_at_offset = fail_at_offset
+        self.lock = threading.Lock()
+        self.requested = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def fetch_page(self, offset: int, limit: int):
+        with self.lock:
+            self.requested.append(offset)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(random.random() / 200)
+        with self.lock:
+            self.in_flight -= 1
+
+        if offset == self.fail_at_offset:
+            return (False, 500)
+        results = list(range(offset, min(offset + limit, self.total)))
+        if not self.with_total:
+            return results
+        return KeywordSearch(limit=limit, offset=offset, results=results, total=self.total)
+
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestIsogeoPaginator(unittest.TestCase):
+    """Test pagination engine."""
+
+    def test_pages_ordered(self):
+        """Pages are reassembled in offset order and concurrency is bounded."""
+        route = FakeRoute(total=2345)
+        paginator = IsogeoPaginator(fetch_page=route.fetch_page, max_workers=4)
+
+        pages = paginator.collect()
+
+        self.assertEqual([i for page in pages for i in page.results], list(range(2345)))
+        self.assertEqual(len(route.requested), 24)
+        self.assertLessEqual(route.max_in_flight, 4)
+
+    def test_pages_first_page(self):
+        """A first page already retrieved is not requested again."""
+        route = FakeRoute(total=450)
+        first_page = route.fetch_page(offset=0, limit=100)
+        paginator = IsogeoPaginator(fetch_page=route.fetch_page)
+
+        pages = paginator.collect(first_page=first_page)
+
+        self.assertIs(pages[0], first_page)
+        self.assertEqual(route.requested.count(0), 1)
+        self.assertEqual([i for page in pages for i in page.results], list(range(450)))
+
+    def test_pages_open_ended(self):
+        """Without total, pages are requested until the last short page."""
+        for total in (0, 50, 100, 730, 800):
+            route = FakeRoute(total=total, with_total=False)
+            paginator = IsogeoPaginator(fetch_page=route.fetch_page, max_workers=3)
+
+            pages = paginator.collect()
+
+            self.assertEqual([i for page in pages for i in page], list(range(total)))
+
+    def test_pages_error(self):
+        """An error stops the pagination and is returned."""
+        route = FakeRoute(total=5000, fail_at_offset=300)
+        paginator = IsogeoPaginator(fetch_page=route.fetch_page, max_workers=2)
+
+        self.assertEqual(paginator.collect(), (False, 500))
+        self.assertLess(len(route.requested), 50)
+
+    def test_cancel(self):
+        """Cancelling stops requesting new pages."""
+        route = FakeRoute(total=5000)
+        paginator = IsogeoPaginator(fetch_page=route.fetch_page, max_workers=2)
+
+        pages = []
+        for page in paginator.pages():
+            pages.append(page)
+            if len(pages) == 3:
+                paginator.cancel()
+
+        self.assertTrue(paginator.cancelled)
+        self.assertLess(len(route.requested), 10)
+
+    def test_window(self):
+        """Pages waiting for their turn are bounded by the window."""
+        route = FakeRoute(total=3000)
+        paginator = IsogeoPaginator(
+            fetch_page=route.fetch_page, max_workers=4, window=6, ordered=False
+        )
+
+        pages = paginator.collect()
+
+        self.assertEqual(
+            sorted(i for page in pages for i in page.results), list(range(3000))
+        )
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
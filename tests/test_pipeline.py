@@ -0,0 +1,157 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+.. code-block:: python
+
+    # for whole test
+    python -m unittest tests.test_pipeline
+    # for specific
+    python -m unittest tests.test_pipeline.TestPipeline.test_middleware_order
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import logging
+import unittest
+
+# 3rd party
+from requests.models import Response
+
+# module target
+from isogeo_pysdk import User
+from isogeo_pysdk.pipeline import DEFAULT_MIDDLEWARES, IsogeoPipeline, IsogeoRequest
+
+# test helpers
+from tests.mock_server import IsogeoMockServer
+from tests.test_mock_server import new_client
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestPipeline(unittest.TestCase):
+    """Test the requests pipeline."""
+
+    @classmethod
+    def setUpClass(cls):
+        logging.getLogger("isogeo_pysdk").setLevel(logging.CRITICAL)
+        cls.server = IsogeoMockServer(total=50).start()
+        cls.isogeo = new_client(cls.server)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.isogeo.close()
+        cls.server.stop()
+
+    def setUp(self):
+        self.isogeo.cache.clear()
+
+    def test_default_middlewares(self):
+        """Client pipeline uses the default middlewares."""
+        self.assertEqual(
+            tuple(self.isogeo.pipeline.middlewares), tuple(DEFAULT_MIDDLEWARES)
+        )
+
+    def test_middleware_order(self):
+        """Middlewares are called from the outermost to the innermost."""
+        calls = []
+
+        def first(request, call_next):
+            calls.append("first")
+            return call_next(request)
+
+        def second(request, call_next):
+            calls.append("second")
+            return call_next(request)
+
+        pipeline = IsogeoPipeline(lambda request: calls.append("transport") or 200)
+        pipeline.add(second)
+        pipeline.add(first, index=0)
+        self.assertEqual(pipeline.send(IsogeoRequest(None, "get", "https://x/")), 200)
+        self.assertEqual(calls, ["first", "second", "transport"])
+
+        pipeline.remove(first)
+        calls.clear()
+        pipeline.send(IsogeoRequest(None, "GET", "https://x/"))
+        self.assertEqual(calls, ["second", "transport"])
+
+    def test_routes_through_pipeline(self):
+        """Routes requests go through the client middlewares, with the client settings."""
+        requests = []
+
+        def spy(request, call_next):
+            requests.append(request)
+            return call_next(request)
+
+        self.isogeo.pipeline.add(spy)
+        try:
+            md = self.isogeo.metadata.get(IsogeoMockServer.metadata_id(4))
+        finally:
+            self.isogeo.pipeline.remove(spy)
+
+        self.assertEqual(md._id, IsogeoMockServer.metadata_id(4))
+        self.assertEqual(len(requests), 1)
+        self.assertEqual(requests[0].method, "GET")
+        self.assertEqual(requests[0].route, "resources/{id}")
+        self.assertEqual(requests[0].kwargs.get("timeout"), self.isogeo.timeout)
+        self.assertIn("Authorization", requests[0].kwargs.get("headers"))
+
+    def test_short_circuit(self):
+        """A middleware can answer without sending the request."""
+
+        def offline(request, call_next):
+            response = Response()
+            response.status_code = 503
+            response._content = b'{"error": "offline"}'
+            response.request = request
+            return response
+
+        self.isogeo.pipeline.add(offline, index=0)
+        try:
+            result = self.isogeo.execute("GET", route="formats")
+        finally:
+            self.isogeo.pipeline.remove(offline)
+
+        self.assertEqual(result, (False, 503))
+
+    def test_route_result(self):
+        """Routes return the same values as before the pipeline."""
+
+        def deleted(request, call_next):
+            response = Response()
+            response.status_code = 200
+            response._content = b""
+            response.request = request
+            return response
+
+        self.isogeo.pipeline.add(deleted, index=0)
+        try:
+            result = self.isogeo.user.delete(User(_id="a" * 32))
+        finally:
+            self.isogeo.pipeline.remove(deleted)
+
+        self.assertIs(result, True)
+
+    def test_execute_error(self):
+        """API errors are returned as tuples, unless check is disabled."""
+        self.assertEqual(
+            self.isogeo.execute("GET", route="resources/{}".format("0" * 32)),
+            (False, 404),
+        )
+        response = self.isogeo.execute(
+            "GET", route="resources/{}".format("0" * 32), check=False
+        )
+        self.assertEqual(response.status_code, 404)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
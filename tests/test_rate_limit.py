@@ -0,0 +1,108 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+.. code-block:: python
+
+    # for whole test
+    python -m unittest tests.test_rate_limit
+    # for specific
+    python -m unittest tests.test_rate_limit.TestRateLimit.test_token_bucket
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import logging
+import unittest
+from email.utils import formatdate
+from time import perf_counter, time
+
+# module target
+from isogeo_pysdk import IsogeoRateLimiter
+
+# test helpers
+from tests.mock_server import IsogeoMockServer
+from tests.test_mock_server import new_client
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestRateLimit(unittest.TestCase):
+    """Test the client-side rate limiting and the retries of throttled requests."""
+
+    @classmethod
+    def setUpClass(cls):
+        logging.getLogger("isogeo_pysdk").setLevel(logging.CRITICAL)
+
+    def test_token_bucket(self):
+        """Requests beyond the burst wait for the rate."""
+        rate_limiter = IsogeoRateLimiter(rate=50, burst=5)
+        start = perf_counter()
+        for i in range(5):
+            rate_limiter.acquire()
+        self.assertLess(perf_counter() - start, 0.05)
+        for i in range(10):
+            rate_limiter.acquire()
+        self.assertGreaterEqual(perf_counter() - start, 0.18)
+        self.assertGreater(rate_limiter.waited, 0)
+
+    def test_bad_rate(self):
+        """Rate must be positive."""
+        with self.assertRaises(ValueError):
+            IsogeoRateLimiter(rate=0)
+
+    def test_parse_retry_after(self):
+        """Retry-After is a number of seconds or an HTTP date."""
+        self.assertEqual(IsogeoRateLimiter.parse_retry_after("120"), 120.0)
+        self.assertEqual(IsogeoRateLimiter.parse_retry_after("-1"), 0.0)
+        delay = IsogeoRateLimiter.parse_retry_after(
+            formatdate(time() + 30, usegmt=True)
+        )
+        self.assertTrue(25 < delay <= 30)
+        self.assertIsNone(IsogeoRateLimiter.parse_retry_after("soon"))
+        self.assertIsNone(IsogeoRateLimiter.parse_retry_after(None))
+
+    def test_throttled_retried(self):
+        """Throttled requests are retried after the Retry-After delay."""
+        with IsogeoMockServer(total=250, error_status=429, retry_after=0.01) as server:
+            isogeo = new_client(server, rate_limiter=IsogeoRateLimiter(max_retries=10))
+            # throttle once the client is authenticated
+            server.error_rate = 0.5
+            search = isogeo.search(whole_results=1, page_size=50)
+            isogeo.close()
+
+        self.assertEqual(len(search.results), 250)
+        self.assertGreater(isogeo.rate_limiter.throttled, 0)
+        stats = isogeo.metrics.snapshot().get("GET resources/search")
+        self.assertGreater(stats.get("retries"), 0)
+
+    def test_retries_exhausted(self):
+        """Throttled requests are returned as errors once the retries are exhausted."""
+        with IsogeoMockServer(total=10, error_status=429, retry_after=0) as server:
+            isogeo = new_client(server, rate_limiter=IsogeoRateLimiter(max_retries=2))
+            server.error_rate = 1
+            self.assertEqual(isogeo.execute("GET", route="formats"), (False, 429))
+            isogeo.close()
+
+        self.assertEqual(isogeo.rate_limiter.throttled, 2)
+
+    def test_disabled(self):
+        """Rate limiting can be disabled."""
+        with IsogeoMockServer(total=10) as server:
+            isogeo = new_client(server, rate_limiter=False)
+            self.assertIsNone(isogeo.rate_limiter)
+            self.assertIsNotNone(isogeo.search(page_size=1))
+            isogeo.close()
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
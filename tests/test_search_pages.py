@@ -0,0 +1,189 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+.. code-block:: python
+
+    # for whole test
+    python -m unittest tests.test_search_pages
+    # for specific
+    python -m unittest tests.test_search_pages.TestSearchPages.test_search_pages_ordered
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import random
+import threading
+import time
+import unittest
+
+# module target
+from isogeo_pysdk import Isogeo, MetadataSearch
+from isogeo_pysdk.api import ApiSearch
+from isogeo_pysdk.exceptions import IsogeoSdkError
+
+# #############################################################################
+# ########## Helpers ###############
+# ##################################
+
+
+class FakeResponse(object):
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, payload: dict, status_code: int = 200):
+        self.payload = payload
+        self.status_code = status_code
+        self.reason = "OK" if status_code == 200 else "Error"
+        self.request = self
+
+    @property
+    def url(self):
+        return "https://fake.isogeo.com/resources/search"
+
+    def json(self):
+        return self.payload
+
+
+class FakeSession(object):
+    """Stand-in for the Isogeo session, serving a catalog of `total` metadata."""
+
+    header = {}
+    platform = "qa"
+    proxies = {}
+    ssl = False
+    timeout = (5, 10)
+    token = {"access_token": "fake", "expires_at": time.time() + 3600}
+
+    def __init__(self, total: int, fail_at_offset: int = None):
+        self.total = total
+        self.fail_at_offset = fail_at_offset
+        self.lock = threading.Lock()
+        self.requested_offsets = []
+
+    # routes requests go through the client method
+    execute = Isogeo.execute
+
+    def request(self, method: str, url: str, **kwargs):
+        return self.get(url, **kwargs)
+
+    def get(self, url: str, params: dict = None, **kwargs):
+        offset, limit = params.get("_offset"), params.get("_limit")
+        with self.lock:
+            self.requested_offsets.append(offset)
+        # shuffle responses order
+        time.sleep(random.random() / 100)
+        if offset == self.fail_at_offset:
+            return FakeResponse({"error": "boom"}, status_code=500)
+        return FakeResponse(
+            {
+                "envelope": None,
+                "limit": limit,
+                "offset": offset,
+                "query": {"_tags": []},
+                "results": [
+                    {"_id": "{:032x}".format(i)}
+                    for i in range(offset, min(offset + limit, self.total))
+                ],
+                "tags": {},
+                "total": self.total,
+            }
+        )
+
+
+def md_ids(first: int, last: int) -> list:
+    return ["{:032x}".format(i) for i in range(first, last)]
+
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestSearchPages(unittest.TestCase):
+    """Test streamed search."""
+
+    def setUp(self):
+        """Executed before each test."""
+        self.session = FakeSession(total=1050)
+        self.api_search = ApiSearch(self.session)
+
+    def test_search_pages_ordered(self):
+        """Pages are yielded in offset order and the first page is the count probe."""
+        pages = list(self.api_search.search_pages(max_workers=4))
+
+        self.assertEqual(len(pages), 11)
+        for page in pages:
+            self.assertIsInstance(page, MetadataSearch)
+        self.assertEqual(
+            [md.get("_id") for page in pages for md in page.results], md_ids(0, 1050)
+        )
+        self.assertEqual(sorted(self.session.requested_offsets), list(range(0, 1050, 100)))
+
+    def test_search_pages_unordered(self):
+        """Unordered pages cover the whole results."""
+        pages = list(self.api_search.search_pages(max_workers=4, ordered=False))
+
+        self.assertEqual(
+            sorted(md.get("_id") for page in pages for md in page.results),
+            md_ids(0, 1050),
+        )
+
+    def test_search_pages_expected_total(self):
+        """With an expected total, every page is requested through the window."""
+        pages = list(
+            self.api_search.search_pages(page_size=50, expected_total=1050, max_workers=3)
+        )
+
+        self.assertEqual(len(pages), 21)
+        self.assertEqual(pages[0].offset, 0)
+        self.assertEqual(len(self.session.requested_offsets), 21)
+
+    def test_search_pages_stop_early(self):
+        """Stopping the iteration does not request the whole catalog."""
+        for page in self.api_search.search_pages(max_workers=2):
+            break
+
+        self.assertEqual(page.offset, 0)
+        self.assertLess(len(self.session.requested_offsets), 11)
+
+    def test_search_whole_results(self):
+        """Whole results search is merged from the paginated pages."""
+        search = self.api_search.search(whole_results=1)
+
+        self.assertEqual(search.total, 1050)
+        self.assertEqual([md.get("_id") for md in search.results], md_ids(0, 1050))
+        # the first page doubles as the count request
+        self.assertEqual(sorted(self.session.requested_offsets), list(range(0, 1050, 100)))
+
+    def test_search_whole_results_single_page(self):
+        """Whole results fitting in a page require a single request."""
+        api_search = ApiSearch(FakeSession(total=42))
+        search = api_search.search(whole_results=1)
+
+        self.assertEqual(len(search.results), 42)
+        self.assertEqual(api_search.api_client.requested_offsets, [0])
+
+    def test_iter_search(self):
+        """Iterate over metadata."""
+        self.assertEqual(
+            [md.get("_id") for md in self.api_search.iter_search(max_workers=4)],
+            md_ids(0, 1050),
+        )
+
+    def test_iter_search_error(self):
+        """A failing page stops the iteration with an error."""
+        api_search = ApiSearch(FakeSession(total=1050, fail_at_offset=500))
+
+        with self.assertRaises(IsogeoSdkError):
+            list(api_search.iter_search(max_workers=4))
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+.. code-block:: python
+
+    # for whole test
+    python -m unittest tests.test_serializer
+    # for specific
+    python -m unittest tests.test_serializer.TestSerializer.test_serialize_many
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import json
+import logging
+import unittest
+
+# module target
+from isogeo_pysdk import (
+    Condition,
+    Contact,
+    CoordinateSystem,
+    License,
+    Metadata,
+    Workgroup,
+)
+from isogeo_pysdk.models.serializer import (
+    compile_plan,
+    serialize,
+    serialize_creation,
+    serialize_many,
+    serialize_value,
+)
+
+# test helpers
+from tests.mock_server import FIXTURE_METADATA
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestSerializer(unittest.TestCase):
+    """Test the models serializer."""
+
+    @classmethod
+    def setUpClass(cls):
+        logging.getLogger("isogeo_pysdk").setLevel(logging.CRITICAL)
+        with FIXTURE_METADATA.open("r", encoding="utf-8") as in_json:
+            cls.fixture = json.load(in_json)
+
+    def test_plan(self):
+        """Plans are compiled once by class, with creation keys renamed."""
+        plan = compile_plan(Metadata)
+        self.assertIs(compile_plan(Metadata), plan)
+        self.assertEqual([key for key, _ in plan], list(Metadata.ATTR_TYPES))
+        creation_keys = [key for key, _ in compile_plan(Metadata, creation=True)]
+        self.assertIn("coordinate-system", creation_keys)
+        self.assertNotIn("coordinateSystem", creation_keys)
+        # contact flattening can't be compiled
+        self.assertIsNone(compile_plan(Workgroup, creation=True))
+
+    def test_serialize(self):
+        """Models are serialized with their nested models converted."""
+        metadata = Metadata.clean_attributes(dict(self.fixture))
+        metadata.coordinateSystem = CoordinateSystem(code=2154, name="RGF93")
+        result = serialize(metadata)
+        self.assertEqual(metadata.to_dict(), result)
+        self.assertEqual(result.get("coordinateSystem").get("code"), 2154)
+        self.assertEqual(result.get("title"), self.fixture.get("title"))
+        self.assertEqual(
+            serialize_creation(metadata).get("coordinate-system"),
+            metadata.coordinateSystem.to_dict(),
+        )
+        self.assertEqual(json.loads(json.dumps(result)), result)
+
+    def test_serialize_value(self):
+        """Lists and dicts are copied with their models converted."""
+        lic = License(name="Licence ouverte")
+        values = [lic, "text"]
+        self.assertEqual(serialize_value(values), [lic.to_dict(), "text"])
+        self.assertIsNot(serialize_value(values), values)
+        self.assertEqual(serialize_value({"license": lic}), {"license": lic.to_dict()})
+        self.assertEqual(serialize_value(lic), lic.to_dict())
+        self.assertEqual(serialize_value(3.5), 3.5)
+
+    def test_serialize_many(self):
+        """Lists of models of any classes are serialized in a single pass."""
+        lic = License(name="Licence ouverte")
+        models = [Condition(description="cond", license=lic), lic, Contact(name="ct")]
+        self.assertEqual(serialize_many(models), [m.to_dict() for m in models])
+
+        workgroup = Workgroup(contact=Contact(name="Isogeo", city="Bordeaux"))
+        models.append(workgroup)
+        result = serialize_many(models, creation=True)
+        self.assertEqual(result, [m.to_dict_creation() for m in models])
+        self.assertEqual(result[-1].get("contact.city"), "Bordeaux")
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+.. code-block:: python
+
+    # for whole test
+    python -m unittest tests.test_single_flight
+    # for specific
+    python -m unittest tests.test_single_flight.TestSingleFlight.test_single_flight_shared
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+# module target
+from isogeo_pysdk import IsogeoSingleFlight
+from isogeo_pysdk.api import ApiSearch
+
+# test helpers
+from tests.test_search_pages import FakeSession
+
+# #############################################################################
+# ########## Helpers ###############
+# ##################################
+
+
+class BlockingSession(FakeSession):
+    """Fake session whose requests are blocked until `release` is set."""
+
+    def __init__(self, total: int):
+        super().__init__(total=total)
+        self.release = threading.Event()
+        self.single_flight = IsogeoSingleFlight()
+
+    def get(self, *args, **kwargs):
+        self.release.wait(5)
+        return super().get(*args, **kwargs)
+
+
+def wait_for(condition, timeout: float = 5):
+    """Wait until the condition is true."""
+    start = time.monotonic()
+    while not condition() and time.monotonic() - start < timeout:
+        time.sleep(0.005)
+
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestSingleFlight(unittest.TestCase):
+    """Test coalescing of identical concurrent calls."""
+
+    def test_single_flight_shared(self):
+        """Identical concurrent calls share one execution and one result."""
+        single_flight = IsogeoSingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def work():
+            calls.append(1)
+            release.wait(5)
+            return {"shares": []}
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(single_flight.do, ("k",), work) for _ in range(8)]
+            wait_for(lambda: single_flight.coalesced == 7)
+            release.set()
+            results = [f.result() for f in futures]
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(r is results[0] for r in results))
+
+        # once finished, a new call is executed again
+        single_flight.do(("k",), work)
+        self.assertEqual(len(calls), 2)
+
+    def test_single_flight_exception(self):
+        """The exception is raised to every caller."""
+        single_flight = IsogeoSingleFlight()
+        release = threading.Event()
+
+        def fail():
+            release.wait(5)
+            raise ValueError("boom")
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(single_flight.do, ("k",), fail) for _ in range(3)]
+            wait_for(lambda: single_flight.coalesced == 2)
+            release.set()
+            for future in futures:
+                self.assertRaises(ValueError, future.result)
+
+    def test_single_flight_request_key(self):
+        """Request keys depend on the full URL and the language."""
+        key = IsogeoSingleFlight.request_key(
+            "https://api.qa.isogeo.com/shares", {"_include": "groups"}, vary="fr"
+        )
+        self.assertEqual(
+            key,
+            IsogeoSingleFlight.request_key(
+                "https://api.qa.isogeo.com/shares?_include=groups", vary="fr"
+            ),
+        )
+        self.assertNotEqual(
+            key,
+            IsogeoSingleFlight.request_key(
+                "https://api.qa.isogeo.com/shares", {"_include": "groups"}, vary="en"
+            ),
+        )
+
+    def test_single_flight_route(self):
+        """Decorated routes send one request for identical concurrent calls."""
+        session = BlockingSession(total=50)
+        api_search = ApiSearch(session)
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            futures = [
+                executor.submit(api_search.search, page_size=10, include=["tags"])
+                for _ in range(4)
+            ]
+            futures.append(executor.submit(api_search.search, page_size=5))
+            wait_for(lambda: session.single_flight.coalesced == 3)
+            session.release.set()
+            results = [f.result() for f in futures]
+
+        self.assertEqual(sorted(session.requested_offsets), [0, 0])
+        self.assertTrue(all(r is results[0] for r in results[:4]))
+        self.assertEqual(len(results[4].results), 5)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
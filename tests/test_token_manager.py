@@ -0,0 +1,157 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+.. code-block:: python
+
+    # for whole test
+    python -m unittest tests.test_token_manager
+    # for specific
+    python -m unittest tests.test_token_manager.TestTokenManager.test_token_expired_serialized
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+# module target
+from isogeo_pysdk import ApiDecorators
+from isogeo_pysdk.token_manager import IsogeoTokenManager
+
+# #############################################################################
+# ########## Helpers ###############
+# ##################################
+
+
+class FakeClient(object):
+    """Stand-in for an authenticated Isogeo client (group authentication)."""
+
+    auto_refresh_url = "https://id.api.isogeo.com/oauth/token"
+    client_id = "fake"
+    client_secret = "fake"
+    proxies = {}
+    ssl = True
+
+    def __init__(self, expires_in: float):
+        self.fetches = 0
+        self.lock = threading.Lock()
+        self.token = self.new_token(expires_in)
+
+    @staticmethod
+    def new_token(expires_in: float) -> dict:
+        return {
+            "access_token": "token-{}".format(time.time()),
+            "expires_in": 3600,
+            "expires_at": time.time() + expires_in,
+        }
+
+    def fetch_token(self, **kwargs):
+        time.sleep(0.05)
+        with self.lock:
+            self.fetches += 1
+        self.token = self.new_token(3600)
+        return self.token
+
+
+class FakeRoutes(object):
+    """Routes object using the fake client."""
+
+    def __init__(self, api_client):
+        self.api_client = api_client
+        self.api_client.token_manager = IsogeoTokenManager(
+            api_client, margin=60, background=False
+        )
+
+    @ApiDecorators._check_bearer_validity
+    def get(self) -> str:
+        return self.api_client.token.get("access_token")
+
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestTokenManager(unittest.TestCase):
+    """Test proactive token renewal."""
+
+    def test_token_valid(self):
+        """A valid token is used as is."""
+        client = FakeClient(expires_in=600)
+        routes = FakeRoutes(client)
+        self.assertEqual(routes.get(), client.token.get("access_token"))
+        self.assertEqual(client.fetches, 0)
+
+    def test_token_expired_serialized(self):
+        """Threads hitting an expired token together send one renewal request."""
+        client = FakeClient(expires_in=-1)
+        routes = FakeRoutes(client)
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            tokens = list(executor.map(lambda _: routes.get(), range(10)))
+
+        self.assertEqual(client.fetches, 1)
+        self.assertEqual(len(set(tokens)), 1)
+        self.assertEqual(client.token_manager.refreshes, 1)
+
+    def test_token_about_to_expire(self):
+        """Callers keep using the valid token during the background renewal."""
+        client = FakeClient(expires_in=30)
+        routes = FakeRoutes(client)
+        old_token = client.token.get("access_token")
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            tokens = list(executor.map(lambda _: routes.get(), range(5)))
+        self.assertEqual(set(tokens), {old_token})
+
+        # renewed once in the background
+        start = time.monotonic()
+        while client.fetches == 0 and time.monotonic() - start < 5:
+            time.sleep(0.01)
+        time.sleep(0.1)
+        self.assertEqual(client.fetches, 1)
+        self.assertNotEqual(routes.get(), old_token)
+
+    def test_token_scheduled(self):
+        """The renewal is scheduled a margin before expiration."""
+        client = FakeClient(expires_in=60.2)
+        manager = IsogeoTokenManager(client, margin=60)
+        manager.start()
+        start = time.monotonic()
+        while client.fetches == 0 and time.monotonic() - start < 5:
+            time.sleep(0.01)
+        manager.stop()
+        self.assertEqual(client.fetches, 1)
+        self.assertGreater(client.token.get("expires_at") - time.time(), 3000)
+
+    def test_token_stopped(self):
+        """A renewal in flight doesn't schedule the next one once stopped."""
+        client = FakeClient(expires_in=60.2)
+        manager = IsogeoTokenManager(client, margin=60)
+        manager.start()
+        # stopped while the renewal is requested
+        start = time.monotonic()
+        while not manager._refreshing and time.monotonic() - start < 5:
+            time.sleep(0.001)
+        manager.stop()
+        while manager._refreshing and time.monotonic() - start < 5:
+            time.sleep(0.01)
+        self.assertEqual(client.fetches, 1)
+        self.assertIsNone(manager._timer)
+
+        # started again
+        manager.start()
+        self.assertIsNotNone(manager._timer)
+        manager.stop()
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+.. code-block:: python
+
+    # for whole test
+    python -m unittest tests.test_tracing
+    # for specific
+    python -m unittest tests.test_tracing.TestTracing.test_search_spans
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import logging
+import unittest
+
+# module target
+from isogeo_pysdk import IsogeoTracer
+from isogeo_pysdk.tracing import SpanRecorder
+
+# test helpers
+from tests.mock_server import IsogeoMockServer
+from tests.test_mock_server import new_client
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestTracing(unittest.TestCase):
+    """Test the tracing spans."""
+
+    @classmethod
+    def setUpClass(cls):
+        logging.getLogger("isogeo_pysdk").setLevel(logging.CRITICAL)
+        cls.server = IsogeoMockServer(total=250).start()
+        cls.recorder = SpanRecorder()
+        cls.isogeo = new_client(cls.server, tracer=cls.recorder)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.isogeo.close()
+        cls.server.stop()
+
+    def setUp(self):
+        self.isogeo.cache.clear()
+        self.recorder.clear()
+
+    def get_span(self, name: str):
+        spans = [span for span in self.recorder.spans if span.name == name]
+        self.assertEqual(len(spans), 1, name)
+        return spans[0]
+
+    def test_tracer_wrapped(self):
+        """OpenTelemetry compatible tracers are wrapped."""
+        self.assertIsInstance(self.isogeo.tracer, IsogeoTracer)
+        self.assertIs(self.isogeo.tracer.tracer, self.recorder)
+
+    def test_search_spans(self):
+        """Paginated search: one span with a child span by page request."""
+        self.isogeo.share.listing.cache_clear()
+        self.isogeo.__dict__.pop("shares_id", None)
+        self.isogeo.search(whole_results=1, augment=1)
+
+        search = self.get_span("ApiSearch.search")
+        self.assertIsNone(search.parent)
+        self.assertEqual(search.attributes.get("isogeo.search.pages"), 3)
+        self.assertEqual(search.attributes.get("isogeo.search.total"), 250)
+        self.assertEqual(search.attributes.get("isogeo.search.results"), 250)
+        self.assertFalse(search.attributes.get("isogeo.cache_hit"))
+
+        children = self.recorder.children(search)
+        requests = [span for span in children if span.name == "HTTP GET"]
+        self.assertEqual(len(requests), 3)
+        for span in requests:
+            self.assertEqual(span.attributes.get("http.route"), "resources/search")
+            self.assertEqual(span.attributes.get("http.status_code"), 200)
+            self.assertGreaterEqual(span.duration, 0)
+
+        # shares listing, nested with its own request
+        share = self.get_span("ApiShare.listing")
+        self.assertIs(share.parent, search)
+        self.assertEqual(
+            [
+                span.attributes.get("http.route")
+                for span in self.recorder.children(share)
+            ],
+            ["shares"],
+        )
+
+    def test_cache_hit_span(self):
+        """Responses served by the cache are traced without request."""
+        md_id = IsogeoMockServer.metadata_id(1)
+        self.isogeo.metadata.get(md_id)
+        self.recorder.clear()
+        self.isogeo.metadata.get(md_id)
+
+        span = self.get_span("ApiMetadata.get")
+        self.assertTrue(span.attributes.get("isogeo.cache_hit"))
+        self.assertEqual(self.recorder.children(span), [])
+
+    def test_exception_recorded(self):
+        """Exceptions are recorded on the span."""
+        with self.assertRaises(ValueError):
+            self.isogeo.metadata.get("not-an-uuid")
+        self.assertIsInstance(self.get_span("ApiMetadata.get").exception, ValueError)
+
+    def test_no_span_outside(self):
+        """Attributes set without span are ignored."""
+        IsogeoTracer.set_attributes(**{"isogeo.test": 1})
+        self.assertEqual(self.recorder.spans, [])
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()